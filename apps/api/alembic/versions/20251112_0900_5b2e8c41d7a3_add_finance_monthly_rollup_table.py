@@ -0,0 +1,54 @@
+"""add_finance_monthly_rollup_table
+
+Revision ID: 5b2e8c41d7a3
+Revises: f329c1a83bf3
+Create Date: 2025-11-12 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5b2e8c41d7a3'
+down_revision = 'f329c1a83bf3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Create finance_monthly_rollup table (month x client x type x status -> sum, count)
+    op.create_table(
+        'finance_monthly_rollup',
+        sa.Column('reference_month', sa.Date(), nullable=False),
+        sa.Column('client_id', sa.UUID(), nullable=False),
+        sa.Column('transaction_type', sa.String(length=10), nullable=False),
+        sa.Column('payment_status', sa.String(length=15), nullable=False),
+        sa.Column('total_amount', sa.Numeric(precision=14, scale=2), nullable=False, comment='Sum of transaction amounts in BRL'),
+        sa.Column('transaction_count', sa.Integer(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['client_id'], ['clients.id'], name='fk_finance_monthly_rollup_client_id'),
+        sa.PrimaryKeyConstraint(
+            'reference_month', 'client_id', 'transaction_type', 'payment_status',
+            name='pk_finance_monthly_rollup'
+        )
+    )
+
+    op.create_index('ix_finance_monthly_rollup_client_month', 'finance_monthly_rollup', ['client_id', 'reference_month'])
+
+    # Backfill from existing transactions
+    op.execute("""
+        INSERT INTO finance_monthly_rollup
+            (reference_month, client_id, transaction_type, payment_status,
+             total_amount, transaction_count, updated_at)
+        SELECT reference_month, client_id, transaction_type, payment_status,
+               SUM(amount), COUNT(*), timezone('UTC', now())
+        FROM financial_transactions
+        WHERE deleted_at IS NULL
+        GROUP BY reference_month, client_id, transaction_type, payment_status
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_finance_monthly_rollup_client_month', 'finance_monthly_rollup')
+    op.drop_table('finance_monthly_rollup')
@@ -0,0 +1,68 @@
+"""add_unique_live_transaction_per_client_month
+
+Revision ID: 9c4f1a27e6b8
+Revises: 5b2e8c41d7a3
+Create Date: 2025-11-12 09:30:00.000000
+
+"""
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9c4f1a27e6b8'
+down_revision = '5b2e8c41d7a3'
+branch_labels = None
+depends_on = None
+
+# Conflicting pairs listed when the index can't be created
+MAX_REPORTED_DUPLICATES = 20
+
+
+def _check_no_live_duplicates() -> None:
+    # Duplicates are not resolved here: they may differ in amount or payment
+    # status, so which one to keep is a decision for the operator
+    duplicates = op.get_bind().execute(sa.text("""
+        SELECT client_id, reference_month, COUNT(*) AS live_count
+        FROM financial_transactions
+        WHERE deleted_at IS NULL
+        GROUP BY client_id, reference_month
+        HAVING COUNT(*) > 1
+        ORDER BY client_id, reference_month
+        LIMIT :limit
+    """), {"limit": MAX_REPORTED_DUPLICATES + 1}).all()
+    if not duplicates:
+        return
+
+    pairs = "\n".join(
+        f"  client {row.client_id}, month {row.reference_month}: {row.live_count} live rows"
+        for row in duplicates[:MAX_REPORTED_DUPLICATES]
+    )
+    more = "\n  ..." if len(duplicates) > MAX_REPORTED_DUPLICATES else ""
+    raise RuntimeError(
+        "Cannot create uq_financial_transactions_client_reference_live: "
+        "financial_transactions has several live rows for the same client "
+        f"and reference month:\n{pairs}{more}\n"
+        "Soft-delete the extra rows (set deleted_at), run "
+        "scripts/rebuild_finance_rollup.py for the affected months, "
+        "then run this migration again."
+    )
+
+
+def upgrade() -> None:
+    # One live (not soft-deleted) transaction per client and reference month.
+    # Backs INSERT ... ON CONFLICT DO NOTHING in bulk monthly fee generation.
+    if not context.is_offline_mode():
+        _check_no_live_duplicates()
+
+    op.create_index(
+        'uq_financial_transactions_client_reference_live',
+        'financial_transactions',
+        ['client_id', 'reference_month'],
+        unique=True,
+        postgresql_where=sa.text('deleted_at IS NULL'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('uq_financial_transactions_client_reference_live', 'financial_transactions')
@@ -0,0 +1,39 @@
+"""add_report_history_cache_key
+
+Revision ID: 3d7e5a9b2c41
+Revises: 9c4f1a27e6b8
+Create Date: 2025-11-13 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3d7e5a9b2c41'
+down_revision = '9c4f1a27e6b8'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Lets exports reuse a file already rendered for the same report result
+    op.add_column(
+        'report_history',
+        sa.Column(
+            'cache_key',
+            sa.String(length=64),
+            nullable=True,
+            comment='Report result cache key the file was rendered from',
+        ),
+    )
+    op.create_index(
+        'ix_report_history_cache_key_format',
+        'report_history',
+        ['cache_key', 'format'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_report_history_cache_key_format', 'report_history')
+    op.drop_column('report_history', 'cache_key')
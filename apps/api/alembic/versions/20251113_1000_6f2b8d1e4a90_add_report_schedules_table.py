@@ -0,0 +1,51 @@
+"""add_report_schedules_table
+
+Revision ID: 6f2b8d1e4a90
+Revises: 3d7e5a9b2c41
+Create Date: 2025-11-13 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '6f2b8d1e4a90'
+down_revision = '3d7e5a9b2c41'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'report_schedules',
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('name', sa.String(length=200), nullable=False),
+        sa.Column('template_id', sa.UUID(), nullable=False),
+        sa.Column('created_by_id', sa.UUID(), nullable=False),
+        sa.Column('cron', sa.String(length=100), nullable=False, comment='Cron expression (minute hour day month weekday) in the schedule timezone'),
+        sa.Column('period', sa.Enum('current_month', 'previous_month', 'last_30_days', 'current_year', 'previous_year', name='schedule_period'), nullable=False, comment='Reporting period, relative to the run date'),
+        sa.Column('format', postgresql.ENUM('pdf', 'csv', name='report_format', create_type=False), nullable=False),
+        sa.Column('recipients', sa.JSON(), nullable=False, comment='IDs of the users who receive each generated report'),
+        sa.Column('is_active', sa.Boolean(), nullable=False, server_default=sa.text('true')),
+        sa.Column('last_run_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('next_run_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['template_id'], ['report_templates.id'], name='fk_report_schedules_template_id'),
+        sa.ForeignKeyConstraint(['created_by_id'], ['users.id'], name='fk_report_schedules_created_by_id'),
+        sa.PrimaryKeyConstraint('id', name='pk_report_schedules')
+    )
+
+    op.create_index('ix_report_schedules_template_id', 'report_schedules', ['template_id'], unique=False)
+    op.create_index('ix_report_schedules_created_by_id', 'report_schedules', ['created_by_id'], unique=False)
+    op.create_index('ix_report_schedules_next_run_at', 'report_schedules', ['next_run_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_report_schedules_next_run_at', table_name='report_schedules')
+    op.drop_index('ix_report_schedules_created_by_id', table_name='report_schedules')
+    op.drop_index('ix_report_schedules_template_id', table_name='report_schedules')
+    op.drop_table('report_schedules')
+    sa.Enum(name='schedule_period').drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,38 @@
+"""add_report_history_janitor_columns
+
+Revision ID: a41c7e9d3b05
+Revises: 6f2b8d1e4a90
+Create Date: 2025-11-13 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a41c7e9d3b05'
+down_revision = '6f2b8d1e4a90'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Download recency drives storage quota eviction
+    op.add_column(
+        'report_history',
+        sa.Column(
+            'last_downloaded_at',
+            sa.DateTime(timezone=True),
+            nullable=True,
+            comment='Last download of the file (storage quota eviction order)',
+        ),
+    )
+    # Expired-record batches and shared-file lookups of the file janitor
+    op.create_index('ix_report_history_expires_at', 'report_history', ['expires_at'])
+    op.create_index('ix_report_history_file_path', 'report_history', ['file_path'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_report_history_file_path', 'report_history')
+    op.drop_index('ix_report_history_expires_at', 'report_history')
+    op.drop_column('report_history', 'last_downloaded_at')
@@ -0,0 +1,71 @@
+"""add_client_search_columns
+
+Revision ID: b7d2e94c1f38
+Revises: a41c7e9d3b05
+Create Date: 2025-11-14 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7d2e94c1f38'
+down_revision = 'a41c7e9d3b05'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.execute('CREATE EXTENSION IF NOT EXISTS unaccent')
+    # unaccent() is only STABLE, generated columns need an IMMUTABLE wrapper
+    op.execute("""
+        CREATE OR REPLACE FUNCTION immutable_unaccent(text) RETURNS text
+        LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT
+        AS $$ SELECT public.unaccent('public.unaccent'::regdictionary, $1) $$
+    """)
+
+    op.add_column(
+        'clients',
+        sa.Column(
+            'search_text',
+            sa.Text(),
+            sa.Computed(
+                "lower(immutable_unaccent(razao_social || ' ' || coalesce(nome_fantasia, '')))",
+                persisted=True,
+            ),
+        ),
+    )
+    op.add_column(
+        'clients',
+        sa.Column(
+            'cnpj_digits',
+            sa.String(length=14),
+            sa.Computed("regexp_replace(cnpj, '[^0-9]', '', 'g')", persisted=True),
+        ),
+    )
+
+    # Substring and similarity search on names
+    op.create_index(
+        'ix_clients_search_text_trgm',
+        'clients',
+        ['search_text'],
+        postgresql_using='gin',
+        postgresql_ops={'search_text': 'gin_trgm_ops'},
+    )
+    # Prefix lookup of partially typed CNPJs
+    op.create_index(
+        'ix_clients_cnpj_digits',
+        'clients',
+        ['cnpj_digits'],
+        postgresql_ops={'cnpj_digits': 'varchar_pattern_ops'},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_clients_cnpj_digits', 'clients')
+    op.drop_index('ix_clients_search_text_trgm', 'clients')
+    op.drop_column('clients', 'cnpj_digits')
+    op.drop_column('clients', 'search_text')
+    op.execute('DROP FUNCTION IF EXISTS immutable_unaccent(text)')
@@ -8,13 +8,14 @@ from uuid import UUID
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import db_manager
 from app.core.security import decode_token
 from app.db.models.user import User, UserRole
 from app.schemas.auth import TokenData
+from app.services.principal_cache import Principal, principal_cache
+from app.services.refresh_tokens import refresh_token_store
 
 # OAuth2 scheme for token authentication
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
@@ -34,16 +35,19 @@ async def get_db() -> AsyncSession:
 async def get_current_user(
     token: Annotated[str, Depends(oauth2_scheme)],
     db: Annotated[AsyncSession, Depends(get_db)],
-) -> User:
+) -> Principal:
     """
     Get current authenticated user from token.
 
+    The user is read from the principal cache; the database is only queried
+    on a miss, so most requests never use their session for authentication.
+
     Args:
         token: JWT token from Authorization header
         db: Database session
 
     Returns:
-        User: Current authenticated user
+        Principal: Current authenticated user
 
     Raises:
         HTTPException: If token is invalid or user not found
@@ -57,30 +61,42 @@ async def get_current_user(
     try:
         payload = decode_token(token)
         user_id: str | None = payload.get("sub")
-        if user_id is None:
+        # Refresh tokens only buy new tokens; logged-out sessions are revoked
+        if (
+            user_id is None
+            or payload.get("type") == "refresh"
+            or refresh_token_store.is_revoked(payload.get("fam"))
+        ):
             raise credentials_exception
         token_data = TokenData(sub=user_id, role=payload.get("role", ""))
     except JWTError:
         raise credentials_exception
 
-    # Get user from database
     try:
         user_uuid = UUID(token_data.sub)
     except ValueError:
         raise credentials_exception
 
-    result = await db.execute(select(User).where(User.id == user_uuid))
-    user = result.scalar_one_or_none()
+    issued_at = payload.get("iat")
+    principal = principal_cache.get(user_uuid, issued_at)
+    if principal is not None:
+        return principal
+
+    # Get user from database
+    generation = principal_cache.generation(user_uuid)
+    user = await db.get(User, user_uuid)
 
     if user is None:
         raise credentials_exception
 
-    return user
+    principal = Principal.from_model(user)
+    principal_cache.set(principal, issued_at, generation)
+    return principal
 
 
 async def get_current_active_user(
-    current_user: Annotated[User, Depends(get_current_user)],
-) -> User:
+    current_user: Annotated[Principal, Depends(get_current_user)],
+) -> Principal:
     """
     Get current active user.
 
@@ -88,7 +104,7 @@ async def get_current_active_user(
         current_user: Current authenticated user
 
     Returns:
-        User: Current active user
+        Principal: Current active user
 
     Raises:
         HTTPException: If user is inactive
@@ -101,6 +117,37 @@ async def get_current_active_user(
     return current_user
 
 
+async def get_current_user_model(
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+) -> User:
+    """
+    Load the ORM model of the current active user.
+
+    For handlers that need more than the principal (profile data,
+    password changes); it shares the request's session.
+
+    Args:
+        current_user: Current active user
+        db: Database session
+
+    Returns:
+        User: Current user model
+
+    Raises:
+        HTTPException: If the user no longer exists
+    """
+    user = await db.get(User, current_user.id)
+    if user is None:
+        principal_cache.invalidate(current_user.id)
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return user
+
+
 def require_role(allowed_roles: list[UserRole]):
     """
     Dependency factory to require specific roles.
@@ -113,12 +160,12 @@ def require_role(allowed_roles: list[UserRole]):
 
     Example:
         @app.get("/admin")
-        async def admin_endpoint(user: User = Depends(require_role([UserRole.ADMIN]))):
+        async def admin_endpoint(user: Principal = Depends(require_role([UserRole.ADMIN]))):
             ...
     """
     async def role_checker(
-        current_user: Annotated[User, Depends(get_current_active_user)],
-    ) -> User:
+        current_user: Annotated[Principal, Depends(get_current_active_user)],
+    ) -> Principal:
         """Check if user has required role."""
         if current_user.role not in allowed_roles:
             raise HTTPException(
@@ -153,7 +200,7 @@ def require_admin_or_func():
 async def get_optional_current_user(
     token: str | None = Depends(oauth2_scheme),
     db: Annotated[AsyncSession, Depends(get_db)] | None = None,
-) -> User | None:
+) -> Principal | None:
     """
     Get current user if token is provided, otherwise return None.
     Useful for endpoints that work with or without authentication.
@@ -163,7 +210,7 @@ async def get_optional_current_user(
         db: Database session
 
     Returns:
-        User or None: Current user if authenticated, None otherwise
+        Principal or None: Current user if authenticated, None otherwise
     """
     if token is None or db is None:
         return None
@@ -7,9 +7,11 @@ from sqlalchemy import text, select, func
 from uuid import uuid4
 
 from app.api.v1.deps import get_current_active_user, get_db
-from app.db.models.user import User, UserRole
+from app.db.models.user import UserRole
 from app.db.models.client import Client
 from app.services.obligation.generator import ObligationGenerator
+from app.services.obligation_type_catalog import obligation_type_catalog
+from app.services.principal_cache import Principal
 from datetime import date
 
 router = APIRouter()
@@ -18,7 +20,7 @@ router = APIRouter()
 @router.post("/seed/obligation-types")
 async def seed_obligation_types(
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
 ):
     """
     Seed obligation types into database.
@@ -48,6 +50,7 @@ async def seed_obligation_types(
             # Delete and recreate
             await db.execute(text("DELETE FROM obligation_types"))
             await db.commit()
+            obligation_type_catalog.invalidate()
 
     # Define obligation types
     obligation_types = [
@@ -213,13 +216,14 @@ async def seed_obligation_types(
         })
 
     await db.commit()
+    obligation_type_catalog.invalidate()
     return {"message": f"Created {len(obligation_types)} obligation types", "count": len(obligation_types)}
 
 
 @router.post("/seed/obligations")
 async def seed_obligations(
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
 ):
     """
     Generate obligations for current and previous month for all clients.
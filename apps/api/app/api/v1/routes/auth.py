@@ -8,8 +8,7 @@ from fastapi import APIRouter, Depends, status
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.v1.deps import get_current_active_user, get_db
-from app.db.models.user import User
+from app.api.v1.deps import get_current_active_user, get_db, oauth2_scheme
 from app.schemas.auth import (
     LoginRequest,
     LogoutRequest,
@@ -19,6 +18,7 @@ from app.schemas.auth import (
 )
 from app.schemas.base import ResponseSchema
 from app.services.auth import AuthService
+from app.services.principal_cache import Principal
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
@@ -93,23 +93,27 @@ async def refresh_token(
 @router.post("/logout", response_model=ResponseSchema, status_code=status.HTTP_200_OK)
 async def logout(
     request: LogoutRequest | None = None,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
+    token: str = Depends(oauth2_scheme),
     db: AsyncSession = Depends(get_db),
 ) -> ResponseSchema:
     """
     Logout current user.
 
-    Note: In JWT-based auth, logout is typically handled client-side
-    by discarding tokens. This endpoint is mainly for audit logging.
+    Revokes the session's token family: the access token and every
+    refresh token of the login stop working.
 
     Args:
         request: Optional logout request
         current_user: Current authenticated user
+        token: Access token of the request
         db: Database session
 
     Returns:
         ResponseSchema: Success message
     """
     auth_service = AuthService(db)
-    result = await auth_service.logout(current_user)
+    result = await auth_service.logout(
+        current_user, token, request.refresh_token if request else None
+    )
     return ResponseSchema(**result)
@@ -5,15 +5,15 @@ Client routes.
 from typing import Annotated, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.v1.deps import get_current_active_user, get_db, require_admin, require_admin_or_func
-from app.db.models.user import User
 from app.schemas.base import ResponseSchema
 from app.schemas.client import ClientCreate, ClientCreateResponse, ClientDraftCreate, ClientListItem, ClientResponse, ClientUpdate
 from app.services.client import ClientService
 from app.services.user import UserService
+from app.services.principal_cache import Principal
 from pydantic import BaseModel, Field
 
 router = APIRouter(prefix="/clients", tags=["clients"])
@@ -22,12 +22,14 @@ router = APIRouter(prefix="/clients", tags=["clients"])
 @router.get("", response_model=dict, status_code=status.HTTP_200_OK)
 async def list_clients(
     db: Annotated[AsyncSession, Depends(get_db)],
-    _: User = Depends(require_admin_or_func()),
+    _: Principal = Depends(require_admin_or_func()),
     query: Optional[str] = Query(None, description="Search by razao social or CNPJ"),
     status_filter: Optional[str] = Query(None, alias="status", description="Filter by status"),
     starts_with: Optional[str] = Query(None, description="Filter by first letter (A-Z)", max_length=1),
     page: int = Query(1, ge=1, description="Page number"),
     size: int = Query(10, ge=1, le=100, description="Page size"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor (replaces page)"),
+    with_total: bool = Query(True, description="Count all matching rows; false skips the count"),
 ) -> dict:
     """
     List all clients with filters and pagination (admin or func only).
@@ -40,6 +42,8 @@ async def list_clients(
         starts_with: Optional first letter filter
         page: Page number (1-indexed)
         size: Page size
+        cursor: Optional keyset cursor, avoids OFFSET scans on deep pages
+        with_total: Whether to count all matching clients
 
     Returns:
         Paginated list of clients
@@ -51,13 +55,15 @@ async def list_clients(
         starts_with=starts_with,
         page=page,
         size=size,
+        cursor=cursor,
+        with_total=with_total,
     )
 
 
 @router.get("/search", response_model=dict, status_code=status.HTTP_200_OK)
 async def search_clients(
     db: Annotated[AsyncSession, Depends(get_db)],
-    _: User = Depends(require_admin_or_func()),
+    _: Principal = Depends(require_admin_or_func()),
     q: str = Query(..., min_length=1, description="Search term"),
     limit: int = Query(10, ge=1, le=50, description="Maximum results"),
 ) -> dict:
@@ -82,7 +88,7 @@ async def search_clients(
 async def get_client(
     client_id: UUID,
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
 ) -> ClientResponse:
     """
     Get client by ID.
@@ -124,7 +130,7 @@ async def get_client(
 async def create_client(
     client_data: ClientCreate,
     db: Annotated[AsyncSession, Depends(get_db)],
-    _: User = Depends(require_admin_or_func()),
+    _: Principal = Depends(require_admin_or_func()),
 ) -> ClientCreateResponse:
     """
     Create a new client with optional user creation (admin or func only).
@@ -149,7 +155,7 @@ async def update_client(
     client_id: UUID,
     client_data: ClientUpdate,
     db: Annotated[AsyncSession, Depends(get_db)],
-    _: User = Depends(require_admin_or_func()),
+    _: Principal = Depends(require_admin_or_func()),
 ) -> ClientResponse:
     """
     Update client (admin or func only).
@@ -174,7 +180,7 @@ async def update_client(
 async def delete_client(
     client_id: UUID,
     db: Annotated[AsyncSession, Depends(get_db)],
-    _: User = Depends(require_admin()),
+    _: Principal = Depends(require_admin()),
 ) -> ResponseSchema:
     """
     Delete client (soft delete, admin only).
@@ -202,7 +208,7 @@ async def delete_client(
 @router.get("/stats/summary", response_model=dict, status_code=status.HTTP_200_OK)
 async def get_client_stats(
     db: Annotated[AsyncSession, Depends(get_db)],
-    _: User = Depends(require_admin_or_func()),
+    _: Principal = Depends(require_admin_or_func()),
 ) -> dict:
     """
     Get client statistics and KPIs (admin or func only).
@@ -222,7 +228,7 @@ async def get_client_stats(
 async def save_client_draft(
     draft_data: ClientDraftCreate,
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
 ) -> ResponseSchema:
     """
     Save client form as draft for auto-save functionality.
@@ -256,7 +262,7 @@ async def link_user_to_client(
     client_id: UUID,
     link_data: LinkUserRequest,
     db: Annotated[AsyncSession, Depends(get_db)],
-    _: User = Depends(require_admin_or_func()),
+    _: Principal = Depends(require_admin_or_func()),
 ) -> ResponseSchema:
     """
     Link an existing user to a client (admin or func only).
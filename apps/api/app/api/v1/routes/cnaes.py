@@ -9,12 +9,13 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.v1.deps import get_current_active_user, get_db, require_admin_or_func
-from app.db.models.user import User, UserRole
+from app.db.models.user import UserRole
 from app.db.repositories.cnae import CnaeRepository
 from app.db.repositories.client import ClientRepository
 from app.schemas.base import ResponseSchema
 from app.schemas.cnae import CnaeCreate, CnaeListResponse, CnaeResponse, CnaeUpdate
 from app.services.cnae.validator import CnaeValidator
+from app.services.principal_cache import Principal
 
 router = APIRouter(prefix="/cnaes", tags=["cnaes"])
 
@@ -22,7 +23,7 @@ router = APIRouter(prefix="/cnaes", tags=["cnaes"])
 @router.get("", response_model=CnaeListResponse, status_code=status.HTTP_200_OK)
 async def list_cnaes(
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
     client_id: Optional[UUID] = Query(None, description="Filter by client ID"),
 ) -> CnaeListResponse:
     """
@@ -72,7 +73,7 @@ async def list_cnaes(
 async def create_cnae(
     cnae_data: CnaeCreate,
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: User = Depends(require_admin_or_func()),
+    current_user: Principal = Depends(require_admin_or_func()),
 ) -> CnaeResponse:
     """
     Create a new CNAE (admin or func only).
@@ -145,7 +146,7 @@ async def create_cnae(
 async def set_primary_cnae(
     cnae_id: UUID,
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: User = Depends(require_admin_or_func()),
+    current_user: Principal = Depends(require_admin_or_func()),
 ) -> CnaeResponse:
     """
     Set a CNAE as primary for its client (admin or func only).
@@ -180,7 +181,7 @@ async def set_primary_cnae(
 async def delete_cnae(
     cnae_id: UUID,
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: User = Depends(require_admin_or_func()),
+    current_user: Principal = Depends(require_admin_or_func()),
 ) -> ResponseSchema:
     """
     Delete a CNAE (admin or func only).
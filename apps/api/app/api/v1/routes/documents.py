@@ -14,7 +14,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.v1.deps import get_current_active_user, get_db, require_admin_or_func
 from app.core.config import settings
-from app.db.models.user import User
+from app.services.principal_cache import Principal
 
 router = APIRouter(prefix="/documents", tags=["documents"])
 
@@ -28,7 +28,7 @@ async def upload_document(
     file: UploadFile = File(...),
     client_id: UUID = None,
     db: Annotated[AsyncSession, Depends(get_db)] = None,
-    current_user: User = Depends(require_admin_or_func()),
+    current_user: Principal = Depends(require_admin_or_func()),
 ) -> dict:
     """
     Upload a document for a client.
@@ -101,7 +101,7 @@ async def upload_document(
 @router.get("/client/{client_id}", status_code=status.HTTP_200_OK)
 async def list_client_documents(
     client_id: UUID,
-    current_user: User = Depends(require_admin_or_func()),
+    current_user: Principal = Depends(require_admin_or_func()),
 ) -> dict:
     """
     List all documents for a client.
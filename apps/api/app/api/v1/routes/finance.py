@@ -9,7 +9,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.v1.deps import get_current_active_user, get_db
 from app.db.models.finance import PaymentStatus
-from app.db.models.user import User, UserRole
+from app.db.models.user import UserRole
 from app.db.repositories.client import ClientRepository
 from app.db.repositories.transaction import TransactionRepository
 from app.schemas.finance import (
@@ -24,6 +24,7 @@ from app.schemas.finance import (
 )
 from fastapi.responses import Response
 from app.services.finance import FeeGeneratorService, FinancialReportService, InvoiceService, TransactionService
+from app.services.principal_cache import Principal
 
 router = APIRouter()
 
@@ -31,20 +32,24 @@ router = APIRouter()
 @router.get("", response_model=TransactionListResponse)
 async def list_transactions(
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
     client_id: Optional[UUID] = Query(None),
-    status: Optional[PaymentStatus] = Query(None),
+    status_filter: Optional[PaymentStatus] = Query(None, alias="status"),
     reference_month: Optional[date] = Query(None),
     due_date_from: Optional[date] = Query(None),
     due_date_to: Optional[date] = Query(None),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor (replaces skip)"),
+    with_total: bool = Query(True, description="Count all matching rows; false skips the count"),
 ):
     """
     List financial transactions with filters.
 
     - Admin/Func: Can see all transactions
     - Client: Can only see their own transactions
+
+    Follow next_cursor for deep pages; it avoids OFFSET scans.
     """
     repo = TransactionRepository(db)
 
@@ -59,15 +64,20 @@ async def list_transactions(
             )
         client_id = client.id
 
-    transactions, total = await repo.list_with_filters(
-        client_id=client_id,
-        status=status,
-        reference_month=reference_month,
-        due_date_from=due_date_from,
-        due_date_to=due_date_to,
-        skip=skip,
-        limit=limit,
-    )
+    try:
+        transactions, total = await repo.list_with_filters(
+            client_id=client_id,
+            status=status_filter,
+            reference_month=reference_month,
+            due_date_from=due_date_from,
+            due_date_to=due_date_to,
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
+            with_total=with_total,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
     # Enrich with client data
     response_items = []
@@ -100,6 +110,7 @@ async def list_transactions(
         "total": total,
         "skip": skip,
         "limit": limit,
+        "next_cursor": repo.next_cursor(transactions, limit),
     }
 
 
@@ -107,7 +118,7 @@ async def list_transactions(
 async def get_transaction(
     transaction_id: UUID,
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
 ):
     """Get transaction by ID."""
     repo = TransactionRepository(db)
@@ -136,7 +147,7 @@ async def get_transaction(
 async def create_transaction(
     data: TransactionCreate,
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
 ):
     """
     Create a new transaction.
@@ -170,7 +181,7 @@ async def update_transaction(
     transaction_id: UUID,
     data: TransactionUpdate,
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
 ):
     """
     Update a transaction.
@@ -204,7 +215,7 @@ async def mark_as_paid(
     transaction_id: UUID,
     data: TransactionMarkAsPaid,
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
 ):
     """
     Mark a transaction as paid.
@@ -240,7 +251,7 @@ async def cancel_transaction(
     transaction_id: UUID,
     data: TransactionCancel,
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
 ):
     """
     Cancel a transaction.
@@ -273,7 +284,7 @@ async def cancel_transaction(
 async def delete_transaction(
     transaction_id: UUID,
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
 ):
     """
     Delete a transaction (soft delete).
@@ -303,7 +314,7 @@ async def delete_transaction(
 async def generate_monthly_fees(
     data: MonthlyFeeGenerateRequest,
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
 ):
     """
     Generate monthly fees for clients.
@@ -336,14 +347,17 @@ async def generate_monthly_fees(
 @router.get("/fees/preview", response_model=dict)
 async def preview_monthly_fees(
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
     reference_month: date = Query(...),
     client_id: Optional[UUID] = Query(None),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor"),
+    limit: int = Query(10, ge=1, le=500),
 ):
     """
     Preview monthly fees generation without creating them.
 
     Admin/Func only.
+    For all clients, the would-generate list is paginated with cursor/limit.
     """
     if current_user.role not in [UserRole.ADMIN, UserRole.FUNC]:
         raise HTTPException(
@@ -357,6 +371,8 @@ async def preview_monthly_fees(
         result = await service.get_generation_preview(
             reference_month=reference_month,
             client_id=client_id,
+            cursor=cursor,
+            limit=limit,
         )
         return result
     except ValueError as e:
@@ -370,7 +386,7 @@ async def preview_monthly_fees(
 @router.get("/reports/dashboard", response_model=dict)
 async def get_dashboard_kpis(
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
 ):
     """
     Get financial dashboard KPIs.
@@ -390,7 +406,12 @@ async def get_dashboard_kpis(
 @router.get("/reports/receivables-aging", response_model=dict)
 async def get_receivables_aging(
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
+    by_client: bool = Query(False, description="Include per-client breakdown"),
+    bucket_bounds: Optional[str] = Query(
+        None,
+        description="Comma-separated overdue day bounds of the buckets (default: 30,60,90)",
+    ),
 ):
     """
     Get receivables aging report.
@@ -404,13 +425,23 @@ async def get_receivables_aging(
         )
 
     service = FinancialReportService(db)
-    return await service.get_receivables_aging_report()
+    try:
+        bounds = [int(bound) for bound in bucket_bounds.split(",")] if bucket_bounds else None
+        return await service.get_receivables_aging_report(
+            bucket_bounds=bounds,
+            by_client=by_client,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
 
 
 @router.get("/reports/revenue-by-period", response_model=dict)
 async def get_revenue_by_period(
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
     start_month: date = Query(...),
     end_month: date = Query(...),
 ):
@@ -436,7 +467,7 @@ async def get_revenue_by_period(
 async def get_client_financial_summary(
     client_id: UUID,
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
 ):
     """
     Get financial summary for a specific client.
@@ -469,7 +500,7 @@ async def get_client_financial_summary(
 async def generate_invoice_pdf(
     transaction_id: UUID,
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
 ):
     """
     Generate invoice PDF for a transaction.
@@ -521,7 +552,7 @@ async def generate_invoice_pdf(
 async def generate_receipt_pdf(
     transaction_id: UUID,
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
 ):
     """
     Generate payment receipt PDF for a paid transaction.
@@ -7,6 +7,8 @@ from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
+from app.core.passwords import password_hasher
+from app.core.security import token_cache
 
 router = APIRouter()
 
@@ -27,3 +29,15 @@ async def health_check_db(db: AsyncSession = Depends(get_db)) -> dict[str, str]:
         return {"status": "ok", "message": "API and database are running"}
     except Exception as e:
         return {"status": "error", "message": f"Database connection failed: {str(e)}"}
+
+
+@router.get("/health/password-hasher")
+async def health_check_password_hasher() -> dict[str, int]:
+    """Queue depth and counters of the password hashing pool."""
+    return password_hasher.stats()
+
+
+@router.get("/health/token-cache")
+async def health_check_token_cache() -> dict[str, int]:
+    """Size and hit/miss counters of the verified token cache."""
+    return token_cache.stats()
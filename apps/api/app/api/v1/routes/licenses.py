@@ -9,7 +9,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.v1.deps import get_current_active_user, get_db, require_admin_or_func
-from app.db.models.user import User, UserRole
+from app.db.models.user import UserRole
 from app.db.repositories.client import ClientRepository
 from app.schemas.base import ResponseSchema
 from app.schemas.license import (
@@ -21,6 +21,7 @@ from app.schemas.license import (
     LicenseEventResponse,
 )
 from app.services.license import LicenseService
+from app.services.principal_cache import Principal
 
 router = APIRouter(prefix="/licenses", tags=["licenses"])
 
@@ -28,19 +29,23 @@ router = APIRouter(prefix="/licenses", tags=["licenses"])
 @router.get("", response_model=LicenseListResponse, status_code=status.HTTP_200_OK)
 async def list_licenses(
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
     query: Optional[str] = Query(None, description="Search by registration number or issuing authority"),
     license_type: Optional[str] = Query(None, description="Filter by license type"),
     status_filter: Optional[str] = Query(None, alias="status", description="Filter by status"),
     client_id: Optional[UUID] = Query(None, description="Filter by client ID"),
     page: int = Query(1, ge=1, description="Page number"),
     size: int = Query(10, ge=1, le=100, description="Page size"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor (replaces page)"),
+    with_total: bool = Query(True, description="Count all matching rows; false skips the count"),
 ) -> LicenseListResponse:
     """
     List all licenses with filters and pagination.
 
     - Admin/Func: Can see all licenses
     - Client: Can only see their own licenses
+
+    Follow next_cursor for deep pages; it avoids OFFSET scans.
     """
     from app.db.repositories.license import LicenseRepository
     from app.schemas.license import LicenseType, LicenseStatus
@@ -82,14 +87,19 @@ async def list_licenses(
 
     # List licenses
     skip = (page - 1) * size
-    licenses, total = await repo.list_with_filters(
-        query=query,
-        license_type=license_type_enum,
-        status=status_enum,
-        client_id=client_id,
-        skip=skip,
-        limit=size,
-    )
+    try:
+        licenses, total = await repo.list_with_filters(
+            query=query,
+            license_type=license_type_enum,
+            status=status_enum,
+            client_id=client_id,
+            skip=skip,
+            limit=size,
+            cursor=cursor,
+            with_total=with_total,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
     # Convert to response
     items = [service._to_response(lic) for lic in licenses]
@@ -99,7 +109,8 @@ async def list_licenses(
         total=total,
         page=page,
         size=size,
-        pages=(total + size - 1) // size if total > 0 else 0,
+        pages=None if total is None else (total + size - 1) // size if total > 0 else 0,
+        next_cursor=repo.next_cursor(licenses, size),
     )
 
 
@@ -107,7 +118,7 @@ async def list_licenses(
 async def create_license(
     license_data: LicenseCreate,
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: User = Depends(require_admin_or_func()),
+    current_user: Principal = Depends(require_admin_or_func()),
 ) -> LicenseResponse:
     """
     Create a new license (admin or func only).
@@ -120,7 +131,7 @@ async def create_license(
 async def get_license(
     license_id: UUID,
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
 ) -> LicenseResponse:
     """
     Get license by ID.
@@ -158,7 +169,7 @@ async def update_license(
     license_id: UUID,
     license_data: LicenseUpdate,
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: User = Depends(require_admin_or_func()),
+    current_user: Principal = Depends(require_admin_or_func()),
 ) -> LicenseResponse:
     """
     Update a license (admin or func only).
@@ -171,7 +182,7 @@ async def update_license(
 async def delete_license(
     license_id: UUID,
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: User = Depends(require_admin_or_func()),
+    current_user: Principal = Depends(require_admin_or_func()),
 ) -> ResponseSchema:
     """
     Delete a license (admin or func only).
@@ -186,7 +197,7 @@ async def renew_license(
     license_id: UUID,
     renewal_data: LicenseRenewal,
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: User = Depends(require_admin_or_func()),
+    current_user: Principal = Depends(require_admin_or_func()),
 ) -> LicenseResponse:
     """
     Renew a license (admin or func only).
@@ -199,7 +210,7 @@ async def renew_license(
 async def get_license_events(
     license_id: UUID,
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
 ) -> list[LicenseEventResponse]:
     """
     Get all events for a license.
@@ -247,7 +258,7 @@ async def get_license_events(
 @router.post("/check-expirations", response_model=dict, status_code=status.HTTP_200_OK)
 async def check_expirations(
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: User = Depends(require_admin_or_func()),
+    current_user: Principal = Depends(require_admin_or_func()),
 ) -> dict:
     """
     Manually trigger license expiration check (admin or func only).
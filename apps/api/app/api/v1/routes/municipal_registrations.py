@@ -9,7 +9,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.v1.deps import get_current_active_user, get_db, require_admin_or_func
-from app.db.models.user import User, UserRole
+from app.db.models.user import UserRole
 from app.db.repositories.municipal_registration import MunicipalRegistrationRepository
 from app.db.repositories.client import ClientRepository
 from app.schemas.base import ResponseSchema
@@ -21,6 +21,7 @@ from app.schemas.municipal_registration import (
 )
 from app.db.models.municipal_registration import MunicipalRegistration
 from app.schemas.municipal_registration import MunicipalRegistrationStatus
+from app.services.principal_cache import Principal
 
 router = APIRouter(prefix="/municipal-registrations", tags=["municipal-registrations"])
 
@@ -28,7 +29,7 @@ router = APIRouter(prefix="/municipal-registrations", tags=["municipal-registrat
 @router.get("", response_model=MunicipalRegistrationListResponse, status_code=status.HTTP_200_OK)
 async def list_municipal_registrations(
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
     client_id: Optional[UUID] = Query(None, description="Filter by client ID"),
     state: Optional[str] = Query(None, description="Filter by state (UF)"),
     status_filter: Optional[str] = Query(None, alias="status", description="Filter by status"),
@@ -117,7 +118,7 @@ async def list_municipal_registrations(
 async def create_municipal_registration(
     registration_data: MunicipalRegistrationCreate,
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: User = Depends(require_admin_or_func()),
+    current_user: Principal = Depends(require_admin_or_func()),
 ) -> MunicipalRegistrationResponse:
     """
     Create a new municipal registration (admin or func only).
@@ -170,7 +171,7 @@ async def update_municipal_registration(
     registration_id: UUID,
     registration_data: MunicipalRegistrationUpdate,
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: User = Depends(require_admin_or_func()),
+    current_user: Principal = Depends(require_admin_or_func()),
 ) -> MunicipalRegistrationResponse:
     """
     Update a municipal registration (admin or func only).
@@ -5,10 +5,11 @@ from typing import Annotated, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, File, Form, HTTPException, Query, UploadFile, status
+from sqlalchemy import inspect
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.v1.deps import get_current_active_user, get_db
-from app.db.models.user import User, UserRole
+from app.db.models.user import UserRole
 from app.db.models.obligation import ObligationStatus
 from app.db.repositories.obligation import ObligationRepository
 from app.db.repositories.obligation_event import ObligationEventRepository
@@ -20,27 +21,36 @@ from app.schemas.obligation import (
     ObligationEventResponse,
     ObligationGenerateRequest,
     ObligationGenerateResponse,
+    ObligationGenerationPreviewItem,
     ObligationReceiptRequest,
     ObligationUpdateDueDateRequest,
     ObligationCancelRequest,
 )
 from app.services.obligation.processor import ObligationProcessor
 from app.services.obligation.generator import ObligationGenerator
+from app.services.obligation_type_catalog import obligation_type_catalog
 from app.websockets.manager import manager as websocket_manager
+from app.services.principal_cache import Principal
 
 router = APIRouter()
 
 
 def _obligation_to_response(obligation) -> ObligationResponse:
     """Convert Obligation model to ObligationResponse schema."""
+    # Type name/code come from the catalog; fall back to the relationship
+    # only if it was eager-loaded (e.g. a type created after the last refresh)
+    obligation_type = obligation_type_catalog.get_by_id(obligation.obligation_type_id)
+    if obligation_type is None and "obligation_type" not in inspect(obligation).unloaded:
+        obligation_type = obligation.obligation_type
+
     ob_dict = {
         "id": obligation.id,
         "client_id": obligation.client_id,
         "client_name": obligation.client.razao_social if obligation.client else "",
         "client_cnpj": obligation.client.cnpj if obligation.client else "",
         "obligation_type_id": obligation.obligation_type_id,
-        "obligation_type_name": obligation.obligation_type.name if obligation.obligation_type else "",
-        "obligation_type_code": obligation.obligation_type.code if obligation.obligation_type else "",
+        "obligation_type_name": obligation_type.name if obligation_type else "",
+        "obligation_type_code": obligation_type.code if obligation_type else "",
         "due_date": obligation.due_date,
         "status": obligation.status,
         "priority": obligation.priority,
@@ -57,19 +67,23 @@ def _obligation_to_response(obligation) -> ObligationResponse:
 @router.get("", response_model=ObligationListResponse)
 async def list_obligations(
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
     client_id: Optional[UUID] = Query(None),
-    status: Optional[ObligationStatus] = Query(None),
+    status_filter: Optional[ObligationStatus] = Query(None, alias="status"),
     year: Optional[int] = Query(None),
     month: Optional[int] = Query(None),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor (replaces skip)"),
+    with_total: bool = Query(True, description="Count all matching rows; false skips the count"),
 ):
     """
     List obligations with filters.
 
     - Admin/Func: Can see all obligations (client_id optional)
     - Client: Can only see their own obligations
+
+    Follow next_cursor for deep pages; it avoids OFFSET scans.
     """
     repo = ObligationRepository(db)
 
@@ -86,14 +100,24 @@ async def list_obligations(
         client_id = client.id
     # Admin/Func can see all obligations if client_id is not provided
 
-    obligations, total = await repo.list_by_client(
-        client_id=client_id,
-        status=status,
-        year=year,
-        month=month,
-        skip=skip,
-        limit=limit,
-    )
+    catalog = await obligation_type_catalog.get(db)
+    try:
+        obligations, total = await repo.list_by_client(
+            client_id=client_id,
+            status=status_filter,
+            year=year,
+            month=month,
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
+            with_total=with_total,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    # Types seeded since the last refresh (e.g. by the seed script) force a reload
+    if any(ob.obligation_type_id not in catalog.by_id for ob in obligations):
+        await obligation_type_catalog.refresh(db)
 
     # Convert to response format with client info
     items = [_obligation_to_response(ob) for ob in obligations]
@@ -103,6 +127,7 @@ async def list_obligations(
         "total": total,
         "skip": skip,
         "limit": limit,
+        "next_cursor": repo.next_cursor(obligations, limit),
     }
 
 
@@ -110,7 +135,7 @@ async def list_obligations(
 async def get_obligation(
     obligation_id: UUID,
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
 ):
     """Get obligation by ID."""
     repo = ObligationRepository(db)
@@ -139,7 +164,7 @@ async def get_obligation(
 async def generate_obligations(
     request: ObligationGenerateRequest,
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
 ):
     """
     Generate obligations for a specific month.
@@ -193,11 +218,38 @@ async def generate_obligations(
         }
 
 
+@router.get("/generate/preview", response_model=list[ObligationGenerationPreviewItem])
+async def preview_obligation_generation(
+    db: Annotated[AsyncSession, Depends(get_db)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
+    year: int = Query(..., ge=2000, le=2100),
+    month: int = Query(..., ge=1, le=12),
+    client_id: Optional[UUID] = Query(None),
+):
+    """
+    Preview obligation generation for a month, per obligation type.
+
+    Admin/Func only.
+    """
+    if current_user.role not in [UserRole.ADMIN, UserRole.FUNC]:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only admin/func can generate obligations",
+        )
+
+    generator = ObligationGenerator(db)
+    return await generator.get_generation_preview(
+        year=year,
+        month=month,
+        client_id=client_id,
+    )
+
+
 @router.post("/{obligation_id}/receipt", response_model=ObligationResponse)
 async def upload_receipt(
     obligation_id: UUID,
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
     file: Annotated[UploadFile, File()],
     notes: Annotated[Optional[str], Form()] = None,
 ):
@@ -266,7 +318,7 @@ async def update_due_date(
     obligation_id: UUID,
     request: ObligationUpdateDueDateRequest,
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
 ):
     """
     Update obligation due date.
@@ -298,7 +350,7 @@ async def cancel_obligation(
     obligation_id: UUID,
     request: ObligationCancelRequest,
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
 ):
     """
     Cancel an obligation.
@@ -328,7 +380,7 @@ async def cancel_obligation(
 async def reopen_obligation(
     obligation_id: UUID,
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
     notes: Optional[str] = None,
 ):
     """
@@ -359,7 +411,7 @@ async def reopen_obligation(
 async def get_obligation_events(
     obligation_id: UUID,
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
 ):
@@ -398,7 +450,7 @@ async def get_obligation_events(
 @router.get("/upcoming/pending", response_model=list[ObligationResponse])
 async def get_upcoming_obligations(
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
     days_ahead: int = Query(7, ge=1, le=90),
 ):
     """
@@ -433,7 +485,7 @@ async def get_upcoming_obligations(
 @router.get("/overdue/list", response_model=list[ObligationResponse])
 async def get_overdue_obligations(
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
 ):
     """
     Get all overdue obligations.
@@ -467,7 +519,7 @@ async def get_overdue_obligations(
 @router.get("/templates/list", response_model=list[dict])
 async def get_obligation_templates(
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
     servico_contratado: Optional[str] = Query(None, description="Filter by service type"),
 ):
     """
@@ -511,7 +563,7 @@ async def get_obligation_templates(
 @router.get("/matrix", response_model=list[dict])
 async def get_obligations_matrix(
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
     month: int = Query(..., ge=1, le=12, description="Month"),
     year: int = Query(..., ge=2020, le=2100, description="Year"),
     search: Optional[str] = Query(None, description="Search by company name"),
@@ -597,7 +649,7 @@ async def get_obligations_matrix(
 @router.post("/{obligation_id}/complete", response_model=ObligationResponse)
 async def complete_obligation(
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
     obligation_id: UUID,
 ):
     """
@@ -652,7 +704,7 @@ async def complete_obligation(
 @router.post("/{obligation_id}/undo", response_model=ObligationResponse)
 async def undo_obligation(
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
     obligation_id: UUID,
 ):
     """
@@ -670,7 +722,7 @@ async def undo_obligation(
 @router.get("/list", response_model=list[dict])
 async def list_obligations_simple(
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
     month: int = Query(..., ge=1, le=12, description="Month"),
     year: int = Query(..., ge=2020, le=2100, description="Year"),
     search: Optional[str] = Query(None, description="Search by company name"),
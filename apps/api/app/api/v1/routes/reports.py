@@ -1,70 +1,49 @@
 """Report API routes."""
 
-from datetime import datetime, timedelta
+import asyncio
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
 from typing import Annotated, Any, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.v1.deps import get_current_active_user, get_db
-from app.db.models.report import ReportFormat, ReportType, ReportType as DBReportType
-from app.db.models.user import User, UserRole
-from app.db.repositories.report import ReportRepository
+from app.core.config import settings
+from app.core.database import db_manager
+from app.db.models.report import ReportFormat, ReportHistory, ReportSchedule, ReportStatus, ReportType, ReportType as DBReportType
+from app.db.models.user import UserRole
+from app.db.repositories.report import ReportRepository, ReportScheduleRepository
 from app.schemas.report import (
     ReportCustomization,
     ReportExportRequest,
+    ReportExportResponse,
     ReportFilterRequest,
     ReportHistoryListResponse,
+    ReportHistoryResponse,
     ReportPreviewRequest,
     ReportPreviewResponse,
+    ReportScheduleCreate,
+    ReportScheduleResponse,
+    ReportScheduleUpdate,
     ReportTemplateCreate,
     ReportTemplateResponse,
     ReportTemplateUpdate,
     ReportTypesListResponse,
 )
-from app.services.report.audit_report import AuditReportService
-from app.services.report.cash_book_report import CashBookReportService
-from app.services.report.cash_flow_projection_report import CashFlowProjectionReportService
-from app.services.report.cash_flow_report import CashFlowReportService
-from app.services.report.client_report import ClientReportService
-from app.services.report.dre_report import DREReportService
-from app.services.report.expenses_by_category_report import ExpensesByCategoryReportService
+from app.services.report import get_report_service
+from app.services.report.base import StreamingReportService
+from app.services.report.cache import report_cache_key, report_result_cache
+from app.services.report.export_jobs import ReportExportJob, csv_metadata, report_job_queue
 from app.services.report.exporters.csv_exporter import CSVExporter
-from app.services.report.exporters.pdf_exporter import PDFExporter
-from app.services.report.kpi_report import KPIReportService
-from app.services.report.license_report import LicenseReportService
-from app.services.report.obligation_report import ObligationReportService
-from app.services.report.revenue_by_client_report import RevenueByClientReportService
+from app.services.report.scheduler import ReportScheduleService
+from app.services.principal_cache import Principal
 
 router = APIRouter()
 
 
-# Report type factory
-def get_report_service(report_type: ReportType, db: AsyncSession):
-    """Factory to get the appropriate report service."""
-    services = {
-        ReportType.DRE: DREReportService,
-        ReportType.FLUXO_CAIXA: CashFlowReportService,
-        ReportType.LIVRO_CAIXA: CashBookReportService,
-        ReportType.RECEITAS_CLIENTE: RevenueByClientReportService,
-        ReportType.DESPESAS_CATEGORIA: ExpensesByCategoryReportService,
-        ReportType.PROJECAO_FLUXO: CashFlowProjectionReportService,
-        ReportType.KPIS: KPIReportService,
-        ReportType.CLIENTES: ClientReportService,
-        ReportType.OBRIGACOES: ObligationReportService,
-        ReportType.LICENCAS: LicenseReportService,
-        ReportType.AUDITORIA: AuditReportService,
-    }
-
-    service_class = services.get(report_type)
-    if not service_class:
-        raise ValueError(f"Unknown report type: {report_type}")
-
-    return service_class(db)
-
-
 @router.get("/types", response_model=ReportTypesListResponse)
 async def list_report_types():
     """List all available report types with metadata."""
@@ -176,7 +155,7 @@ async def list_report_types():
 @router.get("/templates", response_model=list[ReportTemplateResponse])
 async def list_templates(
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
     include_system: bool = Query(True),
 ):
     """List available report templates."""
@@ -188,7 +167,7 @@ async def list_templates(
 @router.post("/templates", response_model=ReportTemplateResponse, status_code=status.HTTP_201_CREATED)
 async def create_template(
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
     template_data: ReportTemplateCreate,
 ):
     """Create a new report template."""
@@ -213,7 +192,7 @@ async def create_template(
 async def update_template(
     template_id: UUID,
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
     template_data: ReportTemplateUpdate,
 ):
     """Update a report template (only custom templates)."""
@@ -242,7 +221,7 @@ async def update_template(
 async def delete_template(
     template_id: UUID,
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
 ):
     """Delete a report template (only custom templates)."""
     repo = ReportRepository(db)
@@ -262,10 +241,96 @@ async def delete_template(
     return None
 
 
+@router.get("/schedules", response_model=list[ReportScheduleResponse])
+async def list_schedules(
+    db: Annotated[AsyncSession, Depends(get_db)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
+):
+    """List the current user's report schedules."""
+    repo = ReportScheduleRepository(db)
+    return await repo.get_user_schedules(current_user.id)
+
+
+@router.post("/schedules", response_model=ReportScheduleResponse, status_code=status.HTTP_201_CREATED)
+async def create_schedule(
+    db: Annotated[AsyncSession, Depends(get_db)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
+    schedule_data: ReportScheduleCreate,
+):
+    """Schedule a template's report to be generated on a cron cadence."""
+    if current_user.role == UserRole.CLIENTE:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN, detail="Client users cannot schedule reports"
+        )
+
+    template = await ReportRepository(db).get_by_id(schedule_data.template_id)
+    if not template or not (template.is_system or template.created_by_id == current_user.id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Template not found"
+        )
+
+    service = ReportScheduleService(db)
+    try:
+        schedule = ReportSchedule(
+            name=schedule_data.name,
+            template_id=template.id,
+            created_by_id=current_user.id,
+            cron=schedule_data.cron,
+            period=schedule_data.period,
+            format=schedule_data.format,
+            recipients=await service.validate_recipients(schedule_data.recipients),
+            is_active=schedule_data.is_active,
+        )
+        service.schedule_next_run(schedule, template, datetime.now(timezone.utc))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    return await service.repository.create(schedule)
+
+
+@router.put("/schedules/{schedule_id}", response_model=ReportScheduleResponse)
+async def update_schedule(
+    schedule_id: UUID,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
+    schedule_data: ReportScheduleUpdate,
+):
+    """Update a report schedule."""
+    service = ReportScheduleService(db)
+    schedule = await _get_owned_schedule(service.repository, schedule_id, current_user)
+    template = await ReportRepository(db).get_by_id(schedule.template_id)
+
+    changes = schedule_data.model_dump(exclude_unset=True)
+    try:
+        if "recipients" in changes:
+            changes["recipients"] = await service.validate_recipients(changes["recipients"] or [])
+        for key, value in changes.items():
+            setattr(schedule, key, value)
+        if changes.keys() & {"cron", "period", "is_active"}:
+            service.schedule_next_run(schedule, template, datetime.now(timezone.utc))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    return await service.repository.update(schedule)
+
+
+@router.delete("/schedules/{schedule_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_schedule(
+    schedule_id: UUID,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
+):
+    """Delete a report schedule."""
+    repo = ReportScheduleRepository(db)
+    await _get_owned_schedule(repo, schedule_id, current_user)
+    await repo.delete(schedule_id)
+    return None
+
+
 @router.post("/preview", response_model=ReportPreviewResponse)
 async def preview_report(
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
     request: ReportPreviewRequest,
 ):
     """Generate a preview of the report."""
@@ -280,9 +345,14 @@ async def preview_report(
 
     # Get appropriate service
     service = get_report_service(request.report_type, db)
+    filters = request.filters.model_dump()
 
-    # Generate preview
-    preview_data = await service.preview(request.filters.model_dump())
+    # Generate preview, reusing data computed for the same filters and data version
+    report_data = await report_result_cache.get_or_compute(
+        await report_cache_key(db, request.report_type, filters),
+        lambda: service.generate_data(filters),
+    )
+    preview_data = service.build_preview(filters, report_data)
 
     return ReportPreviewResponse(
         report_type=request.report_type,
@@ -294,13 +364,22 @@ async def preview_report(
     )
 
 
-@router.post("/export")
+@router.post(
+    "/export", response_model=ReportExportResponse, status_code=status.HTTP_202_ACCEPTED
+)
 async def export_report(
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
     request: ReportExportRequest,
+    response: Response,
 ):
-    """Export report in the specified format."""
+    """
+    Export report in the specified format.
+
+    The export is queued and returned as pending; the user is notified over
+    WebSocket when the file is ready. A file already rendered from the same
+    report result is reused and returned as completed right away.
+    """
     # Apply RBAC filter for clients
     if current_user.role == UserRole.CLIENTE:
         from app.db.repositories.client import ClientRepository
@@ -310,69 +389,160 @@ async def export_report(
         if client:
             request.filters.client_ids = [client.id]
 
-    # Get appropriate service
-    service = get_report_service(request.report_type, db)
+    filename = request.filename or f"report_{request.report_type}_{datetime.now().isoformat()}"
+    filters = request.filters.model_dump()
+    cache_key = await report_cache_key(db, request.report_type, filters)
+    repo = ReportRepository(db)
 
-    # Generate data
-    report_data = await service.generate_data(request.filters.model_dump())
-
-    # Export based on format
-    if request.format == ReportFormat.PDF:
-        exporter = PDFExporter()
-        # Prepare data for PDF export
-        pdf_data = {
-            "title": f"{request.report_type.replace('_', ' ').title()} Report",
-            "period": f"{request.filters.period_start} a {request.filters.period_end}",
-            "summary": report_data.get("summary", {}),
-            "table_data": _prepare_table_data(report_data),
-        }
-        file_bytes, file_path = await exporter.export(
-            pdf_data, request.filename or f"report_{request.report_type}_{datetime.now().isoformat()}"
+    # Reuse a file rendered from the same report result, as long as a cached
+    # result would be: statistics lag writes slightly and miss TRUNCATE
+    rendered = await repo.get_rendered_export(
+        cache_key,
+        request.format,
+        rendered_after=datetime.utcnow() - timedelta(seconds=settings.REPORT_CACHE_TTL_SECONDS),
+    )
+    if rendered and Path(rendered.file_path).is_file():
+        history = await repo.save_template_history(
+            user_id=current_user.id,
+            report_type=request.report_type,
+            filters_used=request.filters.model_dump(mode="json"),
+            format=request.format,
+            file_path=rendered.file_path,
+            file_size=rendered.file_size,
+            expires_at=rendered.expires_at,
+            cache_key=cache_key,
         )
-    else:  # CSV
-        exporter = CSVExporter()
-        csv_data = {
-            "title": request.report_type.replace("_", " ").title(),
-            "period": f"{request.filters.period_start} a {request.filters.period_end}",
-            "summary": report_data,
-            "table_data": _prepare_csv_table_data(report_data),
-        }
-        file_bytes, file_path = await exporter.export(
-            csv_data, request.filename or f"report_{request.report_type}_{datetime.now().isoformat()}"
+        response.status_code = status.HTTP_200_OK
+        return _export_response(history)
+
+    if report_job_queue.is_full():
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many reports being generated, try again later",
         )
 
-    # Save to history
-    repo = ReportRepository(db)
     history = await repo.save_template_history(
         user_id=current_user.id,
         report_type=request.report_type,
-        filters_used=request.filters.model_dump(),
+        filters_used=request.filters.model_dump(mode="json"),
         format=request.format,
-        file_path=str(file_path),
-        file_size=len(file_bytes),
+        status=ReportStatus.PENDING,
+        cache_key=cache_key,
     )
+    # The worker reads the row from its own session
+    await db.commit()
+
+    try:
+        report_job_queue.submit(
+            ReportExportJob(
+                report_id=history.id,
+                user_id=current_user.id,
+                report_type=request.report_type,
+                format=request.format,
+                filters=filters,
+                filename=filename,
+                cache_key=cache_key,
+            )
+        )
+    except asyncio.QueueFull:
+        history.status = ReportStatus.FAILED
+        history.cache_key = None
+        await db.commit()
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many reports being generated, try again later",
+        )
 
-    # Return download info
-    return {
-        "report_id": history.id,
-        "file_url": f"/api/v1/reports/download/{history.id}",
-        "file_name": file_path.name,
-        "file_size": len(file_bytes),
-        "format": request.format,
-        "generated_at": history.generated_at,
-        "expires_at": history.expires_at,
-    }
+    return _export_response(history)
+
+
+@router.get("/status/{report_id}", response_model=ReportHistoryResponse)
+async def get_report_status(
+    report_id: UUID,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
+):
+    """Get the status of an export (pending, completed or failed)."""
+    repo = ReportRepository(db)
+    history = await repo.get_history_record(report_id)
+
+    if not history:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Report not found"
+        )
+
+    # Check ownership
+    if history.user_id != current_user.id and current_user.role != UserRole.ADMIN:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN, detail="Access denied"
+        )
+
+    return history
+
+
+@router.post("/export/stream")
+async def stream_report_export(
+    db: Annotated[AsyncSession, Depends(get_db)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
+    request: ReportExportRequest,
+):
+    """
+    Stream a CSV export directly in the response.
+
+    Only available for report types that stream their rows; nothing is
+    written to disk or saved to history.
+    """
+    if request.format != ReportFormat.CSV:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Only CSV exports can be streamed",
+        )
+
+    # Apply RBAC filter for clients
+    if current_user.role == UserRole.CLIENTE:
+        from app.db.repositories.client import ClientRepository
+
+        client_repo = ClientRepository(db)
+        client = await client_repo.get_by_user_id(current_user.id)
+        if client:
+            request.filters.client_ids = [client.id]
+
+    if not isinstance(get_report_service(request.report_type, db), StreamingReportService):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Report type {request.report_type} does not support streaming export",
+        )
+
+    filters = request.filters.model_dump()
+    metadata = csv_metadata(request.report_type, filters)
+    filename = request.filename or f"report_{request.report_type}_{datetime.now().isoformat()}"
+    if not filename.endswith(".csv"):
+        filename += ".csv"
+
+    async def content():
+        # The request session is closed before the body is sent, so the
+        # cursor needs a session of its own
+        async with db_manager.session_factory() as session:
+            service = get_report_service(request.report_type, session)
+            async for chunk in CSVExporter().iter_csv(metadata, service.iter_export_rows(filters)):
+                yield chunk
+
+    return StreamingResponse(
+        content(),
+        media_type="text/csv",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
 
 
 @router.get("/download/{report_id}")
 async def download_report(
     report_id: UUID,
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
 ):
     """Download a previously generated report."""
     repo = ReportRepository(db)
-    history = await repo.get_by_id(report_id)
+    history = await repo.get_history_record(report_id)
 
     if not history:
         raise HTTPException(
@@ -385,6 +555,16 @@ async def download_report(
             status_code=status.HTTP_403_FORBIDDEN, detail="Access denied"
         )
 
+    if history.status == ReportStatus.PENDING:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT, detail="Report is still being generated"
+        )
+
+    if history.status == ReportStatus.FAILED:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Report generation failed"
+        )
+
     # Check if expired
     if history.expires_at and history.expires_at < datetime.utcnow():
         raise HTTPException(
@@ -396,6 +576,16 @@ async def download_report(
             status_code=status.HTTP_404_NOT_FOUND, detail="File not found"
         )
 
+    # The janitor may have evicted the file to stay within the storage quota
+    if not Path(history.file_path).is_file():
+        raise HTTPException(
+            status_code=status.HTTP_410_GONE, detail="Report file is no longer available"
+        )
+
+    # Download recency keeps the file from quota eviction
+    await repo.mark_downloaded(history.id)
+    await db.commit()
+
     # Return file
     return FileResponse(
         history.file_path,
@@ -407,7 +597,7 @@ async def download_report(
 @router.get("/history", response_model=ReportHistoryListResponse)
 async def get_history(
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_active_user)],
     report_type: Optional[ReportType] = Query(None),
     format: Optional[ReportFormat] = Query(None),
     page: int = Query(1, ge=1),
@@ -435,44 +625,34 @@ async def get_history(
     }
 
 
-def _prepare_table_data(report_data: dict) -> list[list[str]]:
-    """Convert report data to table format for PDF."""
-    table_data = []
-
-    # Handle different report structures
-    if "receitas" in report_data and "despesas" in report_data:
-        # DRE format
-        table_data.append(["Categoria", "Valor", "%"])
-        for item in report_data.get("receitas", []):
-            table_data.append([
-                item.get("categoria", ""),
-                f"R$ {item.get('valor', 0):,.2f}",
-                f"{item.get('percentual', 0):.2f}%",
-            ])
-    elif "periods" in report_data:
-        # Cash flow / projection format
-        table_data.append(["Período", "Entradas", "Saídas", "Saldo"])
-        for item in report_data.get("periods", []):
-            table_data.append([
-                item.get("periodo", ""),
-                f"R$ {item.get('entradas', 0):,.2f}",
-                f"R$ {item.get('saidas', 0):,.2f}",
-                f"R$ {item.get('saldo_final', 0):,.2f}",
-            ])
-    elif "clients" in report_data:
-        # Revenue by client
-        table_data.append(["Cliente", "Receita", "%"])
-        for item in report_data.get("clients", []):
-            table_data.append([
-                item.get("client_name", ""),
-                f"R$ {item.get('total_receita', 0):,.2f}",
-                f"{item.get('percentual_total', 0):.2f}%",
-            ])
-
-    return table_data
-
-
-def _prepare_csv_table_data(report_data: dict) -> list[list[str]]:
-    """Convert report data to CSV table format."""
-    return _prepare_table_data(report_data)
+async def _get_owned_schedule(
+    repo: ReportScheduleRepository, schedule_id: UUID, current_user: Principal
+) -> ReportSchedule:
+    """Get a schedule the current user may manage, or raise 404/403."""
+    schedule = await repo.get_by_id(schedule_id)
+
+    if not schedule:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Schedule not found"
+        )
+
+    if schedule.created_by_id != current_user.id and current_user.role != UserRole.ADMIN:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN, detail="Access denied"
+        )
+
+    return schedule
 
+
+def _export_response(history: ReportHistory) -> dict[str, Any]:
+    """Export response for a report history record."""
+    return {
+        "report_id": history.id,
+        "status": history.status,
+        "file_url": f"/api/v1/reports/download/{history.id}",
+        "file_name": Path(history.file_path).name if history.file_path else None,
+        "file_size": history.file_size,
+        "format": history.format,
+        "generated_at": history.generated_at,
+        "expires_at": history.expires_at,
+    }
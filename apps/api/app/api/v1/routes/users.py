@@ -10,10 +10,12 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.v1.deps import (
     get_current_active_user,
+    get_current_user_model,
     get_db,
     require_admin,
     require_admin_or_func,
 )
+from app.core.passwords import password_hasher
 from app.db.models.user import User
 from app.db.repositories.user import UserRepository
 from app.schemas.base import ResponseSchema
@@ -26,6 +28,7 @@ from app.schemas.user import (
     UserUpdate,
     UserUpdatePassword,
 )
+from app.services.principal_cache import Principal, principal_cache
 from app.services.user import UserService
 
 router = APIRouter(prefix="/users", tags=["users"])
@@ -33,7 +36,7 @@ router = APIRouter(prefix="/users", tags=["users"])
 
 @router.get("/me", response_model=UserResponse, status_code=status.HTTP_200_OK)
 async def get_current_user_info(
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[User, Depends(get_current_user_model)],
 ) -> UserResponse:
     """
     Get current user information.
@@ -51,7 +54,7 @@ async def get_current_user_info(
 async def create_user(
     user_data: UserCreate,
     db: Annotated[AsyncSession, Depends(get_db)],
-    _: User = Depends(require_admin()),
+    _: Principal = Depends(require_admin()),
 ) -> UserResponse:
     """
     Create a new user (admin only).
@@ -84,7 +87,7 @@ async def create_user(
         is_active=True,
         is_verified=False,
     )
-    user.set_password(user_data.password)
+    user.password_hash = await password_hasher.hash(user_data.password)
 
     user = await user_repo.create(user)
     await db.commit()
@@ -97,7 +100,7 @@ async def create_user(
 async def get_user(
     user_id: UUID,
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: User = Depends(require_admin_or_func()),
+    current_user: Principal = Depends(require_admin_or_func()),
 ) -> UserResponse:
     """
     Get user by ID (admin or func only).
@@ -130,7 +133,7 @@ async def update_user(
     user_id: UUID,
     user_data: UserUpdate,
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
 ) -> UserResponse:
     """
     Update user (admin or self only).
@@ -196,6 +199,7 @@ async def update_user(
 
     user = await user_repo.update(user)
     await db.commit()
+    principal_cache.invalidate(user.id)
     await db.refresh(user)
 
     return UserResponse.model_validate(user)
@@ -205,7 +209,7 @@ async def update_user(
 async def update_own_password(
     password_data: UserUpdatePassword,
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: User = Depends(get_current_active_user),
+    current_user: User = Depends(get_current_user_model),
 ) -> ResponseSchema:
     """
     Update own password.
@@ -222,18 +226,19 @@ async def update_own_password(
         HTTPException: 401 if current password is incorrect
     """
     # Verify current password
-    if not current_user.verify_password(password_data.current_password):
+    if not await password_hasher.verify(password_data.current_password, current_user.password_hash):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Current password is incorrect"
         )
 
     # Set new password
-    current_user.set_password(password_data.new_password)
+    current_user.password_hash = await password_hasher.hash(password_data.new_password)
 
     user_repo = UserRepository(db)
     await user_repo.update(current_user)
     await db.commit()
+    principal_cache.invalidate(current_user.id)
 
     return ResponseSchema(
         success=True,
@@ -245,7 +250,7 @@ async def update_own_password(
 async def delete_user(
     user_id: UUID,
     db: Annotated[AsyncSession, Depends(get_db)],
-    _: User = Depends(require_admin()),
+    _: Principal = Depends(require_admin()),
 ) -> ResponseSchema:
     """
     Delete user (admin only).
@@ -273,6 +278,7 @@ async def delete_user(
         )
 
     await db.commit()
+    principal_cache.invalidate(user_id)
 
     return ResponseSchema(
         success=True,
@@ -283,7 +289,7 @@ async def delete_user(
 @router.get("", response_model=dict, status_code=status.HTTP_200_OK)
 async def list_users(
     db: Annotated[AsyncSession, Depends(get_db)],
-    _: User = Depends(require_admin()),
+    _: Principal = Depends(require_admin()),
     query: str | None = None,
     role: str | None = None,
     is_active: bool | None = None,
@@ -319,7 +325,7 @@ async def list_users(
 async def activate_user(
     user_id: UUID,
     db: Annotated[AsyncSession, Depends(get_db)],
-    _: User = Depends(require_admin()),
+    _: Principal = Depends(require_admin()),
 ) -> ResponseSchema:
     """
     Activate user (admin only).
@@ -348,7 +354,7 @@ async def activate_user(
 async def deactivate_user(
     user_id: UUID,
     db: Annotated[AsyncSession, Depends(get_db)],
-    _: User = Depends(require_admin()),
+    _: Principal = Depends(require_admin()),
 ) -> ResponseSchema:
     """
     Deactivate user (admin only).
@@ -378,7 +384,7 @@ async def reset_user_password(
     user_id: UUID,
     reset_data: UserResetPasswordRequest,
     db: Annotated[AsyncSession, Depends(get_db)],
-    _: User = Depends(require_admin()),
+    _: Principal = Depends(require_admin()),
 ) -> UserResetPasswordResponse:
     """
     Reset user password (admin only).
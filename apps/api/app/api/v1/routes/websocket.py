@@ -8,6 +8,7 @@ from typing import Optional
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, status
 
 from app.core.security import decode_token
+from app.services.refresh_tokens import refresh_token_store
 from app.websockets.events import WebSocketEventBuilder
 from app.websockets.manager import manager
 
@@ -53,8 +54,8 @@ async def websocket_endpoint(
             user_id = payload.get("sub")
             role = payload.get("role", "cliente")
 
-            if not user_id:
-                logger.warning("WebSocket connection rejected: invalid token (no sub)")
+            if not user_id or refresh_token_store.is_revoked(payload.get("fam")):
+                logger.warning("WebSocket connection rejected: invalid or revoked token")
                 await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
                 return
 
@@ -116,7 +117,7 @@ async def websocket_endpoint(
 @router.get("/ws/stats")
 async def websocket_stats():
     """
-    Get WebSocket connection statistics.
+    Get WebSocket connection statistics of this worker process.
     Requires admin role (should add dependency).
 
     Returns:
@@ -55,6 +55,21 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    REFRESH_TOKEN_REUSE_GRACE_SECONDS: int = 10  # Concurrent refreshes from several tabs
+    REFRESH_TOKEN_REVOCATION_SYNC_SECONDS: int = 5  # How fast other workers honour a logout
+    BCRYPT_ROUNDS: int = 12  # Existing hashes are upgraded on the next login
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_QUEUE_SIZE: int = 32  # Waiting hashes beyond this get a 503
+    # Fernet keys for sensitive fields, newest first; the SECRET_KEY-derived key stays last
+    FIELD_ENCRYPTION_KEYS: str | list[str] = ""
+
+    @field_validator("FIELD_ENCRYPTION_KEYS", mode="after")
+    @classmethod
+    def assemble_field_encryption_keys(cls, v: str | list[str]) -> list[str]:
+        """Parse field encryption keys from a comma-separated string or list."""
+        if isinstance(v, str):
+            return [i.strip() for i in v.split(",") if i.strip()]
+        return v
 
     # CORS
     CORS_ORIGINS: str | list[str] = "http://localhost:3000,http://localhost"
@@ -67,6 +82,10 @@ class Settings(BaseSettings):
             return [i.strip() for i in v.split(",")]
         return v
 
+    # WebSockets
+    WEBSOCKET_BACKPLANE: str = "postgres"  # "postgres" fans events out across workers, "memory" for a single worker
+    WEBSOCKET_BACKPLANE_CHANNEL: str = "websocket_events"
+
     # Logging
     LOG_LEVEL: str = "INFO"
 
@@ -74,6 +93,29 @@ class Settings(BaseSettings):
     MAX_UPLOAD_SIZE: int = 10485760  # 10MB
     UPLOAD_DIR: str = "/var/uploads"
 
+    # Reports
+    PDF_RENDER_MAX_WORKERS: int = 2
+    REPORT_JOB_WORKERS: int = 2
+    REPORT_JOB_QUEUE_SIZE: int = 100
+    REPORT_JOB_TIMEOUT_SECONDS: int = 1800
+    REPORT_SCHEDULE_TIMEZONE: str = "America/Sao_Paulo"
+    REPORT_SCHEDULE_POLL_SECONDS: int = 60
+    REPORT_SCHEDULE_BATCH_SIZE: int = 100
+    REPORT_SCHEDULE_SPREAD_MINUTES: int = 60  # Window distinct scheduled reports are spread over
+    REPORT_STORAGE_QUOTA_BYTES: int = 10 * 1024**3  # 0 disables the quota
+    REPORT_JANITOR_INTERVAL_SECONDS: int = 3600
+    REPORT_JANITOR_BATCH_SIZE: int = 500
+
+    # Caches
+    OBLIGATION_TYPE_CATALOG_CHECK_SECONDS: int = 30  # How often workers compare the catalog with the table
+    REPORT_CACHE_MAX_ENTRIES: int = 256
+    REPORT_CACHE_TTL_SECONDS: int = 300
+    REPORT_CACHE_DIR: str | None = None  # Optional on-disk tier
+    CLIENT_SEARCH_INDEX_CHECK_SECONDS: int = 30  # How often workers compare the index with the table
+    PRINCIPAL_CACHE_MAX_ENTRIES: int = 10000
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 30  # Bounds how long other workers see stale roles/status
+    TOKEN_CACHE_MAX_ENTRIES: int = 10000
+
 
 @lru_cache
 def get_settings() -> Settings:
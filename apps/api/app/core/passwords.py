@@ -0,0 +1,150 @@
+"""
+Async password hashing.
+
+bcrypt takes hundreds of milliseconds per hash by design, so request
+handlers hash and verify passwords on a small dedicated thread pool
+(bcrypt releases the GIL) instead of on the event loop. The pool admits a
+bounded number of operations; past that, callers are turned away with
+PasswordHasherBusy rather than queueing behind a login burst.
+"""
+
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Optional, TypeVar
+
+from app.core.config import settings
+from app.core.security import hash_password, password_needs_rehash, verify_password
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class PasswordHasherBusy(Exception):
+    """Raised when the password hashing queue is full."""
+
+
+class PasswordHasher:
+    """
+    Bounded thread pool for bcrypt.
+
+    At most ``workers`` hashes run at once per process and ``max_pending``
+    more wait for a thread; further calls raise PasswordHasherBusy.
+    """
+
+    def __init__(self, workers: int, max_pending: int):
+        self.workers = workers
+        self.max_pending = max_pending
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._in_flight = 0
+        self._peak_in_flight = 0
+        self._completed = 0
+        self._rejected = 0
+
+    async def hash(self, password: str) -> str:
+        """
+        Hash a password with the configured cost.
+
+        Args:
+            password: Plain text password
+
+        Returns:
+            Hashed password
+
+        Raises:
+            PasswordHasherBusy: If the queue is full
+        """
+        return await self._run(hash_password, password)
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        """
+        Verify a password against a hash.
+
+        Args:
+            password: Plain text password
+            hashed_password: Hashed password from database
+
+        Returns:
+            True if password matches, False otherwise
+
+        Raises:
+            PasswordHasherBusy: If the queue is full
+        """
+        return await self._run(verify_password, password, hashed_password)
+
+    async def verify_and_update(
+        self, password: str, hashed_password: str
+    ) -> tuple[bool, Optional[str]]:
+        """
+        Verify a password and rehash it if its cost is outdated.
+
+        Args:
+            password: Plain text password
+            hashed_password: Hashed password from database
+
+        Returns:
+            Tuple of (password matches, new hash to store or None)
+
+        Raises:
+            PasswordHasherBusy: If the queue is full
+        """
+        if not await self.verify(password, hashed_password):
+            return False, None
+        if not password_needs_rehash(hashed_password):
+            return True, None
+
+        try:
+            return True, await self.hash(password)
+        except PasswordHasherBusy:
+            # The login itself succeeded; rehash on a later one
+            return True, None
+
+    def stats(self) -> dict[str, int]:
+        """Queue depth and counters of the pool."""
+        return {
+            "workers": self.workers,
+            "max_pending": self.max_pending,
+            "in_flight": self._in_flight,
+            "queued": max(0, self._in_flight - self.workers),
+            "peak_in_flight": self._peak_in_flight,
+            "completed": self._completed,
+            "rejected": self._rejected,
+        }
+
+    def shutdown(self) -> None:
+        """Shut down the pool (application shutdown)."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.workers,
+                thread_name_prefix="password-hash",
+            )
+        return self._executor
+
+    async def _run(self, func: Callable[..., T], *args: Any) -> T:
+        if self._in_flight >= self.workers + self.max_pending:
+            self._rejected += 1
+            logger.warning(f"Password hashing queue full ({self._in_flight} in flight)")
+            raise PasswordHasherBusy("Too many password operations in progress")
+
+        self._in_flight += 1
+        self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), partial(func, *args))
+        finally:
+            self._in_flight -= 1
+            self._completed += 1
+
+
+# Process-wide password hasher
+password_hasher = PasswordHasher(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_QUEUE_SIZE,
+)
@@ -2,12 +2,18 @@
 Security utilities for password hashing, JWT tokens, and field encryption.
 """
 
+import asyncio
 import base64
+import hashlib
+import math
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
-from typing import Any, Optional
+from functools import lru_cache
+from typing import Any, Iterable, Optional, Sequence
 
 import bcrypt
-from cryptography.fernet import Fernet
+from cryptography.fernet import Fernet, MultiFernet
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 from jose import JWTError, jwt
@@ -17,7 +23,10 @@ from app.core.config import settings
 
 def hash_password(password: str) -> str:
     """
-    Hash a password using bcrypt.
+    Hash a password using bcrypt with the configured cost.
+
+    Blocks for the whole hash; async code should use
+    app.core.passwords.password_hasher instead.
 
     Args:
         password: Plain text password
@@ -25,7 +34,7 @@ def hash_password(password: str) -> str:
     Returns:
         Hashed password
     """
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
     return bcrypt.hashpw(password.encode('utf-8'), salt).decode('utf-8')
 
 
@@ -46,6 +55,23 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     )
 
 
+def password_needs_rehash(hashed_password: str) -> bool:
+    """
+    Check whether a hash was made with a cost other than the configured one.
+
+    Args:
+        hashed_password: Hashed password from database
+
+    Returns:
+        True if the password should be hashed again
+    """
+    # $2b$<cost>$<salt and hash>
+    parts = hashed_password.split("$")
+    if len(parts) < 4 or not parts[2].isdigit():
+        return True
+    return int(parts[2]) != settings.BCRYPT_ROUNDS
+
+
 def create_access_token(data: dict[str, Any], expires_delta: Optional[timedelta] = None) -> str:
     """
     Create a JWT access token.
@@ -96,10 +122,101 @@ def create_refresh_token(data: dict[str, Any], expires_delta: Optional[timedelta
     return encoded_jwt
 
 
+class VerifiedTokenCache:
+    """
+    Size-bounded LRU of verified JWT claims.
+
+    Entries are keyed by the SHA-256 of the whole token, so a cached
+    signature never vouches for a different header or payload, and expire
+    at the token's exp.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[bytes, tuple[float, dict[str, Any]]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, token: str) -> Optional[dict[str, Any]]:
+        """
+        Get the claims of an already verified token.
+
+        Args:
+            token: Encoded JWT
+
+        Returns:
+            Claims, or None if the token is not cached or has expired
+        """
+        key = self._key(token)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, claims = entry
+        if time.time() >= expires_at:
+            del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return claims
+
+    def set(self, token: str, claims: dict[str, Any]) -> None:
+        """
+        Cache the claims of a verified token until it expires.
+
+        Args:
+            token: Encoded JWT
+            claims: Its verified claims
+        """
+        if self.max_entries <= 0:
+            return
+
+        exp = claims.get("exp")
+        expires_at = float(exp) if isinstance(exp, (int, float)) else math.inf
+        key = self._key(token)
+        self._entries[key] = (expires_at, claims)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def stats(self) -> dict[str, int]:
+        """Size and hit/miss counters of the cache."""
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "expired": self.expired,
+        }
+
+    def clear(self) -> None:
+        """Drop every cached token."""
+        self._entries.clear()
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode('utf-8')).digest()
+
+
+# Process-wide cache of verified tokens
+token_cache = VerifiedTokenCache(max_entries=settings.TOKEN_CACHE_MAX_ENTRIES)
+
+
 def decode_token(token: str) -> dict[str, Any]:
     """
     Decode and validate a JWT token.
 
+    Tokens already verified by this process are answered from token_cache;
+    otherwise expired tokens are rejected before checking the signature.
+
     Args:
         token: JWT token to decode
 
@@ -109,28 +226,51 @@ def decode_token(token: str) -> dict[str, Any]:
     Raises:
         JWTError: If token is invalid or expired
     """
+    claims = token_cache.get(token)
+    if claims is not None:
+        # Callers may modify the payload; the cached claims must not change
+        return dict(claims)
+
     try:
+        exp = jwt.get_unverified_claims(token).get("exp")
+        if isinstance(exp, (int, float)) and time.time() >= exp:
+            token_cache.expired += 1
+            raise JWTError("Signature has expired.")
+
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        return payload
     except JWTError as e:
         raise JWTError(f"Invalid token: {str(e)}") from e
 
+    token_cache.set(token, payload)
+    return dict(payload)
+
 
-def create_tokens(user_id: str, role: str) -> dict[str, Any]:
+def create_tokens(
+    user_id: str,
+    role: str,
+    family_id: Optional[str] = None,
+    token_id: Optional[str] = None,
+) -> dict[str, Any]:
     """
     Create both access and refresh tokens for a user.
 
     Args:
         user_id: User ID to encode in tokens
         role: User role to encode in tokens
+        family_id: Optional token family (login session) of both tokens
+        token_id: Optional unique ID (jti) of the refresh token
 
     Returns:
         Dictionary with access_token, refresh_token, and expires_in
     """
     token_data = {"sub": user_id, "role": role}
+    if family_id:
+        token_data["fam"] = family_id
 
     access_token = create_access_token(token_data)
-    refresh_token = create_refresh_token(token_data)
+    refresh_token = create_refresh_token(
+        {**token_data, "jti": token_id} if token_id else token_data
+    )
 
     return {
         "access_token": access_token,
@@ -147,6 +287,9 @@ def _get_fernet_key() -> bytes:
     Derive a Fernet encryption key from the SECRET_KEY.
     Uses PBKDF2 with a fixed salt for deterministic key derivation.
 
+    Slow by design (100,000 iterations); use get_field_key_ring(), which
+    derives it once per process.
+
     Returns:
         32-byte Fernet-compatible encryption key
     """
@@ -163,6 +306,100 @@ def _get_fernet_key() -> bytes:
     return key
 
 
+class FieldKeyRing:
+    """
+    Fernet keys used to encrypt sensitive fields.
+
+    The first key encrypts; every key decrypts, so keys can be rotated by
+    prepending a new one and re-encrypting stored values with rotate().
+    """
+
+    def __init__(self, keys: Sequence[bytes]):
+        if not keys:
+            raise ValueError("At least one field encryption key is required")
+        self._fernet = MultiFernet([Fernet(key) for key in keys])
+
+    def encrypt(self, value: str | None) -> str | None:
+        """
+        Encrypt a value.
+
+        Args:
+            value: Plain text value
+
+        Returns:
+            Encrypted value, or None for None or empty values
+        """
+        if value is None or value == "":
+            return None
+        return self._fernet.encrypt(value.encode('utf-8')).decode('utf-8')
+
+    def decrypt(self, encrypted_value: str | None) -> str | None:
+        """
+        Decrypt a value.
+
+        Args:
+            encrypted_value: Encrypted value
+
+        Returns:
+            Plain text value, or None for None or empty values
+
+        Raises:
+            cryptography.fernet.InvalidToken: If no key can decrypt the value
+        """
+        if encrypted_value is None or encrypted_value == "":
+            return None
+        return self._fernet.decrypt(encrypted_value.encode('utf-8')).decode('utf-8')
+
+    def rotate(self, encrypted_value: str | None) -> str | None:
+        """
+        Re-encrypt a value with the primary key.
+
+        Args:
+            encrypted_value: Value encrypted with any key of the ring
+
+        Returns:
+            Value encrypted with the primary key, or None for None or empty values
+
+        Raises:
+            cryptography.fernet.InvalidToken: If no key can decrypt the value
+        """
+        if encrypted_value is None or encrypted_value == "":
+            return None
+        return self._fernet.rotate(encrypted_value.encode('utf-8')).decode('utf-8')
+
+    def encrypt_many(self, values: Iterable[str | None]) -> list[str | None]:
+        """Encrypt several values, keeping their order."""
+        return [self.encrypt(value) for value in values]
+
+    def decrypt_many(self, encrypted_values: Iterable[str | None]) -> list[str | None]:
+        """Decrypt several values, keeping their order."""
+        return [self.decrypt(value) for value in encrypted_values]
+
+    async def encrypt_many_async(self, values: Iterable[str | None]) -> list[str | None]:
+        """Encrypt several values on a worker thread."""
+        return await asyncio.to_thread(self.encrypt_many, list(values))
+
+    async def decrypt_many_async(self, encrypted_values: Iterable[str | None]) -> list[str | None]:
+        """Decrypt several values on a worker thread."""
+        return await asyncio.to_thread(self.decrypt_many, list(encrypted_values))
+
+
+@lru_cache
+def get_field_key_ring() -> FieldKeyRing:
+    """
+    Get the field key ring, deriving its keys on first use.
+
+    FIELD_ENCRYPTION_KEYS come first, newest first; the key derived from
+    SECRET_KEY is always kept last so existing values stay readable.
+
+    Returns:
+        FieldKeyRing
+    """
+    keys = [key.encode('utf-8') for key in settings.FIELD_ENCRYPTION_KEYS]
+    keys.append(_get_fernet_key())
+    return FieldKeyRing(keys)
+
+
 def encrypt_field(value: str | None) -> str | None:
     """
     Encrypt a sensitive field value (e.g., passwords for external systems).
@@ -173,12 +410,7 @@ def encrypt_field(value: str | None) -> str | None:
     Returns:
         Encrypted value as base64 string, or None if input is None
     """
-    if value is None or value == "":
-        return None
-
-    fernet = Fernet(_get_fernet_key())
-    encrypted = fernet.encrypt(value.encode('utf-8'))
-    return encrypted.decode('utf-8')
+    return get_field_key_ring().encrypt(value)
 
 
 def decrypt_field(encrypted_value: str | None) -> str | None:
@@ -194,9 +426,4 @@ def decrypt_field(encrypted_value: str | None) -> str | None:
     Raises:
         cryptography.fernet.InvalidToken: If decryption fails (corrupted data or wrong key)
     """
-    if encrypted_value is None or encrypted_value == "":
-        return None
-
-    fernet = Fernet(_get_fernet_key())
-    decrypted = fernet.decrypt(encrypted_value.encode('utf-8'))
-    return decrypted.decode('utf-8')
+    return get_field_key_ring().decrypt(encrypted_value)
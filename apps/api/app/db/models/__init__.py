@@ -6,7 +6,7 @@ from app.db.models.base import Base  # noqa: F401
 from app.db.models.client import Client, ClientStatus, RegimeTributario, TipoEmpresa  # noqa: F401
 from app.db.models.client_user import ClientUser, ClientAccessLevel  # noqa: F401
 from app.db.models.cnae import Cnae  # noqa: F401
-from app.db.models.finance import FinancialTransaction, PaymentMethod, PaymentStatus, TransactionType  # noqa: F401
+from app.db.models.finance import FinanceMonthlyRollup, FinancialTransaction, PaymentMethod, PaymentStatus, TransactionType  # noqa: F401
 from app.db.models.license import License  # noqa: F401
 from app.db.models.license_event import LicenseEvent  # noqa: F401
 from app.db.models.municipal_registration import MunicipalRegistration  # noqa: F401
@@ -14,7 +14,8 @@ from app.db.models.notification import Notification  # noqa: F401
 from app.db.models.obligation import Obligation  # noqa: F401
 from app.db.models.obligation_event import ObligationEvent  # noqa: F401
 from app.db.models.obligation_type import ObligationType  # noqa: F401
-from app.db.models.report import ReportFormat, ReportHistory, ReportStatus, ReportTemplate, ReportType  # noqa: F401
+from app.db.models.refresh_token import RefreshToken  # noqa: F401
+from app.db.models.report import ReportFormat, ReportHistory, ReportSchedule, ReportStatus, ReportTemplate, ReportType, SchedulePeriod  # noqa: F401
 from app.db.models.user import User, UserRole  # noqa: F401
 
 __all__ = [
@@ -30,6 +31,7 @@ __all__ = [
     "ClientAccessLevel",
     "Cnae",
     "FinancialTransaction",
+    "FinanceMonthlyRollup",
     "PaymentMethod",
     "PaymentStatus",
     "TransactionType",
@@ -40,9 +42,12 @@ __all__ = [
     "Obligation",
     "ObligationEvent",
     "ObligationType",
+    "RefreshToken",
     "ReportTemplate",
     "ReportHistory",
+    "ReportSchedule",
     "ReportType",
     "ReportFormat",
     "ReportStatus",
+    "SchedulePeriod",
 ]
@@ -7,7 +7,7 @@ from enum import Enum
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import Boolean, Date, Float, Integer, Numeric, String, Text, func
+from sqlalchemy import DDL, Boolean, Computed, Date, Float, Index, Integer, Numeric, String, Text, event, func
 from sqlalchemy.dialects.postgresql import ENUM, JSONB, UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -113,6 +113,19 @@ class Client(Base, UUIDMixin, TimestampMixin):
     # Soft delete
     deleted_at: Mapped[Optional[datetime]] = mapped_column(nullable=True, default=None)
 
+    # Search (generated): unaccented lowercase names and the CNPJ digits
+    search_text: Mapped[str] = mapped_column(
+        Text,
+        Computed(
+            "lower(immutable_unaccent(razao_social || ' ' || coalesce(nome_fantasia, '')))",
+            persisted=True,
+        ),
+    )
+    cnpj_digits: Mapped[str] = mapped_column(
+        String(14),
+        Computed("regexp_replace(cnpj, '[^0-9]', '', 'g')", persisted=True),
+    )
+
     # Relationships
     obligations = relationship("Obligation", back_populates="client", cascade="all, delete-orphan")
     transactions = relationship("FinancialTransaction", back_populates="client", cascade="all, delete-orphan")
@@ -121,6 +134,22 @@ class Client(Base, UUIDMixin, TimestampMixin):
     municipal_registrations = relationship("MunicipalRegistration", back_populates="client", cascade="all, delete-orphan")
     client_users = relationship("ClientUser", back_populates="client", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        # Trigram index for substring and similarity search on names
+        Index(
+            "ix_clients_search_text_trgm",
+            "search_text",
+            postgresql_using="gin",
+            postgresql_ops={"search_text": "gin_trgm_ops"},
+        ),
+        # Prefix lookup of partially typed CNPJs
+        Index(
+            "ix_clients_cnpj_digits",
+            "cnpj_digits",
+            postgresql_ops={"cnpj_digits": "varchar_pattern_ops"},
+        ),
+    )
+
     def __repr__(self) -> str:
         return f"<Client {self.razao_social} ({self.cnpj})>"
 
@@ -134,3 +163,17 @@ class Client(Base, UUIDMixin, TimestampMixin):
         from datetime import timezone
         self.deleted_at = datetime.now(timezone.utc)
         self.status = ClientStatus.INATIVO
+
+
+# unaccent() is only STABLE; generated columns and indexes need an IMMUTABLE wrapper.
+# The migration creates the same objects for existing databases.
+for _statement in (
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE EXTENSION IF NOT EXISTS unaccent",
+    """
+    CREATE OR REPLACE FUNCTION immutable_unaccent(text) RETURNS text
+    LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT
+    AS $$ SELECT public.unaccent('public.unaccent'::regdictionary, $1) $$
+    """,
+):
+    event.listen(Client.__table__, "before_create", DDL(_statement))
@@ -6,7 +6,7 @@ from decimal import Decimal
 from typing import Optional
 from uuid import UUID, uuid4
 
-from sqlalchemy import Date, DateTime, Enum, ForeignKey, Index, Numeric, String, Text
+from sqlalchemy import Date, DateTime, Enum, ForeignKey, Index, Integer, Numeric, String, Text, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.models.base import Base
@@ -117,7 +117,63 @@ class FinancialTransaction(Base):
         # Composite indexes for common queries
         Index("ix_financial_transactions_client_status", "client_id", "payment_status"),
         Index("ix_financial_transactions_client_reference", "client_id", "reference_month"),
+        # One live transaction per client and reference month
+        Index(
+            "uq_financial_transactions_client_reference_live",
+            "client_id",
+            "reference_month",
+            unique=True,
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
     )
 
     def __repr__(self) -> str:
         return f"<FinancialTransaction(id={self.id}, client_id={self.client_id}, amount={self.amount}, status={self.payment_status})>"
+
+
+class FinanceMonthlyRollup(Base):
+    """
+    Monthly finance rollup (month × client × type × status → sum, count).
+
+    Maintained incrementally by TransactionService on every write and rebuilt
+    from financial_transactions by FinanceRollupRepository.rebuild().
+    Soft-deleted transactions are not counted.
+    """
+
+    __tablename__ = "finance_monthly_rollup"
+
+    reference_month: Mapped[date] = mapped_column(Date, primary_key=True)
+    client_id: Mapped[UUID] = mapped_column(ForeignKey("clients.id"), primary_key=True)
+    transaction_type: Mapped[TransactionType] = mapped_column(
+        Enum(TransactionType, native_enum=False),
+        primary_key=True
+    )
+    payment_status: Mapped[PaymentStatus] = mapped_column(
+        Enum(PaymentStatus, native_enum=False),
+        primary_key=True
+    )
+
+    total_amount: Mapped[Decimal] = mapped_column(
+        Numeric(14, 2),
+        nullable=False,
+        default=Decimal("0.00"),
+        comment="Sum of transaction amounts in BRL"
+    )
+    transaction_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow,
+        nullable=False
+    )
+
+    __table_args__ = (
+        Index("ix_finance_monthly_rollup_client_month", "client_id", "reference_month"),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<FinanceMonthlyRollup(month={self.reference_month}, client_id={self.client_id}, "
+            f"type={self.transaction_type}, status={self.payment_status}, total={self.total_amount})>"
+        )
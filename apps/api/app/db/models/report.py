@@ -45,6 +45,16 @@ class ReportStatus(str, enum.Enum):
     FAILED = "failed"
 
 
+class SchedulePeriod(str, enum.Enum):
+    """Reporting period of a scheduled report, relative to its run date."""
+
+    CURRENT_MONTH = "current_month"
+    PREVIOUS_MONTH = "previous_month"
+    LAST_30_DAYS = "last_30_days"
+    CURRENT_YEAR = "current_year"
+    PREVIOUS_YEAR = "previous_year"
+
+
 class ReportTemplate(Base, UUIDMixin, TimestampMixin):
     """Report template model - stores reusable report configurations."""
 
@@ -74,6 +84,7 @@ class ReportTemplate(Base, UUIDMixin, TimestampMixin):
     # Relationships
     created_by = relationship("User", foreign_keys=[created_by_id])
     history_records = relationship("ReportHistory", back_populates="template", cascade="all, delete-orphan")
+    schedules = relationship("ReportSchedule", back_populates="template", cascade="all, delete-orphan")
 
     def __repr__(self) -> str:
         return f"<ReportTemplate {self.name} ({self.report_type})>"
@@ -123,6 +134,16 @@ class ReportHistory(Base, UUIDMixin):
         default=ReportStatus.PENDING,
         index=True,
     )
+    cache_key: Mapped[Optional[str]] = mapped_column(
+        String(64),
+        nullable=True,
+        comment="Report result cache key the file was rendered from",
+    )
+    last_downloaded_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        comment="Last download of the file (storage quota eviction order)",
+    )
 
     # Relationships
     template = relationship("ReportTemplate", back_populates="history_records")
@@ -131,12 +152,55 @@ class ReportHistory(Base, UUIDMixin):
     __table_args__ = (
         Index("ix_report_history_user_report_type", "user_id", "report_type"),
         Index("ix_report_history_generated_at", "generated_at"),
+        Index("ix_report_history_cache_key_format", "cache_key", "format"),
+        Index("ix_report_history_expires_at", "expires_at"),
+        Index("ix_report_history_file_path", "file_path"),
     )
 
     def __repr__(self) -> str:
         return f"<ReportHistory {self.report_type} {self.status} by user {self.user_id}>"
 
 
-# Note: ReportSchedule can be implemented in the future for automated report generation
-# For now, it's a placeholder in the model structure
+class ReportSchedule(Base, UUIDMixin, TimestampMixin):
+    """Report schedule model - generates a template's report on a cron cadence."""
+
+    __tablename__ = "report_schedules"
+
+    name: Mapped[str] = mapped_column(String(200), nullable=False)
+    template_id: Mapped[UUID] = mapped_column(
+        ForeignKey("report_templates.id"), nullable=False, index=True
+    )
+    created_by_id: Mapped[UUID] = mapped_column(ForeignKey("users.id"), nullable=False, index=True)
+    cron: Mapped[str] = mapped_column(
+        String(100),
+        nullable=False,
+        comment="Cron expression (minute hour day month weekday) in the schedule timezone",
+    )
+    period: Mapped[SchedulePeriod] = mapped_column(
+        SQLEnum(SchedulePeriod, name="schedule_period", create_type=True),
+        nullable=False,
+        comment="Reporting period, relative to the run date",
+    )
+    format: Mapped[ReportFormat] = mapped_column(
+        SQLEnum(ReportFormat, name="report_format", create_type=False),
+        nullable=False,
+    )
+    recipients: Mapped[list] = mapped_column(
+        JSON,
+        nullable=False,
+        comment="IDs of the users who receive each generated report",
+    )
+    is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
+    last_run_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    next_run_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, index=True
+    )
+
+    # Relationships
+    template = relationship("ReportTemplate", back_populates="schedules")
+    created_by = relationship("User", foreign_keys=[created_by_id])
 
+    def __repr__(self) -> str:
+        return f"<ReportSchedule {self.name} ({self.cron})>"
@@ -7,11 +7,11 @@ from enum import Enum
 from typing import Optional
 from uuid import uuid4, UUID as UUID_TYPE
 
-import bcrypt
 from sqlalchemy import Boolean, DateTime, Enum as SQLEnum, ForeignKey, String, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from app.core.security import hash_password, verify_password
 from app.db.models.base import Base, TimestampMixin, UUIDMixin
 
 
@@ -60,11 +60,13 @@ class User(Base, UUIDMixin, TimestampMixin):
         """
         Hash and set the user's password.
 
+        Blocks while hashing; async code should set password_hash from
+        app.core.passwords.password_hasher instead.
+
         Args:
             password: Plain text password
         """
-        salt = bcrypt.gensalt()
-        self.password_hash = bcrypt.hashpw(password.encode('utf-8'), salt).decode('utf-8')
+        self.password_hash = hash_password(password)
 
     def verify_password(self, password: str) -> bool:
         """
@@ -76,7 +78,4 @@ class User(Base, UUIDMixin, TimestampMixin):
         Returns:
             True if password matches, False otherwise
         """
-        return bcrypt.checkpw(
-            password.encode('utf-8'),
-            self.password_hash.encode('utf-8')
-        )
+        return verify_password(password, self.password_hash)
@@ -2,20 +2,167 @@
 Base repository with common CRUD operations.
 """
 
-from typing import Generic, TypeVar
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from typing import Any, Callable, Generic, Optional, Sequence, TypeVar
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import Select, and_, false, func, or_, select
+from sqlalchemy.sql.elements import ColumnElement
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models.base import Base
 
 ModelType = TypeVar("ModelType", bound=Base)
+# Row type of a paginated listing, which may be a model other than the repository's
+RowType = TypeVar("RowType")
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """
+    Encode keyset pagination values (sort key + id) into an opaque cursor.
+
+    Args:
+        values: Values of the last row's sort columns
+
+    Returns:
+        URL-safe cursor string
+    """
+    payload = json.dumps(
+        [None if value is None else str(value) for value in values], separators=(",", ":")
+    )
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> list[str]:
+    """
+    Decode an opaque cursor produced by encode_cursor.
+
+    Args:
+        cursor: Cursor string
+
+    Returns:
+        List of string (or None) values; callers convert them to column types
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    except (binascii.Error, UnicodeError, ValueError) as e:
+        raise ValueError("Invalid pagination cursor") from e
+
+    if not isinstance(values, list) or not all(
+        value is None or isinstance(value, str) for value in values
+    ):
+        raise ValueError("Invalid pagination cursor")
+    return values
+
+
+@dataclass(frozen=True)
+class SortKey:
+    """One column of a keyset-paginated ordering."""
+
+    column: Any
+    descending: bool = False
+    # Converts the cursor's string value back to the column type
+    parse: Callable[[str], Any] = str
+
+
+def keyset_order_by(keys: Sequence[SortKey]) -> list[ColumnElement]:
+    """
+    ORDER BY clauses of a keyset ordering.
+
+    Args:
+        keys: Sort keys, ending with a unique column (usually id)
+
+    Returns:
+        Clauses for Select.order_by
+    """
+    return [key.column.desc() if key.descending else key.column.asc() for key in keys]
+
+
+def _after(key: SortKey, value: Any) -> Optional[ColumnElement]:
+    # PostgreSQL sorts NULLs last ascending and first descending
+    if value is None:
+        return key.column.is_not(None) if key.descending else None
+    if key.descending:
+        return key.column < value
+    if key.column.expression.nullable:
+        return or_(key.column > value, key.column.is_(None))
+    return key.column > value
+
+
+def _equals(key: SortKey, value: Any) -> ColumnElement:
+    return key.column.is_(None) if value is None else key.column == value
+
+
+def keyset_after(keys: Sequence[SortKey], cursor: str) -> ColumnElement:
+    """
+    Filter for rows sorting strictly after a cursor position.
+
+    Args:
+        keys: Sort keys the cursor was built with
+        cursor: Cursor returned by keyset_cursor
+
+    Returns:
+        WHERE condition
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    raw_values = decode_cursor(cursor)
+    if len(raw_values) != len(keys):
+        raise ValueError("Invalid pagination cursor")
+
+    try:
+        values = [
+            None if raw is None else key.parse(raw) for key, raw in zip(keys, raw_values)
+        ]
+    except (TypeError, ValueError) as e:
+        raise ValueError("Invalid pagination cursor") from e
+
+    alternatives = []
+    for index, (key, value) in enumerate(zip(keys, values)):
+        after = _after(key, value)
+        if after is not None:
+            equal_before = [_equals(k, v) for k, v in zip(keys[:index], values[:index])]
+            alternatives.append(and_(*equal_before, after))
+
+    if not alternatives:
+        return false()
+
+    condition = or_(*alternatives)
+    first, first_value = keys[0], values[0]
+    if first_value is not None and not first.column.expression.nullable:
+        # Redundant bound on the leading column lets its index narrow the scan
+        bound = first.column <= first_value if first.descending else first.column >= first_value
+        condition = and_(bound, condition)
+    return condition
+
+
+def keyset_cursor(keys: Sequence[SortKey], obj: Any) -> str:
+    """
+    Cursor pointing just after an object.
+
+    Args:
+        keys: Sort keys of the listing
+        obj: Last object of a page
+
+    Returns:
+        Opaque cursor
+    """
+    return encode_cursor([getattr(obj, key.column.key) for key in keys])
 
 
 class BaseRepository(Generic[ModelType]):
     """Base repository with common database operations."""
 
+    # Ordering of the repository's paginated listings, for keyset cursors
+    list_sort_keys: Sequence[SortKey] = ()
+
     def __init__(self, model: type[ModelType], session: AsyncSession):
         """
         Initialize repository.
@@ -106,3 +253,65 @@ class BaseRepository(Generic[ModelType]):
             await self.session.flush()
             return True
         return False
+
+    async def paginate(
+        self,
+        stmt: Select[RowType],
+        skip: int = 0,
+        limit: int = 100,
+        after: Optional[ColumnElement] = None,
+        with_total: bool = True,
+    ) -> tuple[list[RowType], Optional[int]]:
+        """
+        Fetch one page of a listing together with its total.
+
+        The total rides along the page as ``count(*) OVER ()``, so filters
+        are planned and evaluated once, in a single round-trip. A separate
+        count is only issued when the window can't provide it: on an empty
+        page past the first, or with a keyset condition (which narrows the
+        rows the window sees).
+
+        Args:
+            stmt: Filtered and ordered SELECT of one entity, without OFFSET/LIMIT
+            skip: Number of records to skip (ignored with after)
+            limit: Maximum number of records to return
+            after: Keyset condition from keyset_after, replaces skip
+            with_total: Whether to count all matching records
+
+        Returns:
+            Tuple of (records, total count or None)
+        """
+        page_stmt = stmt.limit(limit)
+        page_stmt = page_stmt.where(after) if after is not None else page_stmt.offset(skip)
+
+        if not with_total or after is not None:
+            result = await self.session.execute(page_stmt)
+            items = list(result.scalars().all())
+            return items, await self._count(stmt) if with_total else None
+
+        result = await self.session.execute(
+            page_stmt.add_columns(func.count().over().label("total_count"))
+        )
+        rows = result.all()
+        if rows:
+            return [row[0] for row in rows], rows[0].total_count
+        return [], await self._count(stmt) if skip else 0
+
+    async def _count(self, stmt: Select) -> int:
+        count_stmt = select(func.count()).select_from(stmt.order_by(None).subquery())
+        return await self.session.scalar(count_stmt) or 0
+
+    def next_cursor(self, items: Sequence[ModelType], limit: int) -> Optional[str]:
+        """
+        Cursor of the page after a listing page.
+
+        Args:
+            items: Page returned by a listing of this repository
+            limit: Page size requested
+
+        Returns:
+            Cursor, or None when the page came back short (last page)
+        """
+        if not self.list_sort_keys or not items or len(items) < limit:
+            return None
+        return keyset_cursor(self.list_sort_keys, items[-1])
@@ -2,19 +2,68 @@
 Client repository for database operations.
 """
 
+import unicodedata
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import and_, func, or_, select
+from sqlalchemy import and_, func, literal, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import ColumnElement
 
 from app.db.models.client import Client, ClientStatus
-from app.db.repositories.base import BaseRepository
+from app.db.repositories.base import BaseRepository, SortKey, keyset_after, keyset_order_by
+
+
+def normalize_search_text(value: str) -> str:
+    """
+    Normalize a search term the way clients.search_text is generated.
+
+    Args:
+        value: Raw search term
+
+    Returns:
+        Lowercase term without accents and with single spaces
+    """
+    decomposed = unicodedata.normalize("NFKD", value)
+    unaccented = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return " ".join(unaccented.lower().split())
+
+
+def client_search_condition(query: str) -> tuple[ColumnElement, Optional[ColumnElement]]:
+    """
+    Search condition for a client name or partially typed CNPJ.
+
+    Terms without letters are CNPJ prefixes, whatever their punctuation,
+    matched on the digits-only column. Other terms match names by
+    substring or trigram word similarity (typos, missing accents), both
+    served by the trigram index.
+
+    Args:
+        query: Search term
+
+    Returns:
+        Tuple of (WHERE condition, relevance to order by or None)
+    """
+    # Patterns are built here rather than in SQL so the planner sees a
+    # constant prefix and can use the btree pattern index
+    digits = "".join(filter(str.isdigit, query))
+    if digits and not any(char.isalpha() for char in query):
+        return Client.cnpj_digits.like(f"{digits}%"), None
+
+    term = normalize_search_text(query)
+    escaped = term.replace("/", "//").replace("%", "/%").replace("_", "/_")
+    condition = or_(
+        Client.search_text.like(f"%{escaped}%", escape="/"),
+        literal(term).op("<%")(Client.search_text),
+    )
+    return condition, func.word_similarity(term, Client.search_text)
 
 
 class ClientRepository(BaseRepository[Client]):
     """Repository for Client model operations."""
 
+    list_sort_keys = (SortKey(Client.razao_social), SortKey(Client.id, parse=UUID))
+
     def __init__(self, session: AsyncSession):
         """
         Initialize client repository.
@@ -75,7 +124,9 @@ class ClientRepository(BaseRepository[Client]):
         starts_with: Optional[str] = None,
         skip: int = 0,
         limit: int = 10,
-    ) -> tuple[list[Client], int]:
+        cursor: Optional[str] = None,
+        with_total: bool = True,
+    ) -> tuple[list[Client], Optional[int]]:
         """
         List clients with filters and pagination.
 
@@ -85,23 +136,21 @@ class ClientRepository(BaseRepository[Client]):
             starts_with: Filter by first letter of razao_social
             skip: Number of records to skip
             limit: Maximum number of records to return
+            cursor: Cursor from next_cursor(); replaces skip
+            with_total: Whether to count all matching records
 
         Returns:
-            Tuple of (clients list, total count)
+            Tuple of (clients list, total count or None)
+
+        Raises:
+            ValueError: If the cursor is invalid
         """
         # Base query - only non-deleted
         filters = [Client.deleted_at.is_(None)]
 
         # Apply search query
-        if query:
-            search_term = f"%{query}%"
-            filters.append(
-                or_(
-                    Client.razao_social.ilike(search_term),
-                    Client.nome_fantasia.ilike(search_term),
-                    Client.cnpj.ilike(search_term),
-                )
-            )
+        if query and query.strip():
+            filters.append(client_search_condition(query)[0])
 
         # Apply status filter
         if status:
@@ -111,23 +160,19 @@ class ClientRepository(BaseRepository[Client]):
         if starts_with and len(starts_with) == 1:
             filters.append(Client.razao_social.ilike(f"{starts_with}%"))
 
-        # Count query
-        count_query = select(func.count()).select_from(Client).where(and_(*filters))
-        total_result = await self.session.execute(count_query)
-        total = total_result.scalar_one()
-
-        # Data query with pagination
+        # Data query with pagination; the total comes with the page
         data_query = (
             select(Client)
             .where(and_(*filters))
-            .order_by(Client.razao_social)
-            .offset(skip)
-            .limit(limit)
+            .order_by(*keyset_order_by(self.list_sort_keys))
+        )
+        return await self.paginate(
+            data_query,
+            skip=skip,
+            limit=limit,
+            after=keyset_after(self.list_sort_keys, cursor) if cursor else None,
+            with_total=with_total,
         )
-        result = await self.session.execute(data_query)
-        clients = list(result.scalars().all())
-
-        return clients, total
 
     async def search(
         self,
@@ -138,26 +183,24 @@ class ClientRepository(BaseRepository[Client]):
         Quick search for autocomplete.
 
         Args:
-            query: Search term
+            query: Search term (name or CNPJ)
             limit: Maximum number of results
 
         Returns:
-            List of matching clients
+            List of matching clients, most similar first
         """
-        search_term = f"%{query}%"
+        if not query.strip():
+            return []
+
+        condition, relevance = client_search_condition(query)
+        order_by = [Client.razao_social, Client.id]
+        if relevance is not None:
+            order_by.insert(0, relevance.desc())
+
         result = await self.session.execute(
             select(Client)
-            .where(
-                and_(
-                    Client.deleted_at.is_(None),
-                    or_(
-                        Client.razao_social.ilike(search_term),
-                        Client.nome_fantasia.ilike(search_term),
-                        Client.cnpj.ilike(search_term),
-                    ),
-                )
-            )
-            .order_by(Client.razao_social)
+            .where(and_(Client.deleted_at.is_(None), condition))
+            .order_by(*order_by)
             .limit(limit)
         )
         return list(result.scalars().all())
@@ -0,0 +1,200 @@
+"""Finance Rollup Repository - Maintains the monthly finance rollup table."""
+
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Iterable, Optional
+from uuid import UUID
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models.finance import (
+    FinanceMonthlyRollup,
+    FinancialTransaction,
+    PaymentStatus,
+    TransactionType,
+)
+from app.db.repositories.base import BaseRepository
+
+# (reference_month, client_id, transaction_type, payment_status)
+RollupKey = tuple[date, UUID, TransactionType, PaymentStatus]
+
+# A transaction's contribution to the rollup: its key and amount
+RollupContribution = tuple[RollupKey, Decimal]
+
+# Rows per multi-row upsert, keeps bind parameters well under the asyncpg limit
+UPSERT_CHUNK_SIZE = 1000
+
+
+def rollup_contribution(transaction: FinancialTransaction) -> Optional[RollupContribution]:
+    """
+    Snapshot the rollup contribution of a transaction.
+
+    Take one before mutating a transaction and one after, then pass both to
+    FinanceRollupRepository.apply_change().
+
+    Returns:
+        Contribution tuple, or None if the transaction does not count (soft-deleted)
+    """
+    if transaction.deleted_at is not None:
+        return None
+
+    key = (
+        transaction.reference_month,
+        transaction.client_id,
+        TransactionType(transaction.transaction_type),
+        PaymentStatus(transaction.payment_status),
+    )
+    return key, Decimal(transaction.amount)
+
+
+class FinanceRollupRepository(BaseRepository[FinanceMonthlyRollup]):
+    """Repository for FinanceMonthlyRollup maintenance."""
+
+    def __init__(self, db: AsyncSession):
+        super().__init__(FinanceMonthlyRollup, db)
+
+    async def apply_change(
+        self,
+        before: Optional[RollupContribution],
+        after: Optional[RollupContribution],
+    ) -> None:
+        """Apply the rollup delta between two snapshots of the same transaction."""
+        await self.apply_contributions(removed=[before], added=[after])
+
+    async def apply_contributions(
+        self,
+        removed: Iterable[Optional[RollupContribution]] = (),
+        added: Iterable[Optional[RollupContribution]] = (),
+    ) -> None:
+        """
+        Apply many contribution changes with a single upsert.
+
+        Deltas for the same key are merged first, so each rollup row is touched
+        at most once per statement.
+        """
+        deltas: dict[RollupKey, list] = {}
+
+        for contribution, sign in [(c, -1) for c in removed] + [(c, 1) for c in added]:
+            if contribution is None:
+                continue
+            key, amount = contribution
+            delta = deltas.setdefault(key, [Decimal("0.00"), 0])
+            delta[0] += sign * amount
+            delta[1] += sign
+
+        await self.apply_deltas(
+            {key: (amount, count) for key, (amount, count) in deltas.items() if amount or count}
+        )
+
+    async def apply_deltas(self, deltas: dict[RollupKey, tuple[Decimal, int]]) -> None:
+        """
+        Add (amount, count) deltas to rollup rows, creating missing rows.
+
+        Args:
+            deltas: Mapping of rollup key to (amount delta, count delta)
+        """
+        if not deltas:
+            return
+
+        now = datetime.utcnow()
+        values = [
+            {
+                "reference_month": reference_month,
+                "client_id": client_id,
+                "transaction_type": transaction_type,
+                "payment_status": payment_status,
+                "total_amount": amount,
+                "transaction_count": count,
+                "updated_at": now,
+            }
+            for (reference_month, client_id, transaction_type, payment_status), (amount, count)
+            in deltas.items()
+        ]
+
+        for start in range(0, len(values), UPSERT_CHUNK_SIZE):
+            stmt = insert(FinanceMonthlyRollup).values(values[start:start + UPSERT_CHUNK_SIZE])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[
+                    FinanceMonthlyRollup.reference_month,
+                    FinanceMonthlyRollup.client_id,
+                    FinanceMonthlyRollup.transaction_type,
+                    FinanceMonthlyRollup.payment_status,
+                ],
+                set_={
+                    "total_amount": FinanceMonthlyRollup.total_amount + stmt.excluded.total_amount,
+                    "transaction_count": (
+                        FinanceMonthlyRollup.transaction_count + stmt.excluded.transaction_count
+                    ),
+                    "updated_at": stmt.excluded.updated_at,
+                },
+            )
+            await self.db.execute(stmt)
+
+    async def rebuild(
+        self,
+        start_month: Optional[date] = None,
+        end_month: Optional[date] = None,
+    ) -> int:
+        """
+        Rebuild rollup rows from financial_transactions.
+
+        Used for backfills and to repair drift. Without a range the whole
+        table is rebuilt.
+
+        Args:
+            start_month: Optional first reference month to rebuild
+            end_month: Optional last reference month to rebuild
+
+        Returns:
+            Number of rollup rows written
+        """
+        delete_stmt = delete(FinanceMonthlyRollup)
+        conditions = [FinancialTransaction.deleted_at.is_(None)]
+
+        if start_month:
+            delete_stmt = delete_stmt.where(FinanceMonthlyRollup.reference_month >= start_month)
+            conditions.append(FinancialTransaction.reference_month >= start_month)
+
+        if end_month:
+            delete_stmt = delete_stmt.where(FinanceMonthlyRollup.reference_month <= end_month)
+            conditions.append(FinancialTransaction.reference_month <= end_month)
+
+        await self.db.execute(delete_stmt)
+
+        aggregate = (
+            select(
+                FinancialTransaction.reference_month,
+                FinancialTransaction.client_id,
+                FinancialTransaction.transaction_type,
+                FinancialTransaction.payment_status,
+                func.sum(FinancialTransaction.amount),
+                func.count(),
+                func.timezone("UTC", func.now()),
+            )
+            .where(*conditions)
+            .group_by(
+                FinancialTransaction.reference_month,
+                FinancialTransaction.client_id,
+                FinancialTransaction.transaction_type,
+                FinancialTransaction.payment_status,
+            )
+        )
+
+        result = await self.db.execute(
+            insert(FinanceMonthlyRollup).from_select(
+                [
+                    "reference_month",
+                    "client_id",
+                    "transaction_type",
+                    "payment_status",
+                    "total_amount",
+                    "transaction_count",
+                    "updated_at",
+                ],
+                aggregate,
+            )
+        )
+        await self.db.flush()
+        return result.rowcount or 0
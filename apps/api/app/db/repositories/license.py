@@ -6,18 +6,25 @@ from datetime import date, datetime, timedelta
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import and_, func, or_, select
+from sqlalchemy import and_, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models.license import License
 from app.db.models.license_event import LicenseEvent
-from app.db.repositories.base import BaseRepository
+from app.db.repositories.base import BaseRepository, SortKey, keyset_after, keyset_order_by
 from app.schemas.license import LicenseEventType, LicenseStatus, LicenseType
 
 
 class LicenseRepository(BaseRepository[License]):
     """Repository for License model operations."""
 
+    # Licenses without expiration date sort last
+    list_sort_keys = (
+        SortKey(License.expiration_date, parse=date.fromisoformat),
+        SortKey(License.created_at, descending=True, parse=datetime.fromisoformat),
+        SortKey(License.id, descending=True, parse=UUID),
+    )
+
     def __init__(self, session: AsyncSession):
         """
         Initialize license repository.
@@ -35,7 +42,9 @@ class LicenseRepository(BaseRepository[License]):
         client_id: Optional[UUID] = None,
         skip: int = 0,
         limit: int = 10,
-    ) -> tuple[list[License], int]:
+        cursor: Optional[str] = None,
+        with_total: bool = True,
+    ) -> tuple[list[License], Optional[int]]:
         """
         List licenses with filters and pagination.
 
@@ -46,9 +55,14 @@ class LicenseRepository(BaseRepository[License]):
             client_id: Filter by client ID
             skip: Number of records to skip
             limit: Maximum number of records to return
+            cursor: Cursor from next_cursor(); replaces skip
+            with_total: Whether to count all matching records
 
         Returns:
-            Tuple of (licenses list, total count)
+            Tuple of (licenses list, total count or None)
+
+        Raises:
+            ValueError: If the cursor is invalid
         """
         filters = []
 
@@ -74,27 +88,18 @@ class LicenseRepository(BaseRepository[License]):
         if client_id:
             filters.append(License.client_id == client_id)
 
-        # Count query
-        count_query = select(func.count()).select_from(License)
-        if filters:
-            count_query = count_query.where(and_(*filters))
-        total_result = await self.session.execute(count_query)
-        total = total_result.scalar_one()
-
-        # Data query with pagination
+        # Data query with pagination; the total comes with the page
         data_query = select(License)
         if filters:
             data_query = data_query.where(and_(*filters))
-        data_query = (
-            data_query
-            .order_by(License.expiration_date.asc().nulls_last(), License.created_at.desc())
-            .offset(skip)
-            .limit(limit)
+        data_query = data_query.order_by(*keyset_order_by(self.list_sort_keys))
+        return await self.paginate(
+            data_query,
+            skip=skip,
+            limit=limit,
+            after=keyset_after(self.list_sort_keys, cursor) if cursor else None,
+            with_total=with_total,
         )
-        result = await self.session.execute(data_query)
-        licenses = list(result.scalars().all())
-
-        return licenses, total
 
     async def get_by_client(self, client_id: UUID) -> list[License]:
         """
@@ -5,7 +5,7 @@ Municipal Registration repository for database operations.
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import and_, func, select
+from sqlalchemy import and_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models.municipal_registration import MunicipalRegistration
@@ -154,29 +154,14 @@ class MunicipalRegistrationRepository(BaseRepository[MunicipalRegistration]):
         if city:
             filters.append(MunicipalRegistration.city.ilike(f"%{city}%"))
 
-        # Count query
-        count_query = select(func.count()).select_from(MunicipalRegistration)
-        if filters:
-            count_query = count_query.where(and_(*filters))
-        total_result = await self.session.execute(count_query)
-        total = total_result.scalar_one()
-
-        # Data query with pagination
+        # Data query with pagination; the total comes with the page
         data_query = select(MunicipalRegistration)
         if filters:
             data_query = data_query.where(and_(*filters))
-        data_query = (
-            data_query
-            .order_by(
-                MunicipalRegistration.state,
-                MunicipalRegistration.city,
-                MunicipalRegistration.created_at.desc()
-            )
-            .offset(skip)
-            .limit(limit)
+        data_query = data_query.order_by(
+            MunicipalRegistration.state,
+            MunicipalRegistration.city,
+            MunicipalRegistration.created_at.desc()
         )
-        result = await self.session.execute(data_query)
-        registrations = list(result.scalars().all())
-
-        return registrations, total
+        return await self.paginate(data_query, skip=skip, limit=limit)
 
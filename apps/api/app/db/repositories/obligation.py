@@ -1,6 +1,6 @@
 """Obligation Repository - Data access layer for obligations."""
 
-from datetime import datetime
+from datetime import date, datetime
 from typing import Optional, Sequence
 from uuid import UUID
 
@@ -10,12 +10,17 @@ from sqlalchemy.orm import selectinload
 
 from app.db.models.obligation import Obligation, ObligationStatus
 from app.db.models.obligation_event import ObligationEvent
-from app.db.repositories.base import BaseRepository
+from app.db.repositories.base import BaseRepository, SortKey, keyset_after, keyset_order_by
 
 
 class ObligationRepository(BaseRepository[Obligation]):
     """Repository for Obligation operations."""
 
+    list_sort_keys = (
+        SortKey(Obligation.due_date, parse=date.fromisoformat),
+        SortKey(Obligation.id, parse=UUID),
+    )
+
     def __init__(self, db: AsyncSession):
         super().__init__(Obligation, db)
 
@@ -41,8 +46,18 @@ class ObligationRepository(BaseRepository[Obligation]):
         month: Optional[int] = None,
         skip: int = 0,
         limit: int = 100,
-    ) -> tuple[Sequence[Obligation], int]:
-        """List obligations with filters. If client_id is None, lists all obligations."""
+        cursor: Optional[str] = None,
+        with_total: bool = True,
+    ) -> tuple[Sequence[Obligation], Optional[int]]:
+        """
+        List obligations with filters. If client_id is None, lists all obligations.
+
+        Pages are addressed either by skip or, without OFFSET, by a cursor
+        from next_cursor() (which then replaces skip).
+
+        Raises:
+            ValueError: If the cursor is invalid
+        """
         conditions = []
 
         if client_id:
@@ -59,22 +74,20 @@ class ObligationRepository(BaseRepository[Obligation]):
 
         where_clause = and_(*conditions) if conditions else True
 
+        # Obligation types are resolved from the in-process catalog by callers
         stmt = select(Obligation).where(where_clause).options(
-            selectinload(Obligation.obligation_type),
             selectinload(Obligation.client),
         )
 
-        # Count total
-        count_stmt = select(func.count()).select_from(Obligation).where(where_clause)
-        total_result = await self.db.execute(count_stmt)
-        total = total_result.scalar_one()
-
-        # Get paginated results
-        stmt = stmt.offset(skip).limit(limit).order_by(Obligation.due_date.asc())
-        result = await self.db.execute(stmt)
-        items = result.scalars().all()
-
-        return items, total
+        # Paginated results, with the total from the same query
+        stmt = stmt.order_by(*keyset_order_by(self.list_sort_keys))
+        return await self.paginate(
+            stmt,
+            skip=skip,
+            limit=limit,
+            after=keyset_after(self.list_sort_keys, cursor) if cursor else None,
+            with_total=with_total,
+        )
 
     async def list_pending_by_due_date(self, until_date: datetime) -> Sequence[Obligation]:
         """List all pending obligations with due date until specified date."""
@@ -0,0 +1,144 @@
+"""Refresh Token Repository - Issued refresh tokens, rotation and revocation."""
+
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models.refresh_token import RefreshToken
+from app.db.repositories.base import BaseRepository
+
+
+class RefreshTokenRepository(BaseRepository[RefreshToken]):
+    """Repository for RefreshToken operations."""
+
+    def __init__(self, session: AsyncSession):
+        """
+        Initialize refresh token repository.
+
+        Args:
+            session: Database session
+        """
+        super().__init__(RefreshToken, session)
+
+    async def get_by_hash(self, token_hash: str) -> Optional[RefreshToken]:
+        """
+        Get a refresh token by the hash of its jti.
+
+        Args:
+            token_hash: SHA-256 of the jti
+
+        Returns:
+            RefreshToken or None if not found
+        """
+        return await self.db.get(RefreshToken, token_hash)
+
+    async def add(
+        self, token_hash: str, user_id: UUID, family_id: UUID, expires_at: datetime
+    ) -> RefreshToken:
+        """
+        Record an issued refresh token.
+
+        Args:
+            token_hash: SHA-256 of the jti
+            user_id: Owner of the token
+            family_id: Login session the token belongs to
+            expires_at: Token expiration
+
+        Returns:
+            Created RefreshToken
+        """
+        token = RefreshToken(
+            token_hash=token_hash, user_id=user_id, family_id=family_id, expires_at=expires_at
+        )
+        self.db.add(token)
+        await self.db.flush()
+        return token
+
+    async def mark_rotated(self, token_hash: str, now: datetime) -> Optional[tuple[UUID, UUID]]:
+        """
+        Consume a live refresh token in one statement.
+
+        Only one of several concurrent calls with the same token succeeds.
+
+        Args:
+            token_hash: SHA-256 of the jti
+            now: Current datetime
+
+        Returns:
+            Tuple of (user_id, family_id), or None if the token is unknown,
+            expired, revoked or already rotated
+        """
+        stmt = (
+            update(RefreshToken)
+            .where(
+                RefreshToken.token_hash == token_hash,
+                RefreshToken.rotated_at.is_(None),
+                RefreshToken.revoked_at.is_(None),
+                RefreshToken.expires_at > now,
+            )
+            .values(rotated_at=now)
+            .returning(RefreshToken.user_id, RefreshToken.family_id)
+        )
+        result = await self.db.execute(stmt)
+        row = result.one_or_none()
+        return (row.user_id, row.family_id) if row else None
+
+    async def revoke_family(self, family_id: UUID) -> int:
+        """
+        Revoke every token of a family.
+
+        Args:
+            family_id: Family to revoke
+
+        Returns:
+            Number of tokens revoked
+        """
+        stmt = (
+            update(RefreshToken)
+            .where(RefreshToken.family_id == family_id, RefreshToken.revoked_at.is_(None))
+            .values(revoked_at=func.now())
+        )
+        result = await self.db.execute(stmt)
+        return result.rowcount
+
+    async def get_revoked_families(self, since: datetime) -> list[tuple[UUID, datetime]]:
+        """
+        Families revoked since a point in time.
+
+        Args:
+            since: Lower bound of revoked_at (inclusive)
+
+        Returns:
+            List of (family_id, latest revocation)
+        """
+        stmt = (
+            select(RefreshToken.family_id, func.max(RefreshToken.revoked_at))
+            .where(RefreshToken.revoked_at >= since)
+            .group_by(RefreshToken.family_id)
+        )
+        result = await self.db.execute(stmt)
+        return [(family_id, revoked_at) for family_id, revoked_at in result.all()]
+
+    async def delete_expired(self, now: datetime, limit: int) -> int:
+        """
+        Delete a batch of expired tokens in one statement.
+
+        Args:
+            now: Current datetime
+            limit: Maximum number of tokens to delete
+
+        Returns:
+            Number of tokens deleted
+        """
+        expired = (
+            select(RefreshToken.token_hash)
+            .where(RefreshToken.expires_at <= now)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = delete(RefreshToken).where(RefreshToken.token_hash.in_(expired.scalar_subquery()))
+        result = await self.db.execute(stmt)
+        return result.rowcount
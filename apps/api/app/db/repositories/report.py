@@ -4,10 +4,18 @@ from datetime import datetime, timedelta
 from typing import Optional, Sequence
 from uuid import UUID
 
-from sqlalchemy import and_, func, select
+from sqlalchemy import BigInteger, and_, delete, func, literal, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-
-from app.db.models.report import ReportFormat, ReportHistory, ReportStatus, ReportTemplate, ReportType
+from sqlalchemy.orm import selectinload
+
+from app.db.models.report import (
+    ReportFormat,
+    ReportHistory,
+    ReportSchedule,
+    ReportStatus,
+    ReportTemplate,
+    ReportType,
+)
 from app.db.repositories.base import BaseRepository
 
 
@@ -73,6 +81,7 @@ class ReportRepository(BaseRepository[ReportTemplate]):
         template_id: Optional[UUID] = None,
         expires_at: Optional[datetime] = None,
         status: ReportStatus = ReportStatus.COMPLETED,
+        cache_key: Optional[str] = None,
     ) -> ReportHistory:
         """
         Save report generation history.
@@ -87,6 +96,7 @@ class ReportRepository(BaseRepository[ReportTemplate]):
             template_id: Template used (optional)
             expires_at: Expiration datetime
             status: Generation status
+            cache_key: Report result cache key the file was rendered from
 
         Returns:
             Created ReportHistory instance
@@ -104,6 +114,7 @@ class ReportRepository(BaseRepository[ReportTemplate]):
             file_size=file_size,
             expires_at=expires_at,
             status=status,
+            cache_key=cache_key,
         )
 
         self.db.add(history)
@@ -112,6 +123,138 @@ class ReportRepository(BaseRepository[ReportTemplate]):
 
         return history
 
+    async def get_history_record(self, history_id: UUID) -> Optional[ReportHistory]:
+        """
+        Get a report history record by ID.
+
+        Args:
+            history_id: ReportHistory UUID
+
+        Returns:
+            ReportHistory or None
+        """
+        return await self.db.get(ReportHistory, history_id)
+
+    async def lock_export_group(self, cache_key: str, format: ReportFormat) -> None:
+        """
+        Serialize work on the exports of one report result and format.
+
+        Takes a transaction-level advisory lock, released on commit or
+        rollback, so rows joining a pending render and the render finishing
+        never interleave.
+
+        Args:
+            cache_key: Report result cache key
+            format: Export format
+        """
+        key = func.hashtext(f"report-export:{cache_key}:{format.value}")
+        await self.db.execute(select(func.pg_advisory_xact_lock(key)))
+
+    async def get_pending_exports(
+        self,
+        cache_key: str,
+        format: ReportFormat,
+        requested_after: Optional[datetime] = None,
+    ) -> Sequence[ReportHistory]:
+        """
+        Get the exports still waiting for a report result and format.
+
+        Args:
+            cache_key: Report result cache key
+            format: Export format
+            requested_after: Ignore exports requested before this datetime
+
+        Returns:
+            Pending ReportHistory records, oldest first
+        """
+        conditions = [
+            ReportHistory.cache_key == cache_key,
+            ReportHistory.format == format,
+            ReportHistory.status == ReportStatus.PENDING,
+        ]
+        if requested_after is not None:
+            conditions.append(ReportHistory.generated_at > requested_after)
+
+        stmt = (
+            select(ReportHistory)
+            .where(and_(*conditions))
+            .order_by(ReportHistory.generated_at)
+        )
+
+        result = await self.db.execute(stmt)
+        return result.scalars().all()
+
+    async def mark_downloaded(self, history_id: UUID) -> None:
+        """
+        Record a download of a report file, as of the database clock.
+
+        Args:
+            history_id: ReportHistory UUID
+        """
+        stmt = (
+            update(ReportHistory)
+            .where(ReportHistory.id == history_id)
+            .values(last_downloaded_at=func.now())
+        )
+        await self.db.execute(stmt)
+
+    async def fail_pending_before(self, before: datetime) -> int:
+        """
+        Mark exports still pending since before a datetime as failed.
+
+        Args:
+            before: Requests older than this are considered orphaned
+
+        Returns:
+            Number of records marked as failed
+        """
+        stmt = (
+            update(ReportHistory)
+            .where(
+                and_(
+                    ReportHistory.status == ReportStatus.PENDING,
+                    ReportHistory.generated_at < before,
+                )
+            )
+            .values(status=ReportStatus.FAILED, cache_key=None)
+        )
+
+        result = await self.db.execute(stmt)
+        return result.rowcount
+
+    async def get_rendered_export(
+        self, cache_key: str, format: ReportFormat, rendered_after: datetime
+    ) -> Optional[ReportHistory]:
+        """
+        Get the latest unexpired file rendered for a report cache key.
+
+        Args:
+            cache_key: Report result cache key
+            format: Export format
+            rendered_after: Ignore files generated before this datetime
+
+        Returns:
+            ReportHistory with the file or None
+        """
+        stmt = (
+            select(ReportHistory)
+            .where(
+                and_(
+                    ReportHistory.cache_key == cache_key,
+                    ReportHistory.format == format,
+                    ReportHistory.status == ReportStatus.COMPLETED,
+                    ReportHistory.file_path.is_not(None),
+                    ReportHistory.expires_at > datetime.utcnow(),
+                    ReportHistory.generated_at > rendered_after,
+                )
+            )
+            .order_by(ReportHistory.generated_at.desc())
+            .limit(1)
+        )
+
+        result = await self.db.execute(stmt)
+        return result.scalar_one_or_none()
+
     async def get_history(
         self,
         user_id: UUID,
@@ -141,42 +284,188 @@ class ReportRepository(BaseRepository[ReportTemplate]):
         if format:
             conditions.append(ReportHistory.format == format)
 
-        # Count query
-        count_stmt = select(func.count()).select_from(ReportHistory).where(and_(*conditions))
-        total = await self.db.scalar(count_stmt) or 0
-
-        # Data query
         stmt = (
             select(ReportHistory)
             .where(and_(*conditions))
             .order_by(ReportHistory.generated_at.desc())
-            .offset(skip)
+        )
+
+        return await self.paginate(stmt, skip=skip, limit=limit)
+
+    async def delete_expired(self, now: datetime, limit: int) -> list[str]:
+        """
+        Delete a batch of expired history records in one statement.
+
+        Args:
+            now: Current datetime
+            limit: Maximum number of records to delete
+
+        Returns:
+            File paths of the deleted records (files may be shared with
+            records that remain; see get_referenced_paths)
+        """
+        expired = (
+            select(ReportHistory.id)
+            .where(ReportHistory.expires_at <= now)
             .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = (
+            delete(ReportHistory)
+            .where(ReportHistory.id.in_(expired.scalar_subquery()))
+            .returning(ReportHistory.file_path)
         )
 
         result = await self.db.execute(stmt)
-        history_list = result.scalars().all()
+        return [file_path for file_path in result.scalars().all() if file_path]
+
+    async def get_files_over_quota(self, quota_bytes: int, limit: int) -> list[str]:
+        """
+        Least recently used files beyond a storage quota.
+
+        Files are ranked by their last download, or generation when never
+        downloaded, across every record sharing them; the most recently used
+        files that fit in the quota are kept.
 
-        return history_list, total
+        Args:
+            quota_bytes: Total bytes to keep
+            limit: Maximum number of files to return
 
-    async def cleanup_expired_files(self) -> int:
+        Returns:
+            File paths to evict, least recently used first
         """
-        Remove expired report files from history.
+        files = (
+            select(
+                ReportHistory.file_path,
+                func.max(ReportHistory.file_size).label("file_size"),
+                func.max(
+                    func.coalesce(ReportHistory.last_downloaded_at, ReportHistory.generated_at)
+                ).label("last_used_at"),
+            )
+            .where(
+                and_(
+                    ReportHistory.file_path.is_not(None),
+                    ReportHistory.status == ReportStatus.COMPLETED,
+                )
+            )
+            .group_by(ReportHistory.file_path)
+            .subquery()
+        )
+        ranked = select(
+            files.c.file_path,
+            files.c.last_used_at,
+            func.sum(func.coalesce(files.c.file_size, 0))
+            .over(order_by=(files.c.last_used_at.desc(), files.c.file_path))
+            .label("kept_bytes"),
+        ).subquery()
+        stmt = (
+            select(ranked.c.file_path)
+            .where(ranked.c.kept_bytes > literal(quota_bytes, BigInteger))
+            .order_by(ranked.c.last_used_at, ranked.c.file_path)
+            .limit(limit)
+        )
+
+        result = await self.db.execute(stmt)
+        return list(result.scalars().all())
+
+    async def delete_by_file_paths(self, file_paths: Sequence[str]) -> list[str]:
+        """
+        Delete every history record pointing at some files.
+
+        Args:
+            file_paths: File paths
 
         Returns:
-            Number of records cleaned up
+            File paths of the deleted records
         """
-        now = datetime.utcnow()
+        if not file_paths:
+            return []
+
+        stmt = (
+            delete(ReportHistory)
+            .where(ReportHistory.file_path.in_(file_paths))
+            .returning(ReportHistory.file_path)
+        )
 
-        stmt = select(ReportHistory).where(ReportHistory.expires_at <= now)
         result = await self.db.execute(stmt)
-        expired_records = result.scalars().all()
+        return list(set(result.scalars().all()))
 
-        count = len(expired_records)
-        for record in expired_records:
-            await self.db.delete(record)
+    async def get_referenced_paths(self, file_paths: Sequence[str]) -> set[str]:
+        """
+        Which of some files are still referenced by a history record.
 
-        await self.db.flush()
+        Args:
+            file_paths: File paths
+
+        Returns:
+            Referenced file paths
+        """
+        if not file_paths:
+            return set()
+
+        stmt = (
+            select(ReportHistory.file_path)
+            .where(ReportHistory.file_path.in_(file_paths))
+            .distinct()
+        )
+
+        result = await self.db.execute(stmt)
+        return set(result.scalars().all())
+
+
+class ReportScheduleRepository(BaseRepository[ReportSchedule]):
+    """Repository for ReportSchedule operations."""
+
+    def __init__(self, db: AsyncSession):
+        super().__init__(ReportSchedule, db)
+
+    async def get_user_schedules(self, user_id: UUID) -> Sequence[ReportSchedule]:
+        """
+        Get schedules created by a user.
+
+        Args:
+            user_id: User UUID
+
+        Returns:
+            List of schedules
+        """
+        stmt = (
+            select(ReportSchedule)
+            .where(ReportSchedule.created_by_id == user_id)
+            .order_by(ReportSchedule.name)
+        )
 
-        return count
+        result = await self.db.execute(stmt)
+        return result.scalars().all()
+
+    async def claim_due(self, now: datetime, limit: int) -> Sequence[ReportSchedule]:
+        """
+        Lock the active schedules due at a moment, oldest first.
+
+        Rows locked by another worker are skipped, so each due schedule is
+        claimed by one worker; the lock lasts until the transaction ends.
+
+        Args:
+            now: Current datetime
+            limit: Maximum number of schedules
+
+        Returns:
+            List of due schedules with their templates loaded
+        """
+        stmt = (
+            select(ReportSchedule)
+            .where(
+                and_(
+                    ReportSchedule.is_active.is_(True),
+                    ReportSchedule.next_run_at <= now,
+                )
+            )
+            .options(selectinload(ReportSchedule.template))
+            .order_by(ReportSchedule.next_run_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True, of=ReportSchedule)
+        )
+
+        result = await self.db.execute(stmt)
+        return result.scalars().all()
 
@@ -5,18 +5,29 @@ from decimal import Decimal
 from typing import Optional, Sequence
 from uuid import UUID
 
-from sqlalchemy import and_, func, or_, select
+from sqlalchemy import Date, and_, case, func, literal, or_, select, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.db.models.client import Client
 from app.db.models.finance import FinancialTransaction, PaymentStatus
-from app.db.repositories.base import BaseRepository
+from app.db.repositories.base import BaseRepository, SortKey, keyset_after, keyset_order_by
+
+
+# Rows per multi-row INSERT, keeps bind parameters well under the asyncpg limit
+BULK_INSERT_CHUNK_SIZE = 1000
 
 
 class TransactionRepository(BaseRepository[FinancialTransaction]):
     """Repository for FinancialTransaction operations."""
 
+    list_sort_keys = (
+        SortKey(FinancialTransaction.due_date, descending=True, parse=date.fromisoformat),
+        SortKey(FinancialTransaction.id, descending=True, parse=UUID),
+    )
+
     def __init__(self, db: AsyncSession):
         super().__init__(FinancialTransaction, db)
 
@@ -64,27 +75,13 @@ class TransactionRepository(BaseRepository[FinancialTransaction]):
         if due_date_to:
             conditions.append(FinancialTransaction.due_date <= due_date_to)
 
-        # Count query
-        count_stmt = (
-            select(func.count())
-            .select_from(FinancialTransaction)
-            .where(and_(*conditions))
-        )
-        total = await self.db.scalar(count_stmt) or 0
-
-        # Data query
         stmt = (
             select(FinancialTransaction)
             .where(and_(*conditions))
             .options(selectinload(FinancialTransaction.client))
             .order_by(FinancialTransaction.due_date.desc())
-            .offset(skip)
-            .limit(limit)
         )
-        result = await self.db.execute(stmt)
-        transactions = result.scalars().all()
-
-        return transactions, total
+        return await self.paginate(stmt, skip=skip, limit=limit)
 
     async def list_with_filters(
         self,
@@ -95,8 +92,18 @@ class TransactionRepository(BaseRepository[FinancialTransaction]):
         due_date_to: Optional[date] = None,
         skip: int = 0,
         limit: int = 100,
-    ) -> tuple[Sequence[FinancialTransaction], int]:
-        """List transactions with optional filters."""
+        cursor: Optional[str] = None,
+        with_total: bool = True,
+    ) -> tuple[Sequence[FinancialTransaction], Optional[int]]:
+        """
+        List transactions with optional filters.
+
+        Pages are addressed either by skip or, without OFFSET, by a cursor
+        from next_cursor() (which then replaces skip).
+
+        Raises:
+            ValueError: If the cursor is invalid
+        """
         conditions = [FinancialTransaction.deleted_at.is_(None)]
 
         if client_id:
@@ -114,27 +121,20 @@ class TransactionRepository(BaseRepository[FinancialTransaction]):
         if due_date_to:
             conditions.append(FinancialTransaction.due_date <= due_date_to)
 
-        # Count query
-        count_stmt = (
-            select(func.count())
-            .select_from(FinancialTransaction)
-            .where(and_(*conditions))
-        )
-        total = await self.db.scalar(count_stmt) or 0
-
-        # Data query with client data
+        # Data query with client data; the total comes with the page
         stmt = (
             select(FinancialTransaction)
             .where(and_(*conditions))
             .options(selectinload(FinancialTransaction.client))
-            .order_by(FinancialTransaction.due_date.desc())
-            .offset(skip)
-            .limit(limit)
+            .order_by(*keyset_order_by(self.list_sort_keys))
+        )
+        return await self.paginate(
+            stmt,
+            skip=skip,
+            limit=limit,
+            after=keyset_after(self.list_sort_keys, cursor) if cursor else None,
+            with_total=with_total,
         )
-        result = await self.db.execute(stmt)
-        transactions = result.scalars().all()
-
-        return transactions, total
 
     async def get_by_client_and_reference_month(
         self, client_id: UUID, reference_month: date
@@ -154,6 +154,65 @@ class TransactionRepository(BaseRepository[FinancialTransaction]):
         result = await self.db.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def get_client_ids_with_reference_month(self, reference_month: date) -> set[UUID]:
+        """Get IDs of clients that already have a transaction for a reference month."""
+        stmt = (
+            select(FinancialTransaction.client_id)
+            .where(
+                and_(
+                    FinancialTransaction.reference_month == reference_month,
+                    FinancialTransaction.deleted_at.is_(None),
+                )
+            )
+            .distinct()
+        )
+        result = await self.db.execute(stmt)
+        return set(result.scalars().all())
+
+    async def bulk_insert_skip_existing(
+        self, rows: list[dict]
+    ) -> list[Row]:
+        """
+        Insert many transactions with multi-row INSERT ... ON CONFLICT DO NOTHING.
+
+        Conflicts are resolved against the unique (client_id, reference_month)
+        index on live rows, so concurrent runs never create duplicates.
+
+        Args:
+            rows: Column values for each new transaction
+
+        Returns:
+            (id, client_id, reference_month, transaction_type, payment_status, amount)
+            for the rows actually inserted
+        """
+        inserted: list[Row] = []
+
+        for start in range(0, len(rows), BULK_INSERT_CHUNK_SIZE):
+            chunk = rows[start:start + BULK_INSERT_CHUNK_SIZE]
+            stmt = (
+                insert(FinancialTransaction)
+                .values(chunk)
+                .on_conflict_do_nothing(
+                    index_elements=[
+                        FinancialTransaction.client_id,
+                        FinancialTransaction.reference_month,
+                    ],
+                    index_where=text("deleted_at IS NULL"),
+                )
+                .returning(
+                    FinancialTransaction.id,
+                    FinancialTransaction.client_id,
+                    FinancialTransaction.reference_month,
+                    FinancialTransaction.transaction_type,
+                    FinancialTransaction.payment_status,
+                    FinancialTransaction.amount,
+                )
+            )
+            result = await self.db.execute(stmt)
+            inserted.extend(result.all())
+
+        return inserted
+
     async def get_client_balance(self, client_id: UUID) -> Decimal:
         """Calculate total outstanding balance for a client."""
         stmt = (
@@ -285,17 +344,125 @@ class TransactionRepository(BaseRepository[FinancialTransaction]):
         result = await self.db.execute(stmt)
         return result.all()
 
+    async def get_dashboard_totals(
+        self,
+        current_month: date,
+        previous_month: date,
+    ) -> dict[str, Decimal | int]:
+        """
+        Get dashboard totals and counts in a single conditional-aggregate pass.
+
+        Only rows that can contribute to a KPI are scanned: open receivables
+        (pending/overdue) and anything referencing the current or previous month.
+        """
+        amount = FinancialTransaction.amount
+        status = FinancialTransaction.payment_status
+        month = FinancialTransaction.reference_month
+
+        is_pendente = status == PaymentStatus.PENDENTE
+        is_atrasado = status == PaymentStatus.ATRASADO
+        is_pago_mes_atual = and_(status == PaymentStatus.PAGO, month == current_month)
+        is_pago_mes_anterior = and_(status == PaymentStatus.PAGO, month == previous_month)
+
+        stmt = (
+            select(
+                func.coalesce(func.sum(amount).filter(is_pago_mes_atual), 0)
+                .label("total_receita_mes_atual"),
+                func.coalesce(func.sum(amount).filter(is_pago_mes_anterior), 0)
+                .label("total_receita_mes_anterior"),
+                func.coalesce(func.sum(amount).filter(is_pendente), 0).label("total_pendente"),
+                func.coalesce(func.sum(amount).filter(is_atrasado), 0).label("total_atrasado"),
+                func.count().filter(is_pendente).label("count_pendente"),
+                func.count().filter(is_atrasado).label("count_atrasado"),
+                func.count().filter(is_pago_mes_atual).label("count_pago_mes_atual"),
+            )
+            .where(
+                and_(
+                    FinancialTransaction.deleted_at.is_(None),
+                    or_(
+                        status.in_([PaymentStatus.PENDENTE, PaymentStatus.ATRASADO]),
+                        month.in_([current_month, previous_month]),
+                    ),
+                )
+            )
+        )
+        result = await self.db.execute(stmt)
+        return dict(result.one()._mapping)
+
     async def get_top_clients_by_outstanding(
         self, limit: int = 10
     ) -> Sequence[tuple[UUID, str, Decimal]]:
-        """Get top clients with highest outstanding balance."""
+        """
+        Get top clients with highest outstanding balance.
+
+        Balances are ranked with a window function before joining clients, so only
+        the top ``limit`` rows are joined instead of every client with a balance.
+        """
+        outstanding_total = func.sum(FinancialTransaction.amount)
+        ranked = (
+            select(
+                FinancialTransaction.client_id,
+                outstanding_total.label("total_pendente"),
+                func.row_number()
+                .over(order_by=(outstanding_total.desc(), FinancialTransaction.client_id))
+                .label("position"),
+            )
+            .where(
+                and_(
+                    FinancialTransaction.payment_status.in_([
+                        PaymentStatus.PENDENTE,
+                        PaymentStatus.ATRASADO,
+                    ]),
+                    FinancialTransaction.deleted_at.is_(None),
+                )
+            )
+            .group_by(FinancialTransaction.client_id)
+            .subquery()
+        )
+
         stmt = (
+            select(Client.id, Client.razao_social, ranked.c.total_pendente)
+            .join(ranked, ranked.c.client_id == Client.id)
+            .where(ranked.c.position <= limit)
+            .order_by(ranked.c.position)
+        )
+        result = await self.db.execute(stmt)
+        return result.all()
+
+    async def get_aging_buckets(
+        self,
+        as_of: date,
+        bucket_bounds: Sequence[int],
+        by_client: bool = False,
+    ) -> Sequence[Row]:
+        """
+        Get open receivables grouped into aging buckets by a single query.
+
+        Bucket 0 holds rows not due yet, bucket i (1..len(bucket_bounds)) rows at
+        most bucket_bounds[i-1] days overdue and the last bucket everything older.
+
+        Args:
+            as_of: Date the age is measured from
+            bucket_bounds: Increasing upper bounds (days overdue) of the overdue buckets
+            by_client: Also group by client
+
+        Returns:
+            Rows of (bucket, count, total_amount), preceded by
+            (client_id, client_name) when by_client is set
+        """
+        days_overdue = literal(as_of, Date) - FinancialTransaction.due_date
+        bucket = case(
+            (days_overdue < 0, 0),
+            *[(days_overdue <= bound, index) for index, bound in enumerate(bucket_bounds, start=1)],
+            else_=len(bucket_bounds) + 1,
+        )
+
+        aged = (
             select(
-                Client.id,
-                Client.razao_social,
-                func.sum(FinancialTransaction.amount).label("total_pendente"),
+                FinancialTransaction.client_id,
+                FinancialTransaction.amount,
+                bucket.label("bucket"),
             )
-            .join(Client, FinancialTransaction.client_id == Client.id)
             .where(
                 and_(
                     FinancialTransaction.payment_status.in_([
@@ -305,10 +472,28 @@ class TransactionRepository(BaseRepository[FinancialTransaction]):
                     FinancialTransaction.deleted_at.is_(None),
                 )
             )
-            .group_by(Client.id, Client.razao_social)
-            .order_by(func.sum(FinancialTransaction.amount).desc())
-            .limit(limit)
+            .subquery()
+        )
+
+        aggregates = (
+            func.count().label("count"),
+            func.sum(aged.c.amount).label("total_amount"),
         )
+
+        if by_client:
+            stmt = (
+                select(Client.id, Client.razao_social, aged.c.bucket, *aggregates)
+                .join(aged, aged.c.client_id == Client.id)
+                .group_by(Client.id, Client.razao_social, aged.c.bucket)
+                .order_by(Client.razao_social, Client.id, aged.c.bucket)
+            )
+        else:
+            stmt = (
+                select(aged.c.bucket, *aggregates)
+                .group_by(aged.c.bucket)
+                .order_by(aged.c.bucket)
+            )
+
         result = await self.db.execute(stmt)
         return result.all()
 
@@ -2,7 +2,7 @@
 User repository for database operations.
 """
 
-from typing import Optional
+from typing import Optional, Sequence
 from uuid import UUID
 
 from sqlalchemy import select
@@ -111,20 +111,25 @@ class UserRepository(BaseRepository[User]):
         if is_active is not None:
             stmt = stmt.where(User.is_active == is_active)
 
-        # Get total count
-        from sqlalchemy import func
-        count_stmt = select(func.count()).select_from(stmt.subquery())
-        total_result = await self.session.execute(count_stmt)
-        total = total_result.scalar() or 0
+        # Apply ordering; the page and its total come from one query
+        stmt = stmt.order_by(User.created_at.desc())
+        return await self.paginate(stmt, skip=skip, limit=limit)
 
-        # Apply pagination and ordering
-        stmt = stmt.order_by(User.created_at.desc()).offset(skip).limit(limit)
+    async def get_by_ids(self, ids: Sequence[UUID]) -> list[User]:
+        """
+        Get users by ID.
 
-        # Execute query
-        result = await self.session.execute(stmt)
-        users = list(result.scalars().all())
+        Args:
+            ids: User UUIDs
 
-        return users, total
+        Returns:
+            Users found (missing IDs are skipped)
+        """
+        if not ids:
+            return []
+
+        result = await self.session.execute(select(User).where(User.id.in_(ids)))
+        return list(result.scalars().all())
 
     async def get_users_by_client(self, client_id: UUID) -> list[User]:
         """
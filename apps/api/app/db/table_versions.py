@@ -0,0 +1,46 @@
+"""
+Per-table write versions.
+
+Postgres keeps cumulative counts of the rows inserted, updated and deleted
+in every table. Every worker, script and raw SQL statement feeds the same
+counts, so caches of data derived from a table can tell whether it changed,
+whichever process wrote to it.
+"""
+
+from typing import Iterable
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# ((table, rows written), ...)
+TableVersion = tuple[tuple[str, int], ...]
+
+_VERSIONS_SQL = text(
+    """
+    SELECT relname, n_tup_ins + n_tup_upd + n_tup_del
+    FROM pg_stat_user_tables
+    WHERE schemaname = current_schema() AND relname = ANY(:tables)
+    """
+)
+
+
+async def read_table_versions(session: AsyncSession, tables: Iterable[str]) -> TableVersion:
+    """
+    Version of a set of tables.
+
+    Reads the statistics views, not the tables, so it costs the same
+    whatever their size. Statistics are published shortly after a
+    transaction commits (about a second at most), and rolled back writes
+    count too, which only changes the version needlessly.
+
+    Args:
+        session: Database session
+        tables: Table names
+
+    Returns:
+        Hashable version that changes whenever one of the tables changes
+    """
+    names = sorted(set(tables))
+    result = await session.execute(_VERSIONS_SQL, {"tables": names})
+    written = {name: int(count) for name, count in result.all()}
+    return tuple((name, written.get(name, 0)) for name in names)
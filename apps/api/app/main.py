@@ -7,13 +7,14 @@ import logging
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
 from app.api.v1.router import api_router
 from app.core.config import settings
 from app.core.database import db_manager
+from app.core.passwords import PasswordHasherBusy, password_hasher
 
 # Configure logging
 logging.basicConfig(
@@ -22,8 +23,11 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Background task handle
+# Background task handles
 _expiration_task: asyncio.Task | None = None
+_report_schedule_task: asyncio.Task | None = None
+_report_janitor_task: asyncio.Task | None = None
+_token_revocation_task: asyncio.Task | None = None
 
 
 async def _schedule_license_expiration_checks() -> None:
@@ -62,13 +66,74 @@ async def _schedule_license_expiration_checks() -> None:
             await asyncio.sleep(3600)
 
 
+async def _schedule_report_runs() -> None:
+    """
+    Run due report schedules.
+    Polls every REPORT_SCHEDULE_POLL_SECONDS.
+    """
+    from app.services.report.scheduler import report_scheduler
+
+    while True:
+        try:
+            await report_scheduler.run_due()
+            await asyncio.sleep(settings.REPORT_SCHEDULE_POLL_SECONDS)
+
+        except asyncio.CancelledError:
+            logger.info("Report schedule task cancelled")
+            break
+        except Exception as e:
+            logger.error(f"Error running scheduled reports: {e}", exc_info=True)
+            await asyncio.sleep(settings.REPORT_SCHEDULE_POLL_SECONDS)
+
+
+async def _schedule_report_file_cleanup() -> None:
+    """
+    Remove expired and over-quota report files.
+    Runs every REPORT_JANITOR_INTERVAL_SECONDS.
+    """
+    from app.services.report.janitor import report_file_janitor
+
+    while True:
+        try:
+            await report_file_janitor.run()
+            await asyncio.sleep(settings.REPORT_JANITOR_INTERVAL_SECONDS)
+
+        except asyncio.CancelledError:
+            logger.info("Report file cleanup task cancelled")
+            break
+        except Exception as e:
+            logger.error(f"Error cleaning up report files: {e}", exc_info=True)
+            await asyncio.sleep(settings.REPORT_JANITOR_INTERVAL_SECONDS)
+
+
+async def _sync_token_revocations() -> None:
+    """
+    Load token families revoked by other workers.
+    Polls every REFRESH_TOKEN_REVOCATION_SYNC_SECONDS.
+    """
+    from app.services.refresh_tokens import refresh_token_store
+
+    while True:
+        try:
+            async with db_manager.session_factory() as session:
+                await refresh_token_store.sync(session)
+            await asyncio.sleep(settings.REFRESH_TOKEN_REVOCATION_SYNC_SECONDS)
+
+        except asyncio.CancelledError:
+            logger.info("Token revocation sync task cancelled")
+            break
+        except Exception as e:
+            logger.error(f"Error syncing token revocations: {e}", exc_info=True)
+            await asyncio.sleep(settings.REFRESH_TOKEN_REVOCATION_SYNC_SECONDS)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """
     Application lifespan events.
     Startup and shutdown logic.
     """
-    global _expiration_task
+    global _expiration_task, _report_schedule_task, _report_janitor_task, _token_revocation_task
 
     # Startup
     logger.info("Starting application...")
@@ -83,6 +148,59 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     except Exception as e:
         logger.error(f"✗ Database connection failed: {e}")
 
+    # Derive the field encryption keys once, off the event loop
+    try:
+        from app.core.security import get_field_key_ring
+        await asyncio.to_thread(get_field_key_ring)
+        logger.info("✓ Field encryption keys loaded")
+    except Exception as e:
+        logger.error(f"✗ Failed to load field encryption keys: {e}")
+
+    # Warm the obligation type catalog
+    try:
+        from app.services.obligation_type_catalog import obligation_type_catalog
+        async for session in db_manager.get_session():
+            await obligation_type_catalog.refresh(session)
+            break
+        logger.info("✓ Obligation type catalog loaded")
+    except Exception as e:
+        logger.error(f"✗ Failed to load obligation type catalog: {e}")
+
+    # Build the client autocomplete index
+    try:
+        from app.services.client_search_index import client_search_index
+        async for session in db_manager.get_session():
+            await client_search_index.refresh(session)
+            break
+        logger.info("✓ Client search index loaded")
+    except Exception as e:
+        logger.error(f"✗ Failed to load client search index: {e}")
+
+    # Connect the WebSocket manager to the other workers
+    try:
+        from app.websockets.backplane import PostgresBackplane
+        from app.websockets.manager import manager
+        if settings.WEBSOCKET_BACKPLANE == "postgres":
+            await manager.start(
+                PostgresBackplane(
+                    dsn=str(settings.DATABASE_WRITE_URL).replace("postgresql+asyncpg://", "postgresql://", 1),
+                    channel=settings.WEBSOCKET_BACKPLANE_CHANNEL,
+                )
+            )
+        else:
+            await manager.start()
+        logger.info(f"✓ WebSocket backplane started ({settings.WEBSOCKET_BACKPLANE})")
+    except Exception as e:
+        logger.error(f"✗ Failed to start WebSocket backplane: {e}")
+
+    # Start report export workers
+    try:
+        from app.services.report.export_jobs import report_job_queue
+        await report_job_queue.start()
+        logger.info(f"✓ Report export workers started ({report_job_queue.workers})")
+    except Exception as e:
+        logger.error(f"✗ Failed to start report export workers: {e}")
+
     # Start background task for license expiration checks
     try:
         _expiration_task = asyncio.create_task(_schedule_license_expiration_checks())
@@ -90,6 +208,27 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     except Exception as e:
         logger.error(f"✗ Failed to start license expiration check task: {e}")
 
+    # Start background task for scheduled reports
+    try:
+        _report_schedule_task = asyncio.create_task(_schedule_report_runs())
+        logger.info("✓ Report schedule task started")
+    except Exception as e:
+        logger.error(f"✗ Failed to start report schedule task: {e}")
+
+    # Start background task for report file cleanup
+    try:
+        _report_janitor_task = asyncio.create_task(_schedule_report_file_cleanup())
+        logger.info("✓ Report file cleanup task started")
+    except Exception as e:
+        logger.error(f"✗ Failed to start report file cleanup task: {e}")
+
+    # Start background task for token revocation sync
+    try:
+        _token_revocation_task = asyncio.create_task(_sync_token_revocations())
+        logger.info("✓ Token revocation sync task started")
+    except Exception as e:
+        logger.error(f"✗ Failed to start token revocation sync task: {e}")
+
     yield
 
     # Shutdown
@@ -104,6 +243,42 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             pass
         logger.info("✓ License expiration check task cancelled")
 
+    if _report_schedule_task:
+        _report_schedule_task.cancel()
+        try:
+            await _report_schedule_task
+        except asyncio.CancelledError:
+            pass
+        logger.info("✓ Report schedule task cancelled")
+
+    if _report_janitor_task:
+        _report_janitor_task.cancel()
+        try:
+            await _report_janitor_task
+        except asyncio.CancelledError:
+            pass
+        logger.info("✓ Report file cleanup task cancelled")
+
+    if _token_revocation_task:
+        _token_revocation_task.cancel()
+        try:
+            await _token_revocation_task
+        except asyncio.CancelledError:
+            pass
+        logger.info("✓ Token revocation sync task cancelled")
+
+    from app.services.report.export_jobs import report_job_queue
+    await report_job_queue.stop()
+    logger.info("✓ Report export workers stopped")
+
+    from app.websockets.manager import manager
+    await manager.stop()
+    logger.info("✓ WebSocket backplane stopped")
+
+    from app.services.report.exporters.pdf_renderer import shutdown_render_pool
+    shutdown_render_pool()
+    password_hasher.shutdown()
+
     await db_manager.close()
     logger.info("✓ Database connections closed")
 
@@ -146,6 +321,16 @@ async def root() -> JSONResponse:
     )
 
 
+@app.exception_handler(PasswordHasherBusy)
+async def password_hasher_busy_handler(request: Request, exc: PasswordHasherBusy) -> JSONResponse:
+    """Turn away password operations while the hashing pool is saturated."""
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": "Too many login attempts in progress, try again shortly"},
+        headers={"Retry-After": "1"},
+    )
+
+
 # Exception handlers can be added here
 # @app.exception_handler(CustomException)
 # async def custom_exception_handler(request, exc):
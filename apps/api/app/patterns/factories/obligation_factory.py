@@ -3,18 +3,18 @@ Factory for creating obligations based on client type.
 """
 
 import logging
-from datetime import date
+from datetime import date, datetime, timezone
 from typing import List, Optional
 from uuid import UUID, uuid4
 
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.models.client import Client, TipoEmpresa
+from app.db.models.client import Client, ClientStatus, RegimeTributario, TipoEmpresa
 from app.db.models.obligation import Obligation
 from app.db.models.obligation_event import ObligationEvent, ObligationEventType
-from app.db.models.obligation_type import ObligationType
 from app.patterns.strategies import (
+    ApplicabilityMatrix,
     CommerceRule,
     IndustryRule,
     MEIRule,
@@ -22,9 +22,16 @@ from app.patterns.strategies import (
     ServiceRule,
 )
 from app.schemas.obligation import ObligationStatus
+from app.services.obligation_type_catalog import obligation_type_catalog
 
 logger = logging.getLogger(__name__)
 
+# Rows per multi-row INSERT in bulk generation
+BULK_CHUNK_SIZE = 1000
+
+# Applicability matrix of the current catalog version (strategies are stateless)
+_applicability_matrix: Optional[ApplicabilityMatrix] = None
+
 
 class ObligationFactory:
     """
@@ -58,18 +65,40 @@ class ObligationFactory:
         Returns:
             ObligationRule strategy instance
         """
+        return self._strategy_for(client.tipo_empresa, client.regime_tributario)
+
+    def _strategy_for(
+        self,
+        tipo_empresa: TipoEmpresa,
+        regime_tributario: RegimeTributario,
+    ) -> ObligationRule:
+        """Get the strategy for a (tipo_empresa, regime_tributario) pair."""
         # MEI has special treatment
-        from app.db.models.client import RegimeTributario
-        if client.regime_tributario == RegimeTributario.MEI:
+        if regime_tributario == RegimeTributario.MEI:
             return self.mei_strategy
 
         # Get strategy based on tipo_empresa
-        strategy = self.strategies.get(client.tipo_empresa)
+        strategy = self.strategies.get(tipo_empresa)
         if not strategy:
-            raise ValueError(f"No strategy found for tipo_empresa: {client.tipo_empresa}")
+            raise ValueError(f"No strategy found for tipo_empresa: {tipo_empresa}")
 
         return strategy
 
+    async def get_applicability_matrix(self) -> ApplicabilityMatrix:
+        """
+        Get the applicability matrix for the current obligation type catalog.
+
+        The matrix is compiled once per catalog version and shared across
+        factory instances.
+        """
+        global _applicability_matrix
+
+        catalog = await obligation_type_catalog.get(self.db)
+        if _applicability_matrix is None or _applicability_matrix.catalog_version != catalog.version:
+            _applicability_matrix = ApplicabilityMatrix.build(catalog, self._strategy_for)
+
+        return _applicability_matrix
+
     async def generate_for_client(
         self,
         client: Client,
@@ -95,28 +124,21 @@ class ObligationFactory:
             logger.info(f"Skipping obligation generation for client {client.id}: not eligible")
             return []
 
-        # Get applicable type codes
-        type_codes = strategy.get_applicable_type_codes(client)
-
-        # Fetch ObligationType models
-        result = await self.db.execute(
-            select(ObligationType).where(
-                ObligationType.code.in_(type_codes),
-                ObligationType.is_active == True
-            )
-        )
-        obligation_types = result.scalars().all()
+        # Resolve applicable active obligation types from the matrix
+        matrix = await self.get_applicability_matrix()
+        obligation_types = [matrix.types_by_id[type_id] for type_id in matrix.type_ids_for(client)]
 
         if not obligation_types:
             logger.warning(f"No active obligation types found for client {client.id}")
             return []
 
-        # Check for duplicates
+        # Check for duplicates (generated obligations fall due in the following month)
+        window_start, window_end = self._due_window(reference_month)
         existing_result = await self.db.execute(
             select(Obligation).where(
                 Obligation.client_id == client.id,
-                Obligation.due_date >= reference_month,
-                Obligation.due_date < self._next_month(reference_month),
+                Obligation.due_date >= window_start,
+                Obligation.due_date < window_end,
                 Obligation.deleted_at.is_(None)
             )
         )
@@ -172,29 +194,29 @@ class ObligationFactory:
         self,
         reference_month: date,
         client_ids: Optional[List[UUID]] = None,
-        user_id: Optional[UUID] = None
+        user_id: Optional[UUID] = None,
+        chunk_size: int = BULK_CHUNK_SIZE,
+        commit_per_chunk: bool = False,
     ) -> dict:
         """
-        Generate obligations for multiple clients.
+        Generate obligations for multiple clients in a batched pipeline.
+
+        Matches each client against the applicability matrix, loads the month's
+        existing obligations once and bulk-inserts obligations and their
+        creation events in chunks. A client that fails to match or generate
+        is counted in errors and skipped.
 
         Args:
             reference_month: Reference month (first day)
             client_ids: Optional list of specific client IDs
             user_id: Optional user ID who triggered generation
+            chunk_size: Rows per multi-row INSERT
+            commit_per_chunk: Commit after each chunk instead of once at the end
 
         Returns:
             Dict with generation statistics
         """
-        # Get clients
-        query = select(Client).where(
-            Client.deleted_at.is_(None)
-        )
-
-        if client_ids:
-            query = query.where(Client.id.in_(client_ids))
-
-        result = await self.db.execute(query)
-        clients = result.scalars().all()
+        clients = await self._get_active_clients(client_ids)
 
         if not clients:
             logger.warning("No clients found for bulk generation")
@@ -204,26 +226,71 @@ class ObligationFactory:
                 "errors": 0
             }
 
-        # Generate for each client
-        total_created = 0
+        matrix = await self.get_applicability_matrix()
+
+        existing_keys = await self._get_existing_keys(reference_month, client_ids)
+
+        # Run strategy rules in memory
+        obligation_rows = []
+        event_rows = []
         errors = 0
+        description = f"Referência: {reference_month.strftime('%m/%Y')}"
+        event_description = (
+            f"Obrigação criada automaticamente para {reference_month.strftime('%m/%Y')}"
+        )
+        extra_data = {"source": "factory", "reference_month": reference_month.isoformat()}
+        now = datetime.now(timezone.utc)
 
         for client in clients:
             try:
-                obligations = await self.generate_for_client(
-                    client=client,
-                    reference_month=reference_month,
-                    user_id=user_id
-                )
-                total_created += len(obligations)
+                strategy = matrix.strategy_for(client)
+                if not strategy.should_generate_for_client(client):
+                    continue
+
+                # Matched per client, so one bad client only fails itself
+                for type_id in matrix.type_ids_for(client):
+                    if (client.id, type_id) in existing_keys:
+                        continue
+
+                    ob_type = matrix.types_by_id[type_id]
+
+                    due_date = strategy.calculate_due_date(ob_type, reference_month)
+                    obligation_id = uuid4()
+
+                    obligation_rows.append({
+                        "id": obligation_id,
+                        "client_id": client.id,
+                        "obligation_type_id": ob_type.id,
+                        "due_date": due_date,
+                        "priority": strategy.get_priority(ob_type, due_date),
+                        "status": ObligationStatus.PENDENTE,
+                        "description": description,
+                    })
+                    event_rows.append({
+                        "id": uuid4(),
+                        "obligation_id": obligation_id,
+                        "user_id": user_id,
+                        "event_type": ObligationEventType.CREATED,
+                        "description": event_description,
+                        "extra_data": extra_data,
+                        "created_at": now,
+                    })
 
             except Exception as e:
                 logger.error(f"Error generating obligations for client {client.id}: {e}", exc_info=True)
                 errors += 1
 
+        # Bulk insert obligations and their events chunk by chunk
+        for start in range(0, len(obligation_rows), chunk_size):
+            await self.db.execute(insert(Obligation).values(obligation_rows[start:start + chunk_size]))
+            await self.db.execute(insert(ObligationEvent).values(event_rows[start:start + chunk_size]))
+            if commit_per_chunk:
+                await self.db.commit()
+
         # Commit all changes
         await self.db.commit()
 
+        total_created = len(obligation_rows)
         logger.info(f"Bulk generation complete: {total_created} obligations for {len(clients)} clients")
 
         return {
@@ -232,6 +299,86 @@ class ObligationFactory:
             "errors": errors
         }
 
+    async def preview_bulk(
+        self,
+        reference_month: date,
+        client_ids: Optional[List[UUID]] = None,
+    ) -> list[dict]:
+        """
+        Preview bulk generation per obligation type without writing anything.
+
+        Uses the matrix reverse index to find which clients need each type.
+
+        Args:
+            reference_month: Reference month (first day)
+            client_ids: Optional list of specific client IDs
+
+        Returns:
+            One dict per applicable obligation type, ordered by code
+        """
+        clients = await self._get_active_clients(client_ids)
+        if not clients:
+            return []
+
+        matrix = await self.get_applicability_matrix()
+        existing_keys = await self._get_existing_keys(reference_month, client_ids)
+
+        preview = []
+        for type_id, type_client_ids in matrix.clients_by_type(clients).items():
+            ob_type = matrix.types_by_id[type_id]
+            existing = sum(1 for client_id in type_client_ids if (client_id, type_id) in existing_keys)
+            preview.append({
+                "obligation_type_id": type_id,
+                "obligation_type_code": ob_type.code,
+                "obligation_type_name": ob_type.name,
+                "client_count": len(type_client_ids),
+                "existing_count": existing,
+                "would_generate_count": len(type_client_ids) - existing,
+            })
+
+        preview.sort(key=lambda item: item["obligation_type_code"])
+        return preview
+
+    async def _get_active_clients(self, client_ids: Optional[List[UUID]] = None) -> list[Client]:
+        """Get active, non-deleted clients, optionally restricted to some IDs."""
+        query = select(Client).where(
+            Client.status == ClientStatus.ATIVO,
+            Client.deleted_at.is_(None)
+        )
+
+        if client_ids:
+            query = query.where(Client.id.in_(client_ids))
+
+        result = await self.db.execute(query)
+        return list(result.scalars().all())
+
+    async def _get_existing_keys(
+        self,
+        reference_month: date,
+        client_ids: Optional[List[UUID]] = None,
+    ) -> set[tuple[UUID, UUID]]:
+        """Get (client_id, obligation_type_id) of obligations already generated for a month."""
+        window_start, window_end = self._due_window(reference_month)
+        query = select(Obligation.client_id, Obligation.obligation_type_id).where(
+            Obligation.due_date >= window_start,
+            Obligation.due_date < window_end,
+            Obligation.deleted_at.is_(None)
+        )
+        if client_ids:
+            query = query.where(Obligation.client_id.in_(client_ids))
+
+        result = await self.db.execute(query)
+        return set(result.all())
+
+    def _due_window(self, reference_month: date) -> tuple[date, date]:
+        """
+        Get the [start, end) due-date window of obligations generated for a month.
+
+        Generated obligations fall due in the month after the reference month.
+        """
+        window_start = self._next_month(reference_month)
+        return window_start, self._next_month(window_start)
+
     def _next_month(self, reference_month: date) -> date:
         """Get the first day of next month."""
         if reference_month.month == 12:
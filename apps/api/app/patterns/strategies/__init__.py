@@ -3,6 +3,7 @@ Obligation rule strategies.
 """
 
 from app.patterns.strategies.base import ObligationRule
+from app.patterns.strategies.applicability import ApplicabilityMatrix
 from app.patterns.strategies.commerce_rule import CommerceRule
 from app.patterns.strategies.industry_rule import IndustryRule
 from app.patterns.strategies.mei_rule import MEIRule
@@ -14,4 +15,5 @@ __all__ = [
     "ServiceRule",
     "IndustryRule",
     "MEIRule",
+    "ApplicabilityMatrix",
 ]
@@ -0,0 +1,137 @@
+"""
+Precomputed obligation applicability matrix.
+"""
+
+from collections import defaultdict
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Callable, Iterable, Mapping
+from uuid import UUID
+
+from app.db.models.client import Client, RegimeTributario, TipoEmpresa
+from app.patterns.strategies.base import ObligationRule
+
+if TYPE_CHECKING:
+    from app.services.obligation_type_catalog import CatalogSnapshot, ObligationTypeEntry
+
+# (tipo_empresa, regime_tributario)
+ApplicabilityKey = tuple[TipoEmpresa, RegimeTributario]
+
+
+@dataclass(frozen=True)
+class ApplicabilityMatrix:
+    """
+    Obligation type ids applicable to each (tipo_empresa, regime_tributario).
+
+    Compiled once per catalog version from the strategies' regime codes,
+    resolved against the active types of the catalog. Codes that depend on
+    other client data (state, city) come from each strategy's overrides and
+    are resolved per client on top of the precomputed cell.
+    """
+
+    catalog_version: int
+    cells: Mapping[ApplicabilityKey, frozenset[UUID]]
+    strategies: Mapping[ApplicabilityKey, ObligationRule]
+    types_by_id: Mapping[UUID, "ObligationTypeEntry"]
+    active_by_code: Mapping[str, "ObligationTypeEntry"]
+
+    @classmethod
+    def build(
+        cls,
+        catalog: "CatalogSnapshot",
+        strategy_for: Callable[[TipoEmpresa, RegimeTributario], ObligationRule],
+    ) -> "ApplicabilityMatrix":
+        """
+        Compile the matrix for a catalog snapshot.
+
+        Args:
+            catalog: Obligation type catalog snapshot
+            strategy_for: Returns the strategy for a (tipo_empresa, regime) pair
+
+        Returns:
+            ApplicabilityMatrix
+        """
+        cells = {}
+        strategies = {}
+
+        for tipo_empresa in TipoEmpresa:
+            for regime in RegimeTributario:
+                strategy = strategy_for(tipo_empresa, regime)
+                strategies[(tipo_empresa, regime)] = strategy
+                cells[(tipo_empresa, regime)] = frozenset(
+                    catalog.active_by_code[code].id
+                    for code in strategy.get_base_type_codes(regime)
+                    if code in catalog.active_by_code
+                )
+
+        return cls(
+            catalog_version=catalog.version,
+            cells=MappingProxyType(cells),
+            strategies=MappingProxyType(strategies),
+            types_by_id=catalog.by_id,
+            active_by_code=catalog.active_by_code,
+        )
+
+    @staticmethod
+    def key_for(client: Client) -> ApplicabilityKey:
+        """Matrix key of a client."""
+        return TipoEmpresa(client.tipo_empresa), RegimeTributario(client.regime_tributario)
+
+    def strategy_for(self, client: Client) -> ObligationRule:
+        """Strategy that applies to a client."""
+        return self.strategies[self.key_for(client)]
+
+    def type_ids_for(self, client: Client) -> frozenset[UUID]:
+        """Applicable obligation type ids for a single client."""
+        key = self.key_for(client)
+        return self.cells[key] | self._override_ids(self.strategies[key], client)
+
+    def match(self, clients: Iterable[Client]) -> dict[UUID, frozenset[UUID]]:
+        """
+        Match many clients in one pass.
+
+        Clients are grouped by matrix key so each cell is looked up once per
+        group; only strategy overrides are evaluated per client.
+
+        Args:
+            clients: Clients to match
+
+        Returns:
+            Dict of client id to applicable obligation type ids
+        """
+        groups: dict[ApplicabilityKey, list[Client]] = defaultdict(list)
+        for client in clients:
+            groups[self.key_for(client)].append(client)
+
+        matches = {}
+        for key, group in groups.items():
+            cell = self.cells[key]
+            strategy = self.strategies[key]
+            for client in group:
+                overrides = self._override_ids(strategy, client)
+                matches[client.id] = cell | overrides if overrides else cell
+
+        return matches
+
+    def clients_by_type(self, clients: Iterable[Client]) -> dict[UUID, list[UUID]]:
+        """
+        Reverse index: which clients need each obligation type.
+
+        Args:
+            clients: Clients to index
+
+        Returns:
+            Dict of obligation type id to ids of the clients it applies to
+        """
+        index: dict[UUID, list[UUID]] = defaultdict(list)
+        for client_id, type_ids in self.match(clients).items():
+            for type_id in type_ids:
+                index[type_id].append(client_id)
+        return dict(index)
+
+    def _override_ids(self, strategy: ObligationRule, client: Client) -> frozenset[UUID]:
+        return frozenset(
+            self.active_by_code[code].id
+            for code in strategy.get_override_type_codes(client)
+            if code in self.active_by_code
+        )
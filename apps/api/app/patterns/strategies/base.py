@@ -4,12 +4,14 @@ Base strategy for obligation rules.
 
 from abc import ABC, abstractmethod
 from datetime import date
-from typing import List
+from typing import TYPE_CHECKING, List
 
-from app.db.models.client import Client
-from app.db.models.obligation_type import ObligationType
+from app.db.models.client import Client, RegimeTributario
 from app.schemas.obligation import ObligationPriority
 
+if TYPE_CHECKING:
+    from app.services.obligation_type_catalog import ObligationTypeEntry
+
 
 class ObligationRule(ABC):
     """
@@ -20,6 +22,36 @@ class ObligationRule(ABC):
     """
 
     @abstractmethod
+    def get_base_type_codes(self, regime_tributario: RegimeTributario) -> List[str]:
+        """
+        Returns obligation type codes that depend only on the tax regime.
+
+        These are precomputed per (tipo_empresa, regime_tributario) in the
+        applicability matrix, so they must not look at any other client data.
+
+        Args:
+            regime_tributario: Client tax regime
+
+        Returns:
+            List of obligation type codes (e.g., ["DAS_MENSAL", "DEFIS_ANUAL"])
+        """
+        pass
+
+    def get_override_type_codes(self, client: Client) -> List[str]:
+        """
+        Returns extra obligation type codes that depend on other client data
+        (state, city, ...).
+
+        Default implementation adds nothing.
+
+        Args:
+            client: Client model instance
+
+        Returns:
+            List of obligation type codes
+        """
+        return []
+
     def get_applicable_type_codes(self, client: Client) -> List[str]:
         """
         Returns obligation type codes applicable to this client.
@@ -30,11 +62,14 @@ class ObligationRule(ABC):
         Returns:
             List of obligation type codes (e.g., ["DAS_MENSAL", "DEFIS_ANUAL"])
         """
-        pass
+        return (
+            self.get_base_type_codes(client.regime_tributario)
+            + self.get_override_type_codes(client)
+        )
 
     def calculate_due_date(
         self,
-        obligation_type: ObligationType,
+        obligation_type: "ObligationTypeEntry",
         reference_month: date
     ) -> date:
         """
@@ -44,7 +79,7 @@ class ObligationRule(ABC):
         Can be overridden for custom logic.
 
         Args:
-            obligation_type: ObligationType instance
+            obligation_type: Catalog entry for the obligation type
             reference_month: Reference month (first day)
 
         Returns:
@@ -74,7 +109,7 @@ class ObligationRule(ABC):
 
     def get_priority(
         self,
-        obligation_type: ObligationType,
+        obligation_type: "ObligationTypeEntry",
         due_date: date
     ) -> ObligationPriority:
         """
@@ -84,7 +119,7 @@ class ObligationRule(ABC):
         Can be overridden for custom logic.
 
         Args:
-            obligation_type: ObligationType instance
+            obligation_type: Catalog entry for the obligation type
             due_date: Due date
 
         Returns:
@@ -15,12 +15,12 @@ class CommerceRule(ObligationRule):
     Defines which obligations apply based on tax regime.
     """
 
-    def get_applicable_type_codes(self, client: Client) -> List[str]:
+    def get_base_type_codes(self, regime_tributario: RegimeTributario) -> List[str]:
         """
-        Get applicable obligation types for commerce clients.
+        Get obligation types for commerce clients under a tax regime.
 
         Args:
-            client: Client instance
+            regime_tributario: Client tax regime
 
         Returns:
             List of obligation type codes
@@ -28,14 +28,14 @@ class CommerceRule(ObligationRule):
         codes = []
 
         # Simples Nacional
-        if client.regime_tributario == RegimeTributario.SIMPLES_NACIONAL:
+        if regime_tributario == RegimeTributario.SIMPLES_NACIONAL:
             codes.extend([
                 "DAS_MENSAL",           # Documento de Arrecadação do Simples
                 "DEFIS_ANUAL",          # Declaração de Informações Socioeconômicas e Fiscais
             ])
 
         # Lucro Presumido
-        elif client.regime_tributario == RegimeTributario.LUCRO_PRESUMIDO:
+        elif regime_tributario == RegimeTributario.LUCRO_PRESUMIDO:
             codes.extend([
                 "DCTF_MENSAL",          # Declaração de Débitos e Créditos Tributários Federais
                 "PIS_COFINS_MENSAL",    # PIS/COFINS Cumulativo
@@ -45,7 +45,7 @@ class CommerceRule(ObligationRule):
             ])
 
         # Lucro Real
-        elif client.regime_tributario == RegimeTributario.LUCRO_REAL:
+        elif regime_tributario == RegimeTributario.LUCRO_REAL:
             codes.extend([
                 "DCTF_MENSAL",
                 "PIS_COFINS_MENSAL",    # PIS/COFINS Não-Cumulativo
@@ -56,7 +56,7 @@ class CommerceRule(ObligationRule):
             ])
 
         # MEI
-        elif client.regime_tributario == RegimeTributario.MEI:
+        elif regime_tributario == RegimeTributario.MEI:
             codes.extend([
                 "DAS_MEI_MENSAL",       # DAS específico para MEI
                 "DASN_SIMEI_ANUAL",     # Declaração Anual do Simples Nacional - MEI
@@ -64,13 +64,9 @@ class CommerceRule(ObligationRule):
 
         # Obrigações estaduais (ICMS)
         # Commerce sempre tem ICMS
-        if client.regime_tributario != RegimeTributario.MEI:
+        if regime_tributario != RegimeTributario.MEI:
             codes.append("SPED_FISCAL")  # SPED Fiscal (ICMS/IPI)
 
-        # GIA (alguns estados)
-        if client.uf in ["SP"]:
-            codes.append("GIA_MENSAL")  # Guia de Informação e Apuração do ICMS
-
         # Obrigações municipais (ISS - se houver prestação de serviço)
         # Commerce puro normalmente não tem ISS, mas fica como exemplo
 
@@ -89,3 +85,21 @@ class CommerceRule(ObligationRule):
         ])
 
         return codes
+
+    def get_override_type_codes(self, client: Client) -> List[str]:
+        """
+        Get state-specific obligation types for commerce clients.
+
+        Args:
+            client: Client instance
+
+        Returns:
+            List of obligation type codes
+        """
+        codes = []
+
+        # GIA (alguns estados)
+        if client.uf in ["SP"]:
+            codes.append("GIA_MENSAL")  # Guia de Informação e Apuração do ICMS
+
+        return codes
@@ -15,12 +15,12 @@ class IndustryRule(ObligationRule):
     Includes IPI (Imposto sobre Produtos Industrializados).
     """
 
-    def get_applicable_type_codes(self, client: Client) -> List[str]:
+    def get_base_type_codes(self, regime_tributario: RegimeTributario) -> List[str]:
         """
-        Get applicable obligation types for industry clients.
+        Get obligation types for industry clients under a tax regime.
 
         Args:
-            client: Client instance
+            regime_tributario: Client tax regime
 
         Returns:
             List of obligation type codes
@@ -28,14 +28,14 @@ class IndustryRule(ObligationRule):
         codes = []
 
         # Simples Nacional
-        if client.regime_tributario == RegimeTributario.SIMPLES_NACIONAL:
+        if regime_tributario == RegimeTributario.SIMPLES_NACIONAL:
             codes.extend([
                 "DAS_MENSAL",
                 "DEFIS_ANUAL",
             ])
 
         # Lucro Presumido
-        elif client.regime_tributario == RegimeTributario.LUCRO_PRESUMIDO:
+        elif regime_tributario == RegimeTributario.LUCRO_PRESUMIDO:
             codes.extend([
                 "DCTF_MENSAL",
                 "PIS_COFINS_MENSAL",
@@ -46,7 +46,7 @@ class IndustryRule(ObligationRule):
             ])
 
         # Lucro Real
-        elif client.regime_tributario == RegimeTributario.LUCRO_REAL:
+        elif regime_tributario == RegimeTributario.LUCRO_REAL:
             codes.extend([
                 "DCTF_MENSAL",
                 "PIS_COFINS_MENSAL",
@@ -58,20 +58,16 @@ class IndustryRule(ObligationRule):
             ])
 
         # MEI (indústria não pode ser MEI, mas por completude)
-        elif client.regime_tributario == RegimeTributario.MEI:
+        elif regime_tributario == RegimeTributario.MEI:
             codes.extend([
                 "DAS_MEI_MENSAL",
                 "DASN_SIMEI_ANUAL",
             ])
 
         # Obrigações estaduais (ICMS e IPI)
-        if client.regime_tributario != RegimeTributario.MEI:
+        if regime_tributario != RegimeTributario.MEI:
             codes.append("SPED_FISCAL")  # SPED Fiscal (ICMS/IPI)
 
-        # GIA (alguns estados)
-        if client.uf in ["SP"]:
-            codes.append("GIA_MENSAL")
-
         # Bloco K (específico para indústria)
         codes.append("BLOCO_K_MENSAL")  # Controle de Estoque e Produção
 
@@ -90,3 +86,21 @@ class IndustryRule(ObligationRule):
         ])
 
         return codes
+
+    def get_override_type_codes(self, client: Client) -> List[str]:
+        """
+        Get state-specific obligation types for industry clients.
+
+        Args:
+            client: Client instance
+
+        Returns:
+            List of obligation type codes
+        """
+        codes = []
+
+        # GIA (alguns estados)
+        if client.uf in ["SP"]:
+            codes.append("GIA_MENSAL")
+
+        return codes
@@ -4,7 +4,7 @@ Obligation rules for MEI (Microempreendedor Individual).
 
 from typing import List
 
-from app.db.models.client import Client
+from app.db.models.client import RegimeTributario
 from app.patterns.strategies.base import ObligationRule
 
 
@@ -15,14 +15,14 @@ class MEIRule(ObligationRule):
     MEI has simplified obligations regardless of activity type.
     """
 
-    def get_applicable_type_codes(self, client: Client) -> List[str]:
+    def get_base_type_codes(self, regime_tributario: RegimeTributario) -> List[str]:
         """
         Get applicable obligation types for MEI clients.
 
         MEI has very few obligations, regardless of commerce/service/industry.
 
         Args:
-            client: Client instance
+            regime_tributario: Client tax regime
 
         Returns:
             List of obligation type codes
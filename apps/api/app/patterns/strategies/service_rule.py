@@ -15,12 +15,12 @@ class ServiceRule(ObligationRule):
     Main difference from commerce: ISS instead of ICMS.
     """
 
-    def get_applicable_type_codes(self, client: Client) -> List[str]:
+    def get_base_type_codes(self, regime_tributario: RegimeTributario) -> List[str]:
         """
-        Get applicable obligation types for service clients.
+        Get obligation types for service clients under a tax regime.
 
         Args:
-            client: Client instance
+            regime_tributario: Client tax regime
 
         Returns:
             List of obligation type codes
@@ -28,14 +28,14 @@ class ServiceRule(ObligationRule):
         codes = []
 
         # Simples Nacional
-        if client.regime_tributario == RegimeTributario.SIMPLES_NACIONAL:
+        if regime_tributario == RegimeTributario.SIMPLES_NACIONAL:
             codes.extend([
                 "DAS_MENSAL",
                 "DEFIS_ANUAL",
             ])
 
         # Lucro Presumido
-        elif client.regime_tributario == RegimeTributario.LUCRO_PRESUMIDO:
+        elif regime_tributario == RegimeTributario.LUCRO_PRESUMIDO:
             codes.extend([
                 "DCTF_MENSAL",
                 "PIS_COFINS_MENSAL",
@@ -45,7 +45,7 @@ class ServiceRule(ObligationRule):
             ])
 
         # Lucro Real
-        elif client.regime_tributario == RegimeTributario.LUCRO_REAL:
+        elif regime_tributario == RegimeTributario.LUCRO_REAL:
             codes.extend([
                 "DCTF_MENSAL",
                 "PIS_COFINS_MENSAL",
@@ -56,7 +56,7 @@ class ServiceRule(ObligationRule):
             ])
 
         # MEI
-        elif client.regime_tributario == RegimeTributario.MEI:
+        elif regime_tributario == RegimeTributario.MEI:
             codes.extend([
                 "DAS_MEI_MENSAL",
                 "DASN_SIMEI_ANUAL",
@@ -64,13 +64,9 @@ class ServiceRule(ObligationRule):
 
         # Obrigações municipais (ISS)
         # Service sempre tem ISS
-        if client.regime_tributario != RegimeTributario.MEI:
+        if regime_tributario != RegimeTributario.MEI:
             codes.append("NFS_E_MENSAL")  # Nota Fiscal de Serviços Eletrônica
 
-        # Algumas cidades exigem declaração de ISS
-        if client.cidade in ["São Paulo", "Rio de Janeiro", "Belo Horizonte"]:
-            codes.append("DMS_MENSAL")  # Declaração Mensal de Serviços
-
         # Obrigações trabalhistas e previdenciárias
         codes.extend([
             "ESOCIAL_MENSAL",
@@ -86,3 +82,21 @@ class ServiceRule(ObligationRule):
         ])
 
         return codes
+
+    def get_override_type_codes(self, client: Client) -> List[str]:
+        """
+        Get city-specific obligation types for service clients.
+
+        Args:
+            client: Client instance
+
+        Returns:
+            List of obligation type codes
+        """
+        codes = []
+
+        # Algumas cidades exigem declaração de ISS
+        if client.cidade in ["São Paulo", "Rio de Janeiro", "Belo Horizonte"]:
+            codes.append("DMS_MENSAL")  # Declaração Mensal de Serviços
+
+        return codes
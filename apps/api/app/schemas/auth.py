@@ -44,6 +44,7 @@ class RefreshResponse(BaseSchema):
     """Schema for refresh token response."""
 
     access_token: str
+    refresh_token: str  # Replaces the presented one, which can't be used again
     token_type: str = "bearer"
     expires_in: int  # seconds
 
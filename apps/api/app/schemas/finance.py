@@ -167,9 +167,10 @@ class TransactionListResponse(BaseModel):
     """Schema for paginated transaction list response."""
 
     items: list[TransactionResponse]
-    total: int
+    total: Optional[int] = Field(None, description="Omitted when listed with with_total=false")
     skip: int
     limit: int
+    next_cursor: Optional[str] = Field(None, description="Cursor of the next page, null on the last page")
 
 
 # Fee generation schemas
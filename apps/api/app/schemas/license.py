@@ -134,10 +134,11 @@ class LicenseEventResponse(LicenseEventBase):
 class LicenseListResponse(BaseModel):
     """Schema for paginated license list"""
     items: list[LicenseResponse]
-    total: int
+    total: Optional[int] = None  # None when listed with with_total=false
     page: int
     size: int
-    pages: int
+    pages: Optional[int] = None
+    next_cursor: Optional[str] = None  # None on the last page
 
 
 # Statistics
@@ -136,9 +136,10 @@ class ObligationResponse(ObligationBase):
 class ObligationListResponse(BaseModel):
     """Schema for paginated obligation list"""
     items: list[ObligationResponse]
-    total: int
+    total: Optional[int] = None  # None when listed with with_total=false
     skip: int
     limit: int
+    next_cursor: Optional[str] = None  # None on the last page
 
 
 class ObligationReceiptUpload(BaseModel):
@@ -162,6 +163,16 @@ class ObligationGenerateResponse(BaseModel):
     obligations: Optional[list["ObligationResponse"]] = None
 
 
+class ObligationGenerationPreviewItem(BaseModel):
+    """Schema for one obligation type in a generation preview"""
+    obligation_type_id: UUID
+    obligation_type_code: str
+    obligation_type_name: str
+    client_count: int
+    existing_count: int
+    would_generate_count: int
+
+
 class ObligationReceiptRequest(BaseModel):
     """Schema for receipt upload request"""
     notes: Optional[str] = Field(None, max_length=1000)
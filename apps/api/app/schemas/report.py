@@ -46,6 +46,16 @@ class ReportStatus(str, Enum):
     FAILED = "failed"
 
 
+class SchedulePeriod(str, Enum):
+    """Reporting period of a scheduled report, relative to its run date."""
+
+    CURRENT_MONTH = "current_month"
+    PREVIOUS_MONTH = "previous_month"
+    LAST_30_DAYS = "last_30_days"
+    CURRENT_YEAR = "current_year"
+    PREVIOUS_YEAR = "previous_year"
+
+
 class ChartType(str, Enum):
     """Type of chart for visualization."""
 
@@ -188,12 +198,13 @@ class ReportExportResponse(BaseSchema):
     """Response schema for report export."""
 
     report_id: UUID = Field(..., description="Report history ID")
-    file_url: str = Field(..., description="URL to download the file")
-    file_name: str = Field(..., description="Generated filename")
-    file_size: int = Field(..., description="File size in bytes")
+    status: ReportStatus = Field(..., description="Export status")
+    file_url: str = Field(..., description="URL to download the file once completed")
+    file_name: Optional[str] = Field(None, description="Generated filename")
+    file_size: Optional[int] = Field(None, description="File size in bytes")
     format: ReportFormat
     generated_at: datetime
-    expires_at: datetime = Field(..., description="File expiration datetime")
+    expires_at: Optional[datetime] = Field(None, description="File expiration datetime")
 
 
 class ChartConfig(BaseSchema):
@@ -294,6 +305,71 @@ class ReportHistoryListResponse(BaseSchema):
     pages: int
 
 
+# Schedule schemas
+class ReportScheduleCreate(BaseSchema):
+    """Schema for creating a report schedule."""
+
+    name: str = Field(..., min_length=1, max_length=200, description="Schedule name")
+    template_id: UUID = Field(..., description="Template whose report is generated")
+    cron: str = Field(
+        ...,
+        max_length=100,
+        description="Cron expression (minute hour day month weekday) in the schedule timezone",
+    )
+    period: SchedulePeriod = Field(..., description="Reporting period, relative to the run date")
+    format: ReportFormat = Field(..., description="Export format")
+    recipients: list[UUID] = Field(
+        default_factory=list,
+        description="Users who receive each report (defaults to the creator)",
+    )
+    is_active: bool = Field(True, description="Whether the schedule runs")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "name": "DRE do mês anterior",
+                "template_id": "123e4567-e89b-12d3-a456-426614174000",
+                "cron": "0 8 1 * *",
+                "period": "previous_month",
+                "format": "pdf",
+                "recipients": [],
+                "is_active": True,
+            }
+        }
+
+
+class ReportScheduleUpdate(BaseSchema):
+    """Schema for updating a report schedule."""
+
+    name: Optional[str] = Field(None, min_length=1, max_length=200)
+    cron: Optional[str] = Field(None, max_length=100)
+    period: Optional[SchedulePeriod] = None
+    format: Optional[ReportFormat] = None
+    recipients: Optional[list[UUID]] = None
+    is_active: Optional[bool] = None
+
+
+class ReportScheduleResponse(BaseSchema):
+    """Schema for report schedule response."""
+
+    id: UUID
+    name: str
+    template_id: UUID
+    created_by_id: UUID
+    cron: str
+    period: SchedulePeriod
+    format: ReportFormat
+    recipients: list[UUID]
+    is_active: bool
+    last_run_at: Optional[datetime]
+    next_run_at: datetime
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
 # Report type info
 class ReportTypeInfo(BaseSchema):
     """Information about a report type."""
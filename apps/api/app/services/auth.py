@@ -3,18 +3,21 @@ Authentication service with business logic.
 """
 
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Optional
 from uuid import UUID
 
 from fastapi import HTTPException, status
 from jose import JWTError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.security import create_tokens, decode_token
+from app.core.passwords import password_hasher
+from app.core.security import decode_token
 from app.db.models.user import User
 from app.db.repositories.user import UserRepository
 from app.schemas.auth import RefreshResponse, TokenResponse
 from app.schemas.user import UserResponse
+from app.services.principal_cache import Principal, principal_cache
+from app.services.refresh_tokens import refresh_token_store
 
 
 class AuthService:
@@ -54,8 +57,9 @@ class AuthService:
                 headers={"WWW-Authenticate": "Bearer"},
             )
 
-        # Verify password
-        if not user.verify_password(password):
+        # Verify password off the event loop, upgrading outdated hashes
+        valid, new_hash = await password_hasher.verify_and_update(password, user.password_hash)
+        if not valid:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Incorrect email or password",
@@ -69,6 +73,10 @@ class AuthService:
                 detail="Inactive user",
             )
 
+        if new_hash:
+            # Committed along with the login
+            user.password_hash = new_hash
+
         return user
 
     async def login(self, email: str, password: str) -> TokenResponse:
@@ -90,12 +98,12 @@ class AuthService:
 
         # Update last login timestamp
         user.last_login_at = datetime.now(timezone.utc)
+
+        # Create tokens, starting a new token family
+        tokens = await refresh_token_store.issue(self.session, user.id, user.role.value)
         await self.session.commit()
         await self.session.refresh(user)
 
-        # Create tokens
-        tokens = create_tokens(str(user.id), user.role.value)
-
         # Create response
         return TokenResponse(
             **tokens,
@@ -106,14 +114,17 @@ class AuthService:
         """
         Refresh access token using refresh token.
 
+        The refresh token is rotated: it can't be used again, and the
+        response carries its successor.
+
         Args:
             refresh_token: JWT refresh token
 
         Returns:
-            New access token
+            New access and refresh tokens
 
         Raises:
-            HTTPException: If refresh token is invalid
+            HTTPException: If refresh token is invalid, revoked or reused
         """
         try:
             # Decode refresh token
@@ -137,27 +148,7 @@ class AuthService:
                     detail="Invalid token payload",
                     headers={"WWW-Authenticate": "Bearer"},
                 )
-
-            # Verify user still exists and is active
             user_id = UUID(user_id_str)
-            user = await self.user_repo.get_by_id(user_id)
-
-            if not user or not user.is_active:
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="User not found or inactive",
-                    headers={"WWW-Authenticate": "Bearer"},
-                )
-
-            # Create new tokens
-            tokens = create_tokens(str(user.id), user.role.value)
-
-            return RefreshResponse(
-                access_token=tokens["access_token"],
-                token_type=tokens["token_type"],
-                expires_in=tokens["expires_in"],
-            )
-
         except JWTError as e:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -171,18 +162,80 @@ class AuthService:
                 headers={"WWW-Authenticate": "Bearer"},
             ) from e
 
-    async def logout(self, user: User) -> dict[str, Any]:
+        # Consume the refresh token
+        try:
+            token_user_id, family_id = await refresh_token_store.rotate(self.session, payload)
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail=str(e),
+                headers={"WWW-Authenticate": "Bearer"},
+            ) from e
+
+        if token_user_id != user_id:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid token payload",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+
+        # Verify user still exists and is active
+        user = await self.user_repo.get_by_id(user_id)
+
+        if not user or not user.is_active:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="User not found or inactive",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+
+        # Issue the successor in the same family
+        tokens = await refresh_token_store.issue(
+            self.session, user.id, user.role.value, family_id=family_id
+        )
+        await self.session.commit()
+
+        return RefreshResponse(
+            access_token=tokens["access_token"],
+            refresh_token=tokens["refresh_token"],
+            token_type=tokens["token_type"],
+            expires_in=tokens["expires_in"],
+        )
+
+    async def logout(
+        self,
+        user: Principal,
+        access_token: str,
+        refresh_token: Optional[str] = None,
+    ) -> dict[str, Any]:
         """
-        Logout user (optional - mainly for audit logging).
+        Logout user, revoking the token family of the session.
+
+        The access token and its refresh tokens stop working on this worker
+        at once and on the others within REFRESH_TOKEN_REVOCATION_SYNC_SECONDS.
 
         Args:
             user: Current user
+            access_token: Access token of the request
+            refresh_token: Optional refresh token to revoke as well
 
         Returns:
             Success message
         """
-        # In a JWT-based system, logout is typically handled client-side
-        # by discarding the tokens. Here we can do audit logging if needed.
+        family_ids = set()
+        for token in (access_token, refresh_token):
+            if not token:
+                continue
+            try:
+                payload = decode_token(token)
+            except JWTError:
+                continue
+            if payload.get("sub") == str(user.id) and payload.get("fam"):
+                family_ids.add(UUID(payload["fam"]))
+
+        for family_id in family_ids:
+            await refresh_token_store.revoke_family(self.session, family_id)
+        principal_cache.invalidate(user.id)
 
         return {
             "success": True,
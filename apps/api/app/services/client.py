@@ -10,11 +10,13 @@ from uuid import UUID
 from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.passwords import password_hasher
 from app.db.models.client import Client
 from app.db.models.client_user import ClientUser, ClientAccessLevel
 from app.db.models.user import User, UserRole
 from app.db.repositories.client import ClientRepository
 from app.schemas.client import ClientCreate, ClientCreateResponse, ClientDraftCreate, ClientListItem, ClientResponse, ClientUpdate
+from app.services.client_search_index import client_search_index
 
 
 class ClientService:
@@ -116,7 +118,7 @@ class ClientService:
                 is_verified=False,
                 primary_client_id=client.id
             )
-            new_user.set_password(temporary_password)
+            new_user.password_hash = await password_hasher.hash(temporary_password)
             self.session.add(new_user)
             await self.session.flush()
 
@@ -132,6 +134,7 @@ class ClientService:
 
         await self.session.commit()
         await self.session.refresh(client)
+        client_search_index.upsert(client)
 
         return ClientCreateResponse(
             client=ClientResponse.model_validate(client),
@@ -229,6 +232,7 @@ class ClientService:
         client = await self.repo.update(client)
         await self.session.commit()
         await self.session.refresh(client)
+        client_search_index.upsert(client)
 
         return ClientResponse.model_validate(client)
 
@@ -252,6 +256,7 @@ class ClientService:
 
         client.soft_delete()
         await self.session.commit()
+        client_search_index.remove(client_id)
 
     async def list_clients(
         self,
@@ -260,6 +265,8 @@ class ClientService:
         starts_with: Optional[str] = None,
         page: int = 1,
         size: int = 10,
+        cursor: Optional[str] = None,
+        with_total: bool = True,
     ) -> dict:
         """
         List clients with filters and pagination.
@@ -270,9 +277,14 @@ class ClientService:
             starts_with: Filter by first letter
             page: Page number (1-indexed)
             size: Page size
+            cursor: Cursor from a previous page's next_cursor (replaces page)
+            with_total: Whether to count all matching clients
 
         Returns:
             Paginated client list
+
+        Raises:
+            HTTPException: If the cursor is invalid
         """
         skip = (page - 1) * size
 
@@ -285,19 +297,29 @@ class ClientService:
             except ValueError:
                 pass
 
-        clients, total = await self.repo.list_with_filters(
-            query=query,
-            status=status_enum,
-            starts_with=starts_with,
-            skip=skip,
-            limit=size,
-        )
+        try:
+            clients, total = await self.repo.list_with_filters(
+                query=query,
+                status=status_enum,
+                starts_with=starts_with,
+                skip=skip,
+                limit=size,
+                cursor=cursor,
+                with_total=with_total,
+            )
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e),
+            )
 
         # Convert to list items
         items = [ClientListItem.model_validate(c) for c in clients]
 
         # Calculate pages
-        pages = (total + size - 1) // size if size > 0 else 0
+        pages = None
+        if total is not None:
+            pages = (total + size - 1) // size if size > 0 else 0
 
         return {
             "items": items,
@@ -305,6 +327,7 @@ class ClientService:
             "page": page,
             "size": size,
             "pages": pages,
+            "next_cursor": self.repo.next_cursor(clients, size),
         }
 
     async def search_clients(self, query: str, limit: int = 10) -> list[dict]:
@@ -318,6 +341,12 @@ class ClientService:
         Returns:
             List of clients (simplified)
         """
+        # Word and CNPJ prefixes are answered from memory
+        results = await client_search_index.search(self.session, query, limit)
+        if results:
+            return results
+
+        # Typos and mid-word fragments need the trigram search
         clients = await self.repo.search(query, limit)
 
         return [
@@ -0,0 +1,291 @@
+"""
+Client Search Index - In-process autocomplete index over the client list.
+
+Autocomplete fires on every keystroke, so ``/clients/search`` is answered
+from a compact in-memory index of the non-deleted clients instead of
+Postgres. Each snapshot keeps its clients in parallel arrays and a sorted
+array of (accent-stripped) name tokens and CNPJ digits, searched by prefix
+with bisect. Client writes in this process are applied immediately through
+a small overlay; writes by other workers are picked up by a periodic,
+cheap version check that triggers a rebuild.
+"""
+
+import asyncio
+import logging
+import time
+from array import array
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Iterable, Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.db.models.client import Client
+from app.db.repositories.client import normalize_search_text
+from app.db.table_versions import TableVersion, read_table_versions
+
+logger = logging.getLogger(__name__)
+
+# Sorts after every character a normalized token can hold
+_PREFIX_END = "\uffff"
+
+
+@dataclass(frozen=True)
+class ClientSearchEntry:
+    """The client fields autocomplete needs."""
+
+    id: UUID
+    razao_social: str
+    nome_fantasia: Optional[str]
+    cnpj: str
+
+    @classmethod
+    def from_model(cls, client: Client) -> "ClientSearchEntry":
+        """Copy a Client model into an entry."""
+        return cls(
+            id=client.id,
+            razao_social=client.razao_social,
+            nome_fantasia=client.nome_fantasia,
+            cnpj=client.cnpj,
+        )
+
+    @property
+    def tokens(self) -> set[str]:
+        """Normalized words of the client's names."""
+        return set(normalize_search_text(f"{self.razao_social} {self.nome_fantasia or ''}").split())
+
+    @property
+    def cnpj_digits(self) -> str:
+        """CNPJ without punctuation."""
+        return "".join(filter(str.isdigit, self.cnpj))
+
+    def to_result(self) -> dict:
+        """Autocomplete result, as returned by the search endpoint."""
+        return {"id": str(self.id), "razao_social": self.razao_social, "cnpj": self.cnpj}
+
+
+@dataclass(frozen=True)
+class SearchQuery:
+    """A parsed autocomplete query."""
+
+    terms: tuple[str, ...] = ()
+    digits: str = ""
+    phrase: str = ""
+
+    @classmethod
+    def parse(cls, query: str) -> "SearchQuery":
+        """Split a query into name terms or a CNPJ digit prefix."""
+        digits = "".join(filter(str.isdigit, query))
+        if digits and not any(char.isalpha() for char in query):
+            return cls(digits=digits)
+
+        phrase = normalize_search_text(query)
+        return cls(terms=tuple(phrase.split()), phrase=phrase)
+
+    @property
+    def is_empty(self) -> bool:
+        """Whether the query has nothing to search for."""
+        return not self.terms and not self.digits
+
+    def matches(self, entry: ClientSearchEntry) -> bool:
+        """Whether an entry matches, with the same rules as the index."""
+        if self.digits:
+            return entry.cnpj_digits.startswith(self.digits)
+        tokens = entry.tokens
+        return all(any(token.startswith(term) for token in tokens) for term in self.terms)
+
+    def rank(self, entry: ClientSearchEntry) -> tuple:
+        """Sort key: names starting with the whole query first, then by name."""
+        name = normalize_search_text(entry.razao_social)
+        return (not name.startswith(self.phrase), name, str(entry.id))
+
+
+def _prefix_rows(keys: Sequence[str], rows: array, prefix: str) -> set[int]:
+    start = bisect_left(keys, prefix)
+    end = bisect_left(keys, prefix + _PREFIX_END, lo=start)
+    return set(rows[start:end])
+
+
+class ClientSearchSnapshot:
+    """Immutable, array-backed index of the non-deleted clients."""
+
+    def __init__(self, version: Optional[TableVersion], entries: Iterable[ClientSearchEntry]):
+        self.version = version
+        self.entries: list[ClientSearchEntry] = list(entries)
+
+        token_pairs = sorted(
+            (token, row) for row, entry in enumerate(self.entries) for token in entry.tokens
+        )
+        self.tokens = [token for token, _ in token_pairs]
+        self.token_rows = array("I", (row for _, row in token_pairs))
+
+        cnpj_pairs = sorted((entry.cnpj_digits, row) for row, entry in enumerate(self.entries))
+        self.cnpj_digits = [digits for digits, _ in cnpj_pairs]
+        self.cnpj_rows = array("I", (row for _, row in cnpj_pairs))
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def find(self, query: SearchQuery) -> list[ClientSearchEntry]:
+        """
+        Entries matching a query, unordered.
+
+        Args:
+            query: Parsed query
+
+        Returns:
+            Matching entries
+        """
+        if query.digits:
+            rows = _prefix_rows(self.cnpj_digits, self.cnpj_rows, query.digits)
+        else:
+            rows = None
+            # Rarest-first would be faster, but queries have a handful of terms
+            for term in query.terms:
+                term_rows = _prefix_rows(self.tokens, self.token_rows, term)
+                rows = term_rows if rows is None else rows & term_rows
+                if not rows:
+                    break
+
+        return [self.entries[row] for row in rows or ()]
+
+
+class ClientSearchIndex:
+    """
+    Process-wide autocomplete index with write-through updates.
+
+    Writes made through ClientService land in an overlay consulted together
+    with the snapshot, and are folded into a new snapshot when it grows past
+    ``max_pending``. Every ``check_seconds`` a search first compares the
+    clients table version (its write counter, see app.db.table_versions)
+    with the snapshot's and rebuilds it when another worker changed the
+    table.
+    """
+
+    def __init__(self, check_seconds: float, max_pending: int = 256):
+        self.check_seconds = check_seconds
+        self.max_pending = max_pending
+        self._snapshot: Optional[ClientSearchSnapshot] = None
+        # Client ID -> updated entry, or None once deleted
+        self._pending: dict[UUID, Optional[ClientSearchEntry]] = {}
+        self._check_at = 0.0
+        self._lock = asyncio.Lock()
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether a snapshot was built."""
+        return self._snapshot is not None
+
+    async def search(self, db: AsyncSession, query: str, limit: int = 10) -> list[dict]:
+        """
+        Autocomplete clients by name word prefixes or CNPJ prefix.
+
+        Args:
+            db: Session used only for the periodic version check or a rebuild
+            query: Search term
+            limit: Maximum results
+
+        Returns:
+            Matching clients (id, razao_social, cnpj), best first
+        """
+        parsed = SearchQuery.parse(query)
+        if parsed.is_empty:
+            return []
+
+        await self._ensure_fresh(db)
+        snapshot = self._snapshot
+        pending = self._pending
+
+        matches = [entry for entry in snapshot.find(parsed) if entry.id not in pending]
+        matches.extend(
+            entry for entry in pending.values() if entry is not None and parsed.matches(entry)
+        )
+        matches.sort(key=parsed.rank)
+        return [entry.to_result() for entry in matches[:limit]]
+
+    def upsert(self, client: Client) -> None:
+        """Add or update a client after its transaction committed."""
+        if client.deleted_at is not None:
+            self.remove(client.id)
+            return
+        self._pending[client.id] = ClientSearchEntry.from_model(client)
+        self._compact()
+
+    def remove(self, client_id: UUID) -> None:
+        """Drop a deleted client after its transaction committed."""
+        self._pending[client_id] = None
+        self._compact()
+
+    async def refresh(self, db: AsyncSession) -> ClientSearchSnapshot:
+        """Rebuild the index unconditionally."""
+        async with self._lock:
+            return await self._load(db, await self._read_version(db))
+
+    def invalidate(self) -> None:
+        """Make the next search check the table version."""
+        self._check_at = 0.0
+
+    async def _ensure_fresh(self, db: AsyncSession) -> None:
+        if self._snapshot is not None and time.monotonic() < self._check_at:
+            return
+
+        async with self._lock:
+            # Another coroutine may have checked while we waited
+            if self._snapshot is not None and time.monotonic() < self._check_at:
+                return
+
+            version = await self._read_version(db)
+            if self._snapshot is None or version != self._snapshot.version:
+                await self._load(db, version)
+            else:
+                self._check_at = time.monotonic() + self.check_seconds
+
+    async def _read_version(self, db: AsyncSession) -> TableVersion:
+        # Counts every committed insert, update and delete, unlike updated_at,
+        # which is the writing transaction's start time
+        return await read_table_versions(db, (Client.__tablename__,))
+
+    async def _load(self, db: AsyncSession, version: TableVersion) -> ClientSearchSnapshot:
+        # Pending writes were committed before this read, so the rows include them
+        applied = dict(self._pending)
+        result = await db.execute(
+            select(Client.id, Client.razao_social, Client.nome_fantasia, Client.cnpj)
+            .where(Client.deleted_at.is_(None))
+        )
+        entries = [ClientSearchEntry(*row) for row in result.all()]
+
+        self._snapshot = ClientSearchSnapshot(version, entries)
+        # Keep only writes that arrived while the rows were being read
+        self._pending = {
+            client_id: entry
+            for client_id, entry in self._pending.items()
+            if client_id not in applied or applied[client_id] is not entry
+        }
+        self._check_at = time.monotonic() + self.check_seconds
+
+        logger.info(f"Client search index loaded: {len(entries)} clients")
+        return self._snapshot
+
+    def _compact(self) -> None:
+        if self._snapshot is None or len(self._pending) <= self.max_pending:
+            return
+
+        entries = {entry.id: entry for entry in self._snapshot.entries}
+        for client_id, entry in self._pending.items():
+            if entry is None:
+                entries.pop(client_id, None)
+            else:
+                entries[client_id] = entry
+
+        # The table version is unknown here; the next check rebuilds from the database
+        self._snapshot = ClientSearchSnapshot(None, entries.values())
+        self._pending = {}
+
+
+# Process-wide index instance
+client_search_index = ClientSearchIndex(
+    check_seconds=settings.CLIENT_SEARCH_INDEX_CHECK_SECONDS
+)
@@ -1,17 +1,19 @@
 """Fee Generator Service - Generates monthly fees for clients."""
 
 import logging
-from datetime import date, timedelta
+from datetime import date, datetime, timedelta
 from decimal import Decimal
 from typing import Optional
-from uuid import UUID
+from uuid import UUID, uuid4
 
-from sqlalchemy import select
+from sqlalchemy import and_, func, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models.client import Client
 from app.db.models.finance import FinancialTransaction, PaymentStatus, TransactionType
+from app.db.repositories.base import decode_cursor, encode_cursor
 from app.db.repositories.client import ClientRepository
+from app.db.repositories.finance_rollup import FinanceRollupRepository, rollup_contribution
 from app.db.repositories.transaction import TransactionRepository
 
 logger = logging.getLogger(__name__)
@@ -24,6 +26,7 @@ class FeeGeneratorService:
         self.db = db
         self.client_repo = ClientRepository(db)
         self.transaction_repo = TransactionRepository(db)
+        self.rollup_repo = FinanceRollupRepository(db)
 
     async def generate_monthly_fees(
         self,
@@ -116,26 +119,22 @@ class FeeGeneratorService:
             )
             return []
 
-        # Calculate due date (default: 10th day of next month)
-        due_date = self._calculate_due_date(reference_month)
-
         # Create transaction
         transaction = FinancialTransaction(
-            client_id=client.id,
-            transaction_type=TransactionType.RECEITA,
-            amount=client.honorarios_mensais,
-            payment_status=PaymentStatus.PENDENTE,
-            due_date=due_date,
-            reference_month=reference_month,
-            description=f"Honorários mensais - {reference_month.strftime('%B/%Y')}",
-            notes=f"Gerado automaticamente em {date.today().strftime('%d/%m/%Y')}",
-            created_by_id=generated_by_id,
+            **self._build_fee_values(
+                client_id=client.id,
+                amount=client.honorarios_mensais,
+                reference_month=reference_month,
+                generated_by_id=generated_by_id,
+            )
         )
 
         self.db.add(transaction)
         await self.db.flush()
         await self.db.refresh(transaction)
 
+        await self.rollup_repo.apply_change(None, rollup_contribution(transaction))
+
         logger.info(
             f"Generated transaction for client {client.id} "
             f"({client.razao_social}) - R$ {client.honorarios_mensais}"
@@ -158,31 +157,51 @@ class FeeGeneratorService:
         Returns:
             Dictionary with generation statistics
         """
-        # Get all active clients
-        stmt = select(Client).where(Client.status == "ativo", Client.deleted_at.is_(None))
+        # Get all active clients (only the columns needed to build fees)
+        stmt = select(Client.id, Client.honorarios_mensais).where(
+            Client.status == "ativo", Client.deleted_at.is_(None)
+        )
         result = await self.db.execute(stmt)
-        clients = result.scalars().all()
+        clients = result.all()
 
         total_clients = len(clients)
-        total_transactions = 0
+        # Fees are validated in memory and inserted set-based, so there are no
+        # per-client failures left to report; kept for the response shape
         errors = 0
         error_messages = []
 
-        for client in clients:
-            try:
-                transactions = await self._generate_for_client(
-                    client=client,
-                    reference_month=reference_month,
-                    generated_by_id=generated_by_id,
-                )
-                total_transactions += len(transactions)
-            except Exception as e:
-                logger.error(
-                    f"Error generating fee for client {client.id}: {e}",
-                    exc_info=True,
+        # Existing (client_id, reference_month) pairs in one query
+        existing_client_ids = await self.transaction_repo.get_client_ids_with_reference_month(
+            reference_month
+        )
+
+        # Build all missing fees in memory
+        rows = [
+            self._build_fee_values(
+                client_id=client.id,
+                amount=client.honorarios_mensais,
+                reference_month=reference_month,
+                generated_by_id=generated_by_id,
+            )
+            for client in clients
+            if client.id not in existing_client_ids
+            and client.honorarios_mensais
+            and client.honorarios_mensais > 0
+        ]
+
+        # Multi-row INSERT ... ON CONFLICT DO NOTHING; rows created concurrently are skipped
+        inserted = await self.transaction_repo.bulk_insert_skip_existing(rows)
+        total_transactions = len(inserted)
+
+        await self.rollup_repo.apply_contributions(
+            added=[
+                (
+                    (row.reference_month, row.client_id, row.transaction_type, row.payment_status),
+                    row.amount,
                 )
-                errors += 1
-                error_messages.append(f"{client.razao_social}: {str(e)}")
+                for row in inserted
+            ]
+        )
 
         # Commit all changes
         await self.db.commit()
@@ -204,6 +223,42 @@ class FeeGeneratorService:
             "error_details": error_messages if errors > 0 else None,
         }
 
+    def _build_fee_values(
+        self,
+        client_id: UUID,
+        amount: Decimal,
+        reference_month: date,
+        generated_by_id: Optional[UUID] = None,
+    ) -> dict:
+        """
+        Build column values for a monthly fee transaction.
+
+        Args:
+            client_id: Client UUID
+            amount: Monthly fee amount
+            reference_month: Reference month (first day)
+            generated_by_id: ID of user who triggered generation
+
+        Returns:
+            Dictionary of FinancialTransaction column values
+        """
+        now = datetime.utcnow()
+        return {
+            "id": uuid4(),
+            "client_id": client_id,
+            "transaction_type": TransactionType.RECEITA,
+            "amount": amount,
+            "payment_status": PaymentStatus.PENDENTE,
+            # Default: 10th day of next month
+            "due_date": self._calculate_due_date(reference_month),
+            "reference_month": reference_month,
+            "description": f"Honorários mensais - {reference_month.strftime('%B/%Y')}",
+            "notes": f"Gerado automaticamente em {date.today().strftime('%d/%m/%Y')}",
+            "created_by_id": generated_by_id,
+            "created_at": now,
+            "updated_at": now,
+        }
+
     def _calculate_due_date(self, reference_month: date) -> date:
         """
         Calculate due date for a fee.
@@ -235,6 +290,8 @@ class FeeGeneratorService:
         self,
         reference_month: date,
         client_id: Optional[UUID] = None,
+        cursor: Optional[str] = None,
+        limit: int = 10,
     ) -> dict:
         """
         Preview what fees would be generated without actually creating them.
@@ -242,6 +299,8 @@ class FeeGeneratorService:
         Args:
             reference_month: Reference month
             client_id: Optional client ID to preview for specific client
+            cursor: Pagination cursor for the all-clients client list
+            limit: Page size for the all-clients client list
 
         Returns:
             Dictionary with preview information
@@ -291,44 +350,97 @@ class FeeGeneratorService:
                 "reference_month": reference_month.isoformat(),
             }
         else:
-            # Preview for all clients
-            stmt = select(Client).where(Client.status == "ativo", Client.deleted_at.is_(None))
-            result = await self.db.execute(stmt)
-            clients = result.scalars().all()
-
-            total_would_generate = 0
-            total_amount = Decimal("0.00")
-            clients_preview = []
-
-            for client in clients:
-                # Check if already exists
-                existing = await self.transaction_repo.get_by_client_and_reference_month(
-                    client_id=client.id,
-                    reference_month=reference_month,
-                )
+            return await self._get_all_clients_preview(
+                reference_month=reference_month,
+                cursor=cursor,
+                limit=limit,
+            )
 
-                if existing:
-                    continue
+    async def _get_all_clients_preview(
+        self,
+        reference_month: date,
+        cursor: Optional[str] = None,
+        limit: int = 10,
+    ) -> dict:
+        """
+        Preview fee generation for all active clients.
 
-                if not client.honorarios_mensais or client.honorarios_mensais <= 0:
-                    continue
+        Counts and totals come from a single anti-join aggregate; the list of
+        clients that would be billed is keyset-paginated by (razao_social, id).
 
-                total_would_generate += 1
-                total_amount += client.honorarios_mensais
-                clients_preview.append({
-                    "client_id": str(client.id),
-                    "client_name": client.razao_social,
-                    "amount": float(client.honorarios_mensais),
-                })
+        Args:
+            reference_month: Reference month (first day)
+            cursor: Opaque cursor returned as next_cursor by the previous page
+            limit: Page size
 
-            due_date = self._calculate_due_date(reference_month)
+        Returns:
+            Dictionary with preview information
 
-            return {
-                "total_clients": len(clients),
-                "would_generate_count": total_would_generate,
-                "total_amount": float(total_amount),
-                "due_date": due_date.isoformat(),
-                "reference_month": reference_month.isoformat(),
-                "clients": clients_preview[:10],  # Return first 10 for preview
-                "has_more": len(clients_preview) > 10,
-            }
+        Raises:
+            ValueError: If the cursor is invalid
+        """
+        already_generated = (
+            select(FinancialTransaction.id)
+            .where(
+                FinancialTransaction.client_id == Client.id,
+                FinancialTransaction.reference_month == reference_month,
+                FinancialTransaction.deleted_at.is_(None),
+            )
+            .exists()
+        )
+        would_generate = and_(Client.honorarios_mensais > 0, ~already_generated)
+        is_active = and_(Client.status == "ativo", Client.deleted_at.is_(None))
+
+        totals_stmt = select(
+            func.count().label("total_clients"),
+            func.count().filter(would_generate).label("would_generate_count"),
+            func.coalesce(
+                func.sum(Client.honorarios_mensais).filter(would_generate), 0
+            ).label("total_amount"),
+        ).where(is_active)
+        totals = (await self.db.execute(totals_stmt)).one()
+
+        page_stmt = (
+            select(Client.id, Client.razao_social, Client.honorarios_mensais)
+            .where(is_active, would_generate)
+            .order_by(Client.razao_social, Client.id)
+            .limit(limit + 1)
+        )
+        if cursor:
+            values = decode_cursor(cursor)
+            if len(values) != 2 or None in values:
+                raise ValueError("Invalid pagination cursor")
+            razao_social, last_id = values
+            try:
+                last_id = UUID(last_id)
+            except ValueError as e:
+                raise ValueError("Invalid pagination cursor") from e
+            page_stmt = page_stmt.where(
+                tuple_(Client.razao_social, Client.id) > (razao_social, last_id)
+            )
+
+        rows = (await self.db.execute(page_stmt)).all()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+        due_date = self._calculate_due_date(reference_month)
+
+        return {
+            "total_clients": totals.total_clients,
+            "would_generate_count": totals.would_generate_count,
+            "total_amount": float(totals.total_amount),
+            "due_date": due_date.isoformat(),
+            "reference_month": reference_month.isoformat(),
+            "clients": [
+                {
+                    "client_id": str(row.id),
+                    "client_name": row.razao_social,
+                    "amount": float(row.honorarios_mensais),
+                }
+                for row in rows
+            ],
+            "has_more": has_more,
+            "next_cursor": (
+                encode_cursor([rows[-1].razao_social, rows[-1].id]) if has_more else None
+            ),
+        }
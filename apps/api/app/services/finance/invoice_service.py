@@ -4,6 +4,7 @@ import io
 import logging
 from datetime import datetime
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Optional
 from uuid import UUID
 
@@ -23,10 +24,183 @@ from reportlab.platypus import (
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.repositories.transaction import TransactionRepository
+from app.services.report.exporters.pdf_renderer import render_in_pool
 
 logger = logging.getLogger(__name__)
 
 
+def _render_invoice_pdf(invoice: SimpleNamespace, file_path: Optional[Path] = None) -> bytes:
+    """
+    Render an invoice PDF (runs on the PDF render pool).
+
+    Args:
+        invoice: Detached snapshot of the transaction and its client
+        file_path: Optional file to also write the PDF to
+
+    Returns:
+        PDF bytes
+    """
+    buffer = io.BytesIO()
+    pdf = canvas.Canvas(buffer, pagesize=A4)
+    width, height = A4
+
+    # Company header
+    pdf.setFont("Helvetica-Bold", 16)
+    pdf.drawString(2 * cm, height - 2 * cm, "CONTABILCONSULT")
+    pdf.setFont("Helvetica", 10)
+    pdf.drawString(2 * cm, height - 2.5 * cm, "CNPJ: 12.345.678/0001-90")
+    pdf.drawString(2 * cm, height - 3 * cm, "Endereço: Rua Exemplo, 123 - São Paulo/SP")
+    pdf.drawString(2 * cm, height - 3.5 * cm, "Tel: (11) 1234-5678")
+    pdf.drawString(2 * cm, height - 4 * cm, "Email: contato@contabilconsult.com.br")
+
+    # Invoice title
+    pdf.setFont("Helvetica-Bold", 18)
+    invoice_title = "NOTA FISCAL" if invoice.payment_status == "pago" else "FATURA"
+    pdf.drawString(width / 2 - 3 * cm, height - 5.5 * cm, invoice_title)
+
+    # Invoice number
+    pdf.setFont("Helvetica", 10)
+    invoice_number = invoice.invoice_number or f"NF-{invoice.id.hex[:8].upper()}"
+    pdf.drawString(2 * cm, height - 6.5 * cm, f"Número: {invoice_number}")
+    pdf.drawString(2 * cm, height - 7 * cm, f"Data de Emissão: {datetime.now().strftime('%d/%m/%Y')}")
+
+    # Client info
+    pdf.setFont("Helvetica-Bold", 12)
+    pdf.drawString(2 * cm, height - 8.5 * cm, "DADOS DO CLIENTE")
+    pdf.setFont("Helvetica", 10)
+
+    if invoice.client:
+        pdf.drawString(2 * cm, height - 9 * cm, f"Razão Social: {invoice.client.razao_social}")
+        pdf.drawString(2 * cm, height - 9.5 * cm, f"CNPJ: {invoice.client.cnpj}")
+        if invoice.client.endereco:
+            pdf.drawString(2 * cm, height - 10 * cm, f"Endereço: {invoice.client.endereco}")
+        if invoice.client.email:
+            pdf.drawString(2 * cm, height - 10.5 * cm, f"Email: {invoice.client.email}")
+        if invoice.client.telefone:
+            pdf.drawString(2 * cm, height - 11 * cm, f"Telefone: {invoice.client.telefone}")
+
+    # Services/Items table
+    pdf.setFont("Helvetica-Bold", 12)
+    pdf.drawString(2 * cm, height - 12.5 * cm, "DESCRIÇÃO DOS SERVIÇOS")
+
+    # Table data
+    data = [
+        ["Descrição", "Ref. Mês", "Valor"],
+        [
+            invoice.description,
+            invoice.reference_month.strftime("%m/%Y"),
+            f"R$ {invoice.amount:,.2f}".replace(",", "X").replace(".", ",").replace("X", "."),
+        ],
+    ]
+
+    # Create table
+    table_y = height - 14 * cm
+    col_widths = [10 * cm, 3 * cm, 3 * cm]
+
+    for i, row in enumerate(data):
+        y_position = table_y - (i * 0.7 * cm)
+
+        if i == 0:
+            pdf.setFont("Helvetica-Bold", 10)
+        else:
+            pdf.setFont("Helvetica", 10)
+
+        x_position = 2 * cm
+        for j, cell in enumerate(row):
+            pdf.drawString(x_position, y_position, str(cell))
+            x_position += col_widths[j]
+
+    # Draw table borders
+    pdf.rect(2 * cm, table_y - 1 * cm, sum(col_widths), 1.4 * cm)
+    pdf.line(2 * cm, table_y - 0.3 * cm, 2 * cm + sum(col_widths), table_y - 0.3 * cm)
+
+    # Totals
+    pdf.setFont("Helvetica-Bold", 12)
+    total_y = table_y - 2.5 * cm
+    pdf.drawString(11 * cm, total_y, "VALOR TOTAL:")
+    pdf.setFont("Helvetica-Bold", 14)
+    pdf.drawString(
+        14 * cm,
+        total_y,
+        f"R$ {invoice.amount:,.2f}".replace(",", "X").replace(".", ",").replace("X", "."),
+    )
+
+    # Payment info
+    pdf.setFont("Helvetica-Bold", 11)
+    pdf.drawString(2 * cm, total_y - 1.5 * cm, "INFORMAÇÕES DE PAGAMENTO")
+    pdf.setFont("Helvetica", 10)
+
+    pdf.drawString(2 * cm, total_y - 2 * cm, f"Vencimento: {invoice.due_date.strftime('%d/%m/%Y')}")
+
+    if invoice.payment_status == "pago" and invoice.paid_date:
+        pdf.drawString(
+            2 * cm,
+            total_y - 2.5 * cm,
+            f"Data do Pagamento: {invoice.paid_date.strftime('%d/%m/%Y %H:%M')}",
+        )
+        if invoice.payment_method:
+            pdf.drawString(
+                2 * cm,
+                total_y - 3 * cm,
+                f"Forma de Pagamento: {invoice.payment_method.upper()}",
+            )
+
+    # Payment instructions (if not paid)
+    if invoice.payment_status != "pago":
+        pdf.setFont("Helvetica-Bold", 10)
+        pdf.drawString(2 * cm, total_y - 4 * cm, "INSTRUÇÕES PARA PAGAMENTO:")
+        pdf.setFont("Helvetica", 9)
+        pdf.drawString(2 * cm, total_y - 4.5 * cm, "1. PIX: CNPJ 12.345.678/0001-90")
+        pdf.drawString(2 * cm, total_y - 5 * cm, "2. Transferência: Banco do Brasil - Ag: 1234-5 - CC: 12345-6")
+        pdf.drawString(
+            2 * cm,
+            total_y - 5.5 * cm,
+            "3. Após o pagamento, enviar comprovante para financeiro@contabilconsult.com.br",
+        )
+
+    # Notes
+    if invoice.notes:
+        pdf.setFont("Helvetica-Bold", 10)
+        pdf.drawString(2 * cm, total_y - 7 * cm, "OBSERVAÇÕES:")
+        pdf.setFont("Helvetica", 9)
+
+        # Wrap text if too long
+        notes_lines = invoice.notes.split("\n")
+        y_offset = 0
+        for line in notes_lines[:5]:  # Max 5 lines
+            pdf.drawString(2 * cm, total_y - 7.5 * cm - y_offset, line[:80])
+            y_offset += 0.5 * cm
+
+    # Footer
+    footer_y = 3 * cm
+    pdf.setFont("Helvetica", 8)
+    pdf.drawCentredString(
+        width / 2,
+        footer_y,
+        "Este documento foi gerado eletronicamente e não necessita de assinatura.",
+    )
+    pdf.drawCentredString(
+        width / 2,
+        footer_y - 0.5 * cm,
+        f"Gerado em: {datetime.now().strftime('%d/%m/%Y às %H:%M')}",
+    )
+
+    # Page number
+    pdf.drawRightString(width - 2 * cm, 1.5 * cm, "Página 1 de 1")
+
+    # Save PDF
+    pdf.save()
+
+    # Get PDF bytes
+    pdf_bytes = buffer.getvalue()
+    buffer.close()
+
+    if file_path is not None:
+        file_path.write_bytes(pdf_bytes)
+
+    return pdf_bytes
+
+
 class InvoiceService:
     """Service for generating invoices and receipts."""
 
@@ -62,170 +236,18 @@ class InvoiceService:
         if not transaction:
             raise ValueError(f"Transaction with ID {transaction_id} not found")
 
-        # Generate PDF
-        buffer = io.BytesIO()
-        pdf = canvas.Canvas(buffer, pagesize=A4)
-        width, height = A4
-
-        # Company header
-        pdf.setFont("Helvetica-Bold", 16)
-        pdf.drawString(2 * cm, height - 2 * cm, "CONTABILCONSULT")
-        pdf.setFont("Helvetica", 10)
-        pdf.drawString(2 * cm, height - 2.5 * cm, "CNPJ: 12.345.678/0001-90")
-        pdf.drawString(2 * cm, height - 3 * cm, "Endereço: Rua Exemplo, 123 - São Paulo/SP")
-        pdf.drawString(2 * cm, height - 3.5 * cm, "Tel: (11) 1234-5678")
-        pdf.drawString(2 * cm, height - 4 * cm, "Email: contato@contabilconsult.com.br")
-
-        # Invoice title
-        pdf.setFont("Helvetica-Bold", 18)
-        invoice_title = "NOTA FISCAL" if transaction.payment_status == "pago" else "FATURA"
-        pdf.drawString(width / 2 - 3 * cm, height - 5.5 * cm, invoice_title)
-
-        # Invoice number
-        pdf.setFont("Helvetica", 10)
-        invoice_number = transaction.invoice_number or f"NF-{transaction.id.hex[:8].upper()}"
-        pdf.drawString(2 * cm, height - 6.5 * cm, f"Número: {invoice_number}")
-        pdf.drawString(2 * cm, height - 7 * cm, f"Data de Emissão: {datetime.now().strftime('%d/%m/%Y')}")
-
-        # Client info
-        pdf.setFont("Helvetica-Bold", 12)
-        pdf.drawString(2 * cm, height - 8.5 * cm, "DADOS DO CLIENTE")
-        pdf.setFont("Helvetica", 10)
-
-        if transaction.client:
-            pdf.drawString(2 * cm, height - 9 * cm, f"Razão Social: {transaction.client.razao_social}")
-            pdf.drawString(2 * cm, height - 9.5 * cm, f"CNPJ: {transaction.client.cnpj}")
-            if transaction.client.endereco:
-                pdf.drawString(2 * cm, height - 10 * cm, f"Endereço: {transaction.client.endereco}")
-            if transaction.client.email:
-                pdf.drawString(2 * cm, height - 10.5 * cm, f"Email: {transaction.client.email}")
-            if transaction.client.telefone:
-                pdf.drawString(2 * cm, height - 11 * cm, f"Telefone: {transaction.client.telefone}")
-
-        # Services/Items table
-        pdf.setFont("Helvetica-Bold", 12)
-        pdf.drawString(2 * cm, height - 12.5 * cm, "DESCRIÇÃO DOS SERVIÇOS")
-
-        # Table data
-        data = [
-            ["Descrição", "Ref. Mês", "Valor"],
-            [
-                transaction.description,
-                transaction.reference_month.strftime("%m/%Y"),
-                f"R$ {transaction.amount:,.2f}".replace(",", "X").replace(".", ",").replace("X", "."),
-            ],
-        ]
-
-        # Create table
-        table_y = height - 14 * cm
-        col_widths = [10 * cm, 3 * cm, 3 * cm]
-
-        for i, row in enumerate(data):
-            y_position = table_y - (i * 0.7 * cm)
-
-            if i == 0:
-                pdf.setFont("Helvetica-Bold", 10)
-            else:
-                pdf.setFont("Helvetica", 10)
-
-            x_position = 2 * cm
-            for j, cell in enumerate(row):
-                pdf.drawString(x_position, y_position, str(cell))
-                x_position += col_widths[j]
-
-        # Draw table borders
-        pdf.rect(2 * cm, table_y - 1 * cm, sum(col_widths), 1.4 * cm)
-        pdf.line(2 * cm, table_y - 0.3 * cm, 2 * cm + sum(col_widths), table_y - 0.3 * cm)
-
-        # Totals
-        pdf.setFont("Helvetica-Bold", 12)
-        total_y = table_y - 2.5 * cm
-        pdf.drawString(11 * cm, total_y, "VALOR TOTAL:")
-        pdf.setFont("Helvetica-Bold", 14)
-        pdf.drawString(
-            14 * cm,
-            total_y,
-            f"R$ {transaction.amount:,.2f}".replace(",", "X").replace(".", ",").replace("X", "."),
-        )
-
-        # Payment info
-        pdf.setFont("Helvetica-Bold", 11)
-        pdf.drawString(2 * cm, total_y - 1.5 * cm, "INFORMAÇÕES DE PAGAMENTO")
-        pdf.setFont("Helvetica", 10)
-
-        pdf.drawString(2 * cm, total_y - 2 * cm, f"Vencimento: {transaction.due_date.strftime('%d/%m/%Y')}")
-
-        if transaction.payment_status == "pago" and transaction.paid_date:
-            pdf.drawString(
-                2 * cm,
-                total_y - 2.5 * cm,
-                f"Data do Pagamento: {transaction.paid_date.strftime('%d/%m/%Y %H:%M')}",
-            )
-            if transaction.payment_method:
-                pdf.drawString(
-                    2 * cm,
-                    total_y - 3 * cm,
-                    f"Forma de Pagamento: {transaction.payment_method.upper()}",
-                )
-
-        # Payment instructions (if not paid)
-        if transaction.payment_status != "pago":
-            pdf.setFont("Helvetica-Bold", 10)
-            pdf.drawString(2 * cm, total_y - 4 * cm, "INSTRUÇÕES PARA PAGAMENTO:")
-            pdf.setFont("Helvetica", 9)
-            pdf.drawString(2 * cm, total_y - 4.5 * cm, "1. PIX: CNPJ 12.345.678/0001-90")
-            pdf.drawString(2 * cm, total_y - 5 * cm, "2. Transferência: Banco do Brasil - Ag: 1234-5 - CC: 12345-6")
-            pdf.drawString(
-                2 * cm,
-                total_y - 5.5 * cm,
-                "3. Após o pagamento, enviar comprovante para financeiro@contabilconsult.com.br",
-            )
-
-        # Notes
-        if transaction.notes:
-            pdf.setFont("Helvetica-Bold", 10)
-            pdf.drawString(2 * cm, total_y - 7 * cm, "OBSERVAÇÕES:")
-            pdf.setFont("Helvetica", 9)
-
-            # Wrap text if too long
-            notes_lines = transaction.notes.split("\n")
-            y_offset = 0
-            for line in notes_lines[:5]:  # Max 5 lines
-                pdf.drawString(2 * cm, total_y - 7.5 * cm - y_offset, line[:80])
-                y_offset += 0.5 * cm
-
-        # Footer
-        footer_y = 3 * cm
-        pdf.setFont("Helvetica", 8)
-        pdf.drawCentredString(
-            width / 2,
-            footer_y,
-            "Este documento foi gerado eletronicamente e não necessita de assinatura.",
-        )
-        pdf.drawCentredString(
-            width / 2,
-            footer_y - 0.5 * cm,
-            f"Gerado em: {datetime.now().strftime('%d/%m/%Y às %H:%M')}",
-        )
-
-        # Page number
-        pdf.drawRightString(width - 2 * cm, 1.5 * cm, "Página 1 de 1")
-
-        # Save PDF
-        pdf.save()
-
-        # Get PDF bytes
-        pdf_bytes = buffer.getvalue()
-        buffer.close()
-
-        # Save to file if requested
+        # Render off the event loop from a detached snapshot
+        filepath = None
         if save_to_file:
             filename = f"invoice_{transaction_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
             filepath = self.output_dir / filename
 
-            with open(filepath, "wb") as f:
-                f.write(pdf_bytes)
+        pdf_bytes = await render_in_pool(
+            _render_invoice_pdf, self._snapshot_transaction(transaction), filepath
+        )
 
+        # Record the saved file
+        if save_to_file:
             logger.info(f"Invoice PDF saved to {filepath}")
 
             # Update transaction with file path
@@ -234,6 +256,32 @@ class InvoiceService:
 
         return pdf_bytes
 
+    def _snapshot_transaction(self, transaction) -> SimpleNamespace:
+        """Copy the fields the invoice needs, so rendering never touches the session."""
+        client = transaction.client
+        return SimpleNamespace(
+            id=transaction.id,
+            payment_status=transaction.payment_status,
+            invoice_number=transaction.invoice_number,
+            description=transaction.description,
+            reference_month=transaction.reference_month,
+            amount=transaction.amount,
+            due_date=transaction.due_date,
+            paid_date=transaction.paid_date,
+            payment_method=transaction.payment_method,
+            notes=transaction.notes,
+            client=SimpleNamespace(
+                razao_social=client.razao_social,
+                cnpj=client.cnpj,
+                endereco=", ".join(
+                    part for part in (client.logradouro, client.numero, client.bairro, client.cidade)
+                    if part
+                ),
+                email=client.email,
+                telefone=client.telefone,
+            ) if client else None,
+        )
+
     async def generate_receipt_pdf(
         self,
         transaction_id: UUID,
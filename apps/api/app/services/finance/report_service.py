@@ -2,16 +2,35 @@
 
 from datetime import date, datetime, timedelta
 from decimal import Decimal
-from typing import Optional
+from typing import Optional, Sequence
 from uuid import UUID
 
-from sqlalchemy import and_, func, select
+from sqlalchemy import and_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models.client import Client
 from app.db.models.finance import FinancialTransaction, PaymentStatus, TransactionType
 from app.db.repositories.transaction import TransactionRepository
 
+# Default upper bounds (days overdue) of the receivables aging buckets
+DEFAULT_AGING_BUCKET_BOUNDS = (30, 60, 90)
+
+
+def _aging_bucket_definitions(bucket_bounds: Sequence[int]) -> list[tuple[str, str]]:
+    """
+    Get (key, label) of each aging bucket, indexed like the repository buckets.
+
+    The default bounds give current, days_0_30, days_31_60, days_61_90 and
+    days_over_90.
+    """
+    definitions = [("current", "Não vencido")]
+    lower = 0
+    for bound in bucket_bounds:
+        definitions.append((f"days_{lower}_{bound}", f"{lower}-{bound} dias"))
+        lower = bound + 1
+    definitions.append((f"days_over_{bucket_bounds[-1]}", f"Mais de {bucket_bounds[-1]} dias"))
+    return definitions
+
 
 class FinancialReportService:
     """Service for generating financial reports and KPIs."""
@@ -37,17 +56,13 @@ class FinancialReportService:
         else:
             previous_month_start = date(current_month_start.year, current_month_start.month - 1, 1)
 
-        # Current month revenue (paid transactions)
-        total_receita_mes_atual = await self.transaction_repo.get_total_by_status(
-            status=PaymentStatus.PAGO,
-            reference_month=current_month_start,
-        )
-
-        # Previous month revenue
-        total_receita_mes_anterior = await self.transaction_repo.get_total_by_status(
-            status=PaymentStatus.PAGO,
-            reference_month=previous_month_start,
+        # All totals and counts in one pass over financial_transactions
+        totals = await self.transaction_repo.get_dashboard_totals(
+            current_month=current_month_start,
+            previous_month=previous_month_start,
         )
+        total_receita_mes_atual = totals["total_receita_mes_atual"]
+        total_receita_mes_anterior = totals["total_receita_mes_anterior"]
 
         # Calculate growth percentage
         if total_receita_mes_anterior > 0:
@@ -57,24 +72,6 @@ class FinancialReportService:
         else:
             receita_crescimento_percentual = 0.0
 
-        # Pending transactions
-        total_pendente = await self.transaction_repo.get_total_by_status(
-            status=PaymentStatus.PENDENTE,
-        )
-
-        # Overdue transactions
-        total_atrasado = await self.transaction_repo.get_total_by_status(
-            status=PaymentStatus.ATRASADO,
-        )
-
-        # Count transactions
-        count_pendente = await self._count_by_status(PaymentStatus.PENDENTE)
-        count_atrasado = await self._count_by_status(PaymentStatus.ATRASADO)
-        count_pago_mes_atual = await self._count_by_status(
-            PaymentStatus.PAGO,
-            reference_month=current_month_start
-        )
-
         # Top clients with outstanding balance
         top_devedores = await self.transaction_repo.get_top_clients_by_outstanding(limit=5)
 
@@ -82,12 +79,12 @@ class FinancialReportService:
             "total_receita_mes_atual": float(total_receita_mes_atual),
             "total_receita_mes_anterior": float(total_receita_mes_anterior),
             "receita_crescimento_percentual": receita_crescimento_percentual,
-            "total_pendente": float(total_pendente),
-            "total_atrasado": float(total_atrasado),
+            "total_pendente": float(totals["total_pendente"]),
+            "total_atrasado": float(totals["total_atrasado"]),
             "total_pago_mes_atual": float(total_receita_mes_atual),
-            "count_pendente": count_pendente,
-            "count_atrasado": count_atrasado,
-            "count_pago_mes_atual": count_pago_mes_atual,
+            "count_pendente": totals["count_pendente"],
+            "count_atrasado": totals["count_atrasado"],
+            "count_pago_mes_atual": totals["count_pago_mes_atual"],
             "top_devedores": [
                 {
                     "client_id": str(client_id),
@@ -98,98 +95,94 @@ class FinancialReportService:
             ],
         }
 
-    async def get_receivables_aging_report(self) -> dict:
+    async def get_receivables_aging_report(
+        self,
+        bucket_bounds: Optional[Sequence[int]] = None,
+        by_client: bool = False,
+    ) -> dict:
         """
         Get receivables aging report.
 
-        Categorizes outstanding receivables by age:
+        Categorizes outstanding receivables by age. With the default bounds:
         - Current (not due yet)
         - 0-30 days overdue
         - 31-60 days overdue
         - 61-90 days overdue
         - Over 90 days overdue
 
+        Buckets are computed by the database in one grouped query.
+
+        Args:
+            bucket_bounds: Increasing upper bounds (days overdue) of the overdue
+                buckets, defaults to (30, 60, 90)
+            by_client: Include a per-client breakdown
+
         Returns:
             Dictionary with aging buckets
-        """
-        today = date.today()
 
-        # Get all pending and overdue transactions
-        stmt = (
-            select(FinancialTransaction)
-            .where(
-                and_(
-                    FinancialTransaction.payment_status.in_([
-                        PaymentStatus.PENDENTE,
-                        PaymentStatus.ATRASADO,
-                    ]),
-                    FinancialTransaction.deleted_at.is_(None),
-                )
-            )
+        Raises:
+            ValueError: If bucket_bounds are not strictly increasing positive integers
+        """
+        bounds = tuple(bucket_bounds or DEFAULT_AGING_BUCKET_BOUNDS)
+        if any(bound <= 0 for bound in bounds) or list(bounds) != sorted(set(bounds)):
+            raise ValueError("Aging bucket bounds must be strictly increasing positive day counts")
+
+        definitions = _aging_bucket_definitions(bounds)
+
+        def empty_buckets() -> dict:
+            return {
+                key: {"label": label, "count": 0, "total_amount": Decimal("0.00")}
+                for key, label in definitions
+            }
+
+        def serialize(buckets: dict) -> dict:
+            data = {
+                key: {
+                    "label": bucket["label"],
+                    "count": bucket["count"],
+                    "total_amount": float(bucket["total_amount"]),
+                }
+                for key, bucket in buckets.items()
+            }
+            data["total"] = float(sum(bucket["total_amount"] for bucket in buckets.values()))
+            data["total_count"] = sum(bucket["count"] for bucket in buckets.values())
+            return data
+
+        rows = await self.transaction_repo.get_aging_buckets(
+            as_of=date.today(),
+            bucket_bounds=bounds,
+            by_client=by_client,
         )
-        result = await self.db.execute(stmt)
-        transactions = result.scalars().all()
-
-        # Initialize buckets
-        buckets = {
-            "current": {"label": "Não vencido", "count": 0, "total_amount": Decimal("0.00")},
-            "days_0_30": {"label": "0-30 dias", "count": 0, "total_amount": Decimal("0.00")},
-            "days_31_60": {"label": "31-60 dias", "count": 0, "total_amount": Decimal("0.00")},
-            "days_61_90": {"label": "61-90 dias", "count": 0, "total_amount": Decimal("0.00")},
-            "days_over_90": {"label": "Mais de 90 dias", "count": 0, "total_amount": Decimal("0.00")},
-        }
 
-        # Categorize transactions
-        for transaction in transactions:
-            days_overdue = (today - transaction.due_date).days
-
-            if days_overdue < 0:
-                bucket = buckets["current"]
-            elif days_overdue <= 30:
-                bucket = buckets["days_0_30"]
-            elif days_overdue <= 60:
-                bucket = buckets["days_31_60"]
-            elif days_overdue <= 90:
-                bucket = buckets["days_61_90"]
-            else:
-                bucket = buckets["days_over_90"]
+        buckets = empty_buckets()
+        clients: dict[UUID, dict] = {}
 
-            bucket["count"] += 1
-            bucket["total_amount"] += transaction.amount
+        for row in rows:
+            key = definitions[row.bucket][0]
+            buckets[key]["count"] += row.count
+            buckets[key]["total_amount"] += row.total_amount
 
-        # Calculate totals
-        total = sum(bucket["total_amount"] for bucket in buckets.values())
-        total_count = sum(bucket["count"] for bucket in buckets.values())
+            if by_client:
+                client = clients.setdefault(
+                    row.id,
+                    {"client_name": row.razao_social, "buckets": empty_buckets()},
+                )
+                client["buckets"][key]["count"] += row.count
+                client["buckets"][key]["total_amount"] += row.total_amount
 
-        return {
-            "current": {
-                "label": buckets["current"]["label"],
-                "count": buckets["current"]["count"],
-                "total_amount": float(buckets["current"]["total_amount"]),
-            },
-            "days_0_30": {
-                "label": buckets["days_0_30"]["label"],
-                "count": buckets["days_0_30"]["count"],
-                "total_amount": float(buckets["days_0_30"]["total_amount"]),
-            },
-            "days_31_60": {
-                "label": buckets["days_31_60"]["label"],
-                "count": buckets["days_31_60"]["count"],
-                "total_amount": float(buckets["days_31_60"]["total_amount"]),
-            },
-            "days_61_90": {
-                "label": buckets["days_61_90"]["label"],
-                "count": buckets["days_61_90"]["count"],
-                "total_amount": float(buckets["days_61_90"]["total_amount"]),
-            },
-            "days_over_90": {
-                "label": buckets["days_over_90"]["label"],
-                "count": buckets["days_over_90"]["count"],
-                "total_amount": float(buckets["days_over_90"]["total_amount"]),
-            },
-            "total": float(total),
-            "total_count": total_count,
-        }
+        report = serialize(buckets)
+
+        if by_client:
+            report["clients"] = [
+                {
+                    "client_id": str(client_id),
+                    "client_name": client["client_name"],
+                    **serialize(client["buckets"]),
+                }
+                for client_id, client in clients.items()
+            ]
+
+        return report
 
     async def get_revenue_by_period(
         self,
@@ -353,25 +346,3 @@ class FinancialReportService:
                 for t in transactions
             ],
         }
-
-    async def _count_by_status(
-        self,
-        status: PaymentStatus,
-        reference_month: Optional[date] = None,
-    ) -> int:
-        """Count transactions by status."""
-        conditions = [
-            FinancialTransaction.payment_status == status,
-            FinancialTransaction.deleted_at.is_(None),
-        ]
-
-        if reference_month:
-            conditions.append(FinancialTransaction.reference_month == reference_month)
-
-        stmt = (
-            select(func.count())
-            .select_from(FinancialTransaction)
-            .where(and_(*conditions))
-        )
-        result = await self.db.scalar(stmt)
-        return result or 0
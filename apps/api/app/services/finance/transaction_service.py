@@ -5,13 +5,18 @@ from decimal import Decimal
 from typing import Optional
 from uuid import UUID
 
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models.finance import FinancialTransaction, PaymentStatus
 from app.db.repositories.client import ClientRepository
+from app.db.repositories.finance_rollup import FinanceRollupRepository, rollup_contribution
 from app.db.repositories.transaction import TransactionRepository
 from app.schemas.finance import TransactionCreate, TransactionUpdate
 
+# Unique index on (client_id, reference_month) of live transactions
+LIVE_TRANSACTION_INDEX = "uq_financial_transactions_client_reference_live"
+
 
 class TransactionService:
     """Service for managing financial transactions."""
@@ -20,6 +25,7 @@ class TransactionService:
         self.db = db
         self.transaction_repo = TransactionRepository(db)
         self.client_repo = ClientRepository(db)
+        self.rollup_repo = FinanceRollupRepository(db)
 
     async def create_transaction(
         self,
@@ -40,20 +46,22 @@ class TransactionService:
             ValueError: If client not found
         """
         # Validate client exists
-        client = await self.client_repo.get(data.client_id)
+        client = await self.client_repo.get_by_id(data.client_id)
         if not client:
             raise ValueError(f"Client with ID {data.client_id} not found")
 
+        duplicate_error = ValueError(
+            f"Transaction for client {data.client_id} and month "
+            f"{data.reference_month.strftime('%Y-%m')} already exists"
+        )
+
         # Check if transaction already exists for this client/month (to avoid duplicates)
         existing = await self.transaction_repo.get_by_client_and_reference_month(
             client_id=data.client_id,
             reference_month=data.reference_month,
         )
         if existing:
-            raise ValueError(
-                f"Transaction for client {data.client_id} and month "
-                f"{data.reference_month.strftime('%Y-%m')} already exists"
-            )
+            raise duplicate_error
 
         # Create transaction
         transaction = FinancialTransaction(
@@ -72,10 +80,20 @@ class TransactionService:
             created_by_id=created_by_id,
         )
 
-        self.db.add(transaction)
-        await self.db.flush()
+        # A concurrent create for the same client/month can pass the check
+        # above; the unique index rejects the second one
+        try:
+            async with self.db.begin_nested():
+                self.db.add(transaction)
+                await self.db.flush()
+        except IntegrityError as e:
+            if LIVE_TRANSACTION_INDEX not in str(e.orig):
+                raise
+            raise duplicate_error from e
         await self.db.refresh(transaction)
 
+        await self.rollup_repo.apply_change(None, rollup_contribution(transaction))
+
         return transaction
 
     async def update_transaction(
@@ -100,6 +118,8 @@ class TransactionService:
         if not transaction:
             raise ValueError(f"Transaction with ID {transaction_id} not found")
 
+        before = rollup_contribution(transaction)
+
         # Update fields if provided
         if data.amount is not None:
             transaction.amount = data.amount
@@ -121,6 +141,8 @@ class TransactionService:
         await self.db.flush()
         await self.db.refresh(transaction)
 
+        await self.rollup_repo.apply_change(before, rollup_contribution(transaction))
+
         return transaction
 
     async def mark_as_paid(
@@ -152,6 +174,8 @@ class TransactionService:
         if transaction.payment_status == PaymentStatus.PAGO:
             raise ValueError(f"Transaction {transaction_id} is already marked as paid")
 
+        before = rollup_contribution(transaction)
+
         # Update transaction
         transaction.payment_status = PaymentStatus.PAGO
         transaction.paid_date = paid_date
@@ -162,6 +186,8 @@ class TransactionService:
         await self.db.flush()
         await self.db.refresh(transaction)
 
+        await self.rollup_repo.apply_change(before, rollup_contribution(transaction))
+
         return transaction
 
     async def cancel_transaction(
@@ -189,6 +215,8 @@ class TransactionService:
         if transaction.payment_status == PaymentStatus.PAGO:
             raise ValueError("Cannot cancel a paid transaction")
 
+        before = rollup_contribution(transaction)
+
         # Update transaction
         transaction.payment_status = PaymentStatus.CANCELADO
         transaction.notes = reason if not transaction.notes else f"{transaction.notes}\n\nCancelled: {reason}"
@@ -196,6 +224,8 @@ class TransactionService:
         await self.db.flush()
         await self.db.refresh(transaction)
 
+        await self.rollup_repo.apply_change(before, rollup_contribution(transaction))
+
         return transaction
 
     async def get_client_balance(self, client_id: UUID) -> Decimal:
@@ -222,14 +252,18 @@ class TransactionService:
         today = date.today()
         overdue_transactions = await self.transaction_repo.get_pending_by_due_date(today)
 
-        count = 0
+        removed = []
+        added = []
         for transaction in overdue_transactions:
             if transaction.due_date < today and transaction.payment_status == PaymentStatus.PENDENTE:
+                removed.append(rollup_contribution(transaction))
                 transaction.payment_status = PaymentStatus.ATRASADO
-                count += 1
+                added.append(rollup_contribution(transaction))
 
+        count = len(added)
         if count > 0:
             await self.db.flush()
+            await self.rollup_repo.apply_contributions(removed=removed, added=added)
 
         return count
 
@@ -243,4 +277,14 @@ class TransactionService:
         Returns:
             True if deleted, False if not found
         """
-        return await self.transaction_repo.soft_delete(transaction_id)
+        transaction = await self.transaction_repo.get_by_id(transaction_id)
+        if not transaction:
+            return False
+
+        before = rollup_contribution(transaction)
+
+        transaction.deleted_at = datetime.utcnow()
+        await self.db.flush()
+
+        await self.rollup_repo.apply_change(before, rollup_contribution(transaction))
+        return True
@@ -1,10 +1,9 @@
 """Obligation Generator Service - Generates obligations for clients based on their rules."""
 
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from typing import Optional, Sequence
 from uuid import UUID
 
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models.client import Client
@@ -78,34 +77,42 @@ class ObligationGenerator:
         Returns:
             Dictionary with statistics about generation
         """
-        # Get all active clients
-        stmt = select(Client).where(Client.status == "ativo")
-        result = await self.db.execute(stmt)
-        clients = result.scalars().all()
-
-        total_clients = len(clients)
-        total_obligations = 0
-        errors = 0
-
-        for client in clients:
-            try:
-                obligations = await self.generate_for_client(
-                    client=client,
-                    year=year,
-                    month=month,
-                    generated_by_id=generated_by_id,
-                )
-                total_obligations += len(obligations)
-            except Exception as e:
-                print(f"Error generating obligations for client {client.id}: {e}")
-                errors += 1
+        reference_month = date(year, month, 1)
+
+        # Batched pipeline: one catalog load, one duplicate check, bulk inserts
+        stats = await self.factory.generate_bulk(
+            reference_month=reference_month,
+            user_id=generated_by_id,
+        )
 
         return {
-            "total_clients": total_clients,
-            "total_obligations": total_obligations,
-            "errors": errors,
+            "total_clients": stats["total_clients"],
+            "total_obligations": stats["total_created"],
+            "errors": stats["errors"],
         }
 
+    async def get_generation_preview(
+        self,
+        year: int,
+        month: int,
+        client_id: Optional[UUID] = None,
+    ) -> list[dict]:
+        """
+        Preview which obligations would be generated for a month, per type.
+
+        Args:
+            year: Year to preview
+            month: Month to preview
+            client_id: Optional client to restrict the preview to
+
+        Returns:
+            List of per-type counts of applicable, existing and new obligations
+        """
+        return await self.factory.preview_bulk(
+            reference_month=date(year, month, 1),
+            client_ids=[client_id] if client_id else None,
+        )
+
     async def check_pending_obligations(
         self,
         days_ahead: int = 7,
@@ -251,7 +251,7 @@ class ObligationProcessor:
             await self.ws_manager.send_to_user(str(obligation.client_id), message)
 
             # Send to all admins/functionaries
-            await self.ws_manager.broadcast(message, exclude_user=str(user_id))
+            await self.ws_manager.send_to_roles(["admin", "func"], message, exclude=[str(user_id)])
         except Exception as e:
             # Log error but don't fail the operation
             print(f"Error sending WebSocket notification: {e}")
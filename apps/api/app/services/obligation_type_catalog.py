@@ -0,0 +1,191 @@
+"""
+Obligation Type Catalog - In-process cache of obligation type definitions.
+
+The catalog changes only when obligation types are seeded, so it is loaded
+once into immutable snapshots and shared by the factory, the strategies and
+the obligation routes instead of being queried per client or per response.
+Each worker periodically compares a cheap version of the table with the one
+it loaded, so changes made through any worker are picked up.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from types import MappingProxyType
+from typing import Mapping, Optional
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.db.models.obligation_type import ObligationType
+from app.db.table_versions import TableVersion, read_table_versions
+from app.schemas.obligation import ObligationRecurrence
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ObligationTypeEntry:
+    """Detached, read-only copy of an ObligationType row."""
+
+    id: UUID
+    name: str
+    code: str
+    description: Optional[str]
+    applies_to_commerce: bool
+    applies_to_service: bool
+    applies_to_industry: bool
+    applies_to_mei: bool
+    applies_to_simples: bool
+    applies_to_presumido: bool
+    applies_to_real: bool
+    recurrence: ObligationRecurrence
+    day_of_month: Optional[int]
+    month_of_year: Optional[int]
+    is_active: bool
+
+    # Same rules as the model, evaluated without a session
+    applies_to_client = ObligationType.applies_to_client
+
+    @classmethod
+    def from_model(cls, obligation_type: ObligationType) -> "ObligationTypeEntry":
+        """Copy an ObligationType model into an entry."""
+        return cls(
+            id=obligation_type.id,
+            name=obligation_type.name,
+            code=obligation_type.code,
+            description=obligation_type.description,
+            applies_to_commerce=bool(obligation_type.applies_to_commerce),
+            applies_to_service=bool(obligation_type.applies_to_service),
+            applies_to_industry=bool(obligation_type.applies_to_industry),
+            applies_to_mei=bool(obligation_type.applies_to_mei),
+            applies_to_simples=bool(obligation_type.applies_to_simples),
+            applies_to_presumido=bool(obligation_type.applies_to_presumido),
+            applies_to_real=bool(obligation_type.applies_to_real),
+            recurrence=obligation_type.recurrence,
+            day_of_month=obligation_type.day_of_month,
+            month_of_year=obligation_type.month_of_year,
+            is_active=bool(obligation_type.is_active),
+        )
+
+
+@dataclass(frozen=True)
+class CatalogSnapshot:
+    """Immutable view of the obligation type catalog at a given version."""
+
+    version: int
+    loaded_at: datetime
+    by_id: Mapping[UUID, ObligationTypeEntry] = field(default_factory=lambda: MappingProxyType({}))
+    by_code: Mapping[str, ObligationTypeEntry] = field(default_factory=lambda: MappingProxyType({}))
+    active_by_code: Mapping[str, ObligationTypeEntry] = field(
+        default_factory=lambda: MappingProxyType({})
+    )
+
+    @classmethod
+    def build(cls, version: int, entries: list[ObligationTypeEntry]) -> "CatalogSnapshot":
+        """Build a snapshot from catalog entries."""
+        return cls(
+            version=version,
+            loaded_at=datetime.now(timezone.utc),
+            by_id=MappingProxyType({entry.id: entry for entry in entries}),
+            by_code=MappingProxyType({entry.code: entry for entry in entries}),
+            active_by_code=MappingProxyType(
+                {entry.code: entry for entry in entries if entry.is_active}
+            ),
+        )
+
+
+class ObligationTypeCatalog:
+    """
+    Versioned in-memory catalog of obligation types.
+
+    Readers get the current snapshot, which is never mutated; a refresh swaps
+    in a new one. Every ``check_seconds``, get() first compares the table
+    version (its write counter, see app.db.table_versions) with the loaded
+    one and reloads only when it differs. invalidate() makes the next get()
+    check right away (e.g. after the admin seed route).
+    """
+
+    def __init__(self, check_seconds: float):
+        self.check_seconds = check_seconds
+        self._snapshot = CatalogSnapshot(version=0, loaded_at=datetime.now(timezone.utc))
+        self._table_version: Optional[TableVersion] = None
+        self._check_at = 0.0
+        self._lock = asyncio.Lock()
+
+    @property
+    def snapshot(self) -> CatalogSnapshot:
+        """Current snapshot, possibly stale or empty (version 0) if never loaded."""
+        return self._snapshot
+
+    @property
+    def is_stale(self) -> bool:
+        """True if the table version must be checked before use."""
+        return time.monotonic() >= self._check_at
+
+    async def get(self, db: AsyncSession) -> CatalogSnapshot:
+        """
+        Get a fresh snapshot, reloading it first if the table changed.
+
+        Args:
+            db: Session used only when the version is checked
+
+        Returns:
+            Current CatalogSnapshot
+        """
+        if not self.is_stale:
+            return self._snapshot
+
+        async with self._lock:
+            # Another coroutine may have checked while we waited
+            if not self.is_stale:
+                return self._snapshot
+
+            table_version = await self._read_version(db)
+            if self._table_version is None or table_version != self._table_version:
+                return await self._load(db, table_version)
+
+            self._check_at = time.monotonic() + self.check_seconds
+            return self._snapshot
+
+    async def refresh(self, db: AsyncSession) -> CatalogSnapshot:
+        """Reload the catalog unconditionally."""
+        async with self._lock:
+            return await self._load(db, await self._read_version(db))
+
+    def invalidate(self) -> None:
+        """Make the next get() check the table version."""
+        self._check_at = 0.0
+
+    def get_by_id(self, obligation_type_id: UUID) -> Optional[ObligationTypeEntry]:
+        """Look up an obligation type in the current snapshot."""
+        return self._snapshot.by_id.get(obligation_type_id)
+
+    async def _read_version(self, db: AsyncSession) -> TableVersion:
+        return await read_table_versions(db, (ObligationType.__tablename__,))
+
+    async def _load(self, db: AsyncSession, table_version: TableVersion) -> CatalogSnapshot:
+        # The version was read first, so a write in between only causes
+        # one more reload on the next check
+        result = await db.execute(select(ObligationType))
+        entries = [ObligationTypeEntry.from_model(row) for row in result.scalars().all()]
+
+        self._snapshot = CatalogSnapshot.build(self._snapshot.version + 1, entries)
+        self._table_version = table_version
+        self._check_at = time.monotonic() + self.check_seconds
+
+        logger.info(
+            f"Obligation type catalog loaded: {len(entries)} types "
+            f"(version {self._snapshot.version})"
+        )
+        return self._snapshot
+
+
+# Process-wide catalog instance
+obligation_type_catalog = ObligationTypeCatalog(
+    check_seconds=settings.OBLIGATION_TYPE_CATALOG_CHECK_SECONDS
+)
@@ -0,0 +1,138 @@
+"""
+Principal Cache - In-process cache of authenticated users.
+
+Every authenticated request used to load its user row. Requests only need
+who the caller is and what they may do, so get_current_user resolves tokens
+to an immutable Principal cached for a short TTL, keyed by user and token
+issue time. UserService and logout invalidate a user's entries as soon as
+their role, status or credentials change; other workers see such changes
+after at most the TTL.
+"""
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+from uuid import UUID
+
+from app.core.config import settings
+from app.db.models.user import User, UserRole
+
+# (user ID, token iat)
+PrincipalKey = tuple[UUID, Optional[int]]
+
+
+@dataclass(frozen=True)
+class Principal:
+    """Immutable snapshot of an authenticated user."""
+
+    id: UUID
+    role: UserRole
+    is_active: bool
+    primary_client_id: Optional[UUID]
+    email: str
+
+    @classmethod
+    def from_model(cls, user: User) -> "Principal":
+        """Copy a User model into a principal."""
+        return cls(
+            id=user.id,
+            role=user.role,
+            is_active=bool(user.is_active),
+            primary_client_id=user.primary_client_id,
+            email=user.email,
+        )
+
+
+class PrincipalCache:
+    """
+    Size-bounded LRU of principals with a TTL.
+
+    Each user has a generation bumped by invalidate(); a principal loaded
+    before an invalidation is not stored, so a request racing an update
+    can't put the old role back.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[PrincipalKey, tuple[float, Principal]] = OrderedDict()
+        self._keys_by_user: dict[UUID, set[PrincipalKey]] = {}
+        self._generations: dict[UUID, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, user_id: UUID, issued_at: Optional[int]) -> Optional[Principal]:
+        """
+        Get a cached principal.
+
+        Args:
+            user_id: User ID from the token
+            issued_at: Token iat claim
+
+        Returns:
+            Principal, or None if missing or expired
+        """
+        key = (user_id, issued_at)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, principal = entry
+        if time.monotonic() >= expires_at:
+            self._discard(key)
+            return None
+
+        self._entries.move_to_end(key)
+        return principal
+
+    def generation(self, user_id: UUID) -> int:
+        """Current generation of a user, to pass to set() after loading it."""
+        return self._generations.get(user_id, 0)
+
+    def set(self, principal: Principal, issued_at: Optional[int], generation: int) -> None:
+        """
+        Cache a principal loaded from the database.
+
+        Args:
+            principal: Loaded principal
+            issued_at: Token iat claim
+            generation: generation() of the user read before loading it
+        """
+        if self.max_entries <= 0 or generation != self.generation(principal.id):
+            return
+
+        key = (principal.id, issued_at)
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, principal)
+        self._entries.move_to_end(key)
+        self._keys_by_user.setdefault(principal.id, set()).add(key)
+
+        while len(self._entries) > self.max_entries:
+            self._discard(next(iter(self._entries)))
+
+    def invalidate(self, user_id: UUID) -> None:
+        """Drop every cached principal of a user."""
+        self._generations[user_id] = self.generation(user_id) + 1
+        for key in self._keys_by_user.pop(user_id, set()):
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every cached principal."""
+        self._entries.clear()
+        self._keys_by_user.clear()
+
+    def _discard(self, key: PrincipalKey) -> None:
+        self._entries.pop(key, None)
+        keys = self._keys_by_user.get(key[0])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_user[key[0]]
+
+
+# Process-wide cache instance
+principal_cache = PrincipalCache(
+    max_entries=settings.PRINCIPAL_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+)
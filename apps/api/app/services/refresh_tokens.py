@@ -0,0 +1,234 @@
+"""
+Refresh Token Store - Server-side refresh token rotation and revocation.
+
+Every login starts a token family. Each refresh consumes the presented
+refresh token and issues its successor in the same family; presenting a
+consumed token again means it leaked, so the whole family is revoked.
+Access tokens carry their family too, and are checked against an
+in-process set of revoked families, so revocation never costs a query on
+the request path. Workers learn about each other's revocations by polling
+the table every few seconds.
+"""
+
+import hashlib
+import logging
+import secrets
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional
+from uuid import UUID, uuid4
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.security import create_tokens
+from app.db.repositories.refresh_token import RefreshTokenRepository
+
+logger = logging.getLogger(__name__)
+
+# Revocations committed out of order still fall inside the next poll
+_SYNC_OVERLAP = timedelta(seconds=60)
+
+# Rows per expired-token delete
+_PURGE_BATCH_SIZE = 1000
+
+
+class RefreshTokenReused(ValueError):
+    """Raised when an already rotated refresh token is presented again."""
+
+
+def hash_token_id(token_id: str) -> str:
+    """SHA-256 (hex) of a jti, as stored in refresh_tokens."""
+    return hashlib.sha256(token_id.encode("utf-8")).hexdigest()
+
+
+class RevokedFamilies:
+    """
+    Revoked token families, remembered while their access tokens may live.
+
+    Refresh tokens are checked against the database; this set only has to
+    outlast the access tokens issued before a revocation.
+    """
+
+    def __init__(self, retain_seconds: float):
+        self.retain_seconds = retain_seconds
+        # Family ID -> time.time() after which it can be forgotten
+        self._families: OrderedDict[UUID, float] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._families)
+
+    def __contains__(self, family_id: UUID) -> bool:
+        forget_at = self._families.get(family_id)
+        return forget_at is not None and time.time() < forget_at
+
+    def add(self, family_id: UUID) -> None:
+        """Remember a revoked family."""
+        self._families[family_id] = time.time() + self.retain_seconds
+        self._families.move_to_end(family_id)
+        self._prune()
+
+    def _prune(self) -> None:
+        # Entries are in insertion order, so expired ones are at the front
+        now = time.time()
+        while self._families:
+            family_id, forget_at = next(iter(self._families.items()))
+            if forget_at > now:
+                break
+            del self._families[family_id]
+
+
+class RefreshTokenStore:
+    """Issues, rotates and revokes refresh tokens."""
+
+    def __init__(self, reuse_grace_seconds: float, purge_interval_seconds: float = 3600):
+        self.reuse_grace_seconds = reuse_grace_seconds
+        self.purge_interval_seconds = purge_interval_seconds
+        self.revoked = RevokedFamilies(retain_seconds=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60)
+        self._synced_until: Optional[datetime] = None
+        self._purge_at = 0.0
+
+    def is_revoked(self, family_id: Any) -> bool:
+        """
+        Check the family of an access token against the revoked set.
+
+        Args:
+            family_id: The token's fam claim (tokens issued without one pass)
+
+        Returns:
+            True if the family was revoked
+        """
+        if not family_id:
+            return False
+        try:
+            return UUID(str(family_id)) in self.revoked
+        except ValueError:
+            return True
+
+    async def issue(
+        self,
+        session: AsyncSession,
+        user_id: UUID,
+        role: str,
+        family_id: Optional[UUID] = None,
+    ) -> dict[str, Any]:
+        """
+        Create access and refresh tokens and record the refresh token.
+
+        The caller commits the session.
+
+        Args:
+            session: Database session
+            user_id: User the tokens are for
+            role: User role
+            family_id: Family to continue, or None to start one (login)
+
+        Returns:
+            Tokens as returned by create_tokens
+        """
+        family_id = family_id or uuid4()
+        token_id = secrets.token_urlsafe(32)
+        tokens = create_tokens(str(user_id), role, family_id=str(family_id), token_id=token_id)
+
+        await RefreshTokenRepository(session).add(
+            token_hash=hash_token_id(token_id),
+            user_id=user_id,
+            family_id=family_id,
+            expires_at=datetime.now(timezone.utc) + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS),
+        )
+        return tokens
+
+    async def rotate(self, session: AsyncSession, payload: dict[str, Any]) -> tuple[UUID, UUID]:
+        """
+        Consume a refresh token so its successor can be issued.
+
+        Reuse of a token rotated more than reuse_grace_seconds ago revokes
+        its family and commits the session. Within the grace period (two
+        tabs refreshing at once) the request is refused without revoking.
+
+        Args:
+            session: Database session
+            payload: Verified claims of the refresh token
+
+        Returns:
+            Tuple of (user_id, family_id)
+
+        Raises:
+            RefreshTokenReused: If the token was already rotated
+            ValueError: If the token is unknown, revoked or expired
+        """
+        token_id = payload.get("jti")
+        if not token_id or not payload.get("fam"):
+            raise ValueError("Refresh token was not issued by the token store")
+        if self.is_revoked(payload.get("fam")):
+            raise ValueError("Refresh token was revoked")
+
+        repo = RefreshTokenRepository(session)
+        token_hash = hash_token_id(token_id)
+        now = datetime.now(timezone.utc)
+
+        consumed = await repo.mark_rotated(token_hash, now)
+        if consumed is not None:
+            return consumed
+
+        token = await repo.get_by_hash(token_hash)
+        if token is None or token.revoked_at is not None or token.rotated_at is None:
+            raise ValueError("Refresh token was revoked or has expired")
+
+        if now - token.rotated_at > timedelta(seconds=self.reuse_grace_seconds):
+            logger.warning(
+                f"Refresh token reuse for user {token.user_id}, revoking family {token.family_id}"
+            )
+            await self.revoke_family(session, token.family_id)
+        raise RefreshTokenReused("Refresh token was already used")
+
+    async def revoke_family(self, session: AsyncSession, family_id: UUID) -> None:
+        """
+        Revoke every token of a family and commit.
+
+        Args:
+            session: Database session
+            family_id: Family to revoke
+        """
+        await RefreshTokenRepository(session).revoke_family(family_id)
+        await session.commit()
+        self.revoked.add(family_id)
+
+    async def sync(self, session: AsyncSession) -> int:
+        """
+        Load revocations made by other workers and purge expired tokens.
+
+        Args:
+            session: Database session
+
+        Returns:
+            Number of revoked families read
+        """
+        now = datetime.now(timezone.utc)
+        since = self._synced_until or now - timedelta(seconds=self.revoked.retain_seconds)
+
+        repo = RefreshTokenRepository(session)
+        revoked = await repo.get_revoked_families(since - _SYNC_OVERLAP)
+        for family_id, revoked_at in revoked:
+            if family_id not in self.revoked:
+                self.revoked.add(family_id)
+            since = max(since, revoked_at)
+        self._synced_until = since
+
+        if time.monotonic() >= self._purge_at:
+            deleted = await repo.delete_expired(now, _PURGE_BATCH_SIZE)
+            await session.commit()
+            if deleted:
+                logger.info(f"Deleted {deleted} expired refresh tokens")
+            # Keep going next poll while whole batches come back
+            if deleted < _PURGE_BATCH_SIZE:
+                self._purge_at = time.monotonic() + self.purge_interval_seconds
+
+        return len(revoked)
+
+
+# Process-wide refresh token store
+refresh_token_store = RefreshTokenStore(
+    reuse_grace_seconds=settings.REFRESH_TOKEN_REUSE_GRACE_SECONDS,
+)
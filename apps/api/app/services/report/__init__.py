@@ -1,5 +1,8 @@
 """Report services module."""
 
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models.report import ReportType
 from app.services.report.audit_report import AuditReportService
 from app.services.report.cash_book_report import CashBookReportService
 from app.services.report.cash_flow_projection_report import CashFlowProjectionReportService
@@ -10,9 +13,36 @@ from app.services.report.expenses_by_category_report import ExpensesByCategoryRe
 from app.services.report.kpi_report import KPIReportService
 from app.services.report.license_report import LicenseReportService
 from app.services.report.obligation_report import ObligationReportService
+from app.services.report.base import BaseReportService
 from app.services.report.revenue_by_client_report import RevenueByClientReportService
 
+REPORT_SERVICES: dict[ReportType, type[BaseReportService]] = {
+    ReportType.DRE: DREReportService,
+    ReportType.FLUXO_CAIXA: CashFlowReportService,
+    ReportType.LIVRO_CAIXA: CashBookReportService,
+    ReportType.RECEITAS_CLIENTE: RevenueByClientReportService,
+    ReportType.DESPESAS_CATEGORIA: ExpensesByCategoryReportService,
+    ReportType.PROJECAO_FLUXO: CashFlowProjectionReportService,
+    ReportType.KPIS: KPIReportService,
+    ReportType.CLIENTES: ClientReportService,
+    ReportType.OBRIGACOES: ObligationReportService,
+    ReportType.LICENCAS: LicenseReportService,
+    ReportType.AUDITORIA: AuditReportService,
+}
+
+
+def get_report_service(report_type: ReportType, db: AsyncSession) -> BaseReportService:
+    """Factory to get the appropriate report service."""
+    service_class = REPORT_SERVICES.get(report_type)
+    if not service_class:
+        raise ValueError(f"Unknown report type: {report_type}")
+
+    return service_class(db)
+
+
 __all__ = [
+    "REPORT_SERVICES",
+    "get_report_service",
     "DREReportService",
     "CashFlowReportService",
     "CashBookReportService",
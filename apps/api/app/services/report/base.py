@@ -1,7 +1,7 @@
 """Base Report Service - Abstract base class for all report services."""
 
 from abc import ABC, abstractmethod
-from typing import Any, Optional
+from typing import Any, AsyncIterator, Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -38,8 +38,19 @@ class BaseReportService(ABC):
         Returns:
             Dictionary with preview data and chart configs
         """
-        data = await self.generate_data(filters)
+        return self.build_preview(filters, await self.generate_data(filters))
 
+    def build_preview(self, filters: dict[str, Any], data: dict[str, Any]) -> dict[str, Any]:
+        """
+        Build the preview of already generated report data.
+
+        Args:
+            filters: Dictionary with filter parameters
+            data: Data returned by generate_data()
+
+        Returns:
+            Dictionary with preview data and chart configs
+        """
         return {
             "data": data,
             "charts_config": self._get_charts_config(),
@@ -105,3 +116,18 @@ class BaseReportService(ABC):
         """
         return 0
 
+
+class StreamingReportService(BaseReportService):
+    """Report service whose export table can be streamed from the database."""
+
+    @abstractmethod
+    def iter_export_rows(self, filters: dict[str, Any]) -> AsyncIterator[list[Any]]:
+        """
+        Stream the export table row by row, header row first.
+
+        Args:
+            filters: Dictionary with filter parameters
+
+        Returns:
+            Async iterator of table rows
+        """
@@ -0,0 +1,252 @@
+"""
+Report result cache.
+
+Caches generated report data under a content-addressed key: the report
+type, the normalized filters (including the client ids RBAC applied) and the
+version of the tables the report reads. Table versions come from the
+database, so a write to one of those tables changes the key in every
+worker, whoever made it; stale entries are not served and simply age out.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import pickle
+import time
+from collections import OrderedDict
+from datetime import date
+from enum import Enum
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Optional
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.db.models.report import ReportType
+from app.db.table_versions import read_table_versions
+
+logger = logging.getLogger(__name__)
+
+# Tables each report type reads
+REPORT_TABLES: dict[ReportType, tuple[str, ...]] = {
+    ReportType.DRE: ("financial_transactions", "finance_monthly_rollup"),
+    ReportType.FLUXO_CAIXA: ("finance_monthly_rollup",),
+    ReportType.LIVRO_CAIXA: ("financial_transactions",),
+    ReportType.RECEITAS_CLIENTE: ("finance_monthly_rollup", "clients"),
+    ReportType.DESPESAS_CATEGORIA: ("financial_transactions",),
+    ReportType.PROJECAO_FLUXO: ("finance_monthly_rollup",),
+    ReportType.KPIS: ("finance_monthly_rollup",),
+    ReportType.CLIENTES: ("clients", "financial_transactions"),
+    ReportType.OBRIGACOES: ("obligations",),
+    ReportType.LICENCAS: ("licenses",),
+    ReportType.AUDITORIA: ("audit_logs",),
+}
+
+
+def _normalize(value: Any) -> Any:
+    """Canonical JSON-compatible form of a filter value."""
+    if isinstance(value, dict):
+        return {
+            str(key): _normalize(item)
+            for key, item in sorted(value.items())
+            if item is not None
+        }
+    if isinstance(value, (list, tuple, set, frozenset)):
+        # Filter lists are sets of ids or codes: order does not matter
+        items = [_normalize(item) for item in value]
+        return sorted(items, key=lambda item: json.dumps(item, sort_keys=True))
+    if isinstance(value, Enum):
+        return _normalize(value.value)
+    if isinstance(value, (date, UUID)):
+        return str(value)
+    return value
+
+
+def normalize_filters(filters: dict[str, Any]) -> dict[str, Any]:
+    """
+    Normalize report filters for keying.
+
+    Drops unset filters, orders keys and list values, and renders dates,
+    UUIDs and enums as strings, so equivalent requests share a key.
+
+    Args:
+        filters: Report filters
+
+    Returns:
+        Normalized filters
+    """
+    return _normalize(filters)
+
+
+async def report_cache_key(
+    session: AsyncSession,
+    report_type: ReportType,
+    filters: dict[str, Any],
+) -> str:
+    """
+    Content-addressed key of a report result.
+
+    Args:
+        session: Database session, to read the table versions
+        report_type: Report type
+        filters: Report filters, after RBAC was applied
+
+    Returns:
+        Hex SHA-256 key
+    """
+    report_type = ReportType(report_type)
+    payload = {
+        "report_type": report_type.value,
+        "filters": normalize_filters(filters),
+        "data_version": await read_table_versions(session, REPORT_TABLES[report_type]),
+        # Some reports are relative to today (licenses expiring soon)
+        "as_of": date.today().isoformat(),
+    }
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class ReportResultCache:
+    """
+    LRU + TTL cache of report data with an optional on-disk tier.
+
+    Entries are bounded by count and age in memory. With a disk directory,
+    computed results are also pickled there, so entries evicted from memory
+    can be loaded back until they expire. Concurrent requests for the same
+    missing key share a single computation. Cached data is shared between
+    callers and must be treated as read-only.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float, disk_dir: Optional[Path] = None):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.disk_dir = disk_dir
+        self._entries: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._inflight: dict[str, asyncio.Future] = {}
+
+        if self.disk_dir is not None:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+
+    def get(self, key: str) -> Optional[dict[str, Any]]:
+        """Get a result from memory, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: dict[str, Any]) -> None:
+        """Store a result in memory, evicting the least recently used entries."""
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every in-memory entry."""
+        self._entries.clear()
+
+    async def get_or_compute(
+        self, key: str, compute: Callable[[], Awaitable[dict[str, Any]]]
+    ) -> dict[str, Any]:
+        """
+        Get a cached result, computing and storing it on a miss.
+
+        Args:
+            key: Key from report_cache_key()
+            compute: Coroutine function producing the report data
+
+        Returns:
+            Report data
+        """
+        while True:
+            value = self.get(key)
+            if value is not None:
+                return value
+
+            pending = self._inflight.get(key)
+            if pending is None:
+                break
+
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                # Retry only when the computation itself was cancelled
+                if not pending.cancelled():
+                    raise
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await self._load_from_disk(key)
+            if value is None:
+                value = await compute()
+                await self._store_on_disk(key, value)
+
+            self.set(key, value)
+            future.set_result(value)
+            return value
+        except Exception as exc:
+            future.set_exception(exc)
+            # Waiters re-raise it; don't log it as never retrieved
+            future.exception()
+            raise
+        finally:
+            if not future.done():
+                future.cancel()
+            del self._inflight[key]
+
+    def _disk_path(self, key: str) -> Path:
+        return self.disk_dir / f"{key}.pickle"
+
+    async def _load_from_disk(self, key: str) -> Optional[dict[str, Any]]:
+        if self.disk_dir is None:
+            return None
+        return await asyncio.to_thread(self._read_disk, self._disk_path(key))
+
+    async def _store_on_disk(self, key: str, value: dict[str, Any]) -> None:
+        if self.disk_dir is None:
+            return
+        try:
+            await asyncio.to_thread(self._write_disk, self._disk_path(key), value)
+        except (OSError, pickle.PicklingError) as e:
+            logger.warning(f"Failed to write report cache entry {key}: {e}")
+
+    def _read_disk(self, path: Path) -> Optional[dict[str, Any]]:
+        try:
+            if time.time() - path.stat().st_mtime >= self.ttl_seconds:
+                path.unlink(missing_ok=True)
+                return None
+            with path.open("rb") as file:
+                return pickle.load(file)
+        except FileNotFoundError:
+            return None
+        except (OSError, pickle.UnpicklingError, EOFError) as e:
+            logger.warning(f"Discarding unreadable report cache entry {path.name}: {e}")
+            path.unlink(missing_ok=True)
+            return None
+
+    def _write_disk(self, path: Path, value: dict[str, Any]) -> None:
+        # Write then rename, so readers never see a partial file
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with tmp_path.open("wb") as file:
+            pickle.dump(value, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+
+
+# Global report result cache
+report_result_cache = ReportResultCache(
+    max_entries=settings.REPORT_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.REPORT_CACHE_TTL_SECONDS,
+    disk_dir=Path(settings.REPORT_CACHE_DIR) if settings.REPORT_CACHE_DIR else None,
+)
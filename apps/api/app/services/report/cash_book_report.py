@@ -1,15 +1,19 @@
 """Cash Book Report Service - Livro Caixa."""
 
 from decimal import Decimal
+from typing import AsyncIterator
 
 from sqlalchemy import and_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models.finance import FinancialTransaction, PaymentStatus, TransactionType
-from app.services.report.base import BaseReportService
+from app.services.report.base import StreamingReportService
 
+# Rows fetched per round trip when streaming entries
+ENTRY_STREAM_BATCH_SIZE = 1000
 
-class CashBookReportService(BaseReportService):
+
+class CashBookReportService(StreamingReportService):
     """Service for generating Cash Book reports."""
 
     async def generate_data(self, filters: dict) -> dict:
@@ -24,6 +28,43 @@ class CashBookReportService(BaseReportService):
         Returns:
             Dictionary with cash book entries
         """
+        entries = []
+        total_entradas = Decimal("0.00")
+        total_saidas = Decimal("0.00")
+
+        async for entry in self.iter_entries(filters):
+            if entry["tipo"] == "entrada":
+                total_entradas += Decimal(str(entry["valor"]))
+            else:
+                total_saidas += Decimal(str(entry["valor"]))
+            entries.append(entry)
+
+        return {
+            "entries": entries,
+            "saldo_inicial": 0.0,  # Could be enhanced to get opening balance
+            "saldo_final": float(total_entradas - total_saidas),
+            "total_entradas": float(total_entradas),
+            "total_saidas": float(total_saidas),
+        }
+
+    async def iter_entries(
+        self,
+        filters: dict,
+        batch_size: int = ENTRY_STREAM_BATCH_SIZE,
+    ) -> AsyncIterator[dict]:
+        """
+        Stream cash book entries with their accumulated balance.
+
+        Uses a server-side cursor fetching ``batch_size`` rows at a time and
+        selects only the columns the entries need.
+
+        Args:
+            filters: Same filters as generate_data()
+            batch_size: Rows fetched per round trip
+
+        Yields:
+            One entry dictionary per paid transaction, in chronological order
+        """
         period_start = filters["period_start"]
         period_end = filters["period_end"]
         client_ids = filters.get("client_ids")
@@ -37,52 +78,71 @@ class CashBookReportService(BaseReportService):
         if client_ids:
             conditions.append(FinancialTransaction.client_id.in_(client_ids))
 
-        # Get all transactions ordered by paid date
+        # Transactions ordered by paid date
         stmt = (
-            select(FinancialTransaction)
+            select(
+                FinancialTransaction.paid_date,
+                FinancialTransaction.transaction_type,
+                FinancialTransaction.description,
+                FinancialTransaction.amount,
+            )
             .where(and_(*conditions))
             .filter(
                 FinancialTransaction.paid_date >= period_start,
                 FinancialTransaction.paid_date <= period_end,
             )
             .order_by(FinancialTransaction.paid_date, FinancialTransaction.created_at)
+            .execution_options(yield_per=batch_size)
         )
 
-        result = await self.db.execute(stmt)
-        transactions = result.scalars().all()
+        result = await self.db.stream(stmt)
 
-        # Build entries with accumulated balance
-        entries = []
         saldo_acumulado = Decimal("0.00")
-        total_entradas = Decimal("0.00")
-        total_saidas = Decimal("0.00")
-
-        for transaction in transactions:
-            tipo = "entrada" if transaction.transaction_type == TransactionType.RECEITA else "saida"
-            valor = transaction.amount
+        async for row in result:
+            tipo = "entrada" if row.transaction_type == TransactionType.RECEITA else "saida"
 
             if tipo == "entrada":
-                saldo_acumulado += valor
-                total_entradas += valor
+                saldo_acumulado += row.amount
             else:
-                saldo_acumulado -= valor
-                total_saidas += valor
+                saldo_acumulado -= row.amount
 
-            entries.append({
-                "data": transaction.paid_date.date(),
+            yield {
+                "data": row.paid_date.date(),
                 "tipo": tipo,
-                "descricao": transaction.description,
-                "valor": float(valor),
+                "descricao": row.description,
+                "valor": float(row.amount),
                 "saldo_acumulado": float(saldo_acumulado),
-            })
+            }
 
-        return {
-            "entries": entries,
-            "saldo_inicial": 0.0,  # Could be enhanced to get opening balance
-            "saldo_final": float(saldo_acumulado),
-            "total_entradas": float(total_entradas),
-            "total_saidas": float(total_saidas),
-        }
+    async def iter_export_rows(self, filters: dict) -> AsyncIterator[list]:
+        """Stream the Cash Book export table, followed by its totals."""
+        total_entradas = Decimal("0.00")
+        total_saidas = Decimal("0.00")
+        saldo_final = Decimal("0.00")
+
+        yield ["Data", "Tipo", "Descrição", "Valor", "Saldo Acumulado"]
+
+        async for entry in self.iter_entries(filters):
+            valor = Decimal(str(entry["valor"]))
+            if entry["tipo"] == "entrada":
+                total_entradas += valor
+            else:
+                total_saidas += valor
+            saldo_final = Decimal(str(entry["saldo_acumulado"]))
+
+            yield [
+                entry["data"].strftime("%d/%m/%Y"),
+                entry["tipo"],
+                entry["descricao"],
+                entry["valor"],
+                entry["saldo_acumulado"],
+            ]
+
+        yield []
+        yield ["RESUMO"]
+        yield ["Total Entradas", float(total_entradas)]
+        yield ["Total Saídas", float(total_saidas)]
+        yield ["Saldo Final", float(saldo_final)]
 
     def _get_charts_config(self) -> list[dict]:
         """Get chart configurations for Cash Book report."""
@@ -6,7 +6,7 @@ from decimal import Decimal
 from sqlalchemy import and_, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.models.finance import FinancialTransaction, PaymentStatus, TransactionType
+from app.db.models.finance import FinanceMonthlyRollup, PaymentStatus, TransactionType
 from app.services.report.base import BaseReportService
 
 
@@ -31,51 +31,30 @@ class CashFlowProjectionReportService(BaseReportService):
         # Get historical data from last 6 months
         historical_start = period_start - timedelta(days=180)
 
-        # Get historical averages for receipts and disbursements
-        conditions = [
-            FinancialTransaction.deleted_at.is_(None),
-            FinancialTransaction.reference_month >= historical_start.replace(day=1),
-            FinancialTransaction.reference_month < period_start.replace(day=1),
-            FinancialTransaction.payment_status == PaymentStatus.PAGO,
-        ]
-
-        # Calculate average monthly revenue
-        revenue_stmt = (
-            select(func.avg(func.sum(FinancialTransaction.amount)))
-            .where(
-                and_(
-                    *conditions,
-                    FinancialTransaction.transaction_type == TransactionType.RECEITA,
-                )
+        # Get paid monthly totals per type from the monthly rollup
+        stmt = (
+            select(
+                FinanceMonthlyRollup.reference_month,
+                FinanceMonthlyRollup.transaction_type,
+                func.sum(FinanceMonthlyRollup.total_amount).label("total"),
             )
-            .group_by(FinancialTransaction.reference_month)
-        )
-        revenue_result = await self.db.execute(revenue_stmt)
-        avg_revenue_rows = revenue_result.scalars().all()
-        avg_revenue = (
-            float(sum(avg_revenue_rows) / len(avg_revenue_rows))
-            if avg_revenue_rows
-            else 0.0
-        )
-
-        # Calculate average monthly expenses
-        expense_stmt = (
-            select(func.avg(func.sum(FinancialTransaction.amount)))
             .where(
                 and_(
-                    *conditions,
-                    FinancialTransaction.transaction_type == TransactionType.DESPESA,
+                    FinanceMonthlyRollup.reference_month >= historical_start.replace(day=1),
+                    FinanceMonthlyRollup.reference_month < period_start.replace(day=1),
+                    FinanceMonthlyRollup.payment_status == PaymentStatus.PAGO,
                 )
             )
-            .group_by(FinancialTransaction.reference_month)
-        )
-        expense_result = await self.db.execute(expense_stmt)
-        avg_expense_rows = expense_result.scalars().all()
-        avg_expense = (
-            float(sum(avg_expense_rows) / len(avg_expense_rows))
-            if avg_expense_rows
-            else 0.0
+            .group_by(FinanceMonthlyRollup.reference_month, FinanceMonthlyRollup.transaction_type)
         )
+        result = await self.db.execute(stmt)
+        rows = result.all()
+
+        # Average monthly revenue and expenses over months with data
+        revenue_rows = [row.total for row in rows if row.transaction_type == TransactionType.RECEITA]
+        expense_rows = [row.total for row in rows if row.transaction_type == TransactionType.DESPESA]
+        avg_revenue = float(sum(revenue_rows) / len(revenue_rows)) if revenue_rows else 0.0
+        avg_expense = float(sum(expense_rows) / len(expense_rows)) if expense_rows else 0.0
 
         # Generate projections for next 3 months
         periods = []
@@ -6,7 +6,7 @@ from decimal import Decimal
 from sqlalchemy import and_, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.models.finance import FinancialTransaction, PaymentStatus, TransactionType
+from app.db.models.finance import FinanceMonthlyRollup, PaymentStatus, TransactionType
 from app.services.report.base import BaseReportService
 
 
@@ -30,32 +30,30 @@ class CashFlowReportService(BaseReportService):
         client_ids = filters.get("client_ids")
 
         # Build conditions
-        conditions = [
-            FinancialTransaction.deleted_at.is_(None),
-        ]
+        conditions = []
 
         if client_ids:
-            conditions.append(FinancialTransaction.client_id.in_(client_ids))
+            conditions.append(FinanceMonthlyRollup.client_id.in_(client_ids))
 
-        # Get all transactions in period grouped by month
+        # Get paid totals in period grouped by month from the monthly rollup
         stmt = (
             select(
-                FinancialTransaction.reference_month,
-                FinancialTransaction.transaction_type,
-                func.sum(FinancialTransaction.amount).label("total"),
+                FinanceMonthlyRollup.reference_month,
+                FinanceMonthlyRollup.transaction_type,
+                func.sum(FinanceMonthlyRollup.total_amount).label("total"),
             )
             .where(
                 and_(
                     *conditions,
-                    FinancialTransaction.reference_month >= period_start,
-                    FinancialTransaction.reference_month <= period_end,
-                    FinancialTransaction.payment_status.in_([
+                    FinanceMonthlyRollup.reference_month >= period_start,
+                    FinanceMonthlyRollup.reference_month <= period_end,
+                    FinanceMonthlyRollup.payment_status.in_([
                         PaymentStatus.PAGO,
                     ]),
                 )
             )
-            .group_by(FinancialTransaction.reference_month, FinancialTransaction.transaction_type)
-            .order_by(FinancialTransaction.reference_month)
+            .group_by(FinanceMonthlyRollup.reference_month, FinanceMonthlyRollup.transaction_type)
+            .order_by(FinanceMonthlyRollup.reference_month)
         )
 
         result = await self.db.execute(stmt)
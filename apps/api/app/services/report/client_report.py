@@ -1,16 +1,20 @@
 """Client Report Service."""
 
 from decimal import Decimal
+from typing import AsyncIterator
 
-from sqlalchemy import and_, func, select
+from sqlalchemy import Select, and_, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models.client import Client
 from app.db.models.finance import FinancialTransaction, PaymentStatus
-from app.services.report.base import BaseReportService
+from app.services.report.base import StreamingReportService
 
+# Rows fetched per round trip when streaming clients
+CLIENT_STREAM_BATCH_SIZE = 1000
 
-class ClientReportService(BaseReportService):
+
+class ClientReportService(StreamingReportService):
     """Service for generating Client reports."""
 
     async def generate_data(self, filters: dict) -> dict:
@@ -25,69 +29,139 @@ class ClientReportService(BaseReportService):
         Returns:
             Dictionary with client data structure
         """
-        client_ids = filters.get("client_ids")
+        clients_data = []
+        total_honorarios = Decimal("0.00")
 
-        # Build base conditions
-        conditions = [Client.deleted_at.is_(None)]
+        async for client in self.iter_clients(filters):
+            clients_data.append(client)
+            total_honorarios += Decimal(str(client["honorarios"]))
 
-        if client_ids:
-            conditions.append(Client.id.in_(client_ids))
+        return {
+            "clients": clients_data,
+            "total_clientes": len(clients_data),
+            "total_honorarios": float(total_honorarios),
+        }
 
-        # Get all clients with their financial summary
-        stmt = select(Client).where(and_(*conditions)).order_by(Client.razao_social)
+    async def iter_clients(
+        self,
+        filters: dict,
+        batch_size: int = CLIENT_STREAM_BATCH_SIZE,
+    ) -> AsyncIterator[dict]:
+        """
+        Stream client rows with their pending and overdue totals.
 
-        result = await self.db.execute(stmt)
-        clients_list = result.scalars().all()
+        Runs a single query and fetches it in batches of ``batch_size`` rows,
+        so memory stays flat regardless of the number of clients.
 
-        # For each client, calculate financial summaries
-        clients_data = []
+        Args:
+            filters: Same filters as generate_data()
+            batch_size: Rows fetched per round trip
+
+        Yields:
+            One client dictionary per row, ordered by razao_social
+        """
+        stmt = self._build_clients_query(filters).execution_options(yield_per=batch_size)
+        result = await self.db.stream(stmt)
+
+        async for row in result:
+            yield {
+                "id": str(row.id),
+                "razao_social": row.razao_social,
+                "cnpj": row.cnpj,
+                "email": row.email,
+                "status": row.status,
+                "honorarios": float(row.honorarios_mensais),
+                "total_pendente": float(row.total_pendente),
+                "total_atrasado": float(row.total_atrasado),
+            }
+
+    async def iter_export_rows(self, filters: dict) -> AsyncIterator[list]:
+        """Stream the Client export table, followed by its totals."""
+        total_clientes = 0
         total_honorarios = Decimal("0.00")
 
-        for client in clients_list:
-            # Get pending transactions
-            pending_stmt = (
-                select(func.sum(FinancialTransaction.amount))
-                .where(
-                    and_(
-                        FinancialTransaction.client_id == client.id,
-                        FinancialTransaction.payment_status == PaymentStatus.PENDENTE,
-                        FinancialTransaction.deleted_at.is_(None),
-                    )
-                )
-            )
-            total_pendente = await self.db.scalar(pending_stmt) or Decimal("0.00")
-
-            # Get overdue transactions
-            overdue_stmt = (
-                select(func.sum(FinancialTransaction.amount))
-                .where(
-                    and_(
-                        FinancialTransaction.client_id == client.id,
-                        FinancialTransaction.payment_status == PaymentStatus.ATRASADO,
-                        FinancialTransaction.deleted_at.is_(None),
-                    )
-                )
-            )
-            total_atrasado = await self.db.scalar(overdue_stmt) or Decimal("0.00")
+        yield [
+            "Razão Social",
+            "CNPJ",
+            "Email",
+            "Status",
+            "Honorários",
+            "Total Pendente",
+            "Total Atrasado",
+        ]
 
-            clients_data.append({
-                "id": str(client.id),
-                "razao_social": client.razao_social,
-                "cnpj": client.cnpj,
-                "email": client.email,
-                "status": client.status,
-                "honorarios": float(client.honorarios_mensais),
-                "total_pendente": float(total_pendente),
-                "total_atrasado": float(total_atrasado),
-            })
+        async for client in self.iter_clients(filters):
+            total_clientes += 1
+            total_honorarios += Decimal(str(client["honorarios"]))
+
+            yield [
+                client["razao_social"],
+                client["cnpj"],
+                client["email"] or "",
+                str(getattr(client["status"], "value", client["status"])),
+                client["honorarios"],
+                client["total_pendente"],
+                client["total_atrasado"],
+            ]
+
+        yield []
+        yield ["RESUMO"]
+        yield ["Total de Clientes", total_clientes]
+        yield ["Total Honorários", float(total_honorarios)]
+
+    def _build_clients_query(self, filters: dict) -> Select:
+        """
+        Build the client list query.
 
-            total_honorarios += Decimal(str(client.honorarios_mensais))
+        Pending and overdue sums come from one grouped subquery LEFT JOINed
+        onto the clients, instead of two queries per client.
+        """
+        client_ids = filters.get("client_ids")
 
-        return {
-            "clients": clients_data,
-            "total_clientes": len(clients_data),
-            "total_honorarios": float(total_honorarios),
-        }
+        # Build base conditions
+        conditions = [Client.deleted_at.is_(None)]
+        receivable_conditions = [
+            FinancialTransaction.payment_status.in_([
+                PaymentStatus.PENDENTE,
+                PaymentStatus.ATRASADO,
+            ]),
+            FinancialTransaction.deleted_at.is_(None),
+        ]
+
+        if client_ids:
+            conditions.append(Client.id.in_(client_ids))
+            receivable_conditions.append(FinancialTransaction.client_id.in_(client_ids))
+
+        receivables = (
+            select(
+                FinancialTransaction.client_id,
+                func.sum(FinancialTransaction.amount)
+                .filter(FinancialTransaction.payment_status == PaymentStatus.PENDENTE)
+                .label("total_pendente"),
+                func.sum(FinancialTransaction.amount)
+                .filter(FinancialTransaction.payment_status == PaymentStatus.ATRASADO)
+                .label("total_atrasado"),
+            )
+            .where(and_(*receivable_conditions))
+            .group_by(FinancialTransaction.client_id)
+            .subquery()
+        )
+
+        return (
+            select(
+                Client.id,
+                Client.razao_social,
+                Client.cnpj,
+                Client.email,
+                Client.status,
+                Client.honorarios_mensais,
+                func.coalesce(receivables.c.total_pendente, 0).label("total_pendente"),
+                func.coalesce(receivables.c.total_atrasado, 0).label("total_atrasado"),
+            )
+            .outerjoin(receivables, receivables.c.client_id == Client.id)
+            .where(and_(*conditions))
+            .order_by(Client.razao_social, Client.id)
+        )
 
     def _get_charts_config(self) -> list[dict]:
         """Get chart configurations for Client report."""
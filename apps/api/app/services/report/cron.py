@@ -0,0 +1,141 @@
+"""
+Cron expressions for report schedules.
+
+Supports the standard five fields (minute, hour, day of month, month, day
+of week) with ``*``, lists, ranges and steps. Like cron, when both day of
+month and day of week are restricted a day matching either one matches.
+"""
+
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+
+# (name, min, max) per field, in expression order; 0 and 7 are both Sunday
+_FIELDS = (
+    ("minute", 0, 59),
+    ("hour", 0, 23),
+    ("day of month", 1, 31),
+    ("month", 1, 12),
+    ("day of week", 0, 7),
+)
+
+# Search horizon for the next run (covers Feb 29 on a given weekday)
+_MAX_SEARCH_DAYS = 366 * 8
+
+
+def _parse_field(value: str, name: str, low: int, high: int) -> frozenset[int]:
+    values = set()
+
+    for part in value.split(","):
+        range_part, has_step, step_part = part.partition("/")
+        try:
+            step = int(step_part) if has_step else 1
+            if range_part == "*":
+                start, end = low, high
+            elif "-" in range_part:
+                start_str, end_str = range_part.split("-", 1)
+                start, end = int(start_str), int(end_str)
+            else:
+                start = int(range_part)
+                end = high if has_step else start
+        except ValueError:
+            raise ValueError(f"Invalid cron {name} field: {part!r}") from None
+
+        if step < 1 or not (low <= start <= end <= high):
+            raise ValueError(f"Invalid cron {name} field: {part!r}")
+
+        values.update(range(start, end + 1, step))
+
+    return frozenset(values)
+
+
+@dataclass(frozen=True)
+class CronExpression:
+    """Parsed five-field cron expression."""
+
+    expression: str
+    minutes: frozenset[int]
+    hours: frozenset[int]
+    days: frozenset[int]
+    months: frozenset[int]
+    weekdays: frozenset[int]  # 0 = Sunday
+    days_restricted: bool
+    weekdays_restricted: bool
+
+    @classmethod
+    def parse(cls, expression: str) -> "CronExpression":
+        """
+        Parse a cron expression.
+
+        Args:
+            expression: e.g. "0 8 1 * *" (08:00 on the 1st of every month)
+
+        Returns:
+            CronExpression
+
+        Raises:
+            ValueError: If the expression is malformed
+        """
+        fields = expression.split()
+        if len(fields) != 5:
+            raise ValueError("Cron expression must have 5 fields: minute hour day month weekday")
+
+        parsed = [
+            _parse_field(value, name, low, high)
+            for value, (name, low, high) in zip(fields, _FIELDS)
+        ]
+
+        return cls(
+            expression=" ".join(fields),
+            minutes=parsed[0],
+            hours=parsed[1],
+            days=parsed[2],
+            months=parsed[3],
+            weekdays=frozenset(day % 7 for day in parsed[4]),
+            days_restricted=fields[2] != "*",
+            weekdays_restricted=fields[4] != "*",
+        )
+
+    def matches_day(self, day: date) -> bool:
+        """Whether the expression fires at some time on a day."""
+        if day.month not in self.months:
+            return False
+
+        in_days = day.day in self.days
+        # date.weekday(): Monday = 0; cron: Sunday = 0
+        in_weekdays = (day.weekday() + 1) % 7 in self.weekdays
+
+        if self.days_restricted and self.weekdays_restricted:
+            return in_days or in_weekdays
+        return in_days and in_weekdays
+
+    def next_after(self, moment: datetime) -> datetime:
+        """
+        First time strictly after a moment the expression fires.
+
+        Args:
+            moment: Reference datetime (naive or aware; the result keeps its tzinfo)
+
+        Returns:
+            Next fire time, with seconds and microseconds zeroed
+
+        Raises:
+            ValueError: If the expression never fires (e.g. "0 0 31 2 *")
+        """
+        start = moment.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        hours = sorted(self.hours)
+        minutes = sorted(self.minutes)
+
+        for offset in range(_MAX_SEARCH_DAYS):
+            day = start.date() + timedelta(days=offset)
+            if not self.matches_day(day):
+                continue
+
+            for hour in hours:
+                for minute in minutes:
+                    candidate = start.replace(
+                        year=day.year, month=day.month, day=day.day, hour=hour, minute=minute
+                    )
+                    if candidate >= start:
+                        return candidate
+
+        raise ValueError(f"Cron expression never fires: {self.expression!r}")
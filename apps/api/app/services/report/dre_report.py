@@ -5,7 +5,12 @@ from decimal import Decimal
 from sqlalchemy import and_, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.models.finance import FinancialTransaction, PaymentStatus, TransactionType
+from app.db.models.finance import (
+    FinanceMonthlyRollup,
+    FinancialTransaction,
+    PaymentStatus,
+    TransactionType,
+)
 from app.services.report.base import BaseReportService
 
 
@@ -39,18 +44,38 @@ class DREReportService(BaseReportService):
         if client_ids:
             conditions.append(FinancialTransaction.client_id.in_(client_ids))
 
-        # Calculate total revenue
-        revenue_stmt = (
-            select(func.sum(FinancialTransaction.amount))
-            .where(
-                and_(
-                    *conditions,
-                    FinancialTransaction.transaction_type == TransactionType.RECEITA,
-                )
+        # Revenue and expense totals come from the monthly rollup
+        rollup_conditions = [
+            FinanceMonthlyRollup.payment_status == PaymentStatus.PAGO,
+            FinanceMonthlyRollup.reference_month >= period_start.replace(day=1),
+            FinanceMonthlyRollup.reference_month <= period_end.replace(day=1),
+        ]
+
+        if client_ids:
+            rollup_conditions.append(FinanceMonthlyRollup.client_id.in_(client_ids))
+
+        totals_stmt = (
+            select(
+                func.coalesce(
+                    func.sum(FinanceMonthlyRollup.total_amount).filter(
+                        FinanceMonthlyRollup.transaction_type == TransactionType.RECEITA
+                    ),
+                    0,
+                ).label("receita"),
+                func.coalesce(
+                    func.sum(FinanceMonthlyRollup.total_amount).filter(
+                        FinanceMonthlyRollup.transaction_type == TransactionType.DESPESA
+                    ),
+                    0,
+                ).label("despesa"),
             )
+            .where(and_(*rollup_conditions))
         )
-        total_receita = await self.db.scalar(revenue_stmt) or Decimal("0.00")
+        totals = (await self.db.execute(totals_stmt)).one()
+        total_receita = Decimal(totals.receita)
+        total_despesa = Decimal(totals.despesa)
 
+        # Category breakdowns need the description, which the rollup does not keep
         # Group revenue by description/category
         revenue_group_stmt = (
             select(
@@ -69,18 +94,6 @@ class DREReportService(BaseReportService):
         revenue_result = await self.db.execute(revenue_group_stmt)
         revenue_items = revenue_result.all()
 
-        # Calculate total expenses (for future use when expenses are tracked)
-        expense_stmt = (
-            select(func.sum(FinancialTransaction.amount))
-            .where(
-                and_(
-                    *conditions,
-                    FinancialTransaction.transaction_type == TransactionType.DESPESA,
-                )
-            )
-        )
-        total_despesa = await self.db.scalar(expense_stmt) or Decimal("0.00")
-
         # Group expenses by description/category
         expense_group_stmt = (
             select(
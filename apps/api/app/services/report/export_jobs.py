@@ -0,0 +1,330 @@
+"""
+Report export jobs.
+
+Exports are rendered by a bounded pool of background workers instead of
+inside the HTTP request. Each job updates its ReportHistory row from PENDING
+to COMPLETED or FAILED and notifies the requesting user over WebSocket.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Optional
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import settings
+from app.db.models.report import ReportFormat, ReportHistory, ReportStatus, ReportType
+from app.db.repositories.report import ReportRepository
+from app.services.report import get_report_service
+from app.services.report.base import StreamingReportService
+from app.services.report.cache import report_result_cache
+from app.services.report.exporters.csv_exporter import CSVExporter
+from app.services.report.exporters.pdf_exporter import PDFExporter
+
+logger = logging.getLogger(__name__)
+
+# How long generated files are kept
+REPORT_FILE_TTL = timedelta(days=7)
+
+
+@dataclass(frozen=True)
+class ReportExportJob:
+    """A report export waiting to be rendered."""
+
+    report_id: UUID
+    user_id: UUID
+    report_type: ReportType
+    format: ReportFormat
+    filters: dict[str, Any]
+    filename: str
+    cache_key: str
+    # History rows of other users who receive the same file (scheduled reports)
+    shared_report_ids: tuple[UUID, ...] = ()
+
+
+def csv_metadata(report_type: ReportType, filters: dict[str, Any]) -> dict[str, str]:
+    """Title and period rows written at the top of CSV exports."""
+    return {
+        "title": ReportType(report_type).value.replace("_", " ").title(),
+        "period": f"{filters.get('period_start')} a {filters.get('period_end')}",
+    }
+
+
+def prepare_table_data(report_data: dict) -> list[list[str]]:
+    """Convert report data to table format for PDF and CSV exports."""
+    table_data = []
+
+    # Handle different report structures
+    if "receitas" in report_data and "despesas" in report_data:
+        # DRE format
+        table_data.append(["Categoria", "Valor", "%"])
+        for item in report_data.get("receitas", []):
+            table_data.append([
+                item.get("categoria", ""),
+                f"R$ {item.get('valor', 0):,.2f}",
+                f"{item.get('percentual', 0):.2f}%",
+            ])
+    elif "periods" in report_data:
+        # Cash flow / projection format
+        table_data.append(["Período", "Entradas", "Saídas", "Saldo"])
+        for item in report_data.get("periods", []):
+            table_data.append([
+                item.get("periodo", ""),
+                f"R$ {item.get('entradas', 0):,.2f}",
+                f"R$ {item.get('saidas', 0):,.2f}",
+                f"R$ {item.get('saldo_final', 0):,.2f}",
+            ])
+    elif "clients" in report_data:
+        # Revenue by client
+        table_data.append(["Cliente", "Receita", "%"])
+        for item in report_data.get("clients", []):
+            table_data.append([
+                item.get("client_name", ""),
+                f"R$ {item.get('total_receita', 0):,.2f}",
+                f"{item.get('percentual_total', 0):.2f}%",
+            ])
+
+    return table_data
+
+
+async def render_export(db: AsyncSession, job: ReportExportJob) -> tuple[int, Path]:
+    """
+    Generate a report and write its export file.
+
+    Args:
+        db: Database session
+        job: Export job
+
+    Returns:
+        Tuple of (file_size, file_path)
+    """
+    service = get_report_service(job.report_type, db)
+    metadata = csv_metadata(job.report_type, job.filters)
+
+    if job.format == ReportFormat.CSV and isinstance(service, StreamingReportService):
+        # Rows go straight from a server-side cursor into the file
+        return await CSVExporter().export_rows(
+            metadata, service.iter_export_rows(job.filters), job.filename
+        )
+
+    report_data = await report_result_cache.get_or_compute(
+        job.cache_key, lambda: service.generate_data(job.filters)
+    )
+    # Release the connection while the file renders
+    await db.commit()
+
+    if job.format == ReportFormat.PDF:
+        pdf_data = {
+            "title": f"{metadata['title']} Report",
+            "period": metadata["period"],
+            "summary": report_data.get("summary", {}),
+            "table_data": prepare_table_data(report_data),
+        }
+        return await PDFExporter().export_to_file(pdf_data, job.filename)
+
+    csv_data = {
+        **metadata,
+        "summary": report_data,
+        "table_data": prepare_table_data(report_data),
+    }
+    file_bytes, file_path = await CSVExporter().export(csv_data, job.filename)
+    return len(file_bytes), file_path
+
+
+async def notify_report_finished(history: ReportHistory) -> None:
+    """Push the outcome of an export to the user who requested it."""
+    from app.websockets.handlers import WebSocketHandler
+
+    await WebSocketHandler.handle_report_finished(history)
+
+
+class ReportJobQueue:
+    """
+    Bounded queue of report export jobs and the workers that run them.
+
+    Workers are tasks of the application's event loop; database work runs on
+    their own sessions and PDF rendering on the PDF render pool. At most
+    ``workers`` exports render at once per process and at most
+    ``max_pending`` wait; submit() refuses jobs beyond that.
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        max_pending: int,
+        timeout_seconds: float,
+        session_factory: Optional[async_sessionmaker[AsyncSession]] = None,
+        notify: Callable[[ReportHistory], Awaitable[None]] = notify_report_finished,
+    ):
+        self.workers = workers
+        self.timeout_seconds = timeout_seconds
+        self.notify = notify
+        self._session_factory = session_factory
+        self._queue: asyncio.Queue[ReportExportJob] = asyncio.Queue(maxsize=max_pending)
+        self._tasks: list[asyncio.Task] = []
+
+    @property
+    def session_factory(self) -> async_sessionmaker[AsyncSession]:
+        """Session factory used by the workers."""
+        if self._session_factory is None:
+            from app.core.database import db_manager
+
+            self._session_factory = db_manager.session_factory
+        return self._session_factory
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the workers are started."""
+        return bool(self._tasks)
+
+    def is_full(self) -> bool:
+        """Whether no more jobs can be submitted right now."""
+        return self._queue.full()
+
+    def pending_count(self) -> int:
+        """Number of jobs waiting for a worker."""
+        return self._queue.qsize()
+
+    def submit(self, job: ReportExportJob) -> None:
+        """
+        Queue a job.
+
+        Args:
+            job: Export job; its ReportHistory row must be committed
+
+        Raises:
+            asyncio.QueueFull: If max_pending jobs are already waiting
+        """
+        self._queue.put_nowait(job)
+
+    async def enqueue(self, job: ReportExportJob) -> None:
+        """
+        Queue a job, waiting for room if the queue is full.
+
+        Args:
+            job: Export job; its ReportHistory rows must be committed
+        """
+        await self._queue.put(job)
+
+    async def start(self) -> None:
+        """Fail jobs orphaned by a previous process and start the workers."""
+        if self.is_running:
+            return
+
+        # A job that outlived twice the timeout belongs to no live worker
+        stale_before = datetime.utcnow() - timedelta(seconds=2 * self.timeout_seconds)
+        async with self.session_factory() as session:
+            failed = await ReportRepository(session).fail_pending_before(stale_before)
+            await session.commit()
+        if failed:
+            logger.warning(f"Marked {failed} orphaned report exports as failed")
+
+        self._tasks = [
+            asyncio.create_task(self._work(), name=f"report-export-{index}")
+            for index in range(self.workers)
+        ]
+
+    async def stop(self) -> None:
+        """Stop the workers; unfinished jobs stay PENDING until they go stale."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def join(self) -> None:
+        """Wait until every queued job was processed."""
+        await self._queue.join()
+
+    async def _work(self) -> None:
+        while True:
+            job = await self._queue.get()
+            try:
+                await self.run(job)
+            except Exception as e:
+                logger.error(f"Unexpected error in report export {job.report_id}: {e}", exc_info=True)
+            finally:
+                self._queue.task_done()
+
+    async def run(self, job: ReportExportJob) -> list[ReportHistory]:
+        """
+        Render one job and record its outcome.
+
+        Args:
+            job: Export job
+
+        Returns:
+            Updated ReportHistory rows (missing rows are skipped)
+        """
+        try:
+            async with self.session_factory() as session:
+                file_size, file_path = await asyncio.wait_for(
+                    render_export(session, job), timeout=self.timeout_seconds
+                )
+                histories = await self._finish(
+                    session,
+                    job,
+                    status=ReportStatus.COMPLETED,
+                    file_path=str(file_path),
+                    file_size=file_size,
+                )
+        except Exception as e:
+            logger.error(f"Report export {job.report_id} failed: {e}", exc_info=True)
+            async with self.session_factory() as session:
+                histories = await self._finish(session, job, status=ReportStatus.FAILED)
+
+        for history in histories:
+            try:
+                await self.notify(history)
+            except Exception as e:
+                logger.error(f"Failed to notify report export {history.id}: {e}")
+
+        return histories
+
+    async def _finish(
+        self,
+        session: AsyncSession,
+        job: ReportExportJob,
+        status: ReportStatus,
+        file_path: Optional[str] = None,
+        file_size: Optional[int] = None,
+    ) -> list[ReportHistory]:
+        repo = ReportRepository(session)
+        now = datetime.utcnow()
+        histories = []
+
+        # Scheduled runs may have joined this render after it was queued
+        report_ids = [job.report_id, *job.shared_report_ids]
+        await repo.lock_export_group(job.cache_key, job.format)
+        for pending in await repo.get_pending_exports(job.cache_key, job.format):
+            if pending.id not in report_ids:
+                report_ids.append(pending.id)
+
+        for report_id in report_ids:
+            history = await repo.get_history_record(report_id)
+            if history is None:
+                logger.warning(f"Report export {report_id} finished but its history row is gone")
+                continue
+
+            history.status = status
+            history.file_path = file_path
+            history.file_size = file_size
+            history.generated_at = now
+            history.expires_at = now + REPORT_FILE_TTL
+            if status != ReportStatus.COMPLETED:
+                history.cache_key = None
+            histories.append(history)
+
+        await session.commit()
+        return histories
+
+
+# Global report export queue, started by the application lifespan
+report_job_queue = ReportJobQueue(
+    workers=settings.REPORT_JOB_WORKERS,
+    max_pending=settings.REPORT_JOB_QUEUE_SIZE,
+    timeout_seconds=settings.REPORT_JOB_TIMEOUT_SECONDS,
+)
@@ -4,7 +4,10 @@ import csv
 import io
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, AsyncIterable, AsyncIterator, Sequence
+
+# Rows formatted per chunk when streaming a CSV
+CSV_STREAM_CHUNK_ROWS = 500
 
 
 class CSVExporter:
@@ -26,24 +29,13 @@ class CSVExporter:
             Tuple of (csv_bytes, file_path)
         """
         # Generate CSV in memory with UTF-8 BOM for Excel compatibility
-        buffer = io.BytesIO()
-        buffer.write("\ufeff".encode("utf-8"))  # BOM for Excel
+        buffer = io.StringIO()
+        buffer.write("\ufeff")  # BOM for Excel
 
-        writer = csv.writer(
-            buffer, delimiter=";", quoting=csv.QUOTE_NONNUMERIC, lineterminator="\n"
-        )
+        writer = self._create_writer(buffer)
 
         # Write header/metadata
-        writer.writerow(["RELATÓRIO", data.get("title", "Relatório")])
-        if "period" in data:
-            writer.writerow(["PERÍODO", data["period"]])
-        writer.writerow(
-            [
-                "GERADO EM",
-                datetime.now().strftime("%d/%m/%Y %H:%M:%S"),
-            ]
-        )
-        writer.writerow([])  # Blank row
+        self._write_metadata(writer, data)
 
         # Write summary if exists
         if "summary" in data:
@@ -68,14 +60,96 @@ class CSVExporter:
                     writer.writerow(row)
 
         # Get CSV bytes
-        buffer.seek(0)
-        csv_bytes = buffer.read()
+        csv_bytes = buffer.getvalue().encode("utf-8")
 
         # Save to file
         file_path = self._save_to_file(csv_bytes, filename)
 
         return csv_bytes, file_path
 
+    async def export_rows(
+        self,
+        metadata: dict[str, Any],
+        rows: AsyncIterable[Sequence[Any]],
+        filename: str,
+    ) -> tuple[int, Path]:
+        """
+        Stream rows into a CSV file without building it in memory.
+
+        Args:
+            metadata: Title and period written above the rows
+            rows: Async iterable of CSV rows
+            filename: Output filename
+
+        Returns:
+            Tuple of (file_size, file_path)
+        """
+        file_path = self._get_file_path(filename)
+
+        with file_path.open("wb") as file:
+            async for chunk in self.iter_csv(metadata, rows):
+                file.write(chunk)
+
+        return file_path.stat().st_size, file_path
+
+    async def iter_csv(
+        self,
+        metadata: dict[str, Any],
+        rows: AsyncIterable[Sequence[Any]],
+        chunk_rows: int = CSV_STREAM_CHUNK_ROWS,
+    ) -> AsyncIterator[bytes]:
+        """
+        Format rows as CSV incrementally.
+
+        Suitable as the body of a StreamingResponse; only ``chunk_rows`` rows
+        are held in memory at a time.
+
+        Args:
+            metadata: Title and period written above the rows
+            rows: Async iterable of CSV rows
+            chunk_rows: Rows formatted per yielded chunk
+
+        Yields:
+            UTF-8 encoded CSV chunks, the first one starting with a BOM
+        """
+        buffer = io.StringIO()
+        buffer.write("\ufeff")  # BOM for Excel
+
+        writer = self._create_writer(buffer)
+        self._write_metadata(writer, metadata)
+
+        pending = 0
+        async for row in rows:
+            writer.writerow(row)
+            pending += 1
+
+            if pending >= chunk_rows:
+                yield buffer.getvalue().encode("utf-8")
+                buffer.seek(0)
+                buffer.truncate()
+                pending = 0
+
+        yield buffer.getvalue().encode("utf-8")
+
+    def _create_writer(self, buffer: io.StringIO):
+        """Create the CSV writer used by all exports."""
+        return csv.writer(
+            buffer, delimiter=";", quoting=csv.QUOTE_NONNUMERIC, lineterminator="\n"
+        )
+
+    def _write_metadata(self, writer, data: dict[str, Any]) -> None:
+        """Write title, period and generation time header rows."""
+        writer.writerow(["RELATÓRIO", data.get("title", "Relatório")])
+        if "period" in data:
+            writer.writerow(["PERÍODO", data["period"]])
+        writer.writerow(
+            [
+                "GERADO EM",
+                datetime.now().strftime("%d/%m/%Y %H:%M:%S"),
+            ]
+        )
+        writer.writerow([])  # Blank row
+
     def _format_key(self, key: str) -> str:
         """Format dictionary key for display."""
         key_map = {
@@ -99,6 +173,13 @@ class CSVExporter:
 
     def _save_to_file(self, csv_bytes: bytes, filename: str) -> Path:
         """Save CSV bytes to file."""
+        file_path = self._get_file_path(filename)
+        file_path.write_bytes(csv_bytes)
+
+        return file_path
+
+    def _get_file_path(self, filename: str) -> Path:
+        """Get the output path of a CSV file."""
         # Create subdirectory by date
         today = datetime.now().strftime("%Y%m%d")
         subdir = self._ensure_directory(today)
@@ -107,10 +188,7 @@ class CSVExporter:
         if not filename.endswith(".csv"):
             filename += ".csv"
 
-        file_path = subdir / filename
-        file_path.write_bytes(csv_bytes)
-
-        return file_path
+        return subdir / filename
 
     def _ensure_directory(self, subdirectory: str) -> Path:
         """Ensure a subdirectory exists."""
@@ -0,0 +1,173 @@
+"""PDF rendering engine - paginated ReportLab rendering off the event loop."""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Optional, Sequence, TypeVar
+from xml.sax.saxutils import escape
+
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.styles import getSampleStyleSheet
+from reportlab.lib.units import cm
+from reportlab.pdfgen import canvas
+from reportlab.platypus import LongTable, Paragraph, SimpleDocTemplate, Spacer, TableStyle
+
+from app.core.config import settings
+
+T = TypeVar("T")
+
+_render_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_render_executor() -> ThreadPoolExecutor:
+    """Get the bounded pool PDF rendering runs on, creating it on first use."""
+    global _render_executor
+
+    if _render_executor is None:
+        _render_executor = ThreadPoolExecutor(
+            max_workers=settings.PDF_RENDER_MAX_WORKERS,
+            thread_name_prefix="pdf-render",
+        )
+    return _render_executor
+
+
+async def render_in_pool(render: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    Run a synchronous ReportLab render on the PDF render pool.
+
+    Keeps the event loop free while a document renders; at most
+    PDF_RENDER_MAX_WORKERS documents render at once per worker process and
+    the rest wait in the pool queue.
+
+    Args:
+        render: Synchronous render function
+        *args: Positional arguments for render
+        **kwargs: Keyword arguments for render
+
+    Returns:
+        Whatever render returns
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_render_executor(), partial(render, *args, **kwargs))
+
+
+def shutdown_render_pool() -> None:
+    """Shut down the render pool (application shutdown)."""
+    global _render_executor
+
+    if _render_executor is not None:
+        _render_executor.shutdown(wait=False, cancel_futures=True)
+        _render_executor = None
+
+
+class ReportPDFRenderer:
+    """
+    Paginated report renderer.
+
+    Lays out the title, summary and table with platypus, so long tables
+    break across pages and repeat their header row on each page. Pages are
+    compressed and written straight to the target file.
+    """
+
+    def __init__(
+        self,
+        title: str,
+        period: Optional[str] = None,
+        summary: Optional[Sequence[tuple[str, str]]] = None,
+    ):
+        self.title = title
+        self.period = period
+        self.summary = summary or []
+        self.generated_at = datetime.now()
+
+    def render(self, table_data: Sequence[Sequence[Any]], file_path: Path) -> int:
+        """
+        Render the report to a file.
+
+        Args:
+            table_data: Table rows, header row first
+            file_path: Output file
+
+        Returns:
+            Size of the written file in bytes
+        """
+        doc = SimpleDocTemplate(
+            str(file_path),
+            pagesize=A4,
+            leftMargin=2 * cm,
+            rightMargin=2 * cm,
+            topMargin=3 * cm,
+            bottomMargin=2 * cm,
+            pageCompression=1,
+            title=self.title,
+        )
+        doc.build(
+            self._build_story(doc, table_data),
+            onFirstPage=self._draw_page,
+            onLaterPages=self._draw_page,
+        )
+
+        return file_path.stat().st_size
+
+    def _build_story(self, doc: SimpleDocTemplate, table_data: Sequence[Sequence[Any]]) -> list:
+        """Build the flowables of the document."""
+        styles = getSampleStyleSheet()
+        story = [Paragraph(escape(self.title), styles["Title"])]
+
+        if self.period:
+            story.append(Paragraph(f"Período: {escape(self.period)}", styles["Normal"]))
+        story.append(
+            Paragraph(f"Gerado em: {self.generated_at.strftime('%d/%m/%Y %H:%M')}", styles["Normal"])
+        )
+        story.append(Spacer(1, 0.8 * cm))
+
+        if self.summary:
+            story.append(Paragraph("RESUMO", styles["Heading3"]))
+            for key, value in self.summary:
+                story.append(Paragraph(f"{escape(key)}: {escape(value)}", styles["Normal"]))
+            story.append(Spacer(1, 0.5 * cm))
+
+        if table_data:
+            num_cols = len(table_data[0])
+            table = LongTable(
+                [[str(cell) for cell in row] for row in table_data],
+                colWidths=[doc.width / num_cols] * num_cols,
+                repeatRows=1,
+            )
+            table.setStyle(
+                TableStyle([
+                    ("FONT", (0, 0), (-1, 0), "Helvetica-Bold", 10),
+                    ("FONT", (0, 1), (-1, -1), "Helvetica", 9),
+                    ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),
+                    ("GRID", (0, 0), (-1, -1), 0.5, colors.grey),
+                    ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+                ])
+            )
+            story.append(table)
+
+        return story
+
+    def _draw_page(self, pdf: canvas.Canvas, doc: SimpleDocTemplate) -> None:
+        """Draw the header and footer of every page."""
+        width, height = A4
+
+        pdf.saveState()
+
+        pdf.setFont("Helvetica-Bold", 16)
+        pdf.drawString(2 * cm, height - 1.5 * cm, "CONTABILCONSULT")
+        pdf.setFont("Helvetica", 10)
+        pdf.drawString(2 * cm, height - 1.8 * cm, "Sistema de Gestão Contábil")
+        pdf.line(2 * cm, height - 2.2 * cm, width - 2 * cm, height - 2.2 * cm)
+
+        pdf.setFont("Helvetica", 8)
+        pdf.drawCentredString(
+            width / 2,
+            1 * cm,
+            f"Gerado por ContabilConsult em {self.generated_at.strftime('%d/%m/%Y %H:%M')}",
+        )
+        pdf.drawRightString(width - 2 * cm, 1 * cm, f"Página {doc.page}")
+
+        pdf.restoreState()
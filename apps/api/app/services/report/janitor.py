@@ -0,0 +1,157 @@
+"""
+Report file janitor.
+
+Deletes expired report history in set-based batches, then keeps the
+remaining files under a storage quota by evicting the least recently used
+ones. Database rows are deleted and committed first; files no record
+references anymore are then unlinked in batches on a worker thread, so slow
+storage (NFS) never blocks the event loop.
+"""
+
+import asyncio
+import logging
+import os
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import settings
+from app.db.repositories.report import ReportRepository
+
+logger = logging.getLogger(__name__)
+
+
+def remove_report_files(file_paths: Iterable[str]) -> tuple[int, int]:
+    """
+    Unlink report files and prune their emptied date directories.
+
+    Args:
+        file_paths: Files to remove (missing files are skipped)
+
+    Returns:
+        Tuple of (files removed, bytes freed)
+    """
+    removed = 0
+    freed = 0
+    directories = set()
+
+    for file_path in file_paths:
+        path = Path(file_path)
+        try:
+            size = path.stat().st_size
+            path.unlink()
+        except FileNotFoundError:
+            continue
+        except OSError as e:
+            logger.warning(f"Failed to remove report file {path}: {e}")
+            continue
+
+        removed += 1
+        freed += size
+        directories.add(path.parent)
+
+    for directory in directories:
+        try:
+            # Only succeeds once the date directory is empty
+            os.rmdir(directory)
+        except OSError:
+            pass
+
+    return removed, freed
+
+
+@dataclass
+class JanitorSummary:
+    """Outcome of a janitor run."""
+
+    expired_records: int = 0
+    evicted_files: int = 0
+    files_removed: int = 0
+    bytes_freed: int = 0
+
+
+class ReportFileJanitor:
+    """Removes expired and over-quota report files and their history."""
+
+    def __init__(
+        self,
+        quota_bytes: int,
+        batch_size: int,
+        session_factory: Optional[async_sessionmaker[AsyncSession]] = None,
+    ):
+        self.quota_bytes = quota_bytes
+        self.batch_size = batch_size
+        self._session_factory = session_factory
+
+    @property
+    def session_factory(self) -> async_sessionmaker[AsyncSession]:
+        """Session factory used by the janitor."""
+        if self._session_factory is None:
+            from app.core.database import db_manager
+
+            self._session_factory = db_manager.session_factory
+        return self._session_factory
+
+    async def run(self) -> JanitorSummary:
+        """
+        Run one cleanup pass.
+
+        Returns:
+            JanitorSummary
+        """
+        summary = JanitorSummary()
+
+        # Expired history, one DELETE ... RETURNING per batch
+        while True:
+            async with self.session_factory() as session:
+                repo = ReportRepository(session)
+                file_paths = await repo.delete_expired(datetime.utcnow(), self.batch_size)
+                # Reused and scheduled exports share files between records
+                unreferenced = set(file_paths) - await repo.get_referenced_paths(list(set(file_paths)))
+                await session.commit()
+
+            summary.expired_records += len(file_paths)
+            await self._remove(unreferenced, summary)
+            if len(file_paths) < self.batch_size:
+                break
+
+        # Storage quota, least recently generated or downloaded first
+        if self.quota_bytes > 0:
+            while True:
+                async with self.session_factory() as session:
+                    repo = ReportRepository(session)
+                    over_quota = await repo.get_files_over_quota(self.quota_bytes, self.batch_size)
+                    evicted = await repo.delete_by_file_paths(over_quota)
+                    await session.commit()
+
+                summary.evicted_files += len(evicted)
+                await self._remove(evicted, summary)
+                if len(over_quota) < self.batch_size:
+                    break
+
+        if summary.expired_records or summary.evicted_files:
+            logger.info(
+                f"Report janitor: {summary.expired_records} expired records, "
+                f"{summary.evicted_files} files evicted over quota, "
+                f"{summary.files_removed} files removed ({summary.bytes_freed} bytes)"
+            )
+        return summary
+
+    async def _remove(self, file_paths: Iterable[str], summary: JanitorSummary) -> None:
+        file_paths = list(file_paths)
+        if not file_paths:
+            return
+
+        removed, freed = await asyncio.to_thread(remove_report_files, file_paths)
+        summary.files_removed += removed
+        summary.bytes_freed += freed
+
+
+# Global report file janitor, run by the application lifespan
+report_file_janitor = ReportFileJanitor(
+    quota_bytes=settings.REPORT_STORAGE_QUOTA_BYTES,
+    batch_size=settings.REPORT_JANITOR_BATCH_SIZE,
+)
@@ -1,12 +1,12 @@
 """KPI Report Service - Financial Indicators."""
 
+from datetime import date
 from decimal import Decimal
 
-from sqlalchemy import and_, func, select
+from sqlalchemy import and_, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.models.client import Client
-from app.db.models.finance import FinancialTransaction, PaymentStatus, TransactionType
+from app.db.models.finance import FinanceMonthlyRollup, PaymentStatus, TransactionType
 from app.services.report.base import BaseReportService
 
 
@@ -29,97 +29,75 @@ class KPIReportService(BaseReportService):
         period_end = filters["period_end"].replace(day=1)
         client_ids = filters.get("client_ids")
 
-        # Build base conditions
-        conditions = [
-            FinancialTransaction.deleted_at.is_(None),
-        ]
-
-        if client_ids:
-            conditions.append(FinancialTransaction.client_id.in_(client_ids))
+        # Previous month (MoM) and same period last year (YoY)
+        if period_start.month == 1:
+            prev_month = date(period_start.year - 1, 12, 1)
+        else:
+            prev_month = date(period_start.year, period_start.month - 1, 1)
 
-        # Get current period totals
-        current_conditions = [
-            *conditions,
-            FinancialTransaction.reference_month >= period_start,
-            FinancialTransaction.reference_month <= period_end,
-        ]
+        prev_year_month = date(period_start.year - 1, period_start.month, 1)
+        prev_year_end = date(prev_year_month.year, period_end.month, 1)
 
-        # Total revenue (received)
-        revenue_stmt = (
-            select(func.sum(FinancialTransaction.amount))
-            .where(
-                and_(
-                    *current_conditions,
-                    FinancialTransaction.transaction_type == TransactionType.RECEITA,
-                    FinancialTransaction.payment_status == PaymentStatus.PAGO,
-                )
-            )
+        rollup = FinanceMonthlyRollup
+        amount = rollup.total_amount
+        in_period = and_(
+            rollup.reference_month >= period_start,
+            rollup.reference_month <= period_end,
         )
-        receita_total = await self.db.scalar(revenue_stmt) or Decimal("0.00")
-
-        # Total expenses (paid)
-        expense_stmt = (
-            select(func.sum(FinancialTransaction.amount))
-            .where(
-                and_(
-                    *current_conditions,
-                    FinancialTransaction.transaction_type == TransactionType.DESPESA,
-                    FinancialTransaction.payment_status == PaymentStatus.PAGO,
-                )
-            )
+        in_prev_year = and_(
+            rollup.reference_month >= prev_year_month,
+            rollup.reference_month <= prev_year_end,
         )
-        despesa_total = await self.db.scalar(expense_stmt) or Decimal("0.00")
-
-        # Total pending
-        pending_stmt = (
-            select(func.sum(FinancialTransaction.amount))
-            .where(
-                and_(
-                    *current_conditions,
-                    FinancialTransaction.payment_status == PaymentStatus.PENDENTE,
-                )
-            )
+        is_receita_paga = and_(
+            rollup.transaction_type == TransactionType.RECEITA,
+            rollup.payment_status == PaymentStatus.PAGO,
         )
-        total_pendente = await self.db.scalar(pending_stmt) or Decimal("0.00")
-
-        # Total overdue
-        overdue_stmt = (
-            select(func.sum(FinancialTransaction.amount))
-            .where(
-                and_(
-                    *current_conditions,
-                    FinancialTransaction.payment_status == PaymentStatus.ATRASADO,
-                )
-            )
+        is_despesa_paga = and_(
+            rollup.transaction_type == TransactionType.DESPESA,
+            rollup.payment_status == PaymentStatus.PAGO,
         )
-        total_atrasado = await self.db.scalar(overdue_stmt) or Decimal("0.00")
+        is_atrasado = rollup.payment_status == PaymentStatus.ATRASADO
 
-        # Count total transactions
-        total_count_stmt = (
-            select(func.count())
-            .where(and_(*current_conditions))
-        )
-        total_count = await self.db.scalar(total_count_stmt) or 0
-
-        # Count overdue transactions
-        overdue_count_stmt = (
-            select(func.count())
-            .where(
-                and_(
-                    *current_conditions,
-                    FinancialTransaction.payment_status == PaymentStatus.ATRASADO,
-                )
+        conditions = [
+            or_(in_period, rollup.reference_month == prev_month, in_prev_year),
+        ]
+
+        if client_ids:
+            conditions.append(rollup.client_id.in_(client_ids))
+
+        # All totals and counts in one pass over the monthly rollup
+        stmt = (
+            select(
+                func.coalesce(func.sum(amount).filter(in_period, is_receita_paga), 0)
+                .label("receita_total"),
+                func.coalesce(func.sum(amount).filter(in_period, is_despesa_paga), 0)
+                .label("despesa_total"),
+                func.coalesce(
+                    func.sum(rollup.transaction_count).filter(in_period), 0
+                ).label("total_count"),
+                func.coalesce(
+                    func.sum(rollup.transaction_count).filter(in_period, is_atrasado), 0
+                ).label("overdue_count"),
+                func.count(func.distinct(rollup.client_id))
+                .filter(in_period, rollup.transaction_count > 0)
+                .label("active_clients"),
+                func.coalesce(
+                    func.sum(amount).filter(rollup.reference_month == prev_month, is_receita_paga), 0
+                ).label("prev_receita"),
+                func.coalesce(func.sum(amount).filter(in_prev_year, is_receita_paga), 0)
+                .label("prev_year_receita"),
             )
+            .where(and_(*conditions))
         )
-        overdue_count = await self.db.scalar(overdue_count_stmt) or 0
+        totals = (await self.db.execute(stmt)).one()
 
-        # Get count of active clients who have transactions
-        clients_stmt = (
-            select(func.count(func.distinct(Client.id)))
-            .join(FinancialTransaction, Client.id == FinancialTransaction.client_id)
-            .where(and_(*current_conditions))
-        )
-        active_clients = await self.db.scalar(clients_stmt) or 0
+        receita_total = Decimal(totals.receita_total)
+        despesa_total = Decimal(totals.despesa_total)
+        total_count = totals.total_count
+        overdue_count = totals.overdue_count
+        active_clients = totals.active_clients
+        prev_receita = Decimal(totals.prev_receita)
+        prev_year_receita = Decimal(totals.prev_year_receita)
 
         # Calculate KPIs
         margem_lucro = (
@@ -140,49 +118,12 @@ class KPIReportService(BaseReportService):
             float(receita_total / active_clients) if active_clients > 0 else 0.0
         )
 
-        # Month-over-month growth
-        # Previous month revenue for MoM
-        if period_start.month == 1:
-            prev_month = date(period_start.year - 1, 12, 1)
-        else:
-            prev_month = date(period_start.year, period_start.month - 1, 1)
-
-        prev_revenue_stmt = (
-            select(func.sum(FinancialTransaction.amount))
-            .where(
-                and_(
-                    *conditions,
-                    FinancialTransaction.reference_month == prev_month,
-                    FinancialTransaction.transaction_type == TransactionType.RECEITA,
-                    FinancialTransaction.payment_status == PaymentStatus.PAGO,
-                )
-            )
-        )
-        prev_receita = await self.db.scalar(prev_revenue_stmt) or Decimal("0.00")
-
         crescimento_mom = (
             float((receita_total - prev_receita) / prev_receita * 100)
             if prev_receita > 0
             else 0.0
         )
 
-        # Year-over-year growth
-        prev_year_month = date(period_start.year - 1, period_start.month, 1)
-
-        prev_year_revenue_stmt = (
-            select(func.sum(FinancialTransaction.amount))
-            .where(
-                and_(
-                    *conditions,
-                    FinancialTransaction.reference_month >= prev_year_month,
-                    FinancialTransaction.reference_month <= date(prev_year_month.year, period_end.month, 1),
-                    FinancialTransaction.transaction_type == TransactionType.RECEITA,
-                    FinancialTransaction.payment_status == PaymentStatus.PAGO,
-                )
-            )
-        )
-        prev_year_receita = await self.db.scalar(prev_year_revenue_stmt) or Decimal("0.00")
-
         crescimento_yoy = (
             float((receita_total - prev_year_receita) / prev_year_receita * 100)
             if prev_year_receita > 0
@@ -6,7 +6,7 @@ from sqlalchemy import and_, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models.client import Client
-from app.db.models.finance import FinancialTransaction, PaymentStatus, TransactionType
+from app.db.models.finance import FinanceMonthlyRollup, PaymentStatus, TransactionType
 from app.services.report.base import BaseReportService
 
 
@@ -31,28 +31,28 @@ class RevenueByClientReportService(BaseReportService):
 
         # Build conditions
         conditions = [
-            FinancialTransaction.transaction_type == TransactionType.RECEITA,
-            FinancialTransaction.payment_status == PaymentStatus.PAGO,
-            FinancialTransaction.deleted_at.is_(None),
-            FinancialTransaction.reference_month >= period_start,
-            FinancialTransaction.reference_month <= period_end,
+            FinanceMonthlyRollup.transaction_type == TransactionType.RECEITA,
+            FinanceMonthlyRollup.payment_status == PaymentStatus.PAGO,
+            FinanceMonthlyRollup.reference_month >= period_start,
+            FinanceMonthlyRollup.reference_month <= period_end,
         ]
 
         if client_ids:
-            conditions.append(FinancialTransaction.client_id.in_(client_ids))
+            conditions.append(FinanceMonthlyRollup.client_id.in_(client_ids))
 
-        # Get revenue grouped by client
+        # Get revenue grouped by client from the monthly rollup
         stmt = (
             select(
                 Client.id,
                 Client.razao_social,
                 Client.cnpj,
-                func.sum(FinancialTransaction.amount).label("total_receita"),
+                func.sum(FinanceMonthlyRollup.total_amount).label("total_receita"),
             )
-            .join(Client, FinancialTransaction.client_id == Client.id)
+            .join(Client, FinanceMonthlyRollup.client_id == Client.id)
             .where(and_(*conditions))
             .group_by(Client.id, Client.razao_social, Client.cnpj)
-            .order_by(func.sum(FinancialTransaction.amount).desc())
+            .having(func.sum(FinanceMonthlyRollup.transaction_count) > 0)
+            .order_by(func.sum(FinanceMonthlyRollup.total_amount).desc())
         )
 
         result = await self.db.execute(stmt)
@@ -0,0 +1,412 @@
+"""
+Scheduled report execution.
+
+Due schedules are claimed in batches, grouped by the report they produce
+and handed to the report export queue: schedules that ask for the same
+report type, filters, period and format share a single render, whose file
+is delivered to every recipient. A report already rendered within the
+cache TTL, or still being rendered for an earlier batch or another worker,
+is delivered from that render instead. Distinct reports get a stable offset
+within REPORT_SCHEDULE_SPREAD_MINUTES so schedules with the same cadence
+don't all fire at once, while schedules for the same report keep firing
+together and stay deduplicated.
+"""
+
+import calendar
+import hashlib
+import json
+import logging
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Optional
+from uuid import UUID
+from zoneinfo import ZoneInfo
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import settings
+from app.db.models.report import (
+    ReportFormat,
+    ReportHistory,
+    ReportSchedule,
+    ReportStatus,
+    ReportTemplate,
+    ReportType,
+    SchedulePeriod,
+)
+from app.db.models.user import UserRole
+from app.db.repositories.report import ReportRepository, ReportScheduleRepository
+from app.db.repositories.user import UserRepository
+from app.schemas.report import ReportFilterRequest
+from app.services.report.cache import normalize_filters, report_cache_key
+from app.services.report.cron import CronExpression
+from app.services.report.export_jobs import ReportExportJob, ReportJobQueue, report_job_queue
+
+logger = logging.getLogger(__name__)
+
+# Filters set by the schedule itself rather than by its template
+_SCHEDULE_FILTER_KEYS = ("period_start", "period_end", "report_type")
+
+
+def resolve_period(period: SchedulePeriod, today: date) -> tuple[date, date]:
+    """
+    Reporting window of a schedule period.
+
+    Args:
+        period: Schedule period
+        today: Run date
+
+    Returns:
+        Tuple of (period_start, period_end)
+    """
+    if period == SchedulePeriod.CURRENT_MONTH:
+        start = today.replace(day=1)
+    elif period == SchedulePeriod.PREVIOUS_MONTH:
+        start = (today.replace(day=1) - timedelta(days=1)).replace(day=1)
+    elif period == SchedulePeriod.LAST_30_DAYS:
+        return today - timedelta(days=29), today
+    elif period == SchedulePeriod.CURRENT_YEAR:
+        return date(today.year, 1, 1), date(today.year, 12, 31)
+    else:  # PREVIOUS_YEAR
+        return date(today.year - 1, 1, 1), date(today.year - 1, 12, 31)
+
+    last_day = calendar.monthrange(start.year, start.month)[1]
+    return start, start.replace(day=last_day)
+
+
+def spread_offset(
+    template: ReportTemplate,
+    period: SchedulePeriod,
+    spread_minutes: int = settings.REPORT_SCHEDULE_SPREAD_MINUTES,
+) -> timedelta:
+    """
+    Stable delay of a schedule within the spread window.
+
+    Derived from the report the schedule produces, so schedules for the
+    same report share it and keep being deduplicated.
+
+    Args:
+        template: Schedule template
+        period: Schedule period
+        spread_minutes: Width of the spread window
+
+    Returns:
+        Offset added to the cron fire times
+    """
+    if spread_minutes <= 1:
+        return timedelta(0)
+
+    filters = {
+        key: value
+        for key, value in (template.default_filters or {}).items()
+        if key not in _SCHEDULE_FILTER_KEYS
+    }
+    payload = json.dumps(
+        [ReportType(template.report_type).value, normalize_filters(filters), period.value],
+        sort_keys=True,
+    )
+    digest = hashlib.sha256(payload.encode("utf-8")).digest()
+    return timedelta(minutes=int.from_bytes(digest[:4], "big") % spread_minutes)
+
+
+def compute_next_run(
+    cron: CronExpression,
+    offset: timedelta,
+    after: datetime,
+    tz: ZoneInfo,
+) -> datetime:
+    """
+    Next run of a schedule strictly after a moment.
+
+    Args:
+        cron: Schedule cadence, in the schedule timezone
+        offset: Spread offset of the schedule
+        after: Aware reference datetime
+        tz: Schedule timezone
+
+    Returns:
+        Aware UTC datetime
+    """
+    local = (after - offset).astimezone(tz).replace(tzinfo=None)
+    fire_at = cron.next_after(local).replace(tzinfo=tz)
+    return (fire_at + offset).astimezone(timezone.utc)
+
+
+def build_schedule_filters(template: ReportTemplate, period: SchedulePeriod, today: date) -> dict[str, Any]:
+    """
+    Report filters of a scheduled run.
+
+    Args:
+        template: Schedule template
+        period: Schedule period
+        today: Run date
+
+    Returns:
+        Filters as routes pass them to the report services
+
+    Raises:
+        ValueError: If the template's default filters are invalid
+    """
+    period_start, period_end = resolve_period(period, today)
+    filters = ReportFilterRequest.model_validate(
+        {
+            **(template.default_filters or {}),
+            "period_start": period_start,
+            "period_end": period_end,
+            "report_type": template.report_type,
+        }
+    )
+    return filters.model_dump()
+
+
+@dataclass
+class ScheduledRun:
+    """One distinct report due for a group of schedules."""
+
+    template_id: UUID
+    report_type: ReportType
+    format: ReportFormat
+    filters: dict[str, Any]
+    cache_key: str
+    recipients: list[UUID]
+
+
+class ReportScheduleService:
+    """Validation and bookkeeping of report schedules."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.repository = ReportScheduleRepository(db)
+        self.tz = ZoneInfo(settings.REPORT_SCHEDULE_TIMEZONE)
+
+    async def validate_recipients(self, recipients: list[UUID]) -> list[str]:
+        """
+        Check recipients are active staff users.
+
+        Client users only see their own data, so they can't receive reports
+        built with a template's filters.
+
+        Args:
+            recipients: User IDs
+
+        Returns:
+            Recipient IDs as stored on the schedule
+
+        Raises:
+            ValueError: If a recipient is unknown, inactive or a client user
+        """
+        unique = list(dict.fromkeys(recipients))
+        users = {user.id: user for user in await UserRepository(self.db).get_by_ids(unique)}
+
+        for user_id in unique:
+            user = users.get(user_id)
+            if user is None or not user.is_active:
+                raise ValueError(f"Recipient {user_id} not found or inactive")
+            if user.role == UserRole.CLIENTE:
+                raise ValueError(f"Recipient {user_id} is a client user")
+
+        return [str(user_id) for user_id in unique]
+
+    def schedule_next_run(self, schedule: ReportSchedule, template: ReportTemplate, after: datetime) -> None:
+        """
+        Set a schedule's next run.
+
+        Args:
+            schedule: Schedule to update
+            template: Its template
+            after: Aware reference datetime
+
+        Raises:
+            ValueError: If the cron expression is invalid or never fires
+        """
+        schedule.next_run_at = compute_next_run(
+            CronExpression.parse(schedule.cron),
+            spread_offset(template, schedule.period),
+            after,
+            self.tz,
+        )
+
+
+class ReportScheduler:
+    """Runs due report schedules through the report export queue."""
+
+    def __init__(
+        self,
+        queue: ReportJobQueue,
+        batch_size: int,
+        session_factory: Optional[async_sessionmaker[AsyncSession]] = None,
+    ):
+        self.queue = queue
+        self.batch_size = batch_size
+        self._session_factory = session_factory
+
+    @property
+    def session_factory(self) -> async_sessionmaker[AsyncSession]:
+        """Session factory used to claim schedules."""
+        if self._session_factory is None:
+            from app.core.database import db_manager
+
+            self._session_factory = db_manager.session_factory
+        return self._session_factory
+
+    async def run_due(self, now: Optional[datetime] = None) -> int:
+        """
+        Claim and queue every schedule due at a moment.
+
+        Args:
+            now: Aware current datetime (defaults to now)
+
+        Returns:
+            Number of schedules processed
+        """
+        now = now or datetime.now(timezone.utc)
+        processed = 0
+
+        while True:
+            async with self.session_factory() as session:
+                claimed, jobs = await self._claim_batch(session, now)
+            processed += claimed
+
+            # Waits for room in the export queue instead of dropping runs
+            for job in jobs:
+                await self.queue.enqueue(job)
+
+            if claimed < self.batch_size:
+                return processed
+
+    async def _claim_batch(self, session: AsyncSession, now: datetime) -> tuple[int, list[ReportExportJob]]:
+        service = ReportScheduleService(session)
+        schedules = await service.repository.claim_due(now, self.batch_size)
+        today = now.astimezone(service.tz).date()
+        runs: dict[tuple[str, ReportFormat], ScheduledRun] = {}
+
+        for schedule in schedules:
+            template = schedule.template
+            try:
+                service.schedule_next_run(schedule, template, now)
+                filters = build_schedule_filters(template, schedule.period, today)
+            except ValueError as e:
+                logger.error(f"Disabling report schedule {schedule.id}: {e}")
+                schedule.is_active = False
+                continue
+
+            schedule.last_run_at = now
+            cache_key = await report_cache_key(session, template.report_type, filters)
+            run = runs.get((cache_key, schedule.format))
+            if run is None:
+                run = ScheduledRun(
+                    template_id=template.id,
+                    report_type=ReportType(template.report_type),
+                    format=schedule.format,
+                    filters=filters,
+                    cache_key=cache_key,
+                    recipients=[],
+                )
+                runs[(cache_key, schedule.format)] = run
+
+            for recipient in schedule.recipients or [str(schedule.created_by_id)]:
+                user_id = UUID(str(recipient))
+                if user_id not in run.recipients:
+                    run.recipients.append(user_id)
+
+        jobs, delivered = [], []
+        # Export group locks are taken in key order, so workers can't deadlock
+        for run in sorted(runs.values(), key=lambda run: (run.cache_key, run.format.value)):
+            job = await self._dispatch(session, run, delivered)
+            if job is not None:
+                jobs.append(job)
+        # Releases the schedule and export group locks with the new history rows
+        await session.commit()
+
+        for history in delivered:
+            try:
+                await self.queue.notify(history)
+            except Exception as e:
+                logger.error(f"Failed to notify scheduled report {history.id}: {e}")
+
+        if schedules:
+            logger.info(
+                f"Queued {len(jobs)} scheduled reports for {len(schedules)} schedules, "
+                f"{len(runs) - len(jobs)} served by earlier renders"
+            )
+        return len(schedules), jobs
+
+    async def _dispatch(
+        self, session: AsyncSession, run: ScheduledRun, delivered: list[ReportHistory]
+    ) -> Optional[ReportExportJob]:
+        """Record a run's history rows; returns the job to queue, if one is needed."""
+        repo = ReportRepository(session)
+        filters_used = ReportFilterRequest.model_validate(run.filters).model_dump(mode="json")
+
+        # Held until commit: a render finishing meanwhile still sees new rows
+        await repo.lock_export_group(run.cache_key, run.format)
+
+        rendered = await repo.get_rendered_export(
+            run.cache_key,
+            run.format,
+            rendered_after=datetime.utcnow() - timedelta(seconds=settings.REPORT_CACHE_TTL_SECONDS),
+        )
+        if rendered and Path(rendered.file_path).is_file():
+            for user_id in run.recipients:
+                delivered.append(
+                    await repo.save_template_history(
+                        user_id=user_id,
+                        report_type=run.report_type,
+                        filters_used=filters_used,
+                        format=run.format,
+                        file_path=rendered.file_path,
+                        file_size=rendered.file_size,
+                        template_id=run.template_id,
+                        expires_at=rendered.expires_at,
+                        cache_key=run.cache_key,
+                    )
+                )
+            return None
+
+        # Rows left pending are finished by the render already queued for them;
+        # like the export queue, treat renders older than twice the timeout as dead
+        rendering = bool(
+            await repo.get_pending_exports(
+                run.cache_key,
+                run.format,
+                requested_after=datetime.utcnow()
+                - timedelta(seconds=2 * settings.REPORT_JOB_TIMEOUT_SECONDS),
+            )
+        )
+        histories = [
+            await repo.save_template_history(
+                user_id=user_id,
+                report_type=run.report_type,
+                filters_used=filters_used,
+                format=run.format,
+                template_id=run.template_id,
+                status=ReportStatus.PENDING,
+                cache_key=run.cache_key,
+            )
+            for user_id in run.recipients
+        ]
+        if rendering:
+            return None
+
+        return ReportExportJob(
+            report_id=histories[0].id,
+            user_id=histories[0].user_id,
+            report_type=run.report_type,
+            format=run.format,
+            filters=run.filters,
+            # Runs with other filters for the same type and period must not share a file
+            filename=(
+                f"report_{run.report_type.value}_{run.filters['period_start']}_"
+                f"{run.filters['period_end']}_{run.cache_key[:12]}"
+            ),
+            cache_key=run.cache_key,
+            shared_report_ids=tuple(history.id for history in histories[1:]),
+        )
+
+
+# Global report scheduler, run by the application lifespan
+report_scheduler = ReportScheduler(
+    queue=report_job_queue,
+    batch_size=settings.REPORT_SCHEDULE_BATCH_SIZE,
+)
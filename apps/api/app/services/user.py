@@ -10,6 +10,7 @@ from uuid import UUID
 from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.passwords import password_hasher
 from app.db.models.client_user import ClientUser, ClientAccessLevel
 from app.db.models.user import User, UserRole
 from app.db.repositories.user import UserRepository
@@ -21,6 +22,7 @@ from app.schemas.user import (
     UserResponse,
     UserUpdate,
 )
+from app.services.principal_cache import principal_cache
 
 
 class UserService:
@@ -78,7 +80,7 @@ class UserService:
             is_active=True,
             is_verified=False
         )
-        user.set_password(user_data.password)
+        user.password_hash = await password_hasher.hash(user_data.password)
 
         self.session.add(user)
         await self.session.commit()
@@ -150,6 +152,7 @@ class UserService:
             setattr(user, field, value)
 
         await self.session.commit()
+        principal_cache.invalidate(user_id)
         await self.session.refresh(user)
 
         return UserResponse.model_validate(user)
@@ -174,6 +177,7 @@ class UserService:
 
         await self.repo.deactivate(user)
         await self.session.commit()
+        principal_cache.invalidate(user_id)
 
     async def activate_user(self, user_id: UUID) -> None:
         """
@@ -195,6 +199,7 @@ class UserService:
 
         await self.repo.activate(user)
         await self.session.commit()
+        principal_cache.invalidate(user_id)
 
     async def list_users(
         self,
@@ -280,10 +285,10 @@ class UserService:
         if reset_data.generate_temporary:
             # Generate temporary password
             temporary_password = self._generate_temporary_password()
-            user.set_password(temporary_password)
+            user.password_hash = await password_hasher.hash(temporary_password)
         elif reset_data.new_password:
             # Use provided password
-            user.set_password(reset_data.new_password)
+            user.password_hash = await password_hasher.hash(reset_data.new_password)
         else:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -291,6 +296,7 @@ class UserService:
             )
 
         await self.session.commit()
+        principal_cache.invalidate(user_id)
 
         return UserResetPasswordResponse(
             success=True,
@@ -2,11 +2,15 @@
 WebSocket module for real-time communication.
 """
 
+from app.websockets.backplane import Backplane, InMemoryBackplane, PostgresBackplane
 from app.websockets.events import WebSocketEventBuilder, build_event
 from app.websockets.handlers import WebSocketHandler, ws_handler
 from app.websockets.manager import ConnectionManager, manager
 
 __all__ = [
+    "Backplane",
+    "InMemoryBackplane",
+    "PostgresBackplane",
     "ConnectionManager",
     "manager",
     "WebSocketHandler",
@@ -0,0 +1,171 @@
+"""
+WebSocket backplane.
+
+Each worker process only holds its own WebSocket connections. An event is
+delivered to the sender's local connections at once and published once on
+the backplane; every other worker receives it and delivers it to its own
+connections. PostgresBackplane uses LISTEN/NOTIFY on a dedicated asyncpg
+connection; InMemoryBackplane connects managers within one process (single
+worker, tests).
+"""
+
+import asyncio
+import json
+import logging
+from abc import ABC, abstractmethod
+from typing import Any, Awaitable, Callable, Optional
+from uuid import uuid4
+
+import asyncpg
+
+logger = logging.getLogger(__name__)
+
+# Receives (target, message) of events published by other workers
+DeliverCallback = Callable[[dict[str, Any], dict[str, Any]], Awaitable[Any]]
+
+# NOTIFY payloads must be shorter than 8000 bytes
+MAX_NOTIFY_PAYLOAD_BYTES = 7999
+
+
+class Backplane(ABC):
+    """Fans WebSocket events out to the other worker processes."""
+
+    def __init__(self):
+        # Tells this worker's own events apart when they come back
+        self.origin = uuid4().hex
+        self._deliver: Optional[DeliverCallback] = None
+
+    async def start(self, deliver: DeliverCallback) -> None:
+        """
+        Start receiving events from other workers.
+
+        Args:
+            deliver: Called with the target and message of each received event
+        """
+        self._deliver = deliver
+
+    async def stop(self) -> None:
+        """Stop receiving events."""
+        self._deliver = None
+
+    @abstractmethod
+    async def publish(self, target: dict[str, Any], message: dict[str, Any]) -> None:
+        """
+        Publish an event to the other workers.
+
+        Args:
+            target: Who receives it (see ConnectionManager.deliver)
+            message: WebSocket message
+        """
+
+
+class InMemoryBackplane(Backplane):
+    """Backplane between managers of the same process."""
+
+    def __init__(self, peers: Optional[list["InMemoryBackplane"]] = None):
+        super().__init__()
+        # Backplanes sharing a peers list see each other's events
+        self.peers = peers if peers is not None else []
+        self.peers.append(self)
+
+    async def publish(self, target: dict[str, Any], message: dict[str, Any]) -> None:
+        for peer in list(self.peers):
+            if peer is not self and peer._deliver is not None:
+                await peer._deliver(target, message)
+
+
+class PostgresBackplane(Backplane):
+    """
+    Backplane over Postgres LISTEN/NOTIFY.
+
+    Listens on a dedicated connection, reconnecting after failures; events
+    published while a worker is disconnected are not replayed to it.
+    Publishing uses a second connection so it never waits on the listener.
+    """
+
+    def __init__(self, dsn: str, channel: str, reconnect_seconds: float = 5.0):
+        super().__init__()
+        self.dsn = dsn
+        self.channel = channel
+        self.reconnect_seconds = reconnect_seconds
+        self._listen_task: Optional[asyncio.Task] = None
+        self._publish_conn: Optional[asyncpg.Connection] = None
+        self._publish_lock = asyncio.Lock()
+        self._deliveries: set[asyncio.Task] = set()
+
+    async def start(self, deliver: DeliverCallback) -> None:
+        await super().start(deliver)
+        if self._listen_task is None:
+            self._listen_task = asyncio.create_task(self._listen(), name="websocket-backplane")
+
+    async def stop(self) -> None:
+        if self._listen_task is not None:
+            self._listen_task.cancel()
+            try:
+                await self._listen_task
+            except asyncio.CancelledError:
+                pass
+            self._listen_task = None
+
+        async with self._publish_lock:
+            if self._publish_conn is not None:
+                await self._publish_conn.close()
+                self._publish_conn = None
+        await super().stop()
+
+    async def publish(self, target: dict[str, Any], message: dict[str, Any]) -> None:
+        payload = json.dumps(
+            {"origin": self.origin, "target": target, "message": message}, default=str
+        )
+        if len(payload.encode("utf-8")) > MAX_NOTIFY_PAYLOAD_BYTES:
+            logger.warning(
+                f"WebSocket event {message.get('type')} too large for NOTIFY, "
+                "delivered to this worker only"
+            )
+            return
+
+        async with self._publish_lock:
+            try:
+                if self._publish_conn is None or self._publish_conn.is_closed():
+                    self._publish_conn = await asyncpg.connect(self.dsn)
+                await self._publish_conn.execute("SELECT pg_notify($1, $2)", self.channel, payload)
+            except Exception as e:
+                logger.error(f"Failed to publish WebSocket event {message.get('type')}: {e}")
+                self._publish_conn = None
+
+    async def _listen(self) -> None:
+        while True:
+            connection: Optional[asyncpg.Connection] = None
+            try:
+                connection = await asyncpg.connect(self.dsn)
+                closed = asyncio.Event()
+                connection.add_termination_listener(lambda _connection: closed.set())
+                await connection.add_listener(self.channel, self._on_notify)
+                logger.info(f"WebSocket backplane listening on '{self.channel}'")
+
+                await closed.wait()
+                logger.warning("WebSocket backplane connection lost, reconnecting")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"WebSocket backplane connection failed: {e}")
+            finally:
+                if connection is not None and not connection.is_closed():
+                    await connection.close()
+
+            await asyncio.sleep(self.reconnect_seconds)
+
+    def _on_notify(self, connection: asyncpg.Connection, pid: int, channel: str, payload: str) -> None:
+        try:
+            event = json.loads(payload)
+        except ValueError:
+            logger.warning("Ignoring malformed WebSocket backplane payload")
+            return
+
+        if event.get("origin") == self.origin or self._deliver is None:
+            return
+
+        task = asyncio.create_task(self._deliver(event["target"], event["message"]))
+        # Keep a reference until the delivery finishes
+        self._deliveries.add(task)
+        task.add_done_callback(self._deliveries.discard)
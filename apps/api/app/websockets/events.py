@@ -176,6 +176,42 @@ class WebSocketEventBuilder:
             "timestamp": datetime.utcnow().isoformat()
         }
 
+    @staticmethod
+    def report_status_event(
+        report_id: UUID,
+        report_type: str,
+        format: str,
+        status: str,
+        file_url: Optional[str] = None,
+        file_size: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Build a report export status event.
+
+        Args:
+            report_id: Report history ID
+            report_type: Report type
+            format: Export format
+            status: Export status (completed, failed)
+            file_url: Download URL when completed
+            file_size: File size in bytes when completed
+
+        Returns:
+            Dict representing the event
+        """
+        return {
+            "type": "report_status",
+            "data": {
+                "report_id": str(report_id),
+                "report_type": report_type,
+                "format": format,
+                "status": status,
+                "file_url": file_url,
+                "file_size": file_size,
+            },
+            "timestamp": datetime.utcnow().isoformat()
+        }
+
     @staticmethod
     def ping_event() -> Dict[str, str]:
         """
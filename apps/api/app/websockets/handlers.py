@@ -8,6 +8,7 @@ from uuid import UUID
 
 from app.db.models.notification import Notification
 from app.db.models.obligation import Obligation
+from app.db.models.report import ReportHistory, ReportStatus
 from app.schemas.notification import NotificationResponse
 from app.websockets.events import WebSocketEventBuilder
 from app.websockets.manager import manager
@@ -28,7 +29,7 @@ class WebSocketHandler:
             notification: Notification model instance
 
         Returns:
-            bool: True if sent successfully
+            bool: True if delivered on this worker
         """
         try:
             # Convert to response schema
@@ -39,12 +40,12 @@ class WebSocketHandler:
 
             # Send to user
             user_id = str(notification.user_id)
-            success = await manager.send_personal_message(user_id, event)
+            success = await manager.send_to_user(user_id, event)
 
             if success:
                 logger.info(f"Notification sent to user {user_id}: {notification.type}")
             else:
-                logger.debug(f"User {user_id} not connected, notification queued")
+                logger.debug(f"User {user_id} not connected to this worker, notification published")
 
             return success
 
@@ -62,7 +63,7 @@ class WebSocketHandler:
             obligation: Obligation model instance
 
         Returns:
-            int: Number of users notified
+            int: Number of users notified on this worker
         """
         try:
             from app.schemas.obligation import ObligationResponse
@@ -87,7 +88,7 @@ class WebSocketHandler:
             )
 
             # Send to admin and func users
-            sent_count = await manager.broadcast_to_roles(["admin", "func"], event)
+            sent_count = await manager.send_to_roles(["admin", "func"], event)
 
             logger.info(f"Obligation created notification sent to {sent_count} users")
             return sent_count
@@ -109,7 +110,7 @@ class WebSocketHandler:
             action: Action type (updated, completed, canceled, etc)
 
         Returns:
-            int: Number of users notified
+            int: Number of users notified on this worker
         """
         try:
             # Build obligation data
@@ -131,7 +132,7 @@ class WebSocketHandler:
             )
 
             # Send to admin and func users
-            sent_count = await manager.broadcast_to_roles(["admin", "func"], event)
+            sent_count = await manager.send_to_roles(["admin", "func"], event)
 
             logger.info(f"Obligation {action} notification sent to {sent_count} users")
             return sent_count
@@ -155,7 +156,7 @@ class WebSocketHandler:
             target_roles: Optional list of roles to target (None = all)
 
         Returns:
-            int: Number of users notified
+            int: Number of users notified on this worker
         """
         try:
             # Build event
@@ -163,9 +164,9 @@ class WebSocketHandler:
 
             # Send to target roles or all users
             if target_roles:
-                sent_count = await manager.broadcast_to_roles(target_roles, event)
+                sent_count = await manager.send_to_roles(target_roles, event)
             else:
-                sent_count = await manager.broadcast(event)
+                sent_count = await manager.send_to_all(event)
 
             logger.info(f"System message sent to {sent_count} users: {message}")
             return sent_count
@@ -191,7 +192,7 @@ class WebSocketHandler:
             status: Client status
 
         Returns:
-            int: Number of users notified
+            int: Number of users notified on this worker
         """
         try:
             # Build event
@@ -204,7 +205,7 @@ class WebSocketHandler:
             )
 
             # Send to admin and func users
-            sent_count = await manager.broadcast_to_roles(["admin", "func"], event)
+            sent_count = await manager.send_to_roles(["admin", "func"], event)
 
             logger.info(f"Client created notification sent to {sent_count} users")
             return sent_count
@@ -213,6 +214,42 @@ class WebSocketHandler:
             logger.error(f"Error handling client created: {e}", exc_info=True)
             return 0
 
+    @staticmethod
+    async def handle_report_finished(history: ReportHistory) -> bool:
+        """
+        Handle report export finished event.
+        Notifies the user who requested the export.
+
+        Args:
+            history: ReportHistory model instance
+
+        Returns:
+            bool: True if delivered on this worker
+        """
+        try:
+            completed = history.status == ReportStatus.COMPLETED
+
+            # Build event
+            event = WebSocketEventBuilder.report_status_event(
+                report_id=history.id,
+                report_type=history.report_type.value,
+                format=history.format.value,
+                status=history.status.value,
+                file_url=f"/api/v1/reports/download/{history.id}" if completed else None,
+                file_size=history.file_size if completed else None,
+            )
+
+            # Send to the requesting user
+            user_id = str(history.user_id)
+            success = await manager.send_to_user(user_id, event)
+
+            logger.info(f"Report {history.id} {history.status.value} notification sent: {success}")
+            return success
+
+        except Exception as e:
+            logger.error(f"Error handling report finished: {e}", exc_info=True)
+            return False
+
 
 # Global handler instance
 ws_handler = WebSocketHandler()
@@ -1,13 +1,20 @@
 """
 WebSocket Connection Manager.
 Manages active WebSocket connections and message broadcasting.
+
+Connections live in the worker process that accepted them. The send_to_*
+methods reach users on every worker: they deliver to this worker's
+connections and publish the event on the backplane for the others. The
+send_personal_message/broadcast* methods only reach this worker.
 """
 
 import logging
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
 from fastapi import WebSocket
 
+from app.websockets.backplane import Backplane, InMemoryBackplane
+
 logger = logging.getLogger(__name__)
 
 
@@ -18,11 +25,28 @@ class ConnectionManager:
     Attributes:
         active_connections: Dict mapping user_id to WebSocket connection
         user_roles: Dict mapping user_id to user role
+        backplane: Fan-out to the other worker processes
     """
 
-    def __init__(self):
+    def __init__(self, backplane: Optional[Backplane] = None):
         self.active_connections: Dict[str, WebSocket] = {}
         self.user_roles: Dict[str, str] = {}
+        self.backplane: Backplane = backplane or InMemoryBackplane()
+
+    async def start(self, backplane: Optional[Backplane] = None) -> None:
+        """
+        Start receiving events published by other workers.
+
+        Args:
+            backplane: Optional backplane replacing the current one
+        """
+        if backplane is not None:
+            self.backplane = backplane
+        await self.backplane.start(self.deliver)
+
+    async def stop(self) -> None:
+        """Stop receiving events published by other workers."""
+        await self.backplane.stop()
 
     async def connect(self, websocket: WebSocket, user_id: str, role: str) -> None:
         """
@@ -127,21 +151,28 @@ class ConnectionManager:
         logger.debug(f"Broadcast message to role '{role}': {sent_count} users")
         return sent_count
 
-    async def broadcast_to_roles(self, roles: List[str], message: dict) -> int:
+    async def broadcast_to_roles(
+        self,
+        roles: List[str],
+        message: dict,
+        exclude: Optional[List[str]] = None
+    ) -> int:
         """
         Broadcast a message to all users with any of the specified roles.
 
         Args:
             roles: List of target roles
             message: Message dict to broadcast
+            exclude: Optional list of user IDs to exclude
 
         Returns:
             int: Number of users who received the message
         """
+        exclude = exclude or []
         sent_count = 0
 
         for user_id, user_role in list(self.user_roles.items()):
-            if user_role in roles:
+            if user_role in roles and user_id not in exclude:
                 success = await self.send_personal_message(user_id, message)
                 if success:
                     sent_count += 1
@@ -149,6 +180,75 @@ class ConnectionManager:
         logger.debug(f"Broadcast message to roles {roles}: {sent_count} users")
         return sent_count
 
+    async def send_to_user(self, user_id: str, message: dict) -> bool:
+        """
+        Send a message to a user connected to any worker.
+
+        Args:
+            user_id: Target user ID
+            message: Message dict to send
+
+        Returns:
+            bool: True if the user is connected to this worker and got it
+        """
+        return bool(await self._send({"user_id": user_id}, message))
+
+    async def send_to_roles(
+        self,
+        roles: List[str],
+        message: dict,
+        exclude: Optional[List[str]] = None
+    ) -> int:
+        """
+        Send a message to the users of some roles on every worker.
+
+        Args:
+            roles: List of target roles
+            message: Message dict to send
+            exclude: Optional list of user IDs to exclude
+
+        Returns:
+            int: Number of users on this worker who received it
+        """
+        return await self._send({"roles": roles, "exclude": exclude or []}, message)
+
+    async def send_to_all(self, message: dict, exclude: Optional[List[str]] = None) -> int:
+        """
+        Send a message to every connected user on every worker.
+
+        Args:
+            message: Message dict to send
+            exclude: Optional list of user IDs to exclude
+
+        Returns:
+            int: Number of users on this worker who received it
+        """
+        return await self._send({"exclude": exclude or []}, message)
+
+    async def deliver(self, target: Dict[str, Any], message: dict) -> int:
+        """
+        Deliver an event to this worker's connections.
+
+        Args:
+            target: {"user_id": ...}, {"roles": [...], "exclude": [...]} or
+                {"exclude": [...]} for everyone
+            message: Message dict to send
+
+        Returns:
+            int: Number of users who received the message
+        """
+        if "user_id" in target:
+            return int(await self.send_personal_message(target["user_id"], message))
+        if "roles" in target:
+            return await self.broadcast_to_roles(target["roles"], message, target.get("exclude"))
+        return await self.broadcast(message, target.get("exclude"))
+
+    async def _send(self, target: Dict[str, Any], message: dict) -> int:
+        sent_count = await self.deliver(target, message)
+        # A user connected here may also be connected to other workers
+        await self.backplane.publish(target, message)
+        return sent_count
+
     def is_connected(self, user_id: str) -> bool:
         """
         Check if a user is connected.
@@ -0,0 +1,62 @@
+"""
+Script to rebuild the finance_monthly_rollup table from financial_transactions.
+
+Usage:
+    python scripts/rebuild_finance_rollup.py                  # full rebuild
+    python scripts/rebuild_finance_rollup.py 2024-01 2024-12  # rebuild a month range
+"""
+
+import asyncio
+import sys
+from datetime import date
+from pathlib import Path
+from typing import Optional
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import get_settings
+from app.db.repositories.finance_rollup import FinanceRollupRepository
+
+settings = get_settings()
+
+
+def _parse_month(value: str) -> date:
+    """Parse a YYYY-MM string into the first day of that month."""
+    year, month = value.split("-")[:2]
+    return date(int(year), int(month), 1)
+
+
+async def rebuild_finance_rollup(
+    start_month: Optional[date] = None,
+    end_month: Optional[date] = None,
+):
+    """Rebuild rollup rows for the given range (or everything)."""
+    DATABASE_URL = str(settings.DATABASE_URL)
+
+    engine = create_async_engine(DATABASE_URL, echo=False)
+    async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async with async_session() as session:
+        repo = FinanceRollupRepository(session)
+        rows = await repo.rebuild(start_month=start_month, end_month=end_month)
+        await session.commit()
+
+    await engine.dispose()
+
+    scope = (
+        f"{start_month or 'start'} to {end_month or 'end'}"
+        if start_month or end_month
+        else "all months"
+    )
+    print(f"Rebuilt finance_monthly_rollup ({scope}): {rows} rows written")
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    start = _parse_month(args[0]) if len(args) > 0 else None
+    end = _parse_month(args[1]) if len(args) > 1 else None
+    asyncio.run(rebuild_finance_rollup(start, end))
@@ -0,0 +1,78 @@
+"""
+Unit tests for the async password hasher.
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+from app.core import passwords
+from app.core.config import settings
+from app.core.passwords import PasswordHasher, PasswordHasherBusy
+from app.core.security import hash_password, password_needs_rehash
+
+
+@pytest.fixture
+def low_cost(monkeypatch):
+    """Keep bcrypt fast in tests."""
+    monkeypatch.setattr(settings, "BCRYPT_ROUNDS", 4)
+
+
+async def test_hash_and_verify_off_the_loop(low_cost):
+    """Hashing runs on the pool's threads."""
+    hasher = PasswordHasher(workers=1, max_pending=0)
+    try:
+        hashed = await hasher.hash("secret123")
+
+        assert hashed.startswith("$2b$04$")
+        assert await hasher.verify("secret123", hashed) is True
+        assert await hasher.verify("wrong", hashed) is False
+        assert hasher.stats()["completed"] == 3
+    finally:
+        hasher.shutdown()
+
+
+async def test_verify_and_update_rehashes_on_cost_change(low_cost, monkeypatch):
+    """Hashes made with another cost are replaced after a successful login."""
+    hasher = PasswordHasher(workers=1, max_pending=0)
+    hashed = hash_password("secret123")
+    try:
+        assert await hasher.verify_and_update("secret123", hashed) == (True, None)
+
+        monkeypatch.setattr(settings, "BCRYPT_ROUNDS", 5)
+        assert password_needs_rehash(hashed)
+        assert await hasher.verify_and_update("wrong", hashed) == (False, None)
+
+        valid, new_hash = await hasher.verify_and_update("secret123", hashed)
+        assert valid is True
+        assert new_hash.startswith("$2b$05$")
+        assert not password_needs_rehash(new_hash)
+    finally:
+        hasher.shutdown()
+
+
+async def test_rejects_when_queue_is_full(monkeypatch):
+    """Beyond workers + max_pending operations, callers are turned away."""
+    release = threading.Event()
+
+    def blocking_hash(password):
+        release.wait()
+        return password
+
+    monkeypatch.setattr(passwords, "hash_password", blocking_hash)
+    hasher = PasswordHasher(workers=1, max_pending=1)
+    try:
+        running = [asyncio.create_task(hasher.hash(str(index))) for index in range(2)]
+        await asyncio.sleep(0)
+        assert hasher.stats()["queued"] == 1
+
+        with pytest.raises(PasswordHasherBusy):
+            await hasher.hash("third")
+
+        release.set()
+        assert await asyncio.gather(*running) == ["0", "1"]
+        assert hasher.stats()["rejected"] == 1
+    finally:
+        release.set()
+        hasher.shutdown()
@@ -5,14 +5,21 @@ Unit tests for security module.
 from datetime import timedelta
 
 import pytest
+from cryptography.fernet import Fernet, InvalidToken
 from jose import JWTError, jwt
 
+from app.core import security
 from app.core.config import settings
 from app.core.security import (
+    FieldKeyRing,
+    VerifiedTokenCache,
     create_access_token,
     create_refresh_token,
     create_tokens,
     decode_token,
+    decrypt_field,
+    encrypt_field,
+    get_field_key_ring,
     hash_password,
     verify_password,
 )
@@ -206,3 +213,71 @@ def test_tokens_decode_correctly():
     assert refresh_payload["sub"] == user_id
     assert refresh_payload["role"] == role
     assert refresh_payload["type"] == "refresh"
+
+
+def test_field_encryption_round_trip():
+    """Fields encrypt with a key ring derived once per process."""
+    encrypted = encrypt_field("senha-prefeitura")
+
+    assert encrypted != "senha-prefeitura"
+    assert decrypt_field(encrypted) == "senha-prefeitura"
+    assert encrypt_field("") is None and decrypt_field(None) is None
+    assert get_field_key_ring() is get_field_key_ring()
+
+
+async def test_field_key_rotation_and_batches():
+    """Old keys still decrypt; rotate() moves values to the new key."""
+    old_key, new_key = Fernet.generate_key(), Fernet.generate_key()
+    old_ring = FieldKeyRing([old_key])
+    ring = FieldKeyRing([new_key, old_key])
+
+    stored = old_ring.encrypt_many(["a", None, "c"])
+    assert await ring.decrypt_many_async(stored) == ["a", None, "c"]
+
+    rotated = ring.rotate(stored[0])
+    assert FieldKeyRing([new_key]).decrypt(rotated) == "a"
+    with pytest.raises(InvalidToken):
+        old_ring.decrypt(rotated)
+
+    encrypted = await ring.encrypt_many_async(["x", ""])
+    assert encrypted[1] is None
+    assert ring.decrypt_many(encrypted) == ["x", None]
+
+
+def test_decode_token_cache(monkeypatch):
+    """Repeated tokens skip verification; altered or expired ones never hit."""
+    cache = VerifiedTokenCache(max_entries=10)
+    monkeypatch.setattr(security, "token_cache", cache)
+    token = create_access_token({"sub": "user123"})
+
+    payload = decode_token(token)
+    payload["sub"] = "someone-else"
+    assert decode_token(token)["sub"] == "user123"
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    with pytest.raises(JWTError):
+        decode_token(token[:-2] + ("AA" if not token.endswith("AA") else "BB"))
+
+    expired = create_access_token({"sub": "user123"}, expires_delta=timedelta(seconds=-1))
+    monkeypatch.setattr(security.jwt, "decode", lambda *args, **kwargs: pytest.fail("verified"))
+    with pytest.raises(JWTError):
+        decode_token(expired)
+    assert cache.expired == 1
+
+
+def test_token_cache_expiry_and_bound(monkeypatch):
+    """Entries expire at exp and the least recently used are evicted."""
+    now = [1000.0]
+    monkeypatch.setattr(security.time, "time", lambda: now[0])
+    cache = VerifiedTokenCache(max_entries=2)
+
+    cache.set("a", {"exp": 1010})
+    cache.set("b", {"exp": 2000})
+    assert cache.get("a") == {"exp": 1010}
+    cache.set("c", {})
+    assert cache.get("b") is None
+    assert len(cache) == 2
+
+    now[0] = 1010
+    assert cache.get("a") is None
+    assert cache.get("c") == {}
@@ -0,0 +1,158 @@
+"""
+Unit tests for the precomputed obligation applicability matrix.
+"""
+
+from datetime import date
+from itertools import product
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from app.db.models.client import ClientStatus, RegimeTributario, TipoEmpresa
+from app.patterns.factories.obligation_factory import ObligationFactory
+from app.patterns.strategies import ApplicabilityMatrix
+from app.schemas.obligation import ObligationRecurrence
+from app.services.obligation_type_catalog import CatalogSnapshot, ObligationTypeEntry
+
+CODES = [
+    "DAS_MENSAL", "DEFIS_ANUAL", "DCTF_MENSAL", "PIS_COFINS_MENSAL", "EFD_CONTRIBUICOES",
+    "IRPJ_TRIMESTRAL", "CSLL_TRIMESTRAL", "IRPJ_MENSAL", "CSLL_MENSAL", "LALUR_ANUAL",
+    "DAS_MEI_MENSAL", "DASN_SIMEI_ANUAL", "SPED_FISCAL", "GIA_MENSAL", "NFS_E_MENSAL",
+    "DMS_MENSAL", "IPI_MENSAL", "BLOCO_K_MENSAL", "ESOCIAL_MENSAL", "FGTS_MENSAL",
+    "CAGED_MENSAL", "DIRPJ_ANUAL", "DIRF_ANUAL", "RAIS_ANUAL",
+]
+
+
+def make_entry(code: str, is_active: bool = True) -> ObligationTypeEntry:
+    """Build a catalog entry."""
+    return ObligationTypeEntry(
+        id=uuid4(),
+        name=code,
+        code=code,
+        description=None,
+        applies_to_commerce=False,
+        applies_to_service=False,
+        applies_to_industry=False,
+        applies_to_mei=False,
+        applies_to_simples=False,
+        applies_to_presumido=False,
+        applies_to_real=False,
+        recurrence=ObligationRecurrence.MENSAL,
+        day_of_month=20,
+        month_of_year=None,
+        is_active=is_active,
+    )
+
+
+def make_client(tipo_empresa, regime_tributario, uf="MG", cidade="Uberlândia"):
+    """Build a client stand-in with the attributes the strategies read."""
+    return SimpleNamespace(
+        id=uuid4(),
+        tipo_empresa=tipo_empresa,
+        regime_tributario=regime_tributario,
+        uf=uf,
+        cidade=cidade,
+    )
+
+
+@pytest.fixture
+def factory():
+    """Factory used only for its strategy selection."""
+    return ObligationFactory(None)
+
+
+@pytest.fixture
+def catalog():
+    """Catalog with every code the strategies use plus one inactive type."""
+    entries = [make_entry(code) for code in CODES]
+    entries.append(make_entry("LEGACY_MENSAL", is_active=False))
+    return CatalogSnapshot.build(1, entries)
+
+
+@pytest.fixture
+def matrix(factory, catalog):
+    """Matrix compiled from the test catalog."""
+    return ApplicabilityMatrix.build(catalog, factory._strategy_for)
+
+
+def test_matrix_matches_strategies(factory, catalog, matrix):
+    """The matrix gives the same types as running the strategy per client."""
+    locations = [("MG", "Uberlândia"), ("SP", "São Paulo")]
+
+    for tipo, regime, (uf, cidade) in product(TipoEmpresa, RegimeTributario, locations):
+        client = make_client(tipo, regime, uf=uf, cidade=cidade)
+        codes = factory._get_strategy(client).get_applicable_type_codes(client)
+        expected = {catalog.active_by_code[code].id for code in codes if code in catalog.active_by_code}
+
+        assert matrix.type_ids_for(client) == expected, (tipo, regime, uf)
+
+
+def test_match_and_reverse_index(catalog, matrix):
+    """Grouped matching and the reverse index agree with per-client lookups."""
+    sp_commerce = make_client(TipoEmpresa.COMERCIO, RegimeTributario.SIMPLES_NACIONAL, uf="SP")
+    mg_commerce = make_client(TipoEmpresa.COMERCIO, RegimeTributario.SIMPLES_NACIONAL)
+    mei = make_client(TipoEmpresa.SERVICO, RegimeTributario.MEI)
+    clients = [sp_commerce, mg_commerce, mei]
+
+    matches = matrix.match(clients)
+    assert matches == {client.id: matrix.type_ids_for(client) for client in clients}
+
+    index = matrix.clients_by_type(clients)
+    gia = catalog.by_code["GIA_MENSAL"].id
+    fgts = catalog.by_code["FGTS_MENSAL"].id
+    das_mei = catalog.by_code["DAS_MEI_MENSAL"].id
+
+    assert index[gia] == [sp_commerce.id]
+    assert sorted(index[fgts]) == sorted(client.id for client in clients)
+    assert index[das_mei] == [mei.id]
+
+
+def test_inactive_types_are_excluded(catalog, matrix):
+    """Types missing or inactive in the catalog never appear in a cell."""
+    inactive = catalog.by_code["LEGACY_MENSAL"].id
+
+    assert all(inactive not in cell for cell in matrix.cells.values())
+    assert matrix.catalog_version == catalog.version
+
+
+class FakeSession:
+    """Session double recording executed statements."""
+
+    def __init__(self):
+        self.statements = []
+        self.commits = 0
+
+    async def execute(self, statement):
+        self.statements.append(statement)
+
+    async def commit(self):
+        self.commits += 1
+
+
+async def test_bulk_generation_skips_a_bad_client(matrix, monkeypatch):
+    """A client that can't be matched is counted as an error, not fatal to the batch."""
+    good = make_client(TipoEmpresa.SERVICO, RegimeTributario.MEI)
+    good.status, good.deleted_at = ClientStatus.ATIVO, None
+    bad = make_client("desconhecido", RegimeTributario.MEI)
+    session = FakeSession()
+    factory = ObligationFactory(session)
+
+    async def get_active_clients(client_ids=None):
+        return [bad, good]
+
+    async def get_applicability_matrix():
+        return matrix
+
+    async def get_existing_keys(reference_month, client_ids=None):
+        return set()
+
+    monkeypatch.setattr(factory, "_get_active_clients", get_active_clients)
+    monkeypatch.setattr(factory, "get_applicability_matrix", get_applicability_matrix)
+    monkeypatch.setattr(factory, "_get_existing_keys", get_existing_keys)
+
+    stats = await factory.generate_bulk(date(2025, 3, 1))
+
+    assert stats["errors"] == 1
+    assert stats["total_created"] == len(matrix.type_ids_for(good)) > 0
+    assert session.commits == 1
@@ -0,0 +1,41 @@
+"""
+Unit tests for client search conditions.
+"""
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.db.repositories.client import client_search_condition, normalize_search_text
+
+
+def compile_sql(condition) -> str:
+    """Render a condition as PostgreSQL with inlined values."""
+    compiled = condition.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+    return str(compiled).replace("%%", "%")
+
+
+def test_normalize_search_text():
+    """Accents, case and extra spaces are dropped like in clients.search_text."""
+    assert normalize_search_text("  Padaria  São João ") == "padaria sao joao"
+    assert normalize_search_text("AÇÚCAR Ltda") == "acucar ltda"
+
+
+@pytest.mark.parametrize("query", ["12.345", "12345", " 12.345/0"])
+def test_cnpj_prefix_search(query):
+    """Terms without letters look up CNPJ digit prefixes."""
+    condition, relevance = client_search_condition(query)
+
+    sql = compile_sql(condition)
+    assert "clients.cnpj_digits LIKE" in sql
+    assert "'" + "".join(filter(str.isdigit, query)) + "%'" in sql
+    assert relevance is None
+
+
+def test_name_search_is_ranked():
+    """Names match by substring or word similarity, on the normalized term."""
+    condition, relevance = client_search_condition("Joao 50%")
+
+    sql = compile_sql(condition)
+    assert "clients.search_text LIKE '%joao 50/%%' ESCAPE '/'" in sql
+    assert "'joao 50%' <% clients.search_text" in sql
+    assert compile_sql(relevance) == "word_similarity('joao 50%', clients.search_text)"
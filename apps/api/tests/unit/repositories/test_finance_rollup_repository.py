@@ -0,0 +1,91 @@
+"""
+Unit tests for FinanceRollupRepository delta handling.
+"""
+
+from datetime import date, datetime
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from app.db.models.finance import FinancialTransaction, PaymentStatus, TransactionType
+from app.db.repositories.finance_rollup import FinanceRollupRepository, rollup_contribution
+
+
+@pytest.fixture
+def rollup_repo(monkeypatch):
+    """Create a FinanceRollupRepository that records deltas instead of writing them."""
+    repo = FinanceRollupRepository(None)
+    repo.applied = []
+
+    async def fake_apply_deltas(deltas):
+        repo.applied.append(deltas)
+
+    monkeypatch.setattr(repo, "apply_deltas", fake_apply_deltas)
+    return repo
+
+
+def make_transaction(**overrides) -> FinancialTransaction:
+    """Build an in-memory transaction."""
+    data = {
+        "client_id": uuid4(),
+        "transaction_type": TransactionType.RECEITA,
+        "amount": Decimal("100.00"),
+        "payment_status": PaymentStatus.PENDENTE,
+        "due_date": date(2025, 2, 10),
+        "reference_month": date(2025, 1, 1),
+        "description": "Honorários",
+    }
+    data.update(overrides)
+    return FinancialTransaction(**data)
+
+
+def test_contribution_of_deleted_transaction_is_none():
+    """Soft-deleted transactions do not count in the rollup."""
+    transaction = make_transaction(deleted_at=datetime.utcnow())
+
+    assert rollup_contribution(transaction) is None
+
+
+@pytest.mark.asyncio
+async def test_status_change_moves_amount_between_keys(rollup_repo):
+    """Paying a transaction moves its amount from pendente to pago."""
+    transaction = make_transaction()
+    before = rollup_contribution(transaction)
+    transaction.payment_status = PaymentStatus.PAGO
+
+    await rollup_repo.apply_change(before, rollup_contribution(transaction))
+
+    deltas = rollup_repo.applied[0]
+    month, client_id = transaction.reference_month, transaction.client_id
+    assert deltas[(month, client_id, TransactionType.RECEITA, PaymentStatus.PENDENTE)] == (
+        Decimal("-100.00"),
+        -1,
+    )
+    assert deltas[(month, client_id, TransactionType.RECEITA, PaymentStatus.PAGO)] == (
+        Decimal("100.00"),
+        1,
+    )
+
+
+@pytest.mark.asyncio
+async def test_amount_change_on_same_key_is_merged(rollup_repo):
+    """Deltas on the same key collapse into one row update."""
+    transaction = make_transaction()
+    before = rollup_contribution(transaction)
+    transaction.amount = Decimal("150.00")
+
+    await rollup_repo.apply_change(before, rollup_contribution(transaction))
+
+    assert list(rollup_repo.applied[0].values()) == [(Decimal("50.00"), 0)]
+
+
+@pytest.mark.asyncio
+async def test_unchanged_transaction_produces_no_deltas(rollup_repo):
+    """Updates that do not touch rollup dimensions write nothing."""
+    transaction = make_transaction()
+    snapshot = rollup_contribution(transaction)
+
+    await rollup_repo.apply_change(snapshot, rollup_contribution(transaction))
+
+    assert rollup_repo.applied == [{}]
@@ -0,0 +1,64 @@
+"""
+Unit tests for keyset pagination cursors.
+"""
+
+import base64
+from datetime import date, datetime
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.db.repositories.base import keyset_after, keyset_cursor
+from app.db.repositories.license import LicenseRepository
+from app.db.repositories.transaction import TransactionRepository
+
+
+def compile_sql(condition) -> str:
+    """Render a condition as PostgreSQL with inlined values."""
+    return str(condition.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+def test_cursor_round_trip_descending():
+    """Transactions page backwards by (due_date, id), bounded on the indexed column."""
+    keys = TransactionRepository.list_sort_keys
+    transaction_id = uuid4()
+    cursor = keyset_cursor(keys, SimpleNamespace(due_date=date(2025, 3, 10), id=transaction_id))
+
+    sql = compile_sql(keyset_after(keys, cursor))
+
+    assert "financial_transactions.due_date <= '2025-03-10'" in sql
+    assert "financial_transactions.due_date < '2025-03-10'" in sql
+    assert f"financial_transactions.id < '{transaction_id}'" in sql
+
+
+def test_cursor_with_null_sort_value():
+    """Licenses without expiration sort last; a NULL cursor only continues among them."""
+    keys = LicenseRepository.list_sort_keys
+    last = SimpleNamespace(expiration_date=None, created_at=datetime(2025, 1, 2, 3, 4, 5), id=uuid4())
+
+    sql = compile_sql(keyset_after(keys, keyset_cursor(keys, last)))
+
+    assert "licenses.expiration_date IS NULL AND licenses.created_at < '2025-01-02 03:04:05'" in sql
+    assert "licenses.expiration_date >" not in sql
+
+    dated = SimpleNamespace(expiration_date=date(2025, 6, 1), created_at=last.created_at, id=last.id)
+    sql = compile_sql(keyset_after(keys, keyset_cursor(keys, dated)))
+    assert "licenses.expiration_date > '2025-06-01' OR licenses.expiration_date IS NULL" in sql
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not-a-cursor",
+        keyset_cursor([], object()),
+        "WyIyMDI1Il0=",
+        # ["2025-01-01", 5]: values must be strings or null
+        base64.urlsafe_b64encode(b'["2025-01-01",5]').decode("ascii"),
+    ],
+)
+def test_invalid_cursor(cursor):
+    """Malformed cursors and cursors of another listing are rejected."""
+    with pytest.raises(ValueError):
+        keyset_after(TransactionRepository.list_sort_keys, cursor)
@@ -0,0 +1,95 @@
+"""
+Unit tests for BaseRepository.paginate count fusion.
+"""
+
+from types import SimpleNamespace
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.db.models.client import Client
+from app.db.repositories.client import ClientRepository
+
+
+class Row(tuple):
+    """Row double with the window column as an attribute."""
+
+    def __new__(cls, entity, total_count=None):
+        row = super().__new__(cls, (entity, total_count))
+        row.total_count = total_count
+        return row
+
+
+class FakeResult:
+    """Result double for page queries."""
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    def all(self):
+        return self.rows
+
+    def scalars(self):
+        return SimpleNamespace(all=lambda: [row[0] for row in self.rows])
+
+
+class FakeSession:
+    """Session double recording the SQL it runs."""
+
+    def __init__(self, rows, count=0):
+        self.rows = rows
+        self.count = count
+        self.statements = []
+
+    async def execute(self, stmt):
+        self.statements.append(str(stmt.compile(dialect=postgresql.dialect())))
+        return FakeResult(self.rows)
+
+    async def scalar(self, stmt):
+        self.statements.append(str(stmt.compile(dialect=postgresql.dialect())))
+        return self.count
+
+
+def client_stmt():
+    """Filtered, ordered client listing."""
+    return select(Client).where(Client.deleted_at.is_(None)).order_by(Client.razao_social)
+
+
+async def test_page_and_total_in_one_query():
+    """The total rides along the page as a window count."""
+    clients = [Client(razao_social="A"), Client(razao_social="B")]
+    session = FakeSession([Row(client, 42) for client in clients])
+
+    items, total = await ClientRepository(session).paginate(client_stmt(), skip=20, limit=2)
+
+    assert (items, total) == (clients, 42)
+    assert len(session.statements) == 1
+    assert "count(*) OVER () AS total_count" in session.statements[0]
+
+
+async def test_empty_pages():
+    """Only an empty page past the first needs a separate count."""
+    session = FakeSession([], count=7)
+    repo = ClientRepository(session)
+
+    assert await repo.paginate(client_stmt(), skip=0, limit=10) == ([], 0)
+    assert len(session.statements) == 1
+
+    assert await repo.paginate(client_stmt(), skip=50, limit=10) == ([], 7)
+    assert len(session.statements) == 3
+    assert session.statements[-1].startswith("SELECT count(*) AS count_1")
+
+
+async def test_without_total_or_with_keyset():
+    """with_total=false skips counting; a keyset condition counts separately."""
+    session = FakeSession([Row(Client(razao_social="A"))], count=3)
+    repo = ClientRepository(session)
+
+    items, total = await repo.paginate(client_stmt(), limit=10, with_total=False)
+    assert total is None
+    assert "OVER" not in session.statements[-1]
+
+    items, total = await repo.paginate(client_stmt(), limit=10, after=Client.razao_social > "A")
+    assert total == 3
+    assert "razao_social > " in session.statements[-2]
+    assert "OFFSET" not in session.statements[-2]
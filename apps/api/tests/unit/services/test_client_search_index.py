@@ -0,0 +1,90 @@
+"""
+Unit tests for the in-process client search index.
+"""
+
+from types import SimpleNamespace
+from uuid import uuid4
+
+from app.services.client_search_index import ClientSearchEntry, ClientSearchIndex
+
+
+def make_entry(razao_social, cnpj, nome_fantasia=None):
+    """Client row as loaded by the index."""
+    return ClientSearchEntry(uuid4(), razao_social, nome_fantasia, cnpj)
+
+
+class FakeResult:
+    """Result double for the version and row queries."""
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    def one(self):
+        return self.rows[0]
+
+    def all(self):
+        return self.rows
+
+
+class FakeSession:
+    """Session double serving the clients table."""
+
+    def __init__(self, entries):
+        self.entries = entries
+        # Rows written to the clients table, as the statistics views report it
+        self.writes = 1
+        self.loads = 0
+
+    async def execute(self, stmt, params=None):
+        if "pg_stat_user_tables" in str(stmt):
+            return FakeResult([("clients", self.writes)])
+        self.loads += 1
+        return FakeResult(
+            [(e.id, e.razao_social, e.nome_fantasia, e.cnpj) for e in self.entries]
+        )
+
+
+def names(results):
+    """Names of search results."""
+    return [result["razao_social"] for result in results]
+
+
+async def test_prefix_search_on_names_and_cnpj():
+    """Word prefixes ignore accents and case; digit-only queries match CNPJ prefixes."""
+    session = FakeSession([
+        make_entry("Padaria São João Ltda", "12.345.678/0001-90"),
+        make_entry("João Silva ME", "98.765.432/0001-10", nome_fantasia="Mercado Central"),
+        make_entry("Construtora Alfa", "12.399.000/0001-55"),
+    ])
+    index = ClientSearchIndex(check_seconds=60)
+
+    assert names(await index.search(session, "joao")) == ["João Silva ME", "Padaria São João Ltda"]
+    assert names(await index.search(session, "SAO jo")) == ["Padaria São João Ltda"]
+    assert names(await index.search(session, "merc")) == ["João Silva ME"]
+    assert names(await index.search(session, "12.3")) == ["Construtora Alfa", "Padaria São João Ltda"]
+    assert await index.search(session, "xyz") == []
+    assert session.loads == 1
+
+
+async def test_writes_apply_immediately_and_versions_trigger_rebuilds():
+    """Local writes go through the overlay; other workers' writes through the version check."""
+    padaria = make_entry("Padaria Central", "12.345.678/0001-90")
+    session = FakeSession([padaria])
+    index = ClientSearchIndex(check_seconds=0)
+
+    await index.search(session, "padaria")
+    index.upsert(SimpleNamespace(
+        id=padaria.id, razao_social="Panificadora Central", nome_fantasia=None,
+        cnpj=padaria.cnpj, deleted_at=None,
+    ))
+    assert names(await index.search(session, "central")) == ["Panificadora Central"]
+    assert session.loads == 1
+
+    index.remove(padaria.id)
+    assert await index.search(session, "central") == []
+
+    # Another worker added a client
+    session.entries = [make_entry("Central Contábil", "11.111.111/0001-11")]
+    session.writes += 1
+    assert names(await index.search(session, "central")) == ["Central Contábil"]
+    assert session.loads == 2
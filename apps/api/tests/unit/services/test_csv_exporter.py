@@ -0,0 +1,47 @@
+"""
+Unit tests for the streaming CSV export path.
+"""
+
+import pytest
+
+from app.services.report.exporters.csv_exporter import CSVExporter
+
+
+async def rows(count: int):
+    """Async row source like a report service's iter_export_rows()."""
+    yield ["Data", "Valor"]
+    for index in range(count):
+        yield [f"{index + 1:02d}/01/2025", float(index)]
+
+
+@pytest.fixture
+def exporter(tmp_path, monkeypatch):
+    """CSVExporter writing under a temporary directory."""
+    monkeypatch.chdir(tmp_path)
+    return CSVExporter()
+
+
+async def test_iter_csv_yields_in_chunks(exporter):
+    """Rows are formatted in chunks, not as one document."""
+    chunks = [
+        chunk
+        async for chunk in exporter.iter_csv({"title": "Livro Caixa"}, rows(10), chunk_rows=4)
+    ]
+
+    assert len(chunks) == 3
+    text = b"".join(chunks).decode("utf-8")
+    assert text.startswith("﻿")
+    assert '"RELATÓRIO";"Livro Caixa"' in text
+    assert text.rstrip("\n").endswith('"10/01/2025";9.0')
+
+
+async def test_export_rows_writes_file_incrementally(exporter):
+    """Streamed files match the streamed body and report their size from disk."""
+    metadata = {"title": "Clientes", "period": "2025-01-01 a 2025-12-31"}
+
+    file_size, file_path = await exporter.export_rows(metadata, rows(1200), "clientes")
+
+    assert file_path.suffix == ".csv"
+    assert file_size == file_path.stat().st_size
+    content = file_path.read_text(encoding="utf-8-sig")
+    assert content.count("\n") == 4 + 1 + 1200
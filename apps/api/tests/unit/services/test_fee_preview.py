@@ -0,0 +1,38 @@
+"""
+Unit tests for the monthly fee preview cursor.
+"""
+
+import base64
+from datetime import date
+from types import SimpleNamespace
+
+import pytest
+
+from app.db.repositories.base import encode_cursor
+from app.services.finance.fee_generator_service import FeeGeneratorService
+
+
+class FakeSession:
+    """Session double answering the totals aggregate."""
+
+    async def execute(self, stmt):
+        return SimpleNamespace(
+            one=lambda: SimpleNamespace(total_clients=0, would_generate_count=0, total_amount=0)
+        )
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        encode_cursor(["Acme"]),
+        encode_cursor(["Acme", "not-a-uuid"]),
+        encode_cursor([None, None]),
+        base64.urlsafe_b64encode(b'["Acme",5]').decode("ascii"),
+    ],
+)
+async def test_invalid_cursor_is_a_value_error(cursor):
+    """Crafted cursors are rejected as invalid, never crash the preview."""
+    service = FeeGeneratorService(FakeSession())
+
+    with pytest.raises(ValueError, match="Invalid pagination cursor"):
+        await service._get_all_clients_preview(date(2025, 3, 1), cursor=cursor)
@@ -0,0 +1,122 @@
+"""
+Unit tests for the in-process ObligationType catalog.
+"""
+
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from app.db.models.obligation_type import ObligationType
+from app.schemas.obligation import ObligationRecurrence
+from app.services.obligation_type_catalog import ObligationTypeCatalog, ObligationTypeEntry
+
+
+class FakeSession:
+    """Session double over a list of obligation types, counting full loads."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        # Rows written to obligation_types, as the statistics views report it
+        self.writes = len(rows)
+        self.loads = 0
+
+    def _load(self, rows):
+        self.loads += 1
+        return SimpleNamespace(all=lambda: rows)
+
+    async def execute(self, stmt, params=None):
+        rows = list(self.rows)
+        return SimpleNamespace(
+            scalars=lambda: self._load(rows),
+            all=lambda: [("obligation_types", self.writes)],
+        )
+
+
+def make_type(code: str, is_active: bool = True) -> ObligationType:
+    """Build an in-memory obligation type."""
+    return ObligationType(
+        id=uuid4(),
+        name=code.title(),
+        code=code,
+        applies_to_commerce=True,
+        applies_to_simples=True,
+        recurrence=ObligationRecurrence.MENSAL,
+        day_of_month=20,
+        is_active=is_active,
+    )
+
+
+async def test_get_reloads_only_when_the_table_changed():
+    """Snapshots are reused until a version check finds the table changed."""
+    session = FakeSession([make_type("DAS_MENSAL")])
+    catalog = ObligationTypeCatalog(check_seconds=3600)
+
+    first = await catalog.get(session)
+    second = await catalog.get(session)
+
+    assert first is second
+    assert first.version == 1
+    assert session.loads == 1
+
+    # Checked, but unchanged: the snapshot is kept
+    catalog.invalidate()
+    assert await catalog.get(session) is first
+    assert session.loads == 1
+
+    # Another worker added a type
+    session.rows.append(make_type("DCTF_MENSAL"))
+    session.writes += 1
+    catalog.invalidate()
+    third = await catalog.get(session)
+
+    assert third.version == 2
+    assert set(third.by_code) == {"DAS_MENSAL", "DCTF_MENSAL"}
+    assert session.loads == 2
+
+    # ... and another one edited it
+    session.rows[1].name = "DCTF"
+    session.writes += 1
+    catalog.invalidate()
+    assert (await catalog.get(session)).version == 3
+
+
+async def test_snapshot_indexes_and_immutability():
+    """Snapshots index by id and code, and only expose active types as active."""
+    active = make_type("DAS_MENSAL")
+    inactive = make_type("DEFIS_ANUAL", is_active=False)
+    catalog = ObligationTypeCatalog(check_seconds=3600)
+
+    snapshot = await catalog.get(FakeSession([active, inactive]))
+
+    assert catalog.get_by_id(inactive.id).code == "DEFIS_ANUAL"
+    assert set(snapshot.by_code) == {"DAS_MENSAL", "DEFIS_ANUAL"}
+    assert set(snapshot.active_by_code) == {"DAS_MENSAL"}
+    assert snapshot.active_by_code["DAS_MENSAL"].day_of_month == 20
+
+    with pytest.raises(TypeError):
+        snapshot.by_code["NEW"] = snapshot.by_code["DAS_MENSAL"]
+
+
+async def test_refresh_does_not_mutate_previous_snapshot():
+    """A refresh swaps in a new snapshot; readers holding the old one are unaffected."""
+    session = FakeSession([make_type("DAS_MENSAL")])
+    catalog = ObligationTypeCatalog(check_seconds=3600)
+
+    old = await catalog.get(session)
+    session.rows.append(make_type("DCTF_MENSAL"))
+    new = await catalog.refresh(session)
+
+    assert set(old.by_code) == {"DAS_MENSAL"}
+    assert set(new.by_code) == {"DAS_MENSAL", "DCTF_MENSAL"}
+
+
+def test_entry_applies_to_client():
+    """Catalog entries evaluate applicability like the model."""
+    das = ObligationTypeEntry.from_model(make_type("DAS_MENSAL"))
+    client = SimpleNamespace(tipo_empresa="comercio", regime_tributario="simples_nacional")
+
+    assert das.applies_to_client(client)
+
+    client.regime_tributario = "lucro_real"
+    assert not das.applies_to_client(client)
@@ -0,0 +1,33 @@
+"""
+Unit tests for the paginated PDF renderer.
+"""
+
+import re
+import threading
+
+from app.services.report.exporters.pdf_renderer import ReportPDFRenderer, render_in_pool
+
+
+def count_pages(pdf_bytes: bytes) -> int:
+    """Count page objects in a PDF."""
+    return len(re.findall(rb"/Type /Page[^s]", pdf_bytes))
+
+
+async def test_long_tables_break_across_pages(tmp_path):
+    """Rows that do not fit on one page continue on the following pages."""
+    renderer = ReportPDFRenderer("Livro Caixa & Receitas", period="2025-01-01 a 2025-12-31")
+    table = [["Data", "Tipo", "Valor"]] + [[f"{day}", "entrada", f"{day}.00"] for day in range(300)]
+    file_path = tmp_path / "livro_caixa.pdf"
+
+    file_size = await render_in_pool(renderer.render, table, file_path)
+
+    assert file_size == file_path.stat().st_size
+    assert count_pages(file_path.read_bytes()) > 1
+
+
+async def test_render_in_pool_runs_off_the_event_loop_thread():
+    """Renders run on the render pool, not on the event loop thread."""
+    render_thread = await render_in_pool(threading.current_thread)
+
+    assert render_thread is not threading.current_thread()
+    assert render_thread.name.startswith("pdf-render")
@@ -0,0 +1,62 @@
+"""
+Unit tests for the authenticated principal cache.
+"""
+
+from uuid import uuid4
+
+from app.db.models.user import UserRole
+from app.services import principal_cache as principal_cache_module
+from app.services.principal_cache import Principal, PrincipalCache
+
+
+def make_principal(role: UserRole = UserRole.ADMIN) -> Principal:
+    """Principal with a fresh ID."""
+    return Principal(id=uuid4(), role=role, is_active=True, primary_client_id=None, email="a@b.c")
+
+
+def test_lru_and_ttl(monkeypatch):
+    """Entries are keyed by token, evicted least recently used first and expire."""
+    now = [100.0]
+    monkeypatch.setattr(principal_cache_module.time, "monotonic", lambda: now[0])
+    cache = PrincipalCache(max_entries=2, ttl_seconds=30)
+    first, second, third = make_principal(), make_principal(), make_principal()
+
+    for principal in (first, second):
+        cache.set(principal, 1, cache.generation(principal.id))
+    assert cache.get(first.id, 1) is first
+    assert cache.get(first.id, 2) is None
+
+    cache.set(third, 1, cache.generation(third.id))
+    assert cache.get(second.id, 1) is None
+    assert len(cache) == 2
+
+    now[0] += 30
+    assert cache.get(first.id, 1) is None
+    assert len(cache) == 1
+
+
+def test_invalidate_drops_every_token_of_a_user():
+    """Invalidation removes all of a user's sessions, not other users'."""
+    cache = PrincipalCache(max_entries=10, ttl_seconds=30)
+    user, other = make_principal(), make_principal()
+    for issued_at in (1, 2):
+        cache.set(user, issued_at, cache.generation(user.id))
+    cache.set(other, 1, cache.generation(other.id))
+
+    cache.invalidate(user.id)
+
+    assert cache.get(user.id, 1) is None
+    assert cache.get(user.id, 2) is None
+    assert cache.get(other.id, 1) is other
+
+
+def test_load_racing_an_invalidation_is_not_cached():
+    """A principal read before a role change can't be stored after it."""
+    cache = PrincipalCache(max_entries=10, ttl_seconds=30)
+    stale = make_principal(UserRole.ADMIN)
+
+    generation = cache.generation(stale.id)
+    cache.invalidate(stale.id)
+    cache.set(stale, 1, generation)
+
+    assert cache.get(stale.id, 1) is None
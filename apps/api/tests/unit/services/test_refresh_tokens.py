@@ -0,0 +1,131 @@
+"""
+Unit tests for refresh token rotation and revocation.
+"""
+
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from app.core.security import decode_token
+from app.db.repositories.refresh_token import RefreshTokenRepository
+from app.services import refresh_tokens
+from app.services.refresh_tokens import (
+    RefreshTokenReused,
+    RefreshTokenStore,
+    RevokedFamilies,
+    hash_token_id,
+)
+
+
+class FakeSession:
+    """Session double counting commits."""
+
+    def __init__(self):
+        self.commits = 0
+
+    async def commit(self):
+        self.commits += 1
+
+
+@pytest.fixture
+def tokens_table(monkeypatch):
+    """In-memory stand-in for the refresh_tokens repository methods."""
+    rows = {}
+    revoked_families = []
+
+    async def add(self, token_hash, user_id, family_id, expires_at):
+        rows[token_hash] = SimpleNamespace(
+            user_id=user_id, family_id=family_id, rotated_at=None, revoked_at=None
+        )
+
+    async def mark_rotated(self, token_hash, now):
+        row = rows.get(token_hash)
+        if row is None or row.rotated_at or row.revoked_at:
+            return None
+        row.rotated_at = now
+        return row.user_id, row.family_id
+
+    async def get_by_hash(self, token_hash):
+        return rows.get(token_hash)
+
+    async def revoke_family(self, family_id):
+        revoked_families.append(family_id)
+        for row in rows.values():
+            if row.family_id == family_id:
+                row.revoked_at = datetime.now(timezone.utc)
+
+    for method in (add, mark_rotated, get_by_hash, revoke_family):
+        monkeypatch.setattr(RefreshTokenRepository, method.__name__, method)
+    return SimpleNamespace(rows=rows, revoked_families=revoked_families)
+
+
+async def test_rotation_keeps_the_family(tokens_table):
+    """A refresh consumes its token; the successor continues the login's family."""
+    store = RefreshTokenStore(reuse_grace_seconds=10)
+    session, user_id = FakeSession(), uuid4()
+
+    tokens = await store.issue(session, user_id, "admin")
+    payload = decode_token(tokens["refresh_token"])
+    assert decode_token(tokens["access_token"])["fam"] == payload["fam"]
+    assert hash_token_id(payload["jti"]) in tokens_table.rows
+
+    rotated_user_id, family_id = await store.rotate(session, payload)
+    assert (rotated_user_id, str(family_id)) == (user_id, payload["fam"])
+
+    successor = decode_token(
+        (await store.issue(session, user_id, "admin", family_id=family_id))["refresh_token"]
+    )
+    assert successor["fam"] == payload["fam"]
+    assert successor["jti"] != payload["jti"]
+
+
+async def test_reuse_revokes_the_family(tokens_table):
+    """Replaying a rotated token past the grace period revokes the whole family."""
+    store = RefreshTokenStore(reuse_grace_seconds=10)
+    session = FakeSession()
+    payload = decode_token((await store.issue(session, uuid4(), "func"))["refresh_token"])
+    await store.rotate(session, payload)
+
+    # Two tabs refreshing at once: refused, but the session survives
+    with pytest.raises(RefreshTokenReused):
+        await store.rotate(session, payload)
+    assert tokens_table.revoked_families == []
+
+    row = tokens_table.rows[hash_token_id(payload["jti"])]
+    row.rotated_at -= timedelta(minutes=1)
+    with pytest.raises(RefreshTokenReused):
+        await store.rotate(session, payload)
+
+    assert tokens_table.revoked_families == [row.family_id]
+    assert session.commits == 1
+    assert store.is_revoked(payload["fam"])
+    with pytest.raises(ValueError):
+        await store.rotate(session, payload)
+
+
+async def test_legacy_tokens_are_refused(tokens_table):
+    """Refresh tokens issued without a jti can't be rotated."""
+    store = RefreshTokenStore(reuse_grace_seconds=10)
+
+    with pytest.raises(ValueError):
+        await store.rotate(FakeSession(), {"sub": str(uuid4()), "type": "refresh"})
+
+
+def test_revoked_families_outlive_access_tokens_only(monkeypatch):
+    """Revoked families are forgotten once their access tokens expired."""
+    now = [1000.0]
+    monkeypatch.setattr(refresh_tokens.time, "time", lambda: now[0])
+    revoked = RevokedFamilies(retain_seconds=60)
+    first, second = uuid4(), uuid4()
+
+    revoked.add(first)
+    now[0] += 30
+    revoked.add(second)
+    assert first in revoked and second in revoked
+
+    now[0] += 30
+    assert first not in revoked and second in revoked
+    revoked.add(uuid4())
+    assert len(revoked) == 2
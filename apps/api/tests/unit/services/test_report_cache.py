@@ -0,0 +1,156 @@
+"""
+Unit tests for the report result cache and table versions.
+"""
+
+import asyncio
+import sys
+from datetime import date
+from uuid import uuid4
+
+import pytest
+
+from app.db.models.report import ReportType
+from app.db.table_versions import read_table_versions
+from app.services.report import REPORT_SERVICES
+from app.services.report.cache import REPORT_TABLES, ReportResultCache, report_cache_key
+
+
+class StatsSession:
+    """Session double answering the statistics query from a dict."""
+
+    def __init__(self, written=None):
+        self.written = dict(written or {})
+
+    async def execute(self, statement, params):
+        rows = [(name, self.written[name]) for name in params["tables"] if name in self.written]
+        return _Result(rows)
+
+
+class _Result:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def all(self):
+        return self.rows
+
+
+def make_filters(**overrides):
+    """Report filters as routes pass them to the services."""
+    filters = {
+        "period_start": date(2025, 1, 1),
+        "period_end": date(2025, 12, 31),
+        "client_ids": None,
+        "report_type": ReportType.DRE,
+    }
+    filters.update(overrides)
+    return filters
+
+
+def test_every_report_type_declares_its_tables():
+    """Keys can only be built for report types with known dependencies."""
+    assert set(REPORT_TABLES) == set(ReportType)
+
+
+@pytest.mark.parametrize("report_type", list(ReportType))
+def test_declared_tables_match_the_models_the_service_queries(report_type):
+    """A report's key covers exactly the tables of the models its service module uses."""
+    module = sys.modules[REPORT_SERVICES[report_type].__module__]
+    tables = {
+        value.__tablename__
+        for value in vars(module).values()
+        if isinstance(value, type) and hasattr(value, "__tablename__")
+    }
+
+    assert tables == set(REPORT_TABLES[report_type])
+
+
+async def test_key_normalizes_filters():
+    """Equivalent filters share a key; different filters don't."""
+    session = StatsSession()
+    first, second = uuid4(), uuid4()
+
+    key = await report_cache_key(session, ReportType.DRE, make_filters(client_ids=[first, second]))
+
+    assert key == await report_cache_key(session, "dre", make_filters(client_ids=[second, first]))
+    assert key != await report_cache_key(session, ReportType.DRE, make_filters(client_ids=[first]))
+    assert key != await report_cache_key(
+        session, ReportType.KPIS, make_filters(client_ids=[first, second])
+    )
+
+
+async def test_key_changes_only_with_the_report_tables():
+    """Writes to tables a report reads change its key; other writes don't."""
+    session = StatsSession({"financial_transactions": 10, "licenses": 3})
+    key = await report_cache_key(session, ReportType.DRE, make_filters())
+
+    session.written["licenses"] += 1
+    assert await report_cache_key(session, ReportType.DRE, make_filters()) == key
+
+    session.written["financial_transactions"] += 1
+    assert await report_cache_key(session, ReportType.DRE, make_filters()) != key
+
+    # Another worker reading the same statistics computes the same key
+    other_worker = StatsSession(session.written)
+    assert await report_cache_key(other_worker, ReportType.DRE, make_filters()) == (
+        await report_cache_key(session, ReportType.DRE, make_filters())
+    )
+
+
+async def test_table_versions_default_missing_tables_to_zero():
+    """Tables without statistics yet still get a stable version."""
+    session = StatsSession({"clients": 7})
+
+    assert await read_table_versions(session, ["obligations", "clients", "clients"]) == (
+        ("clients", 7),
+        ("obligations", 0),
+    )
+
+
+async def test_lru_and_ttl_eviction():
+    """Entries are evicted least recently used first and expire after the TTL."""
+    cache = ReportResultCache(max_entries=2, ttl_seconds=3600)
+    cache.set("a", {"v": 1})
+    cache.set("b", {"v": 2})
+    cache.get("a")
+    cache.set("c", {"v": 3})
+
+    assert cache.get("b") is None
+    assert cache.get("a") == {"v": 1}
+
+    expired = ReportResultCache(max_entries=2, ttl_seconds=0)
+    expired.set("a", {"v": 1})
+    assert expired.get("a") is None
+
+
+async def test_concurrent_misses_share_one_computation():
+    """Requests for the same missing key wait for a single computation."""
+    cache = ReportResultCache(max_entries=10, ttl_seconds=3600)
+    calls = 0
+
+    async def compute():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"total": 42}
+
+    results = await asyncio.gather(*(cache.get_or_compute("k", compute) for _ in range(5)))
+
+    assert calls == 1
+    assert all(result == {"total": 42} for result in results)
+
+
+async def test_disk_tier_survives_memory_eviction(tmp_path):
+    """Results evicted from memory are loaded back from disk."""
+    cache = ReportResultCache(max_entries=1, ttl_seconds=3600, disk_dir=tmp_path)
+
+    async def compute():
+        return {"period": date(2025, 1, 1)}
+
+    await cache.get_or_compute("a", compute)
+    await cache.get_or_compute("b", compute)
+    assert cache.get("a") is None
+
+    async def fail():
+        raise AssertionError("should be read from disk")
+
+    assert await cache.get_or_compute("a", fail) == {"period": date(2025, 1, 1)}
@@ -0,0 +1,185 @@
+"""
+Unit tests for the background report export queue.
+"""
+
+import asyncio
+from datetime import date
+from pathlib import Path
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from app.db.models.report import ReportFormat, ReportStatus, ReportType
+from app.db.repositories.report import ReportRepository
+from app.services.report import export_jobs
+from app.services.report.export_jobs import ReportExportJob, ReportJobQueue
+
+
+class FakeSession:
+    """Session double holding report history rows by id."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.commits = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def get(self, model, id):
+        return self.rows.get(id)
+
+    async def execute(self, stmt):
+        # Advisory locks and pending export lookups find nothing
+        return SimpleNamespace(rowcount=0, scalars=lambda: SimpleNamespace(all=lambda: []))
+
+    async def commit(self):
+        self.commits += 1
+
+
+def make_job() -> ReportExportJob:
+    """Queued DRE export."""
+    return ReportExportJob(
+        report_id=uuid4(),
+        user_id=uuid4(),
+        report_type=ReportType.DRE,
+        format=ReportFormat.PDF,
+        filters={"period_start": date(2025, 1, 1), "period_end": date(2025, 12, 31)},
+        filename="dre",
+        cache_key="k" * 64,
+    )
+
+
+def make_queue(jobs, workers=2):
+    """Queue whose workers use a fake session over pending rows for jobs."""
+    rows = {
+        job.report_id: SimpleNamespace(
+            id=job.report_id,
+            status=ReportStatus.PENDING,
+            file_path=None,
+            file_size=None,
+            generated_at=None,
+            expires_at=None,
+            cache_key=job.cache_key,
+        )
+        for job in jobs
+    }
+    notified = []
+
+    async def notify(history):
+        notified.append(history.status)
+
+    queue = ReportJobQueue(
+        workers=workers,
+        max_pending=10,
+        timeout_seconds=60,
+        session_factory=lambda: FakeSession(rows),
+        notify=notify,
+    )
+    return queue, rows, notified
+
+
+async def test_run_marks_completed_and_notifies(monkeypatch):
+    """A rendered export stores its file and notifies the user."""
+    job = make_job()
+    queue, rows, notified = make_queue([job])
+
+    async def render(db, job):
+        return 1234, Path("uploads/reports/dre.pdf")
+
+    monkeypatch.setattr(export_jobs, "render_export", render)
+
+    await queue.run(job)
+
+    history = rows[job.report_id]
+    assert history.status == ReportStatus.COMPLETED
+    assert history.file_path == "uploads/reports/dre.pdf"
+    assert history.file_size == 1234
+    assert history.expires_at > history.generated_at
+    assert notified == [ReportStatus.COMPLETED]
+
+
+async def test_run_finishes_exports_that_joined_it(monkeypatch):
+    """Rows a scheduled run attached to the pending render get its file too."""
+    job = make_job()
+    queue, rows, notified = make_queue([job])
+    joined = SimpleNamespace(**{**vars(rows[job.report_id]), "id": uuid4()})
+    rows[joined.id] = joined
+
+    async def get_pending_exports(self, cache_key, format):
+        assert (cache_key, format) == (job.cache_key, job.format)
+        return [rows[job.report_id], joined]
+
+    async def render(db, job):
+        return 1234, Path("uploads/reports/dre.pdf")
+
+    monkeypatch.setattr(ReportRepository, "get_pending_exports", get_pending_exports)
+    monkeypatch.setattr(export_jobs, "render_export", render)
+
+    await queue.run(job)
+
+    assert joined.status == ReportStatus.COMPLETED
+    assert joined.file_path == "uploads/reports/dre.pdf"
+    assert notified == [ReportStatus.COMPLETED, ReportStatus.COMPLETED]
+
+
+async def test_run_marks_failed(monkeypatch):
+    """A failing export is recorded as failed and can't be reused."""
+    job = make_job()
+    queue, rows, notified = make_queue([job])
+
+    async def render(db, job):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(export_jobs, "render_export", render)
+
+    await queue.run(job)
+
+    history = rows[job.report_id]
+    assert history.status == ReportStatus.FAILED
+    assert history.file_path is None
+    assert history.cache_key is None
+    assert notified == [ReportStatus.FAILED]
+
+
+async def test_workers_bound_concurrency(monkeypatch):
+    """Queued jobs all run, never more at once than there are workers."""
+    jobs = [make_job() for _ in range(5)]
+    queue, rows, notified = make_queue(jobs, workers=2)
+    running = 0
+    peak = 0
+
+    async def render(db, job):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return 1, Path(f"{job.report_id}.pdf")
+
+    monkeypatch.setattr(export_jobs, "render_export", render)
+
+    await queue.start()
+    try:
+        for job in jobs:
+            queue.submit(job)
+        await asyncio.wait_for(queue.join(), timeout=5)
+    finally:
+        await queue.stop()
+
+    assert peak == 2
+    assert all(row.status == ReportStatus.COMPLETED for row in rows.values())
+    assert len(notified) == 5
+
+
+def test_submit_refuses_beyond_max_pending():
+    """The queue is bounded."""
+    queue = ReportJobQueue(workers=1, max_pending=1, timeout_seconds=60)
+    queue.submit(make_job())
+
+    assert queue.is_full()
+    with pytest.raises(asyncio.QueueFull):
+        queue.submit(make_job())
@@ -0,0 +1,117 @@
+"""
+Unit tests for the report file janitor and download recency.
+"""
+
+from types import SimpleNamespace
+from uuid import uuid4
+
+from app.api.v1.routes.reports import download_report
+from app.db.models.report import ReportFormat, ReportStatus
+from app.db.models.user import UserRole
+from app.db.repositories.report import ReportRepository
+from app.services.report.janitor import ReportFileJanitor, remove_report_files
+
+
+class FakeSession:
+    """Session double for the janitor transactions."""
+
+    commits = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def commit(self):
+        FakeSession.commits += 1
+
+
+def make_file(directory, name, size=10):
+    """Write a report file of a given size."""
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / name
+    path.write_bytes(b"x" * size)
+    return str(path)
+
+
+def test_remove_report_files_prunes_empty_directories(tmp_path):
+    """Missing files are skipped and emptied date directories removed."""
+    emptied = tmp_path / "2025" / "03" / "01"
+    kept = tmp_path / "2025" / "03" / "02"
+    paths = [make_file(emptied, "a.pdf", 10), make_file(kept, "b.pdf", 5)]
+    make_file(kept, "c.pdf")
+
+    removed, freed = remove_report_files([*paths, str(tmp_path / "missing.pdf")])
+
+    assert (removed, freed) == (2, 15)
+    assert not emptied.exists()
+    assert (kept / "c.pdf").exists()
+
+
+async def test_run_keeps_files_still_referenced(tmp_path, monkeypatch):
+    """Expired records only remove files no remaining record shares."""
+    shared = make_file(tmp_path, "shared.pdf")
+    expired = make_file(tmp_path, "expired.pdf")
+    evicted = make_file(tmp_path, "evicted.pdf")
+    batches = [[shared, expired, expired], [expired]]
+
+    async def delete_expired(self, now, limit):
+        return batches.pop(0) if batches else []
+
+    async def get_referenced_paths(self, file_paths):
+        return {shared} & set(file_paths)
+
+    async def get_files_over_quota(self, quota_bytes, limit):
+        return [evicted]
+
+    async def delete_by_file_paths(self, file_paths):
+        return list(file_paths)
+
+    monkeypatch.setattr(ReportRepository, "delete_expired", delete_expired)
+    monkeypatch.setattr(ReportRepository, "get_referenced_paths", get_referenced_paths)
+    monkeypatch.setattr(ReportRepository, "get_files_over_quota", get_files_over_quota)
+    monkeypatch.setattr(ReportRepository, "delete_by_file_paths", delete_by_file_paths)
+
+    janitor = ReportFileJanitor(quota_bytes=100, batch_size=3, session_factory=FakeSession)
+    summary = await janitor.run()
+
+    # Full first batch, then a short one; a short quota batch ends eviction
+    assert summary.expired_records == 4
+    assert summary.evicted_files == 1
+    assert summary.files_removed == 2
+    assert (tmp_path / "shared.pdf").exists()
+    assert not (tmp_path / "expired.pdf").exists()
+    assert not (tmp_path / "evicted.pdf").exists()
+
+
+async def test_download_recency_is_persisted(tmp_path, monkeypatch):
+    """Downloads are committed, so quota eviction ranks the file by them."""
+    history = SimpleNamespace(
+        id=uuid4(),
+        user_id=uuid4(),
+        status=ReportStatus.COMPLETED,
+        format=ReportFormat.PDF,
+        expires_at=None,
+        file_path=make_file(tmp_path, "report.pdf"),
+    )
+    downloaded = []
+
+    async def get_history_record(self, history_id):
+        return history
+
+    async def mark_downloaded(self, history_id):
+        downloaded.append(history_id)
+
+    monkeypatch.setattr(ReportRepository, "get_history_record", get_history_record)
+    monkeypatch.setattr(ReportRepository, "mark_downloaded", mark_downloaded)
+    session = FakeSession()
+    commits = FakeSession.commits
+
+    response = await download_report(
+        history.id, session, SimpleNamespace(id=history.user_id, role=UserRole.FUNC)
+    )
+
+    assert response.path == history.file_path
+    assert downloaded == [history.id]
+    assert FakeSession.commits == commits + 1
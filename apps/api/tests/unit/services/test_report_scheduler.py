@@ -0,0 +1,250 @@
+"""
+Unit tests for scheduled report execution.
+"""
+
+from datetime import date, datetime, timedelta, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from app.db.models.report import ReportFormat, ReportStatus, ReportType, SchedulePeriod
+from app.db.repositories.report import ReportRepository, ReportScheduleRepository
+from app.services.report.cron import CronExpression
+from app.services.report.scheduler import (
+    ReportScheduler,
+    compute_next_run,
+    resolve_period,
+    spread_offset,
+)
+
+SAO_PAULO = ZoneInfo("America/Sao_Paulo")
+
+
+def make_template(report_type=ReportType.DRE, **default_filters):
+    """Report template stand-in."""
+    return SimpleNamespace(id=uuid4(), report_type=report_type, default_filters=default_filters)
+
+
+def make_schedule(template, fmt=ReportFormat.PDF, recipients=None):
+    """Due schedule stand-in."""
+    return SimpleNamespace(
+        id=uuid4(),
+        template=template,
+        cron="0 8 1 * *",
+        period=SchedulePeriod.PREVIOUS_MONTH,
+        format=fmt,
+        recipients=recipients if recipients is not None else [str(uuid4())],
+        created_by_id=uuid4(),
+        is_active=True,
+        last_run_at=None,
+        next_run_at=None,
+    )
+
+
+def test_cron_next_after():
+    """Fields, steps and the day-of-month/day-of-week OR rule."""
+    monthly = CronExpression.parse("0 8 1 * *")
+    assert monthly.next_after(datetime(2025, 1, 15, 9, 0)) == datetime(2025, 2, 1, 8, 0)
+    assert monthly.next_after(datetime(2025, 2, 1, 7, 59, 30)) == datetime(2025, 2, 1, 8, 0)
+
+    every_15 = CronExpression.parse("*/15 9-10 * * 1-5")
+    # Saturday -> Monday 09:00
+    assert every_15.next_after(datetime(2025, 3, 1, 12, 0)) == datetime(2025, 3, 3, 9, 0)
+    assert every_15.next_after(datetime(2025, 3, 3, 10, 45)) == datetime(2025, 3, 4, 9, 0)
+
+    # 15th or any Sunday (7 is Sunday too)
+    either = CronExpression.parse("0 0 15 * 7")
+    assert either.next_after(datetime(2025, 3, 10, 0, 0)) == datetime(2025, 3, 15, 0, 0)
+    assert either.next_after(datetime(2025, 3, 15, 0, 0)) == datetime(2025, 3, 16, 0, 0)
+
+    with pytest.raises(ValueError):
+        CronExpression.parse("60 * * * *")
+    with pytest.raises(ValueError):
+        CronExpression.parse("0 8 * *")
+
+
+@pytest.mark.parametrize(
+    "period,expected",
+    [
+        (SchedulePeriod.CURRENT_MONTH, (date(2025, 3, 1), date(2025, 3, 31))),
+        (SchedulePeriod.PREVIOUS_MONTH, (date(2025, 2, 1), date(2025, 2, 28))),
+        (SchedulePeriod.LAST_30_DAYS, (date(2025, 2, 14), date(2025, 3, 15))),
+        (SchedulePeriod.CURRENT_YEAR, (date(2025, 1, 1), date(2025, 12, 31))),
+        (SchedulePeriod.PREVIOUS_YEAR, (date(2024, 1, 1), date(2024, 12, 31))),
+    ],
+)
+def test_resolve_period(period, expected):
+    """Periods are resolved relative to the run date."""
+    assert resolve_period(period, date(2025, 3, 15)) == expected
+
+
+def test_spread_offset_is_per_report():
+    """Schedules for the same report share an offset within the window."""
+    dre = make_template(ReportType.DRE)
+    same_dre = make_template(ReportType.DRE)
+    offsets = {
+        spread_offset(make_template(report_type), SchedulePeriod.PREVIOUS_MONTH)
+        for report_type in ReportType
+    }
+
+    assert spread_offset(dre, SchedulePeriod.PREVIOUS_MONTH) == spread_offset(
+        same_dre, SchedulePeriod.PREVIOUS_MONTH
+    )
+    assert all(timedelta(0) <= offset < timedelta(minutes=60) for offset in offsets)
+    assert len(offsets) > 1
+    assert spread_offset(dre, SchedulePeriod.PREVIOUS_MONTH, spread_minutes=1) == timedelta(0)
+
+
+def test_compute_next_run_in_schedule_timezone():
+    """Cron times are local to the schedule timezone and shifted by the offset."""
+    cron = CronExpression.parse("0 8 1 * *")
+    after = datetime(2025, 3, 1, 11, 30, tzinfo=timezone.utc)  # 08:30 in São Paulo
+
+    next_run = compute_next_run(cron, timedelta(minutes=20), after, SAO_PAULO)
+
+    # 08:20 already passed on March 1st: next is April 1st 08:20 local
+    assert next_run == datetime(2025, 4, 1, 11, 20, tzinfo=timezone.utc)
+
+    # Still before the offset fire time on the same day
+    early = datetime(2025, 3, 1, 11, 10, tzinfo=timezone.utc)
+    assert compute_next_run(cron, timedelta(minutes=20), early, SAO_PAULO) == datetime(
+        2025, 3, 1, 11, 20, tzinfo=timezone.utc
+    )
+
+
+class FakeSession:
+    """Session double for the claim transaction."""
+
+    def __init__(self):
+        self.commits = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def commit(self):
+        self.commits += 1
+
+    async def execute(self, statement, params=None):
+        # Table statistics for the report cache key, export group locks
+        return SimpleNamespace(all=lambda: [])
+
+
+class FakeQueue:
+    """Export queue double recording enqueued jobs and notifications."""
+
+    def __init__(self):
+        self.jobs = []
+        self.notified = []
+
+    async def enqueue(self, job):
+        self.jobs.append(job)
+
+    async def notify(self, history):
+        self.notified.append(history)
+
+
+@pytest.fixture
+def history_table(monkeypatch):
+    """In-memory stand-in for the report history lookups of the scheduler."""
+    saved = []
+
+    async def save_template_history(self, status=ReportStatus.COMPLETED, **kwargs):
+        history = SimpleNamespace(id=uuid4(), status=status, **kwargs)
+        saved.append(history)
+        return history
+
+    async def get_rendered_export(self, cache_key, format, rendered_after):
+        return None
+
+    async def get_pending_exports(self, cache_key, format, requested_after=None):
+        return [
+            history
+            for history in saved
+            if (history.cache_key, history.format, history.status)
+            == (cache_key, format, ReportStatus.PENDING)
+        ]
+
+    monkeypatch.setattr(ReportRepository, "save_template_history", save_template_history)
+    monkeypatch.setattr(ReportRepository, "get_rendered_export", get_rendered_export)
+    monkeypatch.setattr(ReportRepository, "get_pending_exports", get_pending_exports)
+    return saved
+
+
+async def test_due_schedules_are_deduplicated(monkeypatch, history_table):
+    """Schedules for the same report and format share one job; others get their own."""
+    dre = make_template(ReportType.DRE)
+    shared_recipient = str(uuid4())
+    schedules = [
+        make_schedule(dre, recipients=[shared_recipient]),
+        make_schedule(make_template(ReportType.DRE), recipients=[shared_recipient, str(uuid4())]),
+        make_schedule(dre, fmt=ReportFormat.CSV),
+        make_schedule(make_template(ReportType.KPIS)),
+    ]
+    saved = history_table
+
+    async def claim_due(self, now, limit):
+        return schedules
+
+    monkeypatch.setattr(ReportScheduleRepository, "claim_due", claim_due)
+
+    queue = FakeQueue()
+    scheduler = ReportScheduler(queue, batch_size=10, session_factory=FakeSession)
+    now = datetime(2025, 3, 1, 11, 0, tzinfo=timezone.utc)
+
+    processed = await scheduler.run_due(now)
+
+    assert processed == 4
+    assert len(queue.jobs) == 3
+    dre_pdf = next(
+        job for job in queue.jobs if job.report_type == ReportType.DRE and job.format == ReportFormat.PDF
+    )
+    # Two recipients, one of them shared by both schedules
+    assert len(dre_pdf.shared_report_ids) == 1
+    assert dre_pdf.filters["period_start"] == date(2025, 2, 1)
+    assert len(saved) == 4
+    assert all(schedule.next_run_at > now for schedule in schedules)
+    assert all(schedule.last_run_at == now for schedule in schedules)
+
+
+async def test_later_batches_join_pending_and_rendered_reports(monkeypatch, history_table, tmp_path):
+    """A report queued by an earlier batch or rendered recently is not rendered again."""
+    dre = make_template(ReportType.DRE)
+    batches = [
+        [make_schedule(dre)],
+        [make_schedule(dre)],
+    ]
+
+    async def claim_due(self, now, limit):
+        return batches.pop(0) if batches else []
+
+    monkeypatch.setattr(ReportScheduleRepository, "claim_due", claim_due)
+    queue = FakeQueue()
+    scheduler = ReportScheduler(queue, batch_size=1, session_factory=FakeSession)
+    now = datetime(2025, 3, 1, 11, 0, tzinfo=timezone.utc)
+
+    assert await scheduler.run_due(now) == 2
+
+    # The second batch's recipient waits on the first batch's render
+    assert len(queue.jobs) == 1
+    assert [history.status for history in history_table] == [ReportStatus.PENDING] * 2
+
+    rendered = SimpleNamespace(
+        file_path=str(tmp_path / "dre.pdf"), file_size=10, expires_at=now + timedelta(days=7)
+    )
+    (tmp_path / "dre.pdf").write_bytes(b"x" * 10)
+
+    async def get_rendered_export(self, cache_key, format, rendered_after):
+        return rendered
+
+    monkeypatch.setattr(ReportRepository, "get_rendered_export", get_rendered_export)
+    batches.append([make_schedule(dre)])
+
+    assert await scheduler.run_due(now) == 1
+    assert len(queue.jobs) == 1
+    assert [history.file_path for history in queue.notified] == [rendered.file_path]
+    assert queue.notified[0].status == ReportStatus.COMPLETED
@@ -0,0 +1,78 @@
+"""
+Unit tests for transaction creation.
+"""
+
+from contextlib import asynccontextmanager
+from datetime import date
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from app.db.repositories.client import ClientRepository
+from app.db.repositories.transaction import TransactionRepository
+from app.schemas.finance import TransactionCreate
+from app.services.finance.transaction_service import LIVE_TRANSACTION_INDEX, TransactionService
+
+
+class RacingSession:
+    """Session double whose flush hits a unique index violation."""
+
+    def __init__(self, violated_index):
+        self.violated_index = violated_index
+
+    @asynccontextmanager
+    async def begin_nested(self):
+        yield
+
+    def add(self, obj):
+        pass
+
+    async def flush(self):
+        orig = Exception(f'duplicate key value violates unique constraint "{self.violated_index}"')
+        raise IntegrityError("INSERT INTO financial_transactions ...", {}, orig)
+
+
+@pytest.fixture
+def no_existing_transaction(monkeypatch):
+    """The client exists and the duplicate check finds nothing (the race window)."""
+
+    async def get_by_id(self, id):
+        return object()
+
+    async def get_by_client_and_reference_month(self, client_id, reference_month):
+        return None
+
+    monkeypatch.setattr(ClientRepository, "get_by_id", get_by_id)
+    monkeypatch.setattr(
+        TransactionRepository,
+        "get_by_client_and_reference_month",
+        get_by_client_and_reference_month,
+    )
+
+
+def make_data():
+    return TransactionCreate(
+        client_id=uuid4(),
+        amount=Decimal("100.00"),
+        due_date=date(2025, 3, 10),
+        reference_month=date(2025, 3, 1),
+        description="Honorários",
+    )
+
+
+async def test_concurrent_duplicate_is_a_value_error(no_existing_transaction):
+    """A duplicate caught by the unique index is reported like one caught by the check."""
+    service = TransactionService(RacingSession(LIVE_TRANSACTION_INDEX))
+
+    with pytest.raises(ValueError, match="already exists"):
+        await service.create_transaction(make_data(), created_by_id=uuid4())
+
+
+async def test_other_integrity_errors_propagate(no_existing_transaction):
+    """Only the live transaction index means a duplicate."""
+    service = TransactionService(RacingSession("financial_transactions_client_id_fkey"))
+
+    with pytest.raises(IntegrityError):
+        await service.create_transaction(make_data(), created_by_id=uuid4())
@@ -0,0 +1,84 @@
+"""
+Unit tests for WebSocket fan-out across workers.
+"""
+
+import json
+
+from app.websockets.backplane import InMemoryBackplane, PostgresBackplane
+from app.websockets.manager import ConnectionManager
+
+
+class FakeWebSocket:
+    """WebSocket double recording what it was sent."""
+
+    def __init__(self):
+        self.sent = []
+
+    async def accept(self):
+        pass
+
+    async def send_json(self, message):
+        self.sent.append(message)
+
+
+async def make_workers(count):
+    """Managers of several workers sharing one in-memory backplane."""
+    peers = []
+    workers = [ConnectionManager(InMemoryBackplane(peers)) for _ in range(count)]
+    for worker in workers:
+        await worker.start()
+    return workers
+
+
+async def test_events_reach_users_on_every_worker():
+    """Each worker delivers to its own connections; the sender publishes once."""
+    first, second = await make_workers(2)
+    admin, func, client = FakeWebSocket(), FakeWebSocket(), FakeWebSocket()
+    await first.connect(admin, "admin-1", "admin")
+    await second.connect(func, "func-1", "func")
+    await second.connect(client, "client-1", "cliente")
+
+    event = {"type": "obligation_update"}
+    assert await first.send_to_roles(["admin", "func"], event) == 1
+    assert admin.sent == [event] and func.sent == [event] and client.sent == []
+
+    assert await first.send_to_user("client-1", {"type": "notification"}) is False
+    assert client.sent == [{"type": "notification"}]
+
+    await second.send_to_all({"type": "system"}, exclude=["func-1"])
+    assert admin.sent[-1] == {"type": "system"}
+    assert func.sent[-1] == event
+    assert client.sent[-1] == {"type": "system"}
+
+
+async def test_stopped_worker_no_longer_receives():
+    """A worker that stopped its backplane only sends."""
+    first, second = await make_workers(2)
+    socket = FakeWebSocket()
+    await second.connect(socket, "admin-1", "admin")
+
+    await second.stop()
+    await first.send_to_all({"type": "system"})
+
+    assert socket.sent == []
+
+
+async def test_postgres_backplane_skips_its_own_notifications():
+    """NOTIFY echoes a worker's own events back; those were delivered locally already."""
+    received = []
+
+    async def deliver(target, message):
+        received.append((target, message))
+
+    backplane = PostgresBackplane(dsn="postgresql://unused", channel="websocket_events")
+    backplane._deliver = deliver
+
+    own = json.dumps({"origin": backplane.origin, "target": {}, "message": {"type": "a"}})
+    other = json.dumps({"origin": "other", "target": {"user_id": "u"}, "message": {"type": "b"}})
+    backplane._on_notify(None, 1, "websocket_events", own)
+    backplane._on_notify(None, 1, "websocket_events", other)
+    backplane._on_notify(None, 1, "websocket_events", "not json")
+    for task in list(backplane._deliveries):
+        await task
+
+    assert received == [({"user_id": "u"}, {"type": "b"})]
@@ -94,7 +94,7 @@ export function AuthProvider({ children }: { children: React.ReactNode }) {
   }, []);
 
   const refresh = useCallback(async () => {
-    const refreshToken = state.refreshToken || localStorage.getItem("refresh_token");
+    const refreshToken = localStorage.getItem("refresh_token") || state.refreshToken;
 
     if (!refreshToken) {
       throw new Error("No refresh token available");
@@ -106,6 +106,7 @@ export function AuthProvider({ children }: { children: React.ReactNode }) {
       setState((prev) => ({
         ...prev,
         accessToken: response.access_token,
+        refreshToken: response.refresh_token,
       }));
     } catch (error) {
       // Refresh failed, logout
@@ -59,6 +59,10 @@ export class ApiClient {
   }
 
   private async refreshAccessToken(): Promise<string> {
+    // Another tab may have rotated the refresh token since this one loaded it
+    if (typeof window !== "undefined") {
+      this.refreshToken = localStorage.getItem("refresh_token") ?? this.refreshToken;
+    }
     if (!this.refreshToken) {
       throw new Error("No refresh token available");
     }
@@ -77,7 +81,8 @@ export class ApiClient {
     }
 
     const data: RefreshResponse = await response.json();
-    this.accessToken = data.access_token;
+    // Refresh tokens are single-use; keep the successor
+    this.setTokens(data.access_token, data.refresh_token);
     return data.access_token;
   }
 
@@ -61,12 +61,9 @@ export const authApi = {
       request
     );
 
-    // Update access token in apiClient
-    if (response.access_token && apiClient.getAccessToken()) {
-      apiClient.setTokens(
-        response.access_token,
-        refreshToken // Keep the same refresh token
-      );
+    // The presented refresh token is now used up; store its successor
+    if (response.access_token && response.refresh_token) {
+      apiClient.setTokens(response.access_token, response.refresh_token);
     }
 
     return response;
@@ -11,6 +11,7 @@ import type {
   ReportTemplate,
   ReportTemplateCreate,
   ReportTemplateUpdate,
+  ReportHistory,
   ReportHistoryListResponse,
   ReportTypesListResponse,
 } from "@/types/report";
@@ -37,6 +38,13 @@ export const reportsApi = {
     return apiClient.post<ReportExportResponse>("/reports/export", request);
   },
 
+  /**
+   * Get the status of an export (pending, completed or failed)
+   */
+  async getReportStatus(reportId: string): Promise<ReportHistory> {
+    return apiClient.get<ReportHistory>(`/reports/status/${reportId}`);
+  },
+
   /**
    * Get report templates
    */
@@ -29,6 +29,7 @@ export interface RefreshRequest {
 
 export interface RefreshResponse {
   access_token: string;
+  refresh_token: string;
   token_type: string;
   expires_in: number; // seconds
 }
@@ -134,6 +134,7 @@ export interface ClientListResponse {
   page: number;
   size: number;
   pages: number;
+  next_cursor?: string | null;
 }
 
 /**
@@ -92,6 +92,7 @@ export interface TransactionListResponse {
   total: number;
   skip: number;
   limit: number;
+  next_cursor?: string | null;
 }
 
 // Filters
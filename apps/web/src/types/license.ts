@@ -147,6 +147,7 @@ export interface LicenseListResponse {
   page: number;
   size: number;
   pages: number;
+  next_cursor?: string | null;
 }
 
 // Statistics
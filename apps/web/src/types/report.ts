@@ -85,12 +85,13 @@ export interface ReportPreviewResponse {
 
 export interface ReportExportResponse {
   report_id: string;
+  status: ReportStatus; // pending until the file is rendered
   file_url: string;
-  file_name: string;
-  file_size: number;
+  file_name?: string | null;
+  file_size?: number | null;
   format: ReportFormat;
   generated_at: string; // ISO datetime string
-  expires_at: string; // ISO datetime string
+  expires_at?: string | null; // ISO datetime string
 }
 
 export interface ChartConfig {